@@ -0,0 +1,418 @@
+"""
+RaaS API — Job queue: runs submitted goals on a pool of orchestrator workers.
+
+POST /v1/tasks persists a PENDING TaskRecord and hands it to JobQueue, which
+returns immediately. Workers pick jobs tenant-fairly (round-robin over the
+tenants that have queued work) so one tenant's burst can't starve the rest.
+Every job keeps an in-memory event log; SSE streams attach to it, replaying
+what already happened and then following live events, instead of running
+the goal a second time. Each queue holds a lease on the jobs it owns and
+renews it from a heartbeat thread; jobs left PENDING/RUNNING by a crashed
+process are re-queued only once their lease has expired and the atomic
+claim in the TaskStore succeeds, so several gateway workers can share one
+task database.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from src.api.raas_task_models import StepDetail, TaskStatus
+from src.api.raas_task_store import TaskRecord, TaskStore, get_task_store
+from src.raas.sse import get_sse_manager
+
+logger = logging.getLogger(__name__)
+
+OrchestratorFactory = Callable[[], Any]
+
+FINAL_EVENT_TYPES = ("complete", "error")
+
+
+def build_orchestrator() -> Any:
+    """Create a RecipeOrchestrator wired to the LLM client."""
+    from src.core.llm_client import get_client
+    from src.core.orchestrator import RecipeOrchestrator
+
+    client = get_client()
+    return RecipeOrchestrator(
+        llm_client=client if client.is_available else None,
+        strict_verification=True,
+        enable_rollback=True,
+    )
+
+
+def result_to_record(record: TaskRecord, result: Any) -> TaskRecord:
+    """Populate a TaskRecord from an OrchestrationResult in-place."""
+    from src.core.orchestrator import OrchestrationStatus
+
+    status_map = {
+        OrchestrationStatus.SUCCESS: TaskStatus.SUCCESS,
+        OrchestrationStatus.FAILED: TaskStatus.FAILED,
+        OrchestrationStatus.PARTIAL: TaskStatus.PARTIAL,
+        OrchestrationStatus.ROLLED_BACK: TaskStatus.ROLLED_BACK,
+    }
+    record.status = status_map.get(result.status, TaskStatus.FAILED)
+    record.total_steps = result.total_steps
+    record.completed_steps = result.completed_steps
+    record.failed_steps = result.failed_steps
+    record.success_rate = result.success_rate
+    record.errors = result.errors
+    record.warnings = result.warnings
+    record.steps = [
+        StepDetail(
+            order=sr.step.order,
+            title=sr.step.title,
+            passed=sr.verification.passed,
+            exit_code=sr.execution.exit_code,
+            summary=sr.verification.summary,
+        )
+        for sr in result.step_results
+    ]
+    return record
+
+
+class JobEventLog:
+    """Event log for one job: late subscribers replay it, then follow live.
+
+    Token events stop being retained once ``max_events`` is reached (they
+    still reach live subscribers), so a chatty job can't grow without bound.
+    """
+
+    def __init__(self, max_events: int = 5000) -> None:
+        self.events: List[Dict[str, Any]] = []
+        self.closed = False
+        self._max_events = max_events
+        self._lock = threading.Lock()
+        self._subscribers: List[Tuple[asyncio.AbstractEventLoop, asyncio.Queue]] = []
+
+    def append(self, event: Dict[str, Any], final: bool = False) -> None:
+        """Record an event and forward it to every live subscriber."""
+        with self._lock:
+            if final or event.get("type") != "token" or len(self.events) < self._max_events:
+                self.events.append(event)
+            self.closed = self.closed or final
+            subscribers = list(self._subscribers)
+        for loop, queue in subscribers:
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, event)
+            except RuntimeError:  # Subscriber's loop already closed
+                self.unsubscribe(queue)
+
+    def subscribe(
+        self, loop: asyncio.AbstractEventLoop,
+    ) -> Tuple[List[Dict[str, Any]], Optional[asyncio.Queue]]:
+        """Return (backlog, live queue); the queue is None once the job is done."""
+        with self._lock:
+            backlog = list(self.events)
+            if self.closed:
+                return backlog, None
+            queue: asyncio.Queue = asyncio.Queue()
+            self._subscribers.append((loop, queue))
+            return backlog, queue
+
+    def unsubscribe(self, queue: Optional[asyncio.Queue]) -> None:
+        with self._lock:
+            self._subscribers = [(lp, q) for lp, q in self._subscribers if q is not queue]
+
+
+class JobQueue:
+    """Tenant-fair job queue drained by a pool of orchestrator worker threads.
+
+    Args:
+        store: Durable task store (defaults to the module singleton).
+        workers: Worker threads (default: ``RAAS_TASK_WORKERS`` env or 4).
+        orchestrator_factory: Zero-arg callable returning an object with
+            ``run_from_goal(goal, progress_callback=..., token_callback=...)``.
+        log_retention: Event logs of finished jobs kept for late SSE clients.
+        lease_seconds: How long a job lease lasts without a heartbeat; other
+            processes may reclaim the job after that (renewed every third of it).
+    """
+
+    def __init__(
+        self,
+        store: Optional[TaskStore] = None,
+        workers: Optional[int] = None,
+        orchestrator_factory: Optional[OrchestratorFactory] = None,
+        log_retention: int = 1000,
+        lease_seconds: float = 30.0,
+    ) -> None:
+        self._store = store if store is not None else get_task_store()
+        self._workers = workers or int(os.environ.get("RAAS_TASK_WORKERS", "4"))
+        self._factory = orchestrator_factory or build_orchestrator
+        self._log_retention = log_retention
+        self._lease_seconds = lease_seconds
+        self._owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._halt = threading.Event()
+        self._cond = threading.Condition()
+        self._tenants: "OrderedDict[str, Deque[TaskRecord]]" = OrderedDict()
+        self._logs: "OrderedDict[str, JobEventLog]" = OrderedDict()
+        self._loops: Dict[str, asyncio.AbstractEventLoop] = {}
+        self._threads: List[threading.Thread] = []
+        self._stopping = False
+        self._queued = 0
+        self._running = 0
+        self._submitted = 0
+        self._finished = 0
+        self._failed = 0
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Start workers and the lease heartbeat, then reclaim orphaned jobs (idempotent)."""
+        with self._cond:
+            if self._threads:
+                return
+            self._stopping = False
+            self._halt.clear()
+            for i in range(self._workers):
+                thread = threading.Thread(
+                    target=self._worker, name=f"raas-job-{i}", daemon=True,
+                )
+                self._threads.append(thread)
+        self._recover()
+        for thread in self._threads:
+            thread.start()
+        threading.Thread(target=self._heartbeat, name="raas-job-lease", daemon=True).start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop taking jobs; running jobs finish in the background."""
+        self._halt.set()
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+            threads, self._threads = self._threads, []
+        for thread in threads:
+            thread.join(timeout)
+
+    def _heartbeat(self) -> None:
+        """Renew this queue's leases and pick up jobs whose owner has died.
+
+        After :meth:`stop` it keeps renewing until the running jobs finish, so
+        another process doesn't reclaim them mid-run.
+        """
+        interval = self._lease_seconds / 3
+        while True:
+            if self._halt.wait(interval):
+                with self._cond:
+                    if not self._running:
+                        return
+                time.sleep(interval)
+            try:
+                self._store.renew(self._owner, self._lease_seconds)
+                if not self._halt.is_set():
+                    self._recover()
+            except Exception as exc:  # Keep beating through transient DB errors
+                logger.warning("JobQueue: lease heartbeat failed: %s", exc)
+
+    def _recover(self) -> int:
+        """Claim and re-queue unfinished jobs whose lease has expired."""
+        now = time.time()
+        unowned_before = now - self._lease_seconds
+        recovered = [
+            r for r in self._store.reclaimable(self._owner, unowned_before, now)
+            if self._store.claim(
+                r.task_id, self._owner, self._lease_seconds, unowned_before, now,
+            )
+        ]
+        if not recovered:
+            return 0
+        with self._cond:
+            for record in recovered:
+                record.status = TaskStatus.PENDING
+                self._logs[record.task_id] = JobEventLog()
+                self._enqueue(record)
+        for record in recovered:
+            self._store.update(record)
+        logger.info("JobQueue: re-queued %d unfinished task(s)", len(recovered))
+        return len(recovered)
+
+    # ------------------------------------------------------------------
+    # Submission and scheduling
+    # ------------------------------------------------------------------
+
+    def submit(
+        self, record: TaskRecord, loop: Optional[asyncio.AbstractEventLoop] = None,
+    ) -> JobEventLog:
+        """Queue a persisted PENDING record for execution.
+
+        Args:
+            record: Record created via :meth:`TaskStore.create`.
+            loop: Event loop of the submitting request; when given, streamed
+                tokens are also pushed to the tenant's dashboard SSE channel.
+
+        Returns:
+            The job's :class:`JobEventLog`.
+        """
+        self.start()
+        self._store.claim(record.task_id, self._owner, self._lease_seconds)
+        log = JobEventLog()
+        with self._cond:
+            self._logs[record.task_id] = log
+            if loop is not None:
+                self._loops[record.task_id] = loop
+            self._submitted += 1
+            self._enqueue(record)
+        return log
+
+    def _enqueue(self, record: TaskRecord) -> None:
+        """Append to the tenant's FIFO (caller holds ``_cond``)."""
+        self._tenants.setdefault(record.tenant_id, deque()).append(record)
+        self._queued += 1
+        self._cond.notify()
+
+    def _next_job(self) -> Optional[TaskRecord]:
+        """Block for the next job, rotating across tenants."""
+        with self._cond:
+            while not self._stopping and not self._tenants:
+                self._cond.wait()
+            if self._stopping:
+                return None
+            tenant_id, jobs = next(iter(self._tenants.items()))
+            record = jobs.popleft()
+            if jobs:
+                self._tenants.move_to_end(tenant_id)
+            else:
+                del self._tenants[tenant_id]
+            self._queued -= 1
+            self._running += 1
+            return record
+
+    def _worker(self) -> None:
+        while True:
+            record = self._next_job()
+            if record is None:
+                return
+            try:
+                self._run(record)
+            except Exception as exc:  # Never let one job kill the worker
+                logger.exception("JobQueue: task %s crashed: %s", record.task_id, exc)
+            finally:
+                with self._cond:
+                    self._running -= 1
+
+    def _run(self, record: TaskRecord) -> None:
+        """Execute one job, streaming progress into its event log."""
+        with self._cond:
+            log = self._logs.setdefault(record.task_id, JobEventLog())
+            loop = self._loops.pop(record.task_id, None)
+        sse = get_sse_manager()
+
+        if not self._store.claim(record.task_id, self._owner, self._lease_seconds):
+            # Our lease lapsed and another process has taken the job over
+            logger.warning("JobQueue: task %s is owned elsewhere, skipping", record.task_id)
+            log.append({"type": "error", "message": "task moved to another worker"}, final=True)
+            return
+
+        record.status = TaskStatus.RUNNING
+        self._store.update(record)
+        log.append({"type": "status", "status": TaskStatus.RUNNING.value})
+
+        def _on_step(step_result: Any, current: Any) -> None:
+            log.append({
+                "type": "step",
+                "order": step_result.step.order,
+                "title": step_result.step.title,
+                "passed": step_result.verification.passed,
+                "exit_code": step_result.execution.exit_code,
+                "summary": step_result.verification.summary,
+                "completed": current.completed_steps,
+                "total": current.total_steps,
+            })
+
+        def _on_token(step: Any, delta: str) -> None:
+            log.append({"type": "token", "order": step.order, "delta": delta})
+            if loop is not None:
+                try:
+                    loop.call_soon_threadsafe(
+                        sse.push_token, record.tenant_id, step.order, delta, record.task_id,
+                    )
+                except RuntimeError:
+                    pass
+
+        try:
+            orchestrator = self._factory()
+            result = orchestrator.run_from_goal(
+                record.goal, progress_callback=_on_step, token_callback=_on_token,
+            )
+            result_to_record(record, result)
+            done = {
+                "type": "complete",
+                "status": record.status.value,
+                "success_rate": record.success_rate,
+                "errors": record.errors,
+            }
+        except Exception as exc:
+            record.status = TaskStatus.FAILED
+            record.errors.append(str(exc))
+            done = {"type": "error", "message": str(exc)}
+
+        self._store.update(record)
+        log.append(done, final=True)
+        with self._cond:
+            self._finished += 1
+            if record.status == TaskStatus.FAILED:
+                self._failed += 1
+            self._trim_logs()
+
+    def _trim_logs(self) -> None:
+        """Drop the oldest finished logs beyond ``log_retention`` (holds ``_cond``)."""
+        excess = len(self._logs) - self._log_retention
+        if excess <= 0:
+            return
+        for task_id in [t for t, lg in self._logs.items() if lg.closed][:excess]:
+            del self._logs[task_id]
+
+    # ------------------------------------------------------------------
+    # Introspection
+    # ------------------------------------------------------------------
+
+    def event_log(self, task_id: str) -> Optional[JobEventLog]:
+        """Return the job's event log, or None if unknown or expired."""
+        with self._cond:
+            return self._logs.get(task_id)
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth, pool utilisation and lifetime counters."""
+        with self._cond:
+            return {
+                "workers": self._workers,
+                "queued": self._queued,
+                "running": self._running,
+                "tenants_waiting": len(self._tenants),
+                "submitted": self._submitted,
+                "finished": self._finished,
+                "failed": self._failed,
+            }
+
+
+# Module-level singleton shared across all route handlers
+_queue: Optional[JobQueue] = None
+_queue_lock = threading.Lock()
+
+
+def get_job_queue() -> JobQueue:
+    """Return the module-level JobQueue singleton (created on first use)."""
+    global _queue
+    with _queue_lock:
+        if _queue is None:
+            _queue = JobQueue()
+        return _queue
+
+
+__all__ = [
+    "JobEventLog",
+    "JobQueue",
+    "build_orchestrator",
+    "get_job_queue",
+    "result_to_record",
+]
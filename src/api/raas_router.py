@@ -3,7 +3,8 @@ RaaS API — /v1/ route handlers: tasks, agents, SSE streaming.
 
 Mounts onto the existing gateway FastAPI app via include_router().
 All routes require Bearer auth resolved by raas_auth_middleware.require_tenant.
-Wires directly to RecipeOrchestrator and AGENT_REGISTRY — no mocks.
+Tasks run on the raas_job_queue worker pool (RecipeOrchestrator); agents
+are wired directly to AGENT_REGISTRY — no mocks.
 """
 
 from __future__ import annotations
@@ -20,64 +21,18 @@ from src.api.raas_task_models import (
     AgentInfo,
     AgentRunRequest,
     AgentRunResponse,
-    StepDetail,
     TaskRequest,
     TaskResponse,
-    TaskStatus,
     TaskStatusResponse,
 )
-from src.api.raas_task_store import TaskRecord, get_task_store
+from src.api.raas_job_queue import FINAL_EVENT_TYPES, get_job_queue
+from src.api.raas_task_store import get_task_store
 from src.raas.auth import TenantContext
 
 router = APIRouter(prefix="/v1", tags=["RaaS v1"])
 
-
-# ---------------------------------------------------------------------------
-# Helpers
-# ---------------------------------------------------------------------------
-
-
-def _build_orchestrator() -> Any:
-    """Create a RecipeOrchestrator wired to the LLM client."""
-    from src.core.llm_client import get_client
-    from src.core.orchestrator import RecipeOrchestrator
-
-    client = get_client()
-    return RecipeOrchestrator(
-        llm_client=client if client.is_available else None,
-        strict_verification=True,
-        enable_rollback=True,
-    )
-
-
-def _result_to_record(record: TaskRecord, result: Any) -> TaskRecord:
-    """Populate a TaskRecord from an OrchestrationResult in-place."""
-    from src.core.orchestrator import OrchestrationStatus
-
-    status_map = {
-        OrchestrationStatus.SUCCESS: TaskStatus.SUCCESS,
-        OrchestrationStatus.FAILED: TaskStatus.FAILED,
-        OrchestrationStatus.PARTIAL: TaskStatus.PARTIAL,
-        OrchestrationStatus.ROLLED_BACK: TaskStatus.ROLLED_BACK,
-    }
-    record.status = status_map.get(result.status, TaskStatus.FAILED)
-    record.total_steps = result.total_steps
-    record.completed_steps = result.completed_steps
-    record.failed_steps = result.failed_steps
-    record.success_rate = result.success_rate
-    record.errors = result.errors
-    record.warnings = result.warnings
-    record.steps = [
-        StepDetail(
-            order=sr.step.order,
-            title=sr.step.title,
-            passed=sr.verification.passed,
-            exit_code=sr.execution.exit_code,
-            summary=sr.verification.summary,
-        )
-        for sr in result.step_results
-    ]
-    return record
+# Seconds of silence before an SSE comment keeps proxies from closing the stream
+_KEEPALIVE_SECS = 15.0
 
 
 # ---------------------------------------------------------------------------
@@ -85,16 +40,20 @@ def _result_to_record(record: TaskRecord, result: Any) -> TaskRecord:
 # ---------------------------------------------------------------------------
 
 
+def _sse(event: Dict[str, Any]) -> str:
+    return f"data: {json.dumps(event)}\n\n"
+
+
 @router.post("/tasks", response_model=TaskResponse, status_code=202)
-def submit_task(
+async def submit_task(
     body: TaskRequest,
     tenant: TenantContext = Depends(require_tenant),
 ) -> TaskResponse:
-    """Submit a goal for execution and return a task_id for polling.
+    """Queue a goal for execution and return a task_id for polling.
 
-    Runs the orchestrator synchronously in the same thread (suitable for
-    short goals). For long-running goals, callers should poll GET /v1/tasks/{id}
-    or stream via GET /v1/tasks/{id}/stream.
+    The task is persisted as PENDING and handed to the job queue; the
+    response is sent immediately. Callers poll GET /v1/tasks/{id} or
+    stream via GET /v1/tasks/{id}/stream.
 
     Args:
         body: Task submission payload.
@@ -103,22 +62,9 @@ def submit_task(
     Returns:
         :class:`TaskResponse` with task_id and initial status.
     """
-    store = get_task_store()
-    record = store.create(goal=body.goal, tenant_id=tenant.tenant_id)
-
-    try:
-        record.status = TaskStatus.RUNNING
-        store.update(record)
-
-        orchestrator = _build_orchestrator()
-        result = orchestrator.run_from_goal(body.goal)
-        record = _result_to_record(record, result)
-
-    except Exception as exc:
-        record.status = TaskStatus.FAILED
-        record.errors.append(str(exc))
-
-    store.update(record)
+    queue = get_job_queue()
+    record = get_task_store().create(goal=body.goal, tenant_id=tenant.tenant_id)
+    queue.submit(record, loop=asyncio.get_running_loop())
     return TaskResponse(
         task_id=record.task_id,
         status=record.status,
@@ -170,8 +116,10 @@ async def stream_task(
 ) -> StreamingResponse:
     """Stream task execution progress as Server-Sent Events (SSE).
 
-    Runs the orchestrator in a background thread and yields step events
-    as they complete. Clients connect with ``Accept: text/event-stream``.
+    Attaches to the queued/running job's event log: events emitted before
+    the client connected are replayed, then live step and token events
+    follow until the final ``complete`` / ``error`` event. The goal is
+    never executed a second time.
 
     Args:
         task_id: Identifier returned by POST /v1/tasks.
@@ -187,58 +135,39 @@ async def stream_task(
     record = store.get(task_id=task_id, tenant_id=tenant.tenant_id)
     if record is None:
         raise HTTPException(status_code=404, detail=f"Task '{task_id}' not found.")
+    log = get_job_queue().event_log(task_id)
 
     async def _event_stream() -> AsyncGenerator[str, None]:
-        queue: asyncio.Queue[Dict] = asyncio.Queue()
-        loop = asyncio.get_running_loop()
-
-        def _on_step(step_result: Any, current: Any) -> None:
-            event = {
-                "type": "step",
-                "order": step_result.step.order,
-                "title": step_result.step.title,
-                "passed": step_result.verification.passed,
-                "exit_code": step_result.execution.exit_code,
-                "summary": step_result.verification.summary,
-                "completed": current.completed_steps,
-                "total": current.total_steps,
-            }
-            asyncio.run_coroutine_threadsafe(queue.put(event), loop)
-
-        def _run() -> Any:
-            orch = _build_orchestrator()
-            return orch.run_from_goal(record.goal, progress_callback=_on_step)
-
-        future = loop.run_in_executor(None, _run)
-
-        # Drain step events until execution finishes
-        while not future.done():
-            try:
-                event = await asyncio.wait_for(queue.get(), timeout=0.5)
-                yield f"data: {json.dumps(event)}\n\n"
-            except asyncio.TimeoutError:
-                continue
-
-        # Flush remaining queued events
-        while not queue.empty():
-            event = queue.get_nowait()
-            yield f"data: {json.dumps(event)}\n\n"
-
-        # Emit final completion event
+        if log is None:
+            # Log expired (or task predates this process): report the snapshot
+            if record.is_terminal:
+                yield _sse({
+                    "type": "complete",
+                    "status": record.status.value,
+                    "success_rate": record.success_rate,
+                    "errors": record.errors,
+                })
+            else:
+                yield _sse({"type": "status", "status": record.status.value})
+            return
+
+        backlog, queue = log.subscribe(asyncio.get_running_loop())
         try:
-            result = future.result()
-            record_updated = _result_to_record(record, result)
-            store.update(record_updated)
-            done_event = {
-                "type": "complete",
-                "status": record_updated.status.value,
-                "success_rate": record_updated.success_rate,
-                "errors": record_updated.errors,
-            }
-        except Exception as exc:
-            done_event = {"type": "error", "message": str(exc)}
-
-        yield f"data: {json.dumps(done_event)}\n\n"
+            for event in backlog:
+                yield _sse(event)
+            if queue is None:
+                return
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=_KEEPALIVE_SECS)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                yield _sse(event)
+                if event.get("type") in FINAL_EVENT_TYPES:
+                    return
+        finally:
+            log.unsubscribe(queue)
 
     return StreamingResponse(
         _event_stream(),
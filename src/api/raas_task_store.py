@@ -1,19 +1,51 @@
 """
-RaaS API — In-memory task store: persists running/completed task state by task_id.
+RaaS API — Durable task store: persists running/completed task state by task_id.
 
-Provides TaskStore singleton used by raas_router.py to create, update, and
-retrieve task records so GET /v1/tasks/{id} can poll status after submission.
+Provides TaskStore singleton used by raas_router.py and the job queue to
+create, update, and retrieve task records so GET /v1/tasks/{id} can poll
+status after submission. Records are written through to SQLite (WAL) and
+survive restarts; a bounded LRU cache keeps hot records in memory, and
+finished records are dropped after a TTL or once the store exceeds its cap.
+Unfinished records carry an owner lease so several gateway processes can
+share one database without running the same task twice.
 """
 
 from __future__ import annotations
 
+import json
+import sqlite3
 import threading
+import time
 import uuid
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from pathlib import Path
+from typing import List, Optional
 
 from src.api.raas_task_models import StepDetail, TaskStatus
 
+DB_PATH = Path.home() / ".mekong" / "raas" / "tasks.db"
+
+# Statuses after which a record never changes again
+TERMINAL_STATUSES = frozenset({
+    TaskStatus.SUCCESS, TaskStatus.FAILED, TaskStatus.PARTIAL, TaskStatus.ROLLED_BACK,
+})
+
+_DDL = """
+CREATE TABLE IF NOT EXISTS raas_tasks (
+    task_id     TEXT PRIMARY KEY,
+    tenant_id   TEXT NOT NULL,
+    status      TEXT NOT NULL,
+    created_at  REAL NOT NULL,
+    updated_at  REAL NOT NULL,
+    data        TEXT NOT NULL,
+    owner       TEXT,
+    lease_expires_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_raas_tasks_status ON raas_tasks (status, created_at);
+CREATE INDEX IF NOT EXISTS idx_raas_tasks_updated ON raas_tasks (updated_at);
+"""
+
 
 @dataclass
 class TaskRecord:
@@ -30,18 +62,119 @@ class TaskRecord:
     errors: List[str] = field(default_factory=list)
     warnings: List[str] = field(default_factory=list)
     steps: List[StepDetail] = field(default_factory=list)
+    created_at: float = field(default_factory=time.time)
+    updated_at: float = field(default_factory=time.time)
+
+    @property
+    def is_terminal(self) -> bool:
+        """True once the task has finished (successfully or not)."""
+        return self.status in TERMINAL_STATUSES
+
+    def to_json(self) -> str:
+        """Serialise the mutable result fields for the ``data`` column."""
+        return json.dumps({
+            "goal": self.goal,
+            "total_steps": self.total_steps,
+            "completed_steps": self.completed_steps,
+            "failed_steps": self.failed_steps,
+            "success_rate": self.success_rate,
+            "errors": self.errors,
+            "warnings": self.warnings,
+            "steps": [s.model_dump() for s in self.steps],
+        })
+
+    @classmethod
+    def from_row(cls, row: sqlite3.Row) -> "TaskRecord":
+        """Rebuild a record from a ``raas_tasks`` row."""
+        data = json.loads(row["data"])
+        return cls(
+            task_id=row["task_id"],
+            goal=data["goal"],
+            tenant_id=row["tenant_id"],
+            status=TaskStatus(row["status"]),
+            total_steps=data["total_steps"],
+            completed_steps=data["completed_steps"],
+            failed_steps=data["failed_steps"],
+            success_rate=data["success_rate"],
+            errors=data["errors"],
+            warnings=data["warnings"],
+            steps=[StepDetail(**s) for s in data["steps"]],
+            created_at=row["created_at"],
+            updated_at=row["updated_at"],
+        )
 
 
 class TaskStore:
-    """Thread-safe in-memory store for RaaS task records.
+    """Thread-safe, SQLite-backed store for RaaS task records.
+
+    Uses one WAL connection guarded by an RLock so concurrent requests and
+    job workers don't corrupt state, plus an LRU cache of recent records.
 
-    Uses a simple dict + RLock so concurrent requests from the same
-    or different tenants don't corrupt state.
+    Args:
+        db_path: SQLite file location (``None`` keeps everything in memory).
+        cache_size: Max records held in the in-memory LRU cache.
+        max_records: Cap on stored records; oldest finished ones are pruned.
+        ttl_seconds: Finished records older than this are pruned.
     """
 
-    def __init__(self) -> None:
-        self._records: Dict[str, TaskRecord] = {}
+    def __init__(
+        self,
+        db_path: Optional[Path] = DB_PATH,
+        cache_size: int = 1000,
+        max_records: int = 50_000,
+        ttl_seconds: float = 7 * 86400,
+    ) -> None:
+        self._cache: OrderedDict[str, TaskRecord] = OrderedDict()
+        self._cache_size = cache_size
+        self._max_records = max_records
+        self._ttl = ttl_seconds
         self._lock = threading.RLock()
+        self._writes = 0
+        target = ":memory:"
+        if db_path is not None:
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+            target = str(db_path)
+        try:
+            self._conn = sqlite3.connect(target, timeout=10, check_same_thread=False)
+            self._conn.row_factory = sqlite3.Row
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_DDL)
+            # Migration: lease columns for databases created before them
+            for column in ("owner TEXT", "lease_expires_at REAL"):
+                try:
+                    self._conn.execute(f"ALTER TABLE raas_tasks ADD COLUMN {column}")
+                except sqlite3.OperationalError:
+                    pass  # Column already exists
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_raas_tasks_owner ON raas_tasks (owner)"
+            )
+        except sqlite3.Error as exc:
+            raise RuntimeError(f"Failed to initialise task store DB: {exc}") from exc
+
+    def _remember(self, record: TaskRecord) -> None:
+        self._cache[record.task_id] = record
+        self._cache.move_to_end(record.task_id)
+        while len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+
+    def _write(self, record: TaskRecord) -> None:
+        record.updated_at = time.time()
+        with self._conn:
+            self._conn.execute(
+                "INSERT INTO raas_tasks (task_id, tenant_id, status, created_at, updated_at, data) "
+                "VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (task_id) DO UPDATE SET status = excluded.status, "
+                "updated_at = excluded.updated_at, data = excluded.data",
+                (
+                    record.task_id, record.tenant_id, record.status.value,
+                    record.created_at, record.updated_at, record.to_json(),
+                ),
+            )
+        self._remember(record)
+        self._writes += 1
+        if self._writes % 500 == 0:
+            self.prune()
 
     def create(self, goal: str, tenant_id: str) -> TaskRecord:
         """Create and persist a new PENDING task record.
@@ -56,7 +189,7 @@ class TaskStore:
         task_id = uuid.uuid4().hex
         record = TaskRecord(task_id=task_id, goal=goal, tenant_id=tenant_id)
         with self._lock:
-            self._records[task_id] = record
+            self._write(record)
         return record
 
     def get(self, task_id: str, tenant_id: str) -> Optional[TaskRecord]:
@@ -70,7 +203,14 @@ class TaskStore:
             :class:`TaskRecord` or ``None`` if not found / tenant mismatch.
         """
         with self._lock:
-            record = self._records.get(task_id)
+            record = self._cache.get(task_id)
+            if record is None:
+                row = self._conn.execute(
+                    "SELECT * FROM raas_tasks WHERE task_id = ?", (task_id,),
+                ).fetchone()
+                if row is not None:
+                    record = TaskRecord.from_row(row)
+                    self._remember(record)
         if record is None or record.tenant_id != tenant_id:
             return None
         return record
@@ -82,16 +222,115 @@ class TaskStore:
             record: Modified record to save back to the store.
         """
         with self._lock:
-            self._records[record.task_id] = record
+            self._write(record)
+
+    def reclaimable(self, owner: str, unowned_before: float, now: Optional[float] = None) -> List[TaskRecord]:
+        """Return PENDING/RUNNING records nobody holds a live lease on, oldest first.
+
+        Args:
+            owner: Caller's owner id; its own records are never returned.
+            unowned_before: Records that were never claimed only count once
+                created before this time (the submitter is about to claim them).
+            now: Current time, for lease expiry.
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM raas_tasks WHERE status IN (?, ?) AND ("
+                "(owner IS NULL AND created_at < ?) OR (owner != ? AND lease_expires_at < ?)"
+                ") ORDER BY created_at",
+                (TaskStatus.PENDING.value, TaskStatus.RUNNING.value, unowned_before, owner, now),
+            ).fetchall()
+        return [TaskRecord.from_row(row) for row in rows]
+
+    def claim(
+        self,
+        task_id: str,
+        owner: str,
+        lease_seconds: float,
+        unowned_before: Optional[float] = None,
+        now: Optional[float] = None,
+    ) -> bool:
+        """Atomically take (or renew) the lease on an unfinished record.
+
+        Succeeds when ``owner`` already holds the lease, the current lease has
+        expired, or the record was never claimed (and, when ``unowned_before``
+        is given, was created before it).
+
+        Returns:
+            True if ``owner`` now holds the lease.
+        """
+        now = time.time() if now is None else now
+        unowned = "owner IS NULL" if unowned_before is None else "(owner IS NULL AND created_at < ?)"
+        params: tuple = () if unowned_before is None else (unowned_before,)
+        with self._lock, self._conn:
+            claimed = self._conn.execute(
+                "UPDATE raas_tasks SET owner = ?, lease_expires_at = ? "
+                "WHERE task_id = ? AND status IN (?, ?) "
+                f"AND (owner = ? OR lease_expires_at < ? OR {unowned})",
+                (
+                    owner, now + lease_seconds, task_id,
+                    TaskStatus.PENDING.value, TaskStatus.RUNNING.value, owner, now, *params,
+                ),
+            ).rowcount
+        return claimed == 1
+
+    def renew(self, owner: str, lease_seconds: float, now: Optional[float] = None) -> int:
+        """Extend every unfinished lease held by ``owner`` (the worker heartbeat).
+
+        Returns:
+            Number of leases renewed.
+        """
+        now = time.time() if now is None else now
+        with self._lock, self._conn:
+            return self._conn.execute(
+                "UPDATE raas_tasks SET lease_expires_at = ? WHERE owner = ? AND status IN (?, ?)",
+                (now + lease_seconds, owner, TaskStatus.PENDING.value, TaskStatus.RUNNING.value),
+            ).rowcount
+
+    def prune(self, now: Optional[float] = None) -> int:
+        """Drop finished records past the TTL or beyond ``max_records``.
+
+        Returns:
+            Number of records deleted.
+        """
+        now = time.time() if now is None else now
+        terminal = tuple(s.value for s in TERMINAL_STATUSES)
+        marks = ",".join("?" * len(terminal))
+        with self._lock, self._conn:
+            removed = self._conn.execute(
+                f"DELETE FROM raas_tasks WHERE status IN ({marks}) AND updated_at < ?",
+                (*terminal, now - self._ttl),
+            ).rowcount
+            excess = self._conn.execute("SELECT COUNT(*) FROM raas_tasks").fetchone()[0] - self._max_records
+            if excess > 0:
+                removed += self._conn.execute(
+                    f"DELETE FROM raas_tasks WHERE task_id IN ("
+                    f"SELECT task_id FROM raas_tasks WHERE status IN ({marks}) "
+                    f"ORDER BY updated_at LIMIT ?)",
+                    (*terminal, excess),
+                ).rowcount
+            if removed:
+                self._cache.clear()  # Cheaper than working out which entries went
+        return removed
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM raas_tasks").fetchone()[0]
 
 
 # Module-level singleton shared across all route handlers
-_store = TaskStore()
+_store: Optional[TaskStore] = None
+_store_lock = threading.Lock()
 
 
 def get_task_store() -> TaskStore:
-    """Return the module-level TaskStore singleton."""
-    return _store
+    """Return the module-level TaskStore singleton (created on first use)."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = TaskStore()
+        return _store
 
 
-__all__ = ["TaskRecord", "TaskStore", "get_task_store"]
+__all__ = ["TaskRecord", "TaskStore", "get_task_store", "TERMINAL_STATUSES"]
@@ -62,7 +62,11 @@ from src.auth.rate_limiter import (
     RateLimitConfig,
     RateLimitExceeded,
     TokenBucket,
+    RateDecision,
+    RateStorageBackend,
     InMemoryRateStorage,
+    ShardedRateStorage,
+    RedisRateStorage,
     get_rate_limiter,
     init_rate_limiter,
     DEFAULT_RATE_LIMITS,
@@ -138,7 +142,11 @@ __all__ = [
     "RateLimitConfig",
     "RateLimitExceeded",
     "TokenBucket",
+    "RateDecision",
+    "RateStorageBackend",
     "InMemoryRateStorage",
+    "ShardedRateStorage",
+    "RedisRateStorage",
     "get_rate_limiter",
     "init_rate_limiter",
     "DEFAULT_RATE_LIMITS",
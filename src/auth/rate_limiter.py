@@ -2,12 +2,23 @@
 Rate Limiter - Token bucket algorithm for per-IP rate limiting
 
 Provides thread-safe rate limiting with configurable limits per endpoint.
+
+Storage backends:
+- ShardedRateStorage (default): GCRA state (one timestamp per key) in
+  hash-sharded dicts with independent locks and background eviction
+- RedisRateStorage: the same GCRA as a Lua script on a Redis-compatible
+  server, for limits shared across processes (MEKONG_RATE_LIMIT_REDIS_URL)
+- InMemoryRateStorage: per-key TokenBucket objects behind a global lock
 """
 
 import asyncio
+import os
+import threading
 import time
+import weakref
+from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Dict, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from enum import Enum
 
 
@@ -167,7 +178,101 @@ class BucketEntry:
     key: str = ""
 
 
-class InMemoryRateStorage:
+@dataclass
+class RateDecision:
+    """Outcome of a rate limit check.
+
+    Attributes:
+        allowed: True if the tokens were (or could be) consumed
+        remaining: Whole tokens left after this check
+        retry_after: Seconds until the request would be allowed (0 if allowed)
+        reset_after: Seconds until the bucket is full again
+    """
+    allowed: bool
+    remaining: int
+    retry_after: float = 0.0
+    reset_after: float = 0.0
+
+
+def gcra_update(
+    tat: float,
+    now: float,
+    interval: float,
+    burst: float,
+    increment: float,
+) -> Tuple[bool, float, float]:
+    """One step of the generic cell rate algorithm (GCRA).
+
+    GCRA is a token bucket stored as a single "theoretical arrival time":
+    the bucket is full when ``tat <= now`` and empty when
+    ``tat >= now + burst``.
+
+    Args:
+        tat: Stored theoretical arrival time (``now`` for an unknown key)
+        now: Current time
+        interval: Seconds per token (window / limit)
+        burst: Burst tolerance in seconds (interval * limit)
+        increment: interval * tokens to consume (0 to only inspect)
+
+    Returns:
+        Tuple of (allowed, tat after this step, retry_after seconds)
+    """
+    tat = max(tat, now)
+    new_tat = tat + increment
+    allow_at = new_tat - burst
+    if now < allow_at:
+        return False, tat, allow_at - now
+    return True, new_tat, 0.0
+
+
+def _gcra_decision(
+    config: RateLimitConfig,
+    tat_offset: float,
+    allowed: bool,
+    retry_after: float,
+) -> RateDecision:
+    """Build a RateDecision from ``tat - now`` after a GCRA step."""
+    tat_offset = max(tat_offset, 0.0)
+    interval = config.window / config.limit
+    remaining = int((config.window - tat_offset) / interval + 1e-9)
+    return RateDecision(
+        allowed=allowed,
+        remaining=max(0, min(config.limit, remaining)),
+        retry_after=retry_after,
+        reset_after=tat_offset,
+    )
+
+
+class RateStorageBackend(ABC):
+    """Abstract base class for rate limit state storage."""
+
+    @abstractmethod
+    async def acquire(self, key: str, config: RateLimitConfig, tokens: float = 1) -> RateDecision:
+        """Consume ``tokens`` for ``key`` if allowed."""
+        pass
+
+    @abstractmethod
+    async def peek(self, key: str, config: RateLimitConfig) -> RateDecision:
+        """Inspect ``key`` without consuming."""
+        pass
+
+    @abstractmethod
+    async def cleanup(self, max_age: Optional[float] = None) -> int:
+        """Remove stale entries. Returns number removed."""
+        pass
+
+    @abstractmethod
+    async def get_stats(self) -> Dict:
+        """Get storage statistics."""
+        pass
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """Clear all stored state."""
+        pass
+
+
+class InMemoryRateStorage(RateStorageBackend):
     """Thread-safe in-memory storage for per-key rate limiting.
 
     Features:
@@ -222,6 +327,44 @@ class InMemoryRateStorage:
                 entry.last_access = time.time()
             return entry.bucket
 
+    async def acquire(self, key: str, config: RateLimitConfig, tokens: float = 1) -> RateDecision:
+        """Consume tokens from the key's bucket.
+
+        Args:
+            key: Unique identifier (e.g., "ip:endpoint")
+            config: Rate limit configuration for new buckets
+            tokens: Number of tokens to consume
+
+        Returns:
+            RateDecision for this request
+        """
+        bucket = await self.get_bucket(key, config)
+        allowed = await bucket.consume(tokens)
+        retry_after = 0.0 if allowed else await bucket.wait_time(tokens)
+        return RateDecision(
+            allowed=allowed,
+            remaining=max(0, bucket.remaining),
+            retry_after=retry_after,
+            reset_after=(bucket.capacity - bucket.tokens) / bucket.refill_rate,
+        )
+
+    async def peek(self, key: str, config: RateLimitConfig) -> RateDecision:
+        """Inspect the key's bucket without consuming.
+
+        Args:
+            key: Unique identifier
+            config: Rate limit configuration for new buckets
+
+        Returns:
+            RateDecision with allowed=True
+        """
+        bucket = await self.get_bucket(key, config)
+        return RateDecision(
+            allowed=True,
+            remaining=max(0, bucket.remaining),
+            reset_after=max(0.0, (bucket.capacity - bucket.tokens) / bucket.refill_rate),
+        )
+
     async def cleanup(self, max_age: Optional[float] = None) -> int:
         """Remove stale bucket entries.
 
@@ -265,6 +408,276 @@ class InMemoryRateStorage:
             self._buckets.clear()
 
 
+class ShardedRateStorage(RateStorageBackend):
+    """In-memory GCRA storage sharded by key hash.
+
+    Each key's state is a single theoretical arrival time (float), so there
+    is no per-bucket object or lock. Keys hash to one of ``shards`` dicts,
+    each guarded by its own short, non-async lock; a check never awaits
+    and never touches other shards.
+
+    A key whose bucket has been full for ``ttl_seconds`` is indistinguishable
+    from an unseen key, so evicting it loses nothing. A daemon thread sweeps
+    one shard every ``evict_interval / shards`` seconds, so no sweep blocks
+    more than one shard at a time.
+
+    Attributes:
+        shards: Number of independent shards
+        ttl_seconds: Seconds a bucket stays full before it is evicted
+        evict_interval: Seconds to sweep all shards once (0 disables)
+
+    Example:
+        >>> storage = ShardedRateStorage(shards=32)
+        >>> decision = await storage.acquire("192.168.1.1:/auth/login", config)
+        >>> decision.allowed, decision.remaining
+        (True, 4)
+    """
+
+    def __init__(
+        self,
+        shards: int = 16,
+        ttl_seconds: float = 60,
+        evict_interval: float = 30,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize sharded storage.
+
+        Args:
+            shards: Number of independent shards
+            ttl_seconds: Seconds a bucket stays full before eviction
+            evict_interval: Seconds to sweep all shards once (0 disables)
+            clock: Monotonic time source (for testing)
+        """
+        if shards < 1:
+            raise ValueError("shards must be >= 1")
+        self._shards: List[Dict[str, float]] = [{} for _ in range(shards)]
+        self._locks = [threading.Lock() for _ in range(shards)]
+        self._ttl_seconds = ttl_seconds
+        self._evict_interval = evict_interval
+        self._clock = clock
+        self._next_shard = 0
+        self._evicted = 0
+        self._evictor: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def _update(self, key: str, config: RateLimitConfig, tokens: float) -> RateDecision:
+        interval = config.window / config.limit
+        index = hash(key) % len(self._shards)
+        with self._locks[index]:
+            now = self._clock()
+            shard = self._shards[index]
+            allowed, tat, retry_after = gcra_update(
+                shard.get(key, now), now, interval, config.window, interval * tokens,
+            )
+            if allowed and tokens:
+                shard[key] = tat
+        if self._evictor is None and self._evict_interval > 0:
+            self._start_evictor()
+        return _gcra_decision(config, tat - now, allowed, retry_after)
+
+    async def acquire(self, key: str, config: RateLimitConfig, tokens: float = 1) -> RateDecision:
+        """Consume tokens for a key.
+
+        Args:
+            key: Unique identifier (e.g., "ip:endpoint")
+            config: Rate limit configuration
+            tokens: Number of tokens to consume
+
+        Returns:
+            RateDecision for this request
+        """
+        return self._update(key, config, tokens)
+
+    async def peek(self, key: str, config: RateLimitConfig) -> RateDecision:
+        """Inspect a key without consuming.
+
+        Args:
+            key: Unique identifier
+            config: Rate limit configuration
+
+        Returns:
+            RateDecision with allowed=True
+        """
+        return self._update(key, config, 0)
+
+    def _evict_shard(self, index: int, max_age: float) -> int:
+        with self._locks[index]:
+            cutoff = self._clock() - max_age
+            shard = self._shards[index]
+            stale = [key for key, tat in shard.items() if tat < cutoff]
+            for key in stale:
+                del shard[key]
+            self._evicted += len(stale)
+        return len(stale)
+
+    def evict_step(self) -> int:
+        """Sweep the next shard for buckets full longer than the TTL.
+
+        Returns:
+            Number of entries removed
+        """
+        index = self._next_shard
+        self._next_shard = (index + 1) % len(self._shards)
+        return self._evict_shard(index, self._ttl_seconds)
+
+    def _start_evictor(self) -> None:
+        with self._locks[0]:
+            if self._evictor is not None:
+                return
+            self._evictor = threading.Thread(
+                target=_evict_loop,
+                args=(weakref.ref(self), self._stop, self._evict_interval / len(self._shards)),
+                name="rate-limit-evictor",
+                daemon=True,
+            )
+        self._evictor.start()
+
+    def close(self) -> None:
+        """Stop the background eviction thread."""
+        self._stop.set()
+        if self._evictor is not None:
+            self._evictor.join(timeout=1)
+
+    async def cleanup(self, max_age: Optional[float] = None) -> int:
+        """Sweep every shard now, one shard lock at a time.
+
+        Args:
+            max_age: Override TTL for this cleanup (default: use configured TTL)
+
+        Returns:
+            Number of entries removed
+        """
+        ttl = max_age if max_age is not None else self._ttl_seconds
+        return sum(self._evict_shard(index, ttl) for index in range(len(self._shards)))
+
+    async def get_stats(self) -> Dict:
+        """Get storage statistics.
+
+        Returns:
+            Dict with active_buckets, shards, largest_shard, evicted_total
+        """
+        sizes = []
+        for lock, shard in zip(self._locks, self._shards):
+            with lock:
+                sizes.append(len(shard))
+        return {
+            "active_buckets": sum(sizes),
+            "shards": len(sizes),
+            "largest_shard": max(sizes),
+            "evicted_total": self._evicted,
+        }
+
+    async def clear(self) -> None:
+        """Clear all stored state."""
+        for lock, shard in zip(self._locks, self._shards):
+            with lock:
+                shard.clear()
+
+
+def _evict_loop(ref: "weakref.ref[ShardedRateStorage]", stop: threading.Event, step: float) -> None:
+    # Holds only a weak reference so an unused storage can still be collected
+    while not stop.wait(step):
+        storage = ref()
+        if storage is None:
+            return
+        storage.evict_step()
+        del storage
+
+
+# KEYS[1] = bucket key
+# ARGV = interval, burst, increment (all seconds)
+# Returns {allowed, retry_after, tat - now}; floats as strings since Redis
+# truncates Lua numbers to integers
+GCRA_LUA = """
+if redis.replicate_commands then redis.replicate_commands() end
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local interval = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local increment = tonumber(ARGV[3])
+local tat = tonumber(redis.call('GET', KEYS[1])) or now
+if tat < now then tat = now end
+local new_tat = tat + increment
+local allow_at = new_tat - burst
+if now < allow_at then
+    return {0, tostring(allow_at - now), tostring(tat - now)}
+end
+if increment > 0 then
+    redis.call('SET', KEYS[1], tostring(new_tat), 'PX', math.ceil((new_tat - now) * 1000))
+end
+return {1, '0', tostring(new_tat - now)}
+"""
+
+
+class RedisRateStorage(RateStorageBackend):
+    """GCRA storage on a Redis-compatible server.
+
+    The whole check runs as one Lua script using the server clock, so
+    limits are exact across processes and hosts. Keys expire when their
+    bucket is full again, so no cleanup pass is needed.
+
+    Args:
+        client: ``redis.asyncio`` client, or anything with the same
+            ``register_script`` / ``scan_iter`` / ``delete`` methods
+        prefix: Key prefix for rate limit state
+
+    Example:
+        >>> storage = RedisRateStorage.from_url("redis://localhost:6379/0")
+        >>> limiter = RateLimiter(storage=storage)
+    """
+
+    def __init__(self, client: Any, prefix: str = "mekong:ratelimit:"):
+        self._client = client
+        self._prefix = prefix
+        self._script = client.register_script(GCRA_LUA)
+
+    @classmethod
+    def from_url(cls, url: str, prefix: str = "mekong:ratelimit:") -> "RedisRateStorage":
+        """Connect with ``redis.asyncio`` (requires the redis package)."""
+        try:
+            import redis.asyncio as redis_asyncio
+        except ImportError as e:
+            raise RuntimeError("RedisRateStorage requires redis: pip install redis") from e
+        return cls(redis_asyncio.from_url(url), prefix=prefix)
+
+    async def _run(self, key: str, config: RateLimitConfig, tokens: float) -> RateDecision:
+        interval = config.window / config.limit
+        allowed, retry_after, tat_offset = await self._script(
+            keys=[self._prefix + key],
+            args=[repr(interval), repr(float(config.window)), repr(interval * tokens)],
+        )
+        return _gcra_decision(config, float(tat_offset), bool(int(allowed)), float(retry_after))
+
+    async def acquire(self, key: str, config: RateLimitConfig, tokens: float = 1) -> RateDecision:
+        """Consume tokens for a key atomically on the server."""
+        return await self._run(key, config, tokens)
+
+    async def peek(self, key: str, config: RateLimitConfig) -> RateDecision:
+        """Inspect a key without consuming."""
+        return await self._run(key, config, 0)
+
+    async def _keys(self) -> List[Any]:
+        return [key async for key in self._client.scan_iter(match=self._prefix + "*")]
+
+    async def cleanup(self, max_age: Optional[float] = None) -> int:
+        """No-op: keys expire on the server once their bucket is full."""
+        return 0
+
+    async def get_stats(self) -> Dict:
+        """Get storage statistics.
+
+        Returns:
+            Dict with active_buckets and backend
+        """
+        return {"active_buckets": len(await self._keys()), "backend": "redis"}
+
+    async def clear(self) -> None:
+        """Delete all rate limit keys under the prefix."""
+        keys = await self._keys()
+        if keys:
+            await self._client.delete(*keys)
+
+
 class RateLimiter:
     """Global rate limiter manager with per-key tracking.
 
@@ -275,7 +688,7 @@ class RateLimiter:
     - Configurable presets
 
     Attributes:
-        storage: InMemoryRateStorage instance
+        storage: RateStorageBackend instance
         presets: Dict of rate limit presets
 
     Example:
@@ -288,13 +701,13 @@ class RateLimiter:
         ...     raise RateLimitExceeded(headers=headers)
     """
 
-    def __init__(self, storage: Optional[InMemoryRateStorage] = None):
+    def __init__(self, storage: Optional[RateStorageBackend] = None):
         """Initialize rate limiter.
 
         Args:
-            storage: Optional custom storage (default: create new InMemoryRateStorage)
+            storage: Optional custom storage (default: create new ShardedRateStorage)
         """
-        self._storage = storage or InMemoryRateStorage()
+        self._storage = storage or ShardedRateStorage()
         self._presets = DEFAULT_RATE_LIMITS.copy()
 
     async def check_limit(
@@ -316,22 +729,19 @@ class RateLimiter:
             - headers: X-RateLimit-* headers for response
         """
         config = self._presets.get(preset, DEFAULT_RATE_LIMITS[RateLimitPreset.API_DEFAULT])
-        bucket = await self._storage.get_bucket(key, config)
-
-        allowed = await bucket.consume(tokens)
+        decision = await self._storage.acquire(key, config, tokens)
 
         # Generate headers
         headers = {
             "X-RateLimit-Limit": str(config.limit),
-            "X-RateLimit-Remaining": str(max(0, bucket.remaining)),
+            "X-RateLimit-Remaining": str(decision.remaining),
             "X-RateLimit-Reset": str(int(time.time() + config.window)),
         }
 
-        if not allowed:
-            wait = await bucket.wait_time(tokens)
-            headers["Retry-After"] = str(int(wait) + 1)
+        if not decision.allowed:
+            headers["Retry-After"] = str(int(decision.retry_after) + 1)
 
-        return allowed, headers
+        return decision.allowed, headers
 
     async def get_remaining(self, key: str, preset: RateLimitPreset) -> int:
         """Get remaining tokens for a key without consuming.
@@ -344,8 +754,8 @@ class RateLimiter:
             Number of remaining tokens
         """
         config = self._presets.get(preset, DEFAULT_RATE_LIMITS[RateLimitPreset.API_DEFAULT])
-        bucket = await self._storage.get_bucket(key, config)
-        return bucket.remaining
+        decision = await self._storage.peek(key, config)
+        return decision.remaining
 
     async def get_reset_time(self, key: str, preset: RateLimitPreset) -> float:
         """Get reset timestamp for a key.
@@ -358,11 +768,8 @@ class RateLimiter:
             Unix timestamp when bucket will be full again
         """
         config = self._presets.get(preset, DEFAULT_RATE_LIMITS[RateLimitPreset.API_DEFAULT])
-        bucket = await self._storage.get_bucket(key, config)
-        tokens_needed = bucket.capacity - bucket.tokens
-        if tokens_needed <= 0:
-            return time.time()
-        return time.time() + (tokens_needed / config.refill_rate)
+        decision = await self._storage.peek(key, config)
+        return time.time() + decision.reset_after
 
     async def cleanup(self) -> int:
         """Remove stale rate limit entries.
@@ -448,11 +855,13 @@ def get_rate_limiter() -> RateLimiter:
     """
     global _rate_limiter
     if _rate_limiter is None:
-        _rate_limiter = RateLimiter()
+        redis_url = os.getenv("MEKONG_RATE_LIMIT_REDIS_URL")
+        storage = RedisRateStorage.from_url(redis_url) if redis_url else None
+        _rate_limiter = RateLimiter(storage=storage)
     return _rate_limiter
 
 
-async def init_rate_limiter(storage: Optional[InMemoryRateStorage] = None) -> RateLimiter:
+async def init_rate_limiter(storage: Optional[RateStorageBackend] = None) -> RateLimiter:
     """Initialize global rate limiter with custom storage.
 
     Args:
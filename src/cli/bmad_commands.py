@@ -0,0 +1,19 @@
+"""
+BMAD Commands - Importable alias for ``bmad-commands.py``
+
+The hyphenated file can't be imported by name; loading it here once lets the
+BMAD Typer app be referenced like any other command module.
+"""
+
+import importlib.util
+from pathlib import Path
+
+_spec = importlib.util.spec_from_file_location(
+    "src.cli._bmad_commands", Path(__file__).with_name("bmad-commands.py")
+)
+_module = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_module)
+
+app = _module.app
+
+__all__ = ["app"]
@@ -0,0 +1,453 @@
+"""
+Mekong CLI - Command manifest
+
+Generated by ``python -m src.cli.lazy_commands``; do not edit by hand.
+Maps each top-level command to the module that defines it.
+"""
+
+COMMAND_MANIFEST = {
+    'validate-license': {
+        'kind': 'command',
+        'module': 'src.commands.raas_validate',
+        'attr': 'validate_license',
+        'help': 'Validate RaaS license key against RaaS Gateway.',
+    },
+    'license-status': {
+        'kind': 'command',
+        'module': 'src.commands.raas_validate',
+        'attr': 'license_status',
+        'help': 'Show current RaaS license status.',
+    },
+    'init': {
+        'kind': 'register',
+        'module': 'src.cli.recipe_commands',
+        'attr': 'register_recipe_commands',
+        'help': 'Initialize Mekong CLI in current directory',
+    },
+    'version': {
+        'kind': 'register',
+        'module': 'src.cli.system_commands',
+        'attr': 'register_system_commands',
+        'help': 'Show version info + AGI subsystem health',
+    },
+    'start': {
+        'kind': 'register',
+        'module': 'src.cli.start_command',
+        'attr': 'register_start_command',
+        'help': 'Bat dau — Chon vai tro va vao dung tang.',
+    },
+    'trace': {
+        'kind': 'register',
+        'module': 'src.cli.trace_command',
+        'attr': 'register_trace_command',
+        'help': 'Hien thi lineage cua session hien tai hoac demo tree.',
+    },
+    'list': {
+        'kind': 'register',
+        'module': 'src.cli.recipe_commands',
+        'attr': 'register_recipe_commands',
+        'help': 'List available recipes',
+    },
+    'search': {
+        'kind': 'register',
+        'module': 'src.cli.recipe_commands',
+        'attr': 'register_recipe_commands',
+        'help': 'Search for recipes',
+    },
+    'run': {
+        'kind': 'register',
+        'module': 'src.cli.recipe_commands',
+        'attr': 'register_recipe_commands',
+        'help': 'Run a recipe workflow',
+    },
+    'ui': {
+        'kind': 'register',
+        'module': 'src.cli.recipe_commands',
+        'attr': 'register_recipe_commands',
+        'help': 'Open interactive terminal UI',
+    },
+    'cook': {
+        'kind': 'merge',
+        'module': 'src.commands.core_commands',
+        'attr': 'app',
+        'help': 'Cook: Plan -> Execute -> Verify workflow (Binh Phap engine)',
+    },
+    'plan': {
+        'kind': 'merge',
+        'module': 'src.commands.core_commands',
+        'attr': 'app',
+        'help': '📋 Plan: Decompose a goal into executable steps (plan only, no execution)',
+    },
+    'ask': {
+        'kind': 'merge',
+        'module': 'src.commands.core_commands',
+        'attr': 'app',
+        'help': 'Ask a question - plan-only shortcut (alias for plan)',
+    },
+    'debug': {
+        'kind': 'merge',
+        'module': 'src.commands.core_commands',
+        'attr': 'app',
+        'help': 'Debug an issue - generates a fix plan (defaults to dry-run)',
+    },
+    'gateway': {
+        'kind': 'merge',
+        'module': 'src.commands.core_commands',
+        'attr': 'app',
+        'help': '🌐 Gateway: Start the OpenClaw Hybrid Commander HTTP server',
+    },
+    'dash': {
+        'kind': 'merge',
+        'module': 'src.commands.core_commands',
+        'attr': 'app',
+        'help': '🟢 Dash: One-button action menu (The Washing Machine)',
+    },
+    'halt': {
+        'kind': 'register',
+        'module': 'src.cli.system_commands',
+        'attr': 'register_system_commands',
+        'help': '🛑 Halt: Emergency stop all autonomous operations.',
+    },
+    'evolve': {
+        'kind': 'register',
+        'module': 'src.cli.system_commands',
+        'attr': 'register_system_commands',
+        'help': '🧬 Evolve: Analyze patterns, generate recipes, deprecate bad ones.',
+    },
+    'evolve-code': {
+        'kind': 'register',
+        'module': 'src.cli.system_commands',
+        'attr': 'register_system_commands',
+        'help': '🧬 Analyze source code for self-improvement opportunities.',
+    },
+    'bmad': {
+        'kind': 'group',
+        'module': 'src.cli.bmad_commands',
+        'attr': 'app',
+        'group_help': 'BMAD workflow management',
+        'help': 'BMAD workflow management',
+    },
+    'binh-phap': {
+        'kind': 'group',
+        'module': 'src.cli.binh_phap_commands',
+        'attr': 'app',
+        'group_help': 'Binh Pháp Strategy',
+        'help': 'Binh Pháp Strategy',
+    },
+    'license': {
+        'kind': 'group',
+        'module': 'src.commands.license_commands',
+        'attr': 'app',
+        'group_help': 'License management',
+        'help': 'License management',
+    },
+    'agi': {
+        'kind': 'group',
+        'module': 'src.commands.agi',
+        'attr': 'app',
+        'group_help': 'Tom Hum AGI daemon',
+        'help': 'Tom Hum AGI daemon',
+    },
+    'status': {
+        'kind': 'group',
+        'module': 'src.commands.status',
+        'attr': 'app',
+        'group_help': 'System health',
+        'help': 'System health',
+    },
+    'config': {
+        'kind': 'group',
+        'module': 'src.commands.config',
+        'attr': 'app',
+        'group_help': 'Environment config',
+        'help': 'Environment config',
+    },
+    'doctor': {
+        'kind': 'group',
+        'module': 'src.commands.doctor',
+        'attr': 'app',
+        'group_help': 'Diagnostics',
+        'help': 'Diagnostics',
+    },
+    'clean': {
+        'kind': 'group',
+        'module': 'src.commands.clean',
+        'attr': 'app',
+        'group_help': 'Clean artifacts',
+        'help': 'Clean artifacts',
+    },
+    'test': {
+        'kind': 'group',
+        'module': 'src.commands.test',
+        'attr': 'app',
+        'group_help': 'Run tests',
+        'help': 'Run tests',
+    },
+    'build': {
+        'kind': 'group',
+        'module': 'src.commands.build',
+        'attr': 'app',
+        'group_help': 'Build project',
+        'help': 'Build project',
+    },
+    'deploy': {
+        'kind': 'group',
+        'module': 'src.commands.deploy',
+        'attr': 'app',
+        'group_help': 'Deploy',
+        'help': 'Deploy',
+    },
+    'lint': {
+        'kind': 'group',
+        'module': 'src.commands.lint',
+        'attr': 'app',
+        'group_help': 'Linting',
+        'help': 'Linting',
+    },
+    'docs': {
+        'kind': 'group',
+        'module': 'src.commands.docs',
+        'attr': 'app',
+        'group_help': 'Documentation',
+        'help': 'Documentation',
+    },
+    'monitor': {
+        'kind': 'group',
+        'module': 'src.commands.monitor',
+        'attr': 'app',
+        'group_help': 'Monitoring',
+        'help': 'Monitoring',
+    },
+    'security': {
+        'kind': 'group',
+        'module': 'src.commands.security',
+        'attr': 'app',
+        'group_help': 'Security',
+        'help': 'Security',
+    },
+    'ci': {
+        'kind': 'group',
+        'module': 'src.commands.ci',
+        'attr': 'app',
+        'group_help': 'CI/CD',
+        'help': 'CI/CD',
+    },
+    'env': {
+        'kind': 'group',
+        'module': 'src.commands.env',
+        'attr': 'app',
+        'group_help': 'Environment',
+        'help': 'Environment',
+    },
+    'test-advanced': {
+        'kind': 'group',
+        'module': 'src.commands.test_advanced',
+        'attr': 'app',
+        'group_help': 'Advanced testing',
+        'help': 'Advanced testing',
+    },
+    'swarm': {
+        'kind': 'group',
+        'module': 'src.cli.swarm_commands',
+        'attr': 'swarm_app',
+        'help': 'Swarm: distributed multi-node execution',
+    },
+    'schedule': {
+        'kind': 'group',
+        'module': 'src.cli.schedule_commands',
+        'attr': 'schedule_app',
+        'help': 'Schedule: autonomous recurring missions',
+    },
+    'memory': {
+        'kind': 'group',
+        'module': 'src.cli.memory_commands',
+        'attr': 'memory_app',
+        'help': 'Memory: execution history & learning',
+    },
+    'telegram': {
+        'kind': 'group',
+        'module': 'src.cli.autonomous_commands',
+        'attr': 'telegram_app',
+        'help': 'Telegram: remote commander bot',
+    },
+    'auth': {
+        'kind': 'group',
+        'module': 'src.cli.raas_auth_commands',
+        'attr': 'app',
+        'group_help': 'RaaS Gateway auth',
+        'help': 'RaaS Gateway auth',
+    },
+    'ocop': {
+        'kind': 'group',
+        'module': 'src.commands.ocop_commands',
+        'attr': 'app',
+        'group_help': 'OCOP: AI-powered agricultural export tools',
+        'help': 'OCOP: AI-powered agricultural export tools',
+    },
+    'sync-raas': {
+        'kind': 'group',
+        'module': 'src.commands.sync_raas_commands',
+        'attr': 'app',
+        'group_help': 'Sync with RaaS Gateway',
+        'help': 'Sync with RaaS Gateway',
+    },
+    'autonomous': {
+        'kind': 'group',
+        'module': 'src.cli.autonomous_commands',
+        'attr': 'autonomous_app',
+        'help': 'Autonomous: AGI loop control',
+    },
+    'license-admin': {
+        'kind': 'group',
+        'module': 'src.commands.license_admin',
+        'attr': 'app',
+        'group_help': 'License Admin Dashboard',
+        'help': 'License Admin Dashboard',
+    },
+    'tier-admin': {
+        'kind': 'group',
+        'module': 'src.commands.tier_admin',
+        'attr': 'app',
+        'group_help': 'Tier rate limit configuration',
+        'help': 'Tier rate limit configuration',
+    },
+    'renewal': {
+        'kind': 'group',
+        'module': 'src.commands.license_renewal',
+        'attr': 'app',
+        'group_help': 'License renewal flow',
+        'help': 'License renewal flow',
+    },
+    'compliance': {
+        'kind': 'group',
+        'module': 'src.commands.compliance',
+        'attr': 'app',
+        'group_help': 'Compliance reporting & audit export',
+        'help': 'Compliance reporting & audit export',
+    },
+    'billing': {
+        'kind': 'group',
+        'module': 'src.cli.billing_commands',
+        'attr': 'app',
+        'group_help': 'Billing operations',
+        'help': 'Billing operations',
+    },
+    'roi': {
+        'kind': 'group',
+        'module': 'src.cli.roi_commands',
+        'attr': 'app',
+        'group_help': 'ROI Unified Command',
+        'help': 'ROI Unified Command',
+    },
+    'telemetry': {
+        'kind': 'group',
+        'module': 'src.commands.telemetry_commands',
+        'attr': 'app',
+        'group_help': 'Telemetry consent management',
+        'help': 'Telemetry consent management',
+    },
+    'dashboard': {
+        'kind': 'group',
+        'module': 'src.commands.dashboard_commands',
+        'attr': 'app',
+        'group_help': 'Analytics Dashboard',
+        'help': 'Analytics Dashboard',
+    },
+    'security-cmd': {
+        'kind': 'group',
+        'module': 'src.commands.security_commands',
+        'attr': 'app',
+        'group_help': 'Security hardening commands',
+        'help': 'Security hardening commands',
+    },
+    'sync': {
+        'kind': 'group',
+        'module': 'src.commands.sync_commands',
+        'attr': 'app',
+        'group_help': 'RaaS usage metrics sync',
+        'help': 'RaaS usage metrics sync',
+    },
+    'update': {
+        'kind': 'group',
+        'module': 'src.cli.update_commands',
+        'attr': 'app',
+        'group_help': 'CLI auto-update',
+        'help': 'CLI auto-update',
+    },
+    'raas-auth': {
+        'kind': 'group',
+        'module': 'src.cli.raas_auth_commands',
+        'attr': 'app',
+        'group_help': 'RaaS Gateway auth',
+        'help': 'RaaS Gateway auth',
+    },
+    'diagnostic': {
+        'kind': 'group',
+        'module': 'src.cli.diagnostic_commands',
+        'attr': 'app',
+        'group_help': 'Diagnostic connectivity checks',
+        'help': 'Diagnostic connectivity checks',
+    },
+    'usage': {
+        'kind': 'group',
+        'module': 'src.cli.usage_commands',
+        'attr': 'app',
+        'group_help': 'Usage metering and reporting',
+        'help': 'Usage metering and reporting',
+    },
+    'raas-maintenance': {
+        'kind': 'group',
+        'module': 'src.commands.raas_maintenance_commands',
+        'attr': 'app',
+        'group_help': 'RaaS Gateway maintenance',
+        'help': 'RaaS Gateway maintenance',
+    },
+    'license-activation': {
+        'kind': 'group',
+        'module': 'src.commands.license_activation',
+        'attr': 'app',
+        'group_help': 'License activation',
+        'help': 'License activation',
+    },
+    'health': {
+        'kind': 'group',
+        'module': 'src.commands.health_commands',
+        'attr': 'app',
+        'group_help': 'Health endpoint server',
+        'help': 'Health endpoint server',
+    },
+    'phase': {
+        'kind': 'group',
+        'module': 'src.commands.phase_commands',
+        'attr': 'app',
+        'group_help': 'ROIaaS phase validation',
+        'help': 'ROIaaS phase validation',
+    },
+    'analytics-cmd': {
+        'kind': 'group',
+        'module': 'src.commands.analytics_commands',
+        'attr': 'app',
+        'group_help': 'Analytics and debug trace',
+        'help': 'Analytics and debug trace',
+    },
+    'tools': {
+        'kind': 'group',
+        'module': 'src.cli.autonomous_commands',
+        'attr': 'tools_app',
+        'help': 'Tools: dynamic tool registry & discovery',
+    },
+    'browse': {
+        'kind': 'group',
+        'module': 'src.cli.autonomous_commands',
+        'attr': 'browse_app',
+        'help': 'Browse: web automation & page analysis',
+    },
+    'collab': {
+        'kind': 'group',
+        'module': 'src.cli.autonomous_commands',
+        'attr': 'collab_app',
+        'help': 'Collab: multi-agent collaboration & debate',
+    },
+}
+
+__all__ = ["COMMAND_MANIFEST"]
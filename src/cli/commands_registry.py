@@ -5,8 +5,6 @@ Centralized registration of all CLI subcommands.
 """
 
 import typer
-from pathlib import Path
-import importlib.util
 
 
 def register_all_commands(app: typer.Typer) -> None:
@@ -34,12 +32,7 @@ def register_all_commands(app: typer.Typer) -> None:
     from src.commands.sync_raas import app as sync_raas_app
 
     # BMAD commands
-    spec = importlib.util.spec_from_file_location(
-        "bmad_commands", Path(__file__).parent.parent / "cli" / "bmad-commands.py"
-    )
-    bmad_module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(bmad_module)
-    bmad_app = bmad_module.app
+    from src.cli.bmad_commands import app as bmad_app
 
     # Register all subcommands
     app.add_typer(bmad_app, name="bmad", help="BMAD workflow management")
@@ -0,0 +1,279 @@
+"""
+Lazy Command Registry
+
+``mekong`` lists its ~70 top-level commands from a precomputed manifest
+(``src/cli/command_manifest.py``) and imports a command's module only when
+that command is invoked, so ``mekong --help`` or ``mekong status`` no longer
+pay for importing every command group and its dependencies.
+
+The manifest is generated from the eager registration below, which stays
+the single source of truth for what is registered where:
+
+    python -m src.cli.lazy_commands            # rewrite the manifest
+    python -m src.cli.lazy_commands --check    # exit 1 if it is stale
+"""
+
+import importlib
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import click
+import typer
+from typer.core import TyperGroup
+from typer.models import DefaultPlaceholder
+
+MANIFEST_PATH = Path(__file__).with_name("command_manifest.py")
+
+# Modules that only wire commands together; never the home of a command
+_REGISTRY_MODULES = {
+    "src.main",
+    "src.cli.commands_registry",
+    "src.cli.command_registry_legacy",
+    "src.cli.lazy_commands",
+}
+
+
+def _manifest() -> Dict[str, Dict[str, Any]]:
+    from src.cli.command_manifest import COMMAND_MANIFEST
+
+    return COMMAND_MANIFEST
+
+
+def load_command(name: str, entry: Optional[Dict[str, Any]] = None) -> click.Command:
+    """
+    Import and build the click command for a manifest entry.
+
+    Entry kinds:
+        group:    ``attr`` is a Typer sub-app mounted as ``name``
+        merge:    ``attr`` is a Typer app whose commands are mounted at the root
+        register: ``attr`` is a ``register_*(app)`` function defining ``name``
+        command:  ``attr`` is a plain command function
+
+    Raises:
+        KeyError: ``name`` is not in the manifest
+    """
+    entry = entry or _manifest()[name]
+    target = getattr(importlib.import_module(entry["module"]), entry["attr"])
+    scratch = typer.Typer()
+    kind = entry["kind"]
+    if kind == "group":
+        kwargs = {"help": entry["group_help"]} if entry.get("group_help") else {}
+        scratch.add_typer(target, name=name, **kwargs)
+    elif kind == "merge":
+        scratch.add_typer(target)
+    elif kind == "register":
+        target(scratch)
+    elif kind == "command":
+        scratch.command(name)(target)
+    else:
+        raise ValueError(f"Unknown manifest kind {kind!r} for command {name!r}")
+    return typer.main.get_group(scratch).commands[name]
+
+
+class LazyCommand(click.Command):
+    """
+    Placeholder carrying just what ``--help`` listings need; the real command
+    is built on first use.
+    """
+
+    def __init__(self, name: str, entry: Dict[str, Any]) -> None:
+        super().__init__(
+            name,
+            help=entry.get("help") or None,
+            hidden=entry.get("hidden", False),
+            deprecated=entry.get("deprecated", False),
+        )
+        self.rich_help_panel = entry.get("rich_help_panel")
+        self._entry = entry
+        self._real: Optional[click.Command] = None
+
+    def load(self) -> click.Command:
+        if self._real is None:
+            self._real = load_command(self.name, self._entry)
+        return self._real
+
+    def make_context(self, info_name: Optional[str], args: List[str], parent: Optional[click.Context] = None, **extra: Any) -> click.Context:
+        return self.load().make_context(info_name, args, parent=parent, **extra)
+
+    def invoke(self, ctx: click.Context) -> Any:
+        return self.load().invoke(ctx)
+
+    def get_help(self, ctx: click.Context) -> str:
+        return self.load().get_help(ctx)
+
+    def to_info_dict(self, ctx: click.Context) -> Dict[str, Any]:
+        return self.load().to_info_dict(ctx)
+
+
+class LazyTyperGroup(TyperGroup):
+    """Root group that resolves manifest commands on demand."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._lazy: Dict[str, LazyCommand] = {}
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        eager = super().list_commands(ctx)
+        return eager + [name for name in _manifest() if name not in self.commands]
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        command = super().get_command(ctx, cmd_name)
+        if command is not None:
+            return command
+        entry = _manifest().get(cmd_name)
+        if entry is None:
+            return None
+        if cmd_name not in self._lazy:
+            self._lazy[cmd_name] = LazyCommand(cmd_name, entry)
+        return self._lazy[cmd_name]
+
+    def resolve_command(self, ctx: click.Context, args: List[str]) -> Any:
+        name, command, rest = super().resolve_command(ctx, args)
+        if isinstance(command, LazyCommand):
+            command = command.load()
+        return name, command, rest
+
+
+# ===== Eager registration (manifest source of truth) =====
+
+
+def register_eager_commands(app: typer.Typer) -> None:
+    """Register every command group the way ``mekong`` resolves them."""
+    from src.cli.commands_registry import register_all_commands
+    from src.cli.command_registry_legacy import register_legacy_commands
+    from src.cli.core_commands import register_core_commands
+    from src.cli.start_command import register_start_command
+    from src.cli.trace_command import register_trace_command
+    from src.cli.recipe_commands import register_recipe_commands
+    from src.cli.cook_command import register_cook_command
+    from src.cli.workflow_commands import register_workflow_commands
+    from src.cli.swarm_commands import swarm_app
+    from src.cli.schedule_commands import schedule_app
+    from src.cli.memory_commands import memory_app
+    from src.cli.autonomous_commands import register_agi_commands
+
+    register_all_commands(app)
+    register_legacy_commands(app)
+    register_core_commands(app)
+    register_start_command(app)
+    register_trace_command(app)
+    register_recipe_commands(app)
+    register_cook_command(app)
+    register_workflow_commands(app)
+    register_agi_commands(app)
+
+    app.add_typer(swarm_app, name="swarm")
+    app.add_typer(schedule_app, name="schedule")
+    app.add_typer(memory_app, name="memory")
+
+
+def _locate(obj: Any) -> tuple:
+    """(module, attribute) under which ``obj`` is importable."""
+    candidates = sorted(
+        (module_name, attr)
+        for module_name, module in list(sys.modules.items())
+        if module_name.startswith("src.") and module_name not in _REGISTRY_MODULES
+        for attr, value in list(vars(module).items())
+        if value is obj
+    )
+    if not candidates:
+        raise LookupError(f"{obj!r} is not a module-level attribute of any src module")
+    return candidates[0]
+
+
+def _command_source(callback: Any) -> Dict[str, Any]:
+    qualname = callback.__qualname__
+    if ".<locals>." in qualname:
+        return {"kind": "register", "module": callback.__module__, "attr": qualname.split(".<locals>.")[0]}
+    return {"kind": "command", "module": callback.__module__, "attr": qualname}
+
+
+def build_manifest() -> Dict[str, Dict[str, Any]]:
+    """Register everything eagerly and record where each command lives."""
+    app = typer.Typer()
+    register_eager_commands(app)
+
+    # Same precedence as typer: commands, then groups, later ones winning
+    sources: Dict[str, Any] = {}
+    for info in app.registered_commands:
+        name = info.name or typer.main.get_command_name(info.callback.__name__)
+        sources[name] = _command_source(info.callback)
+    for info in app.registered_groups:
+        if info.name:
+            sources[info.name] = info  # Located below, only if it wins
+        else:
+            module, attr = _locate(info.typer_instance)
+            for name in typer.main.get_group(info.typer_instance).commands:
+                sources[name] = {"kind": "merge", "module": module, "attr": attr}
+    for name, source in sources.items():
+        if isinstance(source, dict):
+            continue
+        module, attr = _locate(source.typer_instance)
+        sources[name] = {"kind": "group", "module": module, "attr": attr}
+        if not isinstance(source.help, DefaultPlaceholder) and source.help:
+            sources[name]["group_help"] = source.help
+
+    manifest: Dict[str, Dict[str, Any]] = {}
+    for name, command in typer.main.get_group(app).commands.items():
+        entry = dict(sources[name])
+        help_text = (command.short_help or command.help or "").strip()
+        entry["help"] = help_text.split("\n\n")[0]
+        if command.hidden:
+            entry["hidden"] = True
+        if command.deprecated:
+            entry["deprecated"] = True
+        panel = getattr(command, "rich_help_panel", None)
+        if panel:
+            entry["rich_help_panel"] = panel
+        manifest[name] = entry
+    return manifest
+
+
+def render_manifest(manifest: Dict[str, Dict[str, Any]]) -> str:
+    lines = [
+        '"""',
+        "Mekong CLI - Command manifest",
+        "",
+        "Generated by ``python -m src.cli.lazy_commands``; do not edit by hand.",
+        "Maps each top-level command to the module that defines it.",
+        '"""',
+        "",
+        "COMMAND_MANIFEST = {",
+    ]
+    for name, entry in manifest.items():
+        lines.append(f"    {name!r}: {{")
+        for key, value in entry.items():
+            lines.append(f"        {key!r}: {value!r},")
+        lines.append("    },")
+    lines += ["}", "", '__all__ = ["COMMAND_MANIFEST"]', ""]
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    rendered = render_manifest(build_manifest())
+    current = MANIFEST_PATH.read_text() if MANIFEST_PATH.exists() else ""
+    if "--check" in argv:
+        if rendered != current:
+            print(f"{MANIFEST_PATH} is stale; run: python -m src.cli.lazy_commands")
+            return 1
+        return 0
+    if rendered != current:
+        MANIFEST_PATH.write_text(rendered)
+        print(f"Wrote {MANIFEST_PATH}")
+    return 0
+
+
+__all__ = [
+    "LazyCommand",
+    "LazyTyperGroup",
+    "build_manifest",
+    "load_command",
+    "register_eager_commands",
+    "render_manifest",
+]
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
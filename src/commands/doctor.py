@@ -15,6 +15,84 @@ from pathlib import Path
 app = typer.Typer(name="doctor", help="Diagnostic tool - check system requirements")
 console = Console()
 
+# Cold start budget for `import src.main`, in milliseconds
+STARTUP_BUDGET_MS = 1000
+
+
+@app.callback(invoke_without_command=True)
+def doctor(
+    ctx: typer.Context,
+    startup: bool = typer.Option(False, "--startup", help="Profile CLI startup imports"),
+    top: int = typer.Option(15, "--top", "-n", help="Modules to show with --startup"),
+) -> None:
+    """Diagnostic tool - check system requirements"""
+    if startup:
+        show_startup_profile(top)
+        raise typer.Exit()
+    if ctx.invoked_subcommand is None:
+        console.print(ctx.get_help())
+
+
+def profile_startup(target: str = "src.main") -> tuple:
+    """
+    Import ``target`` in a fresh interpreter under ``-X importtime``.
+
+    Returns:
+        (total_ms, rows) where rows are (module, self_ms, cumulative_ms)
+        sorted by cumulative time, slowest first
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        capture_output=True,
+        text=True,
+        timeout=60,
+        cwd=Path(__file__).resolve().parents[2],
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "import failed")
+
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        if not self_us.strip().isdigit():
+            continue  # Header line
+        rows.append((name.strip(), int(self_us) / 1000, int(cumulative_us) / 1000))
+
+    total_ms = next((cumulative for name, _, cumulative in rows if name == target), 0.0)
+    rows.sort(key=lambda row: row[2], reverse=True)
+    return total_ms, rows
+
+
+def show_startup_profile(top: int = 15) -> None:
+    """Print the slowest imports on the `mekong` cold start path."""
+    try:
+        total_ms, rows = profile_startup()
+    except (OSError, RuntimeError, subprocess.TimeoutExpired) as e:
+        console.print(f"[red]Startup profiling failed: {e}[/red]")
+        raise typer.Exit(1)
+
+    table = Table(title=f"Startup imports (top {top} by cumulative time)")
+    table.add_column("Module", style="cyan")
+    table.add_column("Self (ms)", justify="right")
+    table.add_column("Cumulative (ms)", justify="right", style="yellow")
+    for name, self_ms, cumulative_ms in rows[:top]:
+        table.add_row(name, f"{self_ms:.1f}", f"{cumulative_ms:.1f}")
+    console.print(table)
+
+    style = "green" if total_ms <= STARTUP_BUDGET_MS else "red"
+    console.print(
+        f"\n[{style}]import src.main: {total_ms:.0f} ms[/{style}] "
+        f"[dim](budget {STARTUP_BUDGET_MS} ms, {len(rows)} modules)[/dim]"
+    )
+    heavy = [name for name, _, _ in rows if name.startswith("src.commands.")]
+    if heavy:
+        console.print(
+            f"[yellow]⚠ {len(heavy)} command modules imported at startup "
+            f"(e.g. {heavy[0]}); regenerate the manifest: python -m src.cli.lazy_commands[/yellow]"
+        )
+
 
 @app.command()
 def diagnose() -> None:
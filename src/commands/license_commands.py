@@ -576,4 +576,37 @@ def entitlement() -> None:
     show_entitlement_status()
 
 
+@app.command("gate-latency")
+def gate_latency(
+    command: Optional[str] = typer.Option(None, "--command", "-c", help="Only samples for this command"),
+    flush: bool = typer.Option(False, "--flush", help="Push pending usage to the backend first"),
+) -> None:
+    """⏱ Show p50/p99 latency of the license gate on premium commands."""
+    from src.lib.raas_gate_cache import flush_usage, get_gate_cache
+
+    cache = get_gate_cache()
+    if flush:
+        try:
+            sent = flush_usage(cache)
+            console.print(f"[green]✓ Flushed {sent} pending credit(s)[/green]")
+        except Exception as e:
+            console.print(f"[yellow]⚠ Usage flush failed: {e}[/yellow]")
+
+    stats = cache.latency_stats(command)
+    if not stats["count"]:
+        console.print("[dim]No gate latency samples recorded yet.[/dim]")
+        return
+
+    table = Table(title=f"License Gate Latency{f' — {command}' if command else ''}")
+    table.add_column("Metric", style="cyan")
+    table.add_column("Value", justify="right")
+    table.add_row("Samples", f"{stats['count']:,}")
+    table.add_row("p50", f"{stats['p50_ms']:.3f} ms")
+    table.add_row("p99", f"{stats['p99_ms']:.3f} ms")
+    table.add_row("Max", f"{stats['max_ms']:.3f} ms")
+    for outcome, count in sorted(stats["outcomes"].items()):
+        table.add_row(f"Outcome: {outcome}", f"{count:,}")
+    console.print(table)
+
+
 __all__ = ["app"]
@@ -4,6 +4,7 @@ from .agent_base import AgentBase, Result, Task, TaskStatus
 from .agent_registry import AgentRegistry
 from .alert_router import Alert, AlertConfig, AlertRouter, AlertSeverity, get_alert_router
 from .dag_scheduler import DAGScheduler, DAGStepResult, validate_dag
+from .event_dag_scheduler import EventDrivenDAGScheduler
 from .executor import RecipeExecutor
 from .orchestrator import (
     OrchestrationResult,
@@ -47,6 +48,7 @@ __all__ = [
     # DAG Scheduler
     "DAGScheduler",
     "DAGStepResult",
+    "EventDrivenDAGScheduler",
     "ExecutionResult",
     "GeminiProvider",
     # LLM Providers
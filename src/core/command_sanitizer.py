@@ -9,6 +9,8 @@ from __future__ import annotations
 import re
 from dataclasses import dataclass, field
 
+from src.security.sanitizer_engine import compile_rules, get_verdict_cache
+
 
 @dataclass
 class SanitizationResult:
@@ -115,19 +117,23 @@ class CommandSanitizer:
         self.allow_patterns = allow_patterns or []
         self.deny_patterns = deny_patterns or []
 
-        # Compile regex patterns
-        self._dangerous_regex = [
-            (re.compile(pattern, re.IGNORECASE), name)
-            for pattern, name in self.DANGEROUS_PATTERNS
-        ]
-        self._suspicious_regex = [
-            (re.compile(pattern, re.IGNORECASE), name)
-            for pattern, name in self.SUSPICIOUS_PATTERNS
-        ]
+        # Compiled once per class, shared by every instance
+        cls = type(self)
+        engine = cls.__dict__.get("_shared_engine")
+        if engine is None:
+            engine = cls._shared_engine = compile_rules(
+                tuple((("dangerous", name), pattern) for pattern, name in cls.DANGEROUS_PATTERNS)
+                + tuple((("suspicious", name), pattern) for pattern, name in cls.SUSPICIOUS_PATTERNS)
+            )
+        self._engine = engine
 
     def sanitize(self, command: str) -> SanitizationResult:
         """Sanitize a shell command.
 
+        Verdicts are cached process-wide. The cache key includes
+        strict_mode and the current allow/deny lists, so changing either
+        list (assigned or mutated in place) never serves a stale verdict.
+
         Args:
             command: The command string to sanitize
 
@@ -135,6 +141,24 @@ class CommandSanitizer:
             SanitizationResult with safety status and details
 
         """
+        config = (
+            type(self),
+            self._engine,
+            self.strict_mode,
+            tuple(self.allow_patterns),
+            tuple(self.deny_patterns),
+        )
+        verdict = get_verdict_cache().get_or_compute(config, command, self._sanitize)
+        return SanitizationResult(
+            is_safe=verdict.is_safe,
+            sanitized_command=verdict.sanitized_command,
+            blocked_patterns=list(verdict.blocked_patterns),
+            warnings=list(verdict.warnings),
+            blocked_reason=verdict.blocked_reason,
+        )
+
+    def _sanitize(self, command: str) -> SanitizationResult:
+        """Uncached sanitize (see ``sanitize``)."""
         result = SanitizationResult(
             is_safe=True,
             sanitized_command=command.strip(),
@@ -155,9 +179,12 @@ class CommandSanitizer:
             except re.error:
                 pass
 
+        # One engine pass covers dangerous and suspicious patterns
+        matches = self._engine.matches(command)
+
         # Check dangerous patterns
-        for regex, name in self._dangerous_regex:
-            if regex.search(command):
+        for kind, name in matches:
+            if kind == "dangerous":
                 result.is_safe = False
                 result.blocked_patterns.append(name)
                 result.warnings.append(f"Dangerous pattern detected: {name}")
@@ -170,8 +197,8 @@ class CommandSanitizer:
             return result
 
         # Check suspicious patterns (warnings only, unless strict mode)
-        for regex, name in self._suspicious_regex:
-            if regex.search(command):
+        for kind, name in matches:
+            if kind == "suspicious":
                 result.warnings.append(f"Suspicious pattern: {name}")
                 if self.strict_mode:
                     result.is_safe = False
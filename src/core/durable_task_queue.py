@@ -0,0 +1,428 @@
+"""Mekong CLI - Durable Priority Task Queue.
+
+SQLite (WAL) backend for :class:`PriorityTaskQueue` that several daemon or
+gateway processes can share. Workers *lease* tasks instead of popping them:
+a leased task stays invisible for ``visibility_timeout`` seconds and is
+handed out again if the worker neither acks nor nacks it in time, so a
+crashed worker's tasks reappear (Temporal/SQS visibility-timeout pattern).
+
+Dispatch order uses an aging score, ``enqueued_at + priority * aging_interval``:
+every ``aging_interval`` seconds a task waits counts as one priority level,
+so a steady stream of HIGH work cannot starve LOW tasks forever.
+"""
+
+from __future__ import annotations
+
+import heapq
+import json
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any
+
+from .task_queue import DeadLetterEntry, QueuedTask, TaskPriority
+
+logger = logging.getLogger(__name__)
+
+# Score spacing between priority levels when aging is disabled
+_STRICT_LEVEL_GAP = 1e12
+
+_DDL = """
+CREATE TABLE IF NOT EXISTS queue_tasks (
+    task_id      TEXT PRIMARY KEY,
+    goal         TEXT NOT NULL,
+    payload      TEXT NOT NULL,
+    priority     INTEGER NOT NULL,
+    enqueued_at  REAL NOT NULL,
+    score        REAL NOT NULL,
+    attempt      INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    source       TEXT NOT NULL,
+    state        TEXT NOT NULL,
+    visible_at   REAL NOT NULL,
+    lease_owner  TEXT,
+    lease_token  TEXT,
+    last_error   TEXT,
+    failed_at    REAL
+);
+CREATE INDEX IF NOT EXISTS idx_queue_ready ON queue_tasks (state, score);
+CREATE INDEX IF NOT EXISTS idx_queue_visible ON queue_tasks (state, visible_at);
+CREATE INDEX IF NOT EXISTS idx_queue_dead ON queue_tasks (state, failed_at);
+"""
+
+_READY = "ready"
+_LEASED = "leased"
+_DEAD = "dead"
+
+
+class DurableTaskQueue:
+    """SQLite-backed priority queue with leases, aging and an indexed DLQ.
+
+    Drop-in for :class:`PriorityTaskQueue` (``enqueue``/``poll``/
+    ``mark_completed``/``mark_failed``/DLQ helpers), plus ``poll_many``,
+    ``ack``/``ack_many``/``nack``/``extend_lease`` for worker pools. Every state change
+    is a single SQLite transaction, so concurrent processes never lease the
+    same task twice. A heap of ready tasks is cached in memory for ``peek``
+    and is rebuilt only when the database changes.
+
+    Args:
+        db_path: SQLite file shared by all processes using this queue.
+        max_size: Maximum ready + leased tasks (0 = unlimited).
+        visibility_timeout: Seconds a lease lasts before the task reappears.
+        aging_interval: Seconds of waiting worth one priority level
+            (0 = strict priority, no aging).
+        worker_id: Lease owner recorded on polled tasks.
+    """
+
+    def __init__(
+        self,
+        db_path: str | Path,
+        max_size: int = 1000,
+        visibility_timeout: float = 300.0,
+        aging_interval: float = 60.0,
+        worker_id: str | None = None,
+    ) -> None:
+        """Open (or create) the queue database."""
+        self._db_path = Path(db_path)
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._max_size = max_size
+        self._visibility_timeout = visibility_timeout
+        self._aging_interval = aging_interval
+        self._worker_id = worker_id or f"worker-{uuid.uuid4().hex[:8]}"
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(
+            str(self._db_path), timeout=30, isolation_level=None, check_same_thread=False,
+        )
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_DDL)
+        self._heap: list[tuple[float, str, QueuedTask]] = []
+        self._heap_version: int | None = None
+        self._total_enqueued = 0
+        self._total_completed = 0
+
+    # -- helpers --
+
+    def _score(self, priority: int, enqueued_at: float) -> float:
+        gap = self._aging_interval if self._aging_interval > 0 else _STRICT_LEVEL_GAP
+        return enqueued_at + priority * gap
+
+    @staticmethod
+    def _task_from_row(row: sqlite3.Row) -> QueuedTask:
+        return QueuedTask(
+            priority=row["priority"],
+            enqueued_at=row["enqueued_at"],
+            task_id=row["task_id"],
+            goal=row["goal"],
+            payload=json.loads(row["payload"]),
+            attempt=row["attempt"],
+            max_attempts=row["max_attempts"],
+            source=row["source"],
+            lease_token=row["lease_token"] or "",
+        )
+
+    def _write(self, sql: str, params: tuple = ()) -> tuple[int, list[sqlite3.Row]]:
+        """Run one statement in its own immediate (write-locked) transaction.
+
+        Returns:
+            (rowcount, rows returned by a RETURNING clause)
+        """
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                cur = self._conn.execute(sql, params)
+                rows = cur.fetchall() if cur.description else []
+                count = cur.rowcount
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._heap_version = None
+            return count, rows
+
+    def _count(self, *states: str) -> int:
+        marks = ",".join("?" * len(states))
+        with self._lock:
+            return self._conn.execute(
+                f"SELECT COUNT(*) FROM queue_tasks WHERE state IN ({marks})", states,
+            ).fetchone()[0]
+
+    # -- producer API --
+
+    def enqueue(
+        self,
+        task_id: str,
+        goal: str,
+        priority: TaskPriority = TaskPriority.NORMAL,
+        payload: dict[str, Any] | None = None,
+        max_attempts: int = 3,
+        source: str = "manual",
+    ) -> QueuedTask | None:
+        """Add a task. Returns None if the queue is full or task_id is already queued."""
+        now = time.time()
+        task = QueuedTask(
+            priority=int(priority),
+            enqueued_at=now,
+            task_id=task_id,
+            goal=goal,
+            payload=payload or {},
+            max_attempts=max_attempts,
+            source=source,
+        )
+        # The capacity check and insert share one statement, so concurrent
+        # producers cannot overshoot max_size.
+        inserted, _ = self._write(
+            "INSERT INTO queue_tasks (task_id, goal, payload, priority, enqueued_at, score,"
+            " max_attempts, source, state, visible_at)"
+            " SELECT ?, ?, ?, ?, ?, ?, ?, ?, ?, ?"
+            " WHERE ? = 0 OR (SELECT COUNT(*) FROM queue_tasks WHERE state IN (?, ?)) < ?"
+            " ON CONFLICT (task_id) DO NOTHING",
+            (
+                task.task_id, task.goal, json.dumps(task.payload), task.priority, now,
+                self._score(task.priority, now), max_attempts, source, _READY, now,
+                self._max_size, _READY, _LEASED, self._max_size,
+            ),
+        )
+        if inserted != 1:
+            return None
+        self._total_enqueued += 1
+        return task
+
+    # -- consumer API --
+
+    def poll_many(self, limit: int, worker_id: str | None = None) -> list[QueuedTask]:
+        """Lease up to ``limit`` tasks atomically, best score first.
+
+        Expired leases are reclaimed in the same transaction; a task whose
+        lease expired ``max_attempts`` times goes to the DLQ.
+        """
+        if limit <= 0:
+            return []
+        now = time.time()
+        owner = worker_id or self._worker_id
+        token = uuid.uuid4().hex
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._reclaim_expired(now)
+                rows = self._conn.execute(
+                    "UPDATE queue_tasks SET state = ?, lease_owner = ?, lease_token = ?,"
+                    " visible_at = ? WHERE task_id IN ("
+                    "  SELECT task_id FROM queue_tasks WHERE state = ? AND visible_at <= ?"
+                    "  ORDER BY score LIMIT ?"
+                    ") RETURNING *",
+                    (_LEASED, owner, token, now + self._visibility_timeout, _READY, now, limit),
+                ).fetchall()
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._heap_version = None
+        rows.sort(key=lambda r: r["score"])
+        return [self._task_from_row(r) for r in rows]
+
+    def poll(self, worker_id: str | None = None) -> QueuedTask | None:
+        """Lease the best task. Returns None if nothing is ready."""
+        tasks = self.poll_many(1, worker_id)
+        return tasks[0] if tasks else None
+
+    def _reclaim_expired(self, now: float) -> int:
+        """Return timed-out leases to the queue (caller holds a write txn)."""
+        dead = self._conn.execute(
+            "UPDATE queue_tasks SET state = ?, attempt = attempt + 1, failed_at = ?,"
+            " last_error = 'lease expired', lease_owner = NULL, lease_token = NULL"
+            " WHERE state = ? AND visible_at <= ? AND attempt + 1 >= max_attempts",
+            (_DEAD, now, _LEASED, now),
+        ).rowcount
+        requeued = self._conn.execute(
+            "UPDATE queue_tasks SET state = ?, attempt = attempt + 1,"
+            " last_error = 'lease expired', lease_owner = NULL, lease_token = NULL"
+            " WHERE state = ? AND visible_at <= ?",
+            (_READY, _LEASED, now),
+        ).rowcount
+        if dead or requeued:
+            logger.info("Task queue: reclaimed %d expired lease(s), %d to DLQ", requeued, dead)
+        return dead + requeued
+
+    def requeue_expired(self) -> int:
+        """Reclaim expired leases now (poll does this too). Returns tasks affected."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                count = self._reclaim_expired(time.time())
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._heap_version = None
+        return count
+
+    def extend_lease(self, task: QueuedTask, seconds: float | None = None) -> bool:
+        """Heartbeat: push the task's visibility deadline out. False if the lease was lost."""
+        deadline = time.time() + (seconds or self._visibility_timeout)
+        updated, _ = self._write(
+            "UPDATE queue_tasks SET visible_at = ? WHERE task_id = ? AND state = ? AND lease_token = ?",
+            (deadline, task.task_id, _LEASED, task.lease_token),
+        )
+        return updated == 1
+
+    def ack(self, task: QueuedTask) -> bool:
+        """Delete a completed task. False if its lease expired and it was re-leased."""
+        deleted, _ = self._write(
+            "DELETE FROM queue_tasks WHERE task_id = ? AND state = ? AND lease_token = ?",
+            (task.task_id, _LEASED, task.lease_token),
+        )
+        if deleted == 1:
+            self._total_completed += 1
+            return True
+        return False
+
+    def ack_many(self, tasks: list[QueuedTask]) -> int:
+        """Delete a batch of completed tasks in one transaction. Returns tasks acked."""
+        if not tasks:
+            return 0
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                deleted = 0
+                for task in tasks:
+                    deleted += self._conn.execute(
+                        "DELETE FROM queue_tasks WHERE task_id = ? AND state = ? AND lease_token = ?",
+                        (task.task_id, _LEASED, task.lease_token),
+                    ).rowcount
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._heap_version = None
+        self._total_completed += deleted
+        return deleted
+
+    def nack(self, task: QueuedTask, error: str, delay: float = 0.0) -> bool:
+        """Fail a leased task: retry after ``delay`` or move it to the DLQ.
+
+        Returns:
+            True if re-queued for retry, False if moved to the DLQ (or the
+            lease was already lost)
+        """
+        now = time.time()
+        _, rows = self._write(
+            "UPDATE queue_tasks SET attempt = attempt + 1, last_error = ?,"
+            " lease_owner = NULL, lease_token = NULL,"
+            " state = CASE WHEN attempt + 1 < max_attempts THEN ? ELSE ? END,"
+            " visible_at = ?, failed_at = CASE WHEN attempt + 1 < max_attempts THEN NULL ELSE ? END"
+            " WHERE task_id = ? AND state = ? AND lease_token = ? RETURNING state, attempt",
+            (error, _READY, _DEAD, now + delay, now, task.task_id, _LEASED, task.lease_token),
+        )
+        if not rows:
+            return False
+        task.attempt = rows[0]["attempt"]
+        task.lease_token = ""
+        return rows[0]["state"] == _READY
+
+    def mark_completed(self, task: QueuedTask) -> None:
+        """PriorityTaskQueue compatibility: ack the task."""
+        self.ack(task)
+
+    def mark_failed(self, task: QueuedTask, error: str) -> bool:
+        """PriorityTaskQueue compatibility: nack the task with no delay."""
+        return self.nack(task, error)
+
+    def peek(self) -> QueuedTask | None:
+        """Best ready task without leasing it (served from the heap cache)."""
+        with self._lock:
+            version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+            if self._heap_version != version:
+                rows = self._conn.execute(
+                    "SELECT * FROM queue_tasks WHERE state = ? AND visible_at <= ?"
+                    " ORDER BY score LIMIT 256",
+                    (_READY, time.time()),
+                ).fetchall()
+                self._heap = [(r["score"], r["task_id"], self._task_from_row(r)) for r in rows]
+                heapq.heapify(self._heap)
+                self._heap_version = version
+            return self._heap[0][2] if self._heap else None
+
+    # -- DLQ --
+
+    def get_dlq(self, limit: int | None = None) -> list[DeadLetterEntry]:
+        """Dead letter entries, most recent failure first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM queue_tasks WHERE state = ? ORDER BY failed_at DESC LIMIT ?",
+                (_DEAD, -1 if limit is None else limit),
+            ).fetchall()
+        return [
+            DeadLetterEntry(
+                task=self._task_from_row(r), final_error=r["last_error"] or "",
+                failed_at=r["failed_at"] or 0.0,
+            )
+            for r in rows
+        ]
+
+    def retry_from_dlq(self, task_id: str) -> bool:
+        """Move a dead task back to the queue (primary-key lookup)."""
+        now = time.time()
+        updated, _ = self._write(
+            "UPDATE queue_tasks SET state = ?, attempt = 0, visible_at = ?, failed_at = NULL"
+            " WHERE task_id = ? AND state = ?",
+            (_READY, now, task_id, _DEAD),
+        )
+        return updated == 1
+
+    # -- introspection --
+
+    @property
+    def size(self) -> int:
+        """Tasks waiting to be leased."""
+        return self._count(_READY)
+
+    @property
+    def in_flight(self) -> int:
+        """Tasks currently leased by a worker."""
+        return self._count(_LEASED)
+
+    @property
+    def dlq_size(self) -> int:
+        """Number of tasks in the dead letter queue."""
+        return self._count(_DEAD)
+
+    @property
+    def is_empty(self) -> bool:
+        """Check if queue has no pending tasks."""
+        return self.size == 0
+
+    def stats(self) -> dict[str, Any]:
+        """Queue depth across all processes plus this instance's counters."""
+        with self._lock:
+            counts = dict(self._conn.execute(
+                "SELECT state, COUNT(*) FROM queue_tasks GROUP BY state",
+            ).fetchall())
+        return {
+            "pending": counts.get(_READY, 0),
+            "in_flight": counts.get(_LEASED, 0),
+            "dlq": counts.get(_DEAD, 0),
+            "total_enqueued": self._total_enqueued,
+            "total_completed": self._total_completed,
+            "completion_rate": (
+                (self._total_completed / self._total_enqueued * 100)
+                if self._total_enqueued > 0
+                else 0.0
+            ),
+        }
+
+    def clear(self) -> None:
+        """Remove all tasks from queue and DLQ."""
+        self._write("DELETE FROM queue_tasks")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+__all__ = ["DurableTaskQueue"]
@@ -3,11 +3,20 @@
 In-process pub/sub event bus with streaming support for gateway events.
 Enables WebSocket subscribers, Telegram/webhook integrations, and
 real-time execution streaming (Netdata streaming pattern).
+
+Subscribers are called inline on the emitting thread ("sync", the default
+and what tests rely on) or, in "async" dispatch, through a bounded queue
+drained by one worker thread per subscriber so a slow consumer never adds
+latency to the emitter. Each subscriber's queue is FIFO, so events of a
+type reach it in emit order; the overflow policy decides what happens when
+the queue is full.
 """
 
 from __future__ import annotations
 
 import logging
+import os
+import threading
 import time
 from collections import deque
 from collections.abc import Callable
@@ -87,44 +96,301 @@ class Event:
 # Subscriber callback signature: (event: Event) -> None
 Subscriber = Callable[[Event], None]
 
+DISPATCH_MODES = ("sync", "async")
+
+
+class OverflowPolicy(str, Enum):
+    """What an async subscriber's full queue does with a new event."""
+
+    DROP_OLDEST = "drop_oldest"  # Discard the oldest queued event
+    BLOCK = "block"  # Make the emitter wait for room
+    COALESCE = "coalesce"  # Replace the newest queued event of the same type
+
+
+def _callback_name(callback: Subscriber) -> str:
+    owner = getattr(callback, "__self__", None)
+    name = getattr(callback, "__qualname__", None) or repr(callback)
+    if owner is not None and "." not in name:
+        name = f"{type(owner).__name__}.{name}"
+    return name
+
+
+class _Subscription:
+    """One callback, the event types it listens to, and its async queue.
+
+    The queue and worker thread exist only while the subscription runs in
+    async dispatch; the worker starts lazily on the first queued event.
+    """
+
+    def __init__(
+        self,
+        callback: Subscriber,
+        dispatch: str | None,
+        maxsize: int,
+        overflow: OverflowPolicy,
+    ) -> None:
+        self.callback = callback
+        self.name = _callback_name(callback)
+        self.event_types: set[EventType] = set()
+        self.dispatch = dispatch  # None follows the bus-wide mode
+        self.maxsize = max(1, maxsize)
+        self.overflow = OverflowPolicy(overflow)
+        self._queue: deque[Event] = deque()
+        self._cond = threading.Condition()
+        self._worker: threading.Thread | None = None
+        self._busy = False
+        self._closed = False
+        self.delivered = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.errors = 0
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+
+    def call(self, event: Event) -> None:
+        """Invoke the callback, counting failures instead of raising."""
+        try:
+            self.callback(event)
+        except Exception as e:
+            self.errors += 1
+            logger.debug("Event subscriber %s failed: %s", self.name, e)
+        self.delivered += 1
+
+    def enqueue(self, event: Event) -> None:
+        """Queue an event for the worker, applying the overflow policy."""
+        with self._cond:
+            if self._closed:
+                return
+            if len(self._queue) >= self.maxsize:
+                on_worker = threading.current_thread() is self._worker
+                if self.overflow is OverflowPolicy.COALESCE:
+                    for i in range(len(self._queue) - 1, -1, -1):
+                        if self._queue[i].type == event.type:
+                            self._queue[i] = event
+                            self.coalesced += 1
+                            return
+                elif self.overflow is OverflowPolicy.BLOCK and not on_worker:
+                    # A callback that re-emits to itself would deadlock; it
+                    # falls through to drop-oldest instead.
+                    while len(self._queue) >= self.maxsize and not self._closed:
+                        self._cond.wait()
+                    if self._closed:
+                        return
+                if len(self._queue) >= self.maxsize:
+                    self._queue.popleft()
+                    self.dropped += 1
+            self._queue.append(event)
+            self._cond.notify_all()
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run, name=f"event-bus:{self.name}", daemon=True,
+                )
+                self._worker.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._queue and not self._closed:
+                    self._busy = False
+                    self._cond.notify_all()
+                    self._cond.wait()
+                if not self._queue:
+                    self._busy = False
+                    self._cond.notify_all()
+                    return
+                event = self._queue.popleft()
+                self._busy = True
+                self._cond.notify_all()
+            lag = time.time() - event.timestamp
+            self.last_lag = lag
+            self.max_lag = max(self.max_lag, lag)
+            self.call(event)
+
+    def drain(self, timeout: float | None = None) -> bool:
+        """Wait until the queue is empty and the callback is idle."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self._queue or self._busy:
+                if threading.current_thread() is self._worker:
+                    return False
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def close(self, timeout: float | None = None) -> None:
+        """Deliver what is queued, then stop the worker."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            worker = self._worker
+        if worker is not None and worker is not threading.current_thread():
+            worker.join(timeout)
+
+    def stats(self) -> dict[str, Any]:
+        with self._cond:
+            depth = len(self._queue)
+            oldest = self._queue[0].timestamp if self._queue else None
+        return {
+            "subscriber": self.name,
+            "event_types": sorted(t.value for t in self.event_types),
+            "dispatch": self.dispatch,
+            "overflow": self.overflow.value,
+            "queued": depth,
+            "maxsize": self.maxsize,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+            "errors": self.errors,
+            "lag_seconds": round(time.time() - oldest, 4) if oldest else 0.0,
+            "last_lag_seconds": round(self.last_lag, 4),
+            "max_lag_seconds": round(self.max_lag, 4),
+        }
+
 
 class EventBus:
-    """In-process publish/subscribe event bus."""
+    """In-process publish/subscribe event bus.
+
+    Args:
+        dispatch: ``"sync"`` calls subscribers on the emitting thread;
+            ``"async"`` hands events to per-subscriber queues and workers.
+            Defaults to ``MEKONG_EVENT_DISPATCH`` or ``"sync"``.
+        queue_size: Default bound of each async subscriber's queue.
+        overflow: Default :class:`OverflowPolicy` for full queues.
+    """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        dispatch: str | None = None,
+        queue_size: int = 1000,
+        overflow: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+    ) -> None:
         """Initialize EventBus with an empty subscriber registry."""
-        self._subscribers: dict[EventType, list[Subscriber]] = {}
+        self._subscribers: dict[EventType, list[_Subscription]] = {}
+        self._by_callback: dict[Subscriber, _Subscription] = {}
+        self._lock = threading.RLock()
+        self._dispatch = "sync"
+        self.dispatch = dispatch or os.environ.get("MEKONG_EVENT_DISPATCH", "sync")
+        self._queue_size = queue_size
+        self._overflow = OverflowPolicy(overflow)
+
+    @property
+    def dispatch(self) -> str:
+        """Bus-wide dispatch mode for subscribers without their own."""
+        return self._dispatch
+
+    @dispatch.setter
+    def dispatch(self, mode: str) -> None:
+        if mode not in DISPATCH_MODES:
+            raise ValueError(f"dispatch must be one of {DISPATCH_MODES}, got {mode!r}")
+        self._dispatch = mode
+
+    def subscribe(
+        self,
+        event_type: EventType,
+        callback: Subscriber,
+        *,
+        dispatch: str | None = None,
+        queue_size: int | None = None,
+        overflow: OverflowPolicy | None = None,
+    ) -> None:
+        """Register a callback for an event type.
 
-    def subscribe(self, event_type: EventType, callback: Subscriber) -> None:
-        """Register a callback for an event type."""
-        self._subscribers.setdefault(event_type, []).append(callback)
+        A callback subscribed to several types shares one queue and worker,
+        so it sees all of its events in emit order. The keyword options
+        override the bus defaults and apply to every type of that callback.
+        """
+        if dispatch is not None and dispatch not in DISPATCH_MODES:
+            raise ValueError(f"dispatch must be one of {DISPATCH_MODES}, got {dispatch!r}")
+        with self._lock:
+            sub = self._by_callback.get(callback)
+            if sub is None:
+                sub = _Subscription(
+                    callback,
+                    dispatch,
+                    queue_size or self._queue_size,
+                    overflow or self._overflow,
+                )
+                self._by_callback[callback] = sub
+            else:
+                sub.dispatch = dispatch or sub.dispatch
+                sub.maxsize = max(1, queue_size or sub.maxsize)
+                sub.overflow = OverflowPolicy(overflow or sub.overflow)
+            sub.event_types.add(event_type)
+            self._subscribers.setdefault(event_type, []).append(sub)
 
     def unsubscribe(
         self, event_type: EventType, callback: Subscriber,
     ) -> None:
         """Remove a callback for an event type."""
-        listeners = self._subscribers.get(event_type, [])
-        if callback in listeners:
-            listeners.remove(callback)
+        with self._lock:
+            sub = self._by_callback.get(callback)
+            listeners = self._subscribers.get(event_type, [])
+            if sub is None or sub not in listeners:
+                return
+            listeners.remove(sub)
+            if sub not in listeners:
+                sub.event_types.discard(event_type)
+            if not sub.event_types:
+                del self._by_callback[callback]
+        if sub is not None and not sub.event_types:
+            sub.close(timeout=0)
 
     def emit(self, event_type: EventType, data: dict[str, Any] | None = None) -> Event:
         """Emit an event to all subscribers of that type."""
         event = Event(type=event_type, data=data or {})
-        for callback in self._subscribers.get(event_type, []):
-            try:
-                callback(event)
-            except Exception as e:
-                logger.debug("Event subscriber callback failed: %s", e)
+        with self._lock:
+            listeners = list(self._subscribers.get(event_type, ()))
+        for sub in listeners:
+            if (sub.dispatch or self._dispatch) == "async":
+                sub.enqueue(event)
+            else:
+                sub.call(event)
         return event
 
+    def flush(self, timeout: float | None = 5.0) -> bool:
+        """Wait until every async subscriber has handled its queued events.
+
+        Returns:
+            True if all queues drained before the timeout.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            subs = list(self._by_callback.values())
+        for sub in subs:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if not sub.drain(remaining):
+                return False
+        return True
+
+    def stats(self) -> list[dict[str, Any]]:
+        """Per-subscriber queue depth, lag, and delivery/drop counters."""
+        with self._lock:
+            subs = list(self._by_callback.values())
+        return [sub.stats() for sub in subs]
+
+    def close(self, timeout: float | None = 5.0) -> None:
+        """Deliver queued events and stop every async worker."""
+        with self._lock:
+            subs = list(self._by_callback.values())
+        for sub in subs:
+            sub.close(timeout)
+
     def clear(self) -> None:
         """Remove all subscribers."""
-        self._subscribers.clear()
+        with self._lock:
+            subs = list(self._by_callback.values())
+            self._subscribers.clear()
+            self._by_callback.clear()
+        for sub in subs:
+            sub.close(timeout=0)
 
     @property
     def subscriber_count(self) -> int:
         """Total number of registered subscriber callbacks."""
-        return sum(len(v) for v in self._subscribers.values())
+        with self._lock:
+            return sum(len(v) for v in self._subscribers.values())
 
 
 class EventStream:
@@ -185,9 +451,9 @@ class StreamingEventBus(EventBus):
     for real-time consumers (WebSocket, SSE, polling).
     """
 
-    def __init__(self, max_buffer: int = 1000) -> None:
-        """Initialize with event stream."""
-        super().__init__()
+    def __init__(self, max_buffer: int = 1000, **kwargs: Any) -> None:
+        """Initialize with event stream (other kwargs go to EventBus)."""
+        super().__init__(**kwargs)
         self.stream = EventStream(max_buffer=max_buffer)
 
     def emit(self, event_type: EventType, data: dict[str, Any] | None = None) -> Event:
@@ -222,6 +488,7 @@ __all__ = [
     "EventBus",
     "EventStream",
     "EventType",
+    "OverflowPolicy",
     "StreamingEventBus",
     "Subscriber",
     "get_event_bus",
@@ -0,0 +1,275 @@
+"""Mekong CLI - Event-Driven DAG Scheduler.
+
+Dispatches each recipe step the moment its last dependency finishes,
+instead of waiting for a whole wave of steps like DAGScheduler.
+
+Dependency state is precomputed once: an indegree counter per step and a
+reverse-dependency adjacency list. Completing a step decrements only its
+direct dependents; failing a step cancels only its transitive dependents.
+Ready steps are ordered by explicit priority, then critical-path length.
+"""
+
+from __future__ import annotations
+
+import heapq
+import logging
+from collections import defaultdict, deque
+from collections.abc import Callable
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import Any
+
+from .dag_scheduler import DAGStepResult
+
+logger = logging.getLogger(__name__)
+
+THREAD_POOL = "thread"
+PROCESS_POOL = "process"
+
+
+def _deps_of(step: Any) -> list[int]:
+    return list(getattr(step, "dependencies", []) or [])
+
+
+def _params_of(step: Any) -> dict[str, Any]:
+    return getattr(step, "params", None) or {}
+
+
+class EventDrivenDAGScheduler:
+    """Completion-driven DAG scheduler for recipe steps.
+
+    Drop-in replacement for DAGScheduler.execute_all: same executor_fn and
+    on_complete contract, same DAGStepResult output.
+
+    Args:
+        steps: List of recipe steps with .order and .dependencies
+        max_workers: Thread pool size (default: 4)
+        process_workers: Process pool size; 0 disables the process pool.
+            Steps routed to it need a picklable executor_fn.
+        pool_by_type: Map of step type (params["type"]) to pool name
+            ("thread" or "process"). A step's params["pool"] overrides it.
+        priority_fn: Optional callable(step) -> number; higher runs first.
+            Defaults to params["priority"] (0 when absent). Ties are broken
+            by critical-path length, then by step order.
+
+    """
+
+    def __init__(
+        self,
+        steps: list,
+        max_workers: int = 4,
+        *,
+        process_workers: int = 0,
+        pool_by_type: dict[str, str] | None = None,
+        priority_fn: Callable[[Any], float] | None = None,
+    ) -> None:
+        self._steps = {s.order: s for s in steps}
+        self._max_workers = max_workers
+        self._process_workers = process_workers
+        self._pool_by_type = dict(pool_by_type or {})
+        self._priority_fn = priority_fn
+
+        self._dependents: dict[int, list[int]] = defaultdict(list)
+        self._indegree: dict[int, int] = {}
+        self._has_deps = False
+        for order, step in self._steps.items():
+            deps = _deps_of(step)
+            self._has_deps = self._has_deps or bool(deps)
+            self._indegree[order] = len(deps)
+            for dep in deps:
+                self._dependents[dep].append(order)
+
+        self._critical_path = self._compute_critical_path()
+        self._completed: set[int] = set()
+        self._failed: set[int] = set()
+        self._cancelled: set[int] = set()
+        self._dispatched: set[int] = set()
+        self._ready: dict[str, list[tuple[float, float, int]]] = defaultdict(list)
+        for order, degree in self._indegree.items():
+            if degree == 0:
+                self._push_ready(order)
+
+    @property
+    def steps(self) -> list:
+        """Steps managed by this scheduler, in insertion order."""
+        return list(self._steps.values())
+
+    @property
+    def cancelled_steps(self) -> set[int]:
+        """Steps cancelled due to upstream failure or unsatisfiable deps."""
+        return self._cancelled.copy()
+
+    def has_dependencies(self) -> bool:
+        """Check if any step has non-empty dependencies."""
+        return self._has_deps
+
+    def critical_path_length(self, order: int) -> float:
+        """Weighted length of the longest chain starting at this step."""
+        return self._critical_path.get(order, 0.0)
+
+    def pool_for(self, step: Any) -> str:
+        """Resolve which pool a step runs in."""
+        params = _params_of(step)
+        pool = params.get("pool") or self._pool_by_type.get(params.get("type", "shell"))
+        if pool == PROCESS_POOL and self._process_workers > 0:
+            return PROCESS_POOL
+        return THREAD_POOL
+
+    def get_ready_steps(self) -> list:
+        """Return steps whose dependencies are satisfied but not yet dispatched."""
+        entries = sorted(e for heap in self._ready.values() for e in heap)
+        return [self._steps[order] for _, _, order in entries]
+
+    def mark_completed(self, order: int) -> list[int]:
+        """Mark step as completed and release dependents.
+
+        Returns:
+            Orders of dependents that became ready as a result.
+
+        """
+        self._completed.add(order)
+        released = []
+        for child in self._dependents.get(order, ()):
+            if child not in self._steps or child in self._cancelled:
+                continue
+            self._indegree[child] -= 1
+            if self._indegree[child] == 0:
+                self._push_ready(child)
+                released.append(child)
+        return released
+
+    def mark_failed(self, order: int) -> None:
+        """Mark step as failed and cancel downstream dependents."""
+        self._failed.add(order)
+        self._cancel_downstream(order)
+
+    def _cancel_downstream(self, failed_order: int) -> None:
+        """Cancel transitive dependents by walking the adjacency list."""
+        queue = deque([failed_order])
+        while queue:
+            current = queue.popleft()
+            for child in self._dependents.get(current, ()):
+                if child in self._cancelled or child not in self._steps:
+                    continue
+                self._cancelled.add(child)
+                queue.append(child)
+
+    def is_done(self) -> bool:
+        """True when all steps are completed, failed, or cancelled."""
+        return len(self._completed) + len(self._failed) + len(self._cancelled) >= len(
+            self._steps,
+        )
+
+    def execute_all(
+        self,
+        executor_fn: Callable,
+        on_complete: Callable | None = None,
+    ) -> dict[int, DAGStepResult]:
+        """Execute all steps, dispatching each as soon as it becomes ready.
+
+        Args:
+            executor_fn: Callable(step) → result with .verification.passed
+            on_complete: Optional callback(order, dag_result) after each step
+
+        Returns:
+            Dict mapping step order → DAGStepResult
+
+        """
+        results: dict[int, DAGStepResult] = {}
+        pools: dict[str, Executor] = {
+            THREAD_POOL: ThreadPoolExecutor(max_workers=self._max_workers),
+        }
+        capacity = {THREAD_POOL: self._max_workers}
+        if self._process_workers > 0:
+            pools[PROCESS_POOL] = ProcessPoolExecutor(max_workers=self._process_workers)
+            capacity[PROCESS_POOL] = self._process_workers
+        in_flight: dict[str, int] = dict.fromkeys(pools, 0)
+        futures: dict[Future, tuple[Any, str]] = {}
+
+        try:
+            while True:
+                for pool_name, pool in pools.items():
+                    heap = self._ready[pool_name]
+                    while heap and in_flight[pool_name] < capacity[pool_name]:
+                        _, _, order = heapq.heappop(heap)
+                        if order in self._cancelled:
+                            continue
+                        step = self._steps[order]
+                        self._dispatched.add(order)
+                        in_flight[pool_name] += 1
+                        futures[pool.submit(executor_fn, step)] = (step, pool_name)
+
+                if not futures:
+                    break
+
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    step, pool_name = futures.pop(future)
+                    in_flight[pool_name] -= 1
+                    dag_result = self._collect(step, future)
+                    results[step.order] = dag_result
+                    if dag_result.success:
+                        self.mark_completed(step.order)
+                    else:
+                        self.mark_failed(step.order)
+                    if on_complete:
+                        on_complete(step.order, dag_result)
+        finally:
+            for pool in pools.values():
+                pool.shutdown(wait=True)
+
+        # Steps waiting on orders that never exist can never run.
+        for order in self._steps:
+            if order not in results and order not in self._cancelled:
+                self._cancelled.add(order)
+        return results
+
+    def _collect(self, step: Any, future: Future) -> DAGStepResult:
+        try:
+            result = future.result()
+        except Exception as e:
+            logger.exception("Step %d failed: %s", step.order, e)
+            return DAGStepResult(order=step.order, success=False, error=str(e))
+        passed = getattr(getattr(result, "verification", None), "passed", False)
+        return DAGStepResult(order=step.order, success=bool(passed), result=result)
+
+    def _push_ready(self, order: int) -> None:
+        step = self._steps[order]
+        if self._priority_fn is not None:
+            priority = float(self._priority_fn(step))
+        else:
+            priority = float(_params_of(step).get("priority", 0) or 0)
+        entry = (-priority, -self._critical_path.get(order, 0.0), order)
+        heapq.heappush(self._ready[self.pool_for(step)], entry)
+
+    def _compute_critical_path(self) -> dict[int, float]:
+        """Longest weighted path from each step to a sink (Kahn, reversed)."""
+        out_degree = {
+            order: sum(1 for c in self._dependents.get(order, ()) if c in self._steps)
+            for order in self._steps
+        }
+        weight = {
+            order: float(_params_of(step).get("weight", 1) or 1)
+            for order, step in self._steps.items()
+        }
+        path: dict[int, float] = {}
+        queue = deque(o for o, d in out_degree.items() if d == 0)
+        while queue:
+            order = queue.popleft()
+            children = [c for c in self._dependents.get(order, ()) if c in path]
+            path[order] = weight[order] + max((path[c] for c in children), default=0.0)
+            for dep in _deps_of(self._steps[order]):
+                if dep in out_degree:
+                    out_degree[dep] -= 1
+                    if out_degree[dep] == 0:
+                        queue.append(dep)
+        return path
+
+
+__all__ = ["PROCESS_POOL", "THREAD_POOL", "EventDrivenDAGScheduler"]
@@ -4,18 +4,27 @@ Temporal-inspired append-only event log for durable execution.
 Enables replay, audit trail, and crash recovery.
 
 Pattern: Every state change is an immutable event appended to history.
+Indexes are kept per workflow and folded into periodic snapshots so
+long-running workflows reload without replaying their whole log.
 """
 
 from __future__ import annotations
 
+import bisect
 import json
+import os
+import threading
 import time
 import uuid
+from collections import Counter
+from collections.abc import Iterable, Iterator
 from dataclasses import asdict, dataclass, field
 from enum import Enum
 from pathlib import Path
 from typing import Any
 
+SNAPSHOT_VERSION = 1
+
 
 class EventKind(str, Enum):
     """Types of execution events (mirrors Temporal event types)."""
@@ -65,84 +74,207 @@ class ExecutionEvent:
         )
 
 
+class _WorkflowIndex:
+    """Incrementally maintained view of one workflow's history.
+
+    Every query the orchestrator makes inside its step loops (last
+    checkpoint, events of a step, retry count) is answered from these
+    structures instead of re-sorting the full event list.
+    """
+
+    def __init__(self) -> None:
+        self.events: list[ExecutionEvent] = []
+        self._timestamps: list[float] = []
+        self.by_step: dict[int, list[ExecutionEvent]] = {}
+        self.last_checkpoint = 0
+        self.retries: Counter[int] = Counter()
+        self.kind_counts: Counter[str] = Counter()
+        self.status = "running"
+        self.started_at: float | None = None
+        self.updated_at: float | None = None
+        self.event_count = 0  # Includes events folded into a snapshot
+
+    def add(self, event: ExecutionEvent) -> None:
+        # Events almost always arrive in timestamp order; only out-of-order
+        # arrivals (parallel steps) pay for a binary search.
+        if not self._timestamps or event.timestamp >= self._timestamps[-1]:
+            self.events.append(event)
+            self._timestamps.append(event.timestamp)
+        else:
+            i = bisect.bisect_right(self._timestamps, event.timestamp)
+            self.events.insert(i, event)
+            self._timestamps.insert(i, event.timestamp)
+        if event.step_order is not None:
+            step_events = self.by_step.setdefault(event.step_order, [])
+            if not step_events or event.timestamp >= step_events[-1].timestamp:
+                step_events.append(event)
+            else:
+                keys = [e.timestamp for e in step_events]
+                step_events.insert(bisect.bisect_right(keys, event.timestamp), event)
+        self._fold(event)
+
+    def _fold(self, event: ExecutionEvent) -> None:
+        """Update the summary counters (also used when replaying a snapshot tail)."""
+        kind = event.kind
+        if kind == EventKind.STEP_COMPLETED and event.step_order:
+            self.last_checkpoint = max(self.last_checkpoint, event.step_order)
+        elif kind == EventKind.STEP_RETRIED and event.step_order is not None:
+            self.retries[event.step_order] += 1
+        elif kind == EventKind.WORKFLOW_STARTED:
+            self.status = "running"
+        elif kind == EventKind.WORKFLOW_COMPLETED:
+            self.status = "completed"
+        elif kind == EventKind.WORKFLOW_FAILED:
+            self.status = "failed"
+        self.kind_counts[kind.value] += 1
+        self.event_count += 1
+        if self.started_at is None or event.timestamp < self.started_at:
+            self.started_at = event.timestamp
+        if self.updated_at is None or event.timestamp > self.updated_at:
+            self.updated_at = event.timestamp
+
+    def to_snapshot(self, offset: int) -> dict[str, Any]:
+        return {
+            "version": SNAPSHOT_VERSION,
+            "offset": offset,
+            "last_checkpoint": self.last_checkpoint,
+            "retries": {str(k): v for k, v in self.retries.items()},
+            "kind_counts": dict(self.kind_counts),
+            "status": self.status,
+            "started_at": self.started_at,
+            "updated_at": self.updated_at,
+            "event_count": self.event_count,
+        }
+
+    @classmethod
+    def from_snapshot(cls, snap: dict[str, Any]) -> "_WorkflowIndex":
+        index = cls()
+        index.last_checkpoint = snap["last_checkpoint"]
+        index.retries = Counter({int(k): v for k, v in snap["retries"].items()})
+        index.kind_counts = Counter(snap["kind_counts"])
+        index.status = snap["status"]
+        index.started_at = snap["started_at"]
+        index.updated_at = snap["updated_at"]
+        index.event_count = snap["event_count"]
+        return index
+
+    def summary(self, workflow_id: str) -> dict[str, Any]:
+        return {
+            "workflow_id": workflow_id,
+            "status": self.status,
+            "started_at": self.started_at,
+            "updated_at": self.updated_at,
+            "event_count": self.event_count,
+            "last_checkpoint": self.last_checkpoint or None,
+            "total_retries": sum(self.retries.values()),
+            "kind_counts": dict(self.kind_counts),
+        }
+
+
+def _event_from_line(line: str) -> ExecutionEvent:
+    raw = json.loads(line)
+    raw["kind"] = EventKind(raw["kind"])
+    return ExecutionEvent(**raw)
+
+
 class ExecutionHistory:
     """Append-only event log for workflow execution.
 
     Inspired by Temporal's event sourcing: every state mutation
     is recorded as an immutable event. Supports replay and recovery.
 
-    OPTIMIZATION: Batch events in memory before persisting to reduce I/O.
+    Events are buffered in memory and each is written to
+    ``<workflow_id>.jsonl`` exactly once. Per-workflow indexes are updated
+    on :meth:`append`, so checkpoint and retry lookups are O(1). Once a
+    workflow's log grows by ``snapshot_every`` lines, a snapshot
+    (``<workflow_id>.snapshot.json``) records the folded index and the
+    byte offset it covers; :meth:`load` then replays only the tail. A
+    workflow whose log already existed when this process first appended to
+    it is replayed from disk before its first snapshot, so the snapshot
+    never covers lines its counters have not seen.
     """
 
-    def __init__(self, storage_dir: str | None = None, batch_size: int = 10) -> None:
+    def __init__(
+        self,
+        storage_dir: str | None = None,
+        batch_size: int = 10,
+        snapshot_every: int = 10_000,
+    ) -> None:
         """Initialize history store.
 
         Args:
             storage_dir: Directory for history files. Defaults to .mekong/history/
             batch_size: Number of events to buffer before persisting (default: 10)
+            snapshot_every: Lines written after the last snapshot before a new
+                one is taken (0 disables automatic snapshots)
 
         """
         self._storage_dir = Path(storage_dir) if storage_dir else Path(".mekong/history")
-        self._events: dict[str, list[ExecutionEvent]] = {}
+        self._indexes: dict[str, _WorkflowIndex] = {}
         self._batch_size = batch_size
+        self._snapshot_every = snapshot_every
         self._pending_events: dict[str, list[ExecutionEvent]] = {}  # Unpersisted events
+        self._unsnapshotted: Counter[str] = Counter()
+        self._synced: set[str] = set()  # Indexes that cover the whole on-disk log
+        self._lock = threading.RLock()
+
+    def _index(self, workflow_id: str) -> _WorkflowIndex:
+        index = self._indexes.get(workflow_id)
+        if index is None:
+            index = self._indexes[workflow_id] = _WorkflowIndex()
+            if not self._path(workflow_id).exists():
+                self._synced.add(workflow_id)
+        return index
+
+    def _path(self, workflow_id: str) -> Path:
+        return self._storage_dir / f"{workflow_id}.jsonl"
+
+    def _snapshot_path(self, workflow_id: str) -> Path:
+        return self._storage_dir / f"{workflow_id}.snapshot.json"
 
     def append(self, event: ExecutionEvent) -> None:
         """Append an event to the workflow's history (immutable, never modified)."""
         wf_id = event.workflow_id
-        if wf_id not in self._events:
-            self._events[wf_id] = []
-        self._events[wf_id].append(event)
+        with self._lock:
+            self._index(wf_id).add(event)
 
-        # Batch buffering — persist when batch_size reached
-        if wf_id not in self._pending_events:
-            self._pending_events[wf_id] = []
-        self._pending_events[wf_id].append(event)
-
-        if len(self._pending_events[wf_id]) >= self._batch_size:
-            self.flush(wf_id)
+            # Batch buffering — persist when batch_size reached
+            pending = self._pending_events.setdefault(wf_id, [])
+            pending.append(event)
+            if len(pending) >= self._batch_size:
+                self.flush(wf_id)
 
     def get_history(self, workflow_id: str) -> list[ExecutionEvent]:
-        """Get all events for a workflow, ordered by timestamp."""
-        return sorted(
-            self._events.get(workflow_id, []),
-            key=lambda e: e.timestamp,
-        )
+        """Get all events for a workflow, ordered by timestamp.
+
+        After a snapshot-based :meth:`load`, only events newer than the
+        snapshot are held in memory; ``load(full=True)`` restores all.
+        """
+        with self._lock:
+            index = self._indexes.get(workflow_id)
+            return list(index.events) if index else []
 
     def get_last_checkpoint(self, workflow_id: str) -> int | None:
         """Find the last successfully completed step order for crash recovery."""
-        history = self.get_history(workflow_id)
-        last_completed = 0
-        for event in history:
-            if event.kind == EventKind.STEP_COMPLETED and event.step_order:
-                last_completed = max(last_completed, event.step_order)
-        return last_completed if last_completed > 0 else None
+        index = self._indexes.get(workflow_id)
+        return index.last_checkpoint or None if index else None
 
     def get_step_events(
         self, workflow_id: str, step_order: int,
     ) -> list[ExecutionEvent]:
         """Get all events for a specific step."""
-        return [
-            e for e in self.get_history(workflow_id)
-            if e.step_order == step_order
-        ]
+        with self._lock:
+            index = self._indexes.get(workflow_id)
+            return list(index.by_step.get(step_order, [])) if index else []
 
     def get_retry_count(self, workflow_id: str, step_order: int) -> int:
         """Count how many times a step has been retried."""
-        return sum(
-            1 for e in self.get_step_events(workflow_id, step_order)
-            if e.kind == EventKind.STEP_RETRIED
-        )
+        index = self._indexes.get(workflow_id)
+        return index.retries[step_order] if index else 0
 
     def persist(self, workflow_id: str) -> Path:
-        """Write workflow history to disk as append-only JSON lines."""
-        self._storage_dir.mkdir(parents=True, exist_ok=True)
-        filepath = self._storage_dir / f"{workflow_id}.jsonl"
-        with open(filepath, "a", encoding="utf-8") as f:
-            for event in self._events.get(workflow_id, []):
-                line = json.dumps(asdict(event), default=str)
-                f.write(line + "\n")
-        return filepath
+        """Write any unpersisted events to disk; already written ones are skipped."""
+        return self.flush(workflow_id) or self._path(workflow_id)
 
     def flush(self, workflow_id: str) -> Path | None:
         """Flush pending events to disk (batch persist).
@@ -150,38 +282,99 @@ class ExecutionHistory:
         Returns:
             Path to file if events were flushed, None if no pending events.
         """
-        if not self._pending_events.get(workflow_id):
-            return None
-
-        self._storage_dir.mkdir(parents=True, exist_ok=True)
-        filepath = self._storage_dir / f"{workflow_id}.jsonl"
-        with open(filepath, "a", encoding="utf-8") as f:
-            for event in self._pending_events[workflow_id]:
-                line = json.dumps(asdict(event), default=str)
-                f.write(line + "\n")
-
-        self._pending_events[workflow_id] = []
-        return filepath
+        with self._lock:
+            pending = self._pending_events.get(workflow_id)
+            if not pending:
+                return None
+
+            self._storage_dir.mkdir(parents=True, exist_ok=True)
+            filepath = self._path(workflow_id)
+            lines = "".join(json.dumps(asdict(e), default=str) + "\n" for e in pending)
+            with open(filepath, "a", encoding="utf-8") as f:
+                f.write(lines)
+                offset = f.tell()
+
+            self._pending_events[workflow_id] = []
+            self._unsnapshotted[workflow_id] += len(pending)
+            if self._snapshot_every and self._unsnapshotted[workflow_id] >= self._snapshot_every:
+                self._write_snapshot(workflow_id, offset)
+            return filepath
 
     def flush_all(self) -> None:
         """Flush all pending events to disk."""
         for wf_id in list(self._pending_events.keys()):
             self.flush(wf_id)
 
-    def load(self, workflow_id: str) -> list[ExecutionEvent]:
-        """Load workflow history from disk."""
-        filepath = self._storage_dir / f"{workflow_id}.jsonl"
-        if not filepath.exists():
-            return []
-        events: list[ExecutionEvent] = []
-        for line in filepath.read_text(encoding="utf-8").strip().split("\n"):
-            if not line:
-                continue
-            raw = json.loads(line)
-            raw["kind"] = EventKind(raw["kind"])
-            events.append(ExecutionEvent(**raw))
-        self._events[workflow_id] = events
-        return events
+    def snapshot(self, workflow_id: str) -> Path | None:
+        """Flush, then snapshot the workflow's index so load() can skip the log.
+
+        Returns:
+            Path to the snapshot, or None if the workflow has no history.
+        """
+        with self._lock:
+            self.flush(workflow_id)
+            filepath = self._path(workflow_id)
+            if workflow_id not in self._indexes or not filepath.exists():
+                return None
+            return self._write_snapshot(workflow_id, filepath.stat().st_size)
+
+    def _write_snapshot(self, workflow_id: str, offset: int) -> Path:
+        if workflow_id not in self._synced:
+            # Only this process's events are indexed; fold in the rest of the log
+            index, _, offset = self._replay(workflow_id, full=False)
+            self._indexes[workflow_id] = index
+            self._synced.add(workflow_id)
+        path = self._snapshot_path(workflow_id)
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(json.dumps(self._indexes[workflow_id].to_snapshot(offset)), encoding="utf-8")
+        os.replace(tmp, path)
+        self._unsnapshotted[workflow_id] = 0
+        return path
+
+    def _read_snapshot(self, workflow_id: str) -> dict[str, Any] | None:
+        try:
+            snap = json.loads(self._snapshot_path(workflow_id).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        return snap if snap.get("version") == SNAPSHOT_VERSION else None
+
+    def _replay(self, workflow_id: str, full: bool) -> tuple[_WorkflowIndex, int, int]:
+        """Rebuild an index from snapshot + log tail.
+
+        Returns:
+            (index, lines read, byte offset the index covers)
+        """
+        snap = None if full else self._read_snapshot(workflow_id)
+        index = _WorkflowIndex.from_snapshot(snap) if snap else _WorkflowIndex()
+        offset = snap["offset"] if snap else 0
+        lines = 0
+        filepath = self._path(workflow_id)
+        if filepath.exists():
+            with open(filepath, "rb") as f:
+                f.seek(offset)
+                for raw in f:
+                    if not raw.endswith(b"\n"):
+                        break  # Another process is mid-write
+                    offset += len(raw)
+                    line = raw.decode("utf-8")
+                    if line.strip():
+                        index.add(_event_from_line(line))
+                        lines += 1
+        return index, lines, offset
+
+    def load(self, workflow_id: str, full: bool = False) -> list[ExecutionEvent]:
+        """Load workflow history from disk.
+
+        Uses the snapshot when present, replaying only the lines written
+        after it; ``full=True`` replays the whole log.
+        """
+        with self._lock:
+            self.flush(workflow_id)
+            index, lines, _ = self._replay(workflow_id, full)
+            self._indexes[workflow_id] = index
+            self._synced.add(workflow_id)
+            self._unsnapshotted[workflow_id] = lines
+            return list(index.events)
 
     def workflow_ids(self) -> list[str]:
         """List all workflow IDs with persisted history."""
@@ -189,12 +382,76 @@ class ExecutionHistory:
             return []
         return [p.stem for p in self._storage_dir.glob("*.jsonl")]
 
+    # ===== Cross-workflow analytics =====
+
+    def summary(self, workflow_id: str) -> dict[str, Any] | None:
+        """Status, timing, checkpoint and retry totals for one workflow."""
+        with self._lock:
+            index = self._indexes.get(workflow_id)
+            if index is None:
+                if not self._path(workflow_id).exists():
+                    return None
+                index, _, _ = self._replay(workflow_id, full=False)
+            return index.summary(workflow_id)
+
+    def summaries(self, status: str | None = None) -> list[dict[str, Any]]:
+        """Summaries of every known workflow, optionally filtered by status."""
+        with self._lock:
+            ids = set(self.workflow_ids()) | set(self._indexes)
+        result = [s for s in (self.summary(wf_id) for wf_id in sorted(ids)) if s]
+        if status is not None:
+            result = [s for s in result if s["status"] == status]
+        return result
+
+    def query(
+        self,
+        kinds: Iterable[EventKind] | None = None,
+        workflow_ids: Iterable[str] | None = None,
+        since: float | None = None,
+        until: float | None = None,
+        step_order: int | None = None,
+    ) -> Iterator[ExecutionEvent]:
+        """Stream events across workflows matching every given filter.
+
+        Persisted events are read line by line (never whole files), then
+        events still buffered in memory are included.
+        """
+        wanted = {EventKind(k) for k in kinds} if kinds is not None else None
+
+        def _match(e: ExecutionEvent) -> bool:
+            return (
+                (wanted is None or e.kind in wanted)
+                and (since is None or e.timestamp >= since)
+                and (until is None or e.timestamp < until)
+                and (step_order is None or e.step_order == step_order)
+            )
+
+        with self._lock:
+            ids = list(workflow_ids) if workflow_ids is not None else sorted(
+                set(self.workflow_ids()) | set(self._pending_events),
+            )
+            pending = {wf: list(self._pending_events.get(wf, [])) for wf in ids}
+        for wf_id in ids:
+            filepath = self._path(wf_id)
+            if filepath.exists():
+                with open(filepath, encoding="utf-8") as f:
+                    for line in f:
+                        if line.strip():
+                            event = _event_from_line(line)
+                            if _match(event):
+                                yield event
+            yield from (e for e in pending[wf_id] if _match(e))
+
     def clear(self, workflow_id: str) -> None:
         """Remove all events for a workflow (for testing only)."""
-        self._events.pop(workflow_id, None)
-        filepath = self._storage_dir / f"{workflow_id}.jsonl"
-        if filepath.exists():
-            filepath.unlink()
+        with self._lock:
+            self._indexes.pop(workflow_id, None)
+            self._pending_events.pop(workflow_id, None)
+            self._unsnapshotted.pop(workflow_id, None)
+            self._synced.discard(workflow_id)
+            for filepath in (self._path(workflow_id), self._snapshot_path(workflow_id)):
+                if filepath.exists():
+                    filepath.unlink()
 
 
 __all__ = [
@@ -4,38 +4,60 @@ Executes recipes parsed from Markdown files.
 Returns ExecutionResult for orchestrator integration.
 """
 
-import re
 import shlex
 import subprocess
+import threading
 import time
+from collections.abc import Callable
 
 from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
 
 from src.core.parser import Recipe, RecipeStep
+from src.core.process_runner import get_process_runner
 from src.core.verifier import ExecutionResult
 from src.security.command_sanitizer import CommandSanitizer
 
-DANGEROUS_PATTERNS = [
-    "rm -rf /", "mkfs", "dd if=", ": (){",
-    "chmod -R 777 /", "curl.*|.*sh", "wget.*|.*sh",
-    "eval ", "exec(", "> /dev/sd", "shutdown", "reboot", "init 0",
-]
+
+SHELL_TIMEOUT = 300  # seconds per shell step attempt
 
 
 class RecipeExecutor:
     """Executes a Recipe step by step, returning structured results."""
 
-    def __init__(self, recipe: Recipe) -> None:
+    def __init__(
+        self,
+        recipe: Recipe,
+        token_callback: Callable[[RecipeStep, str], None] | None = None,
+        output_callback: Callable[[RecipeStep, str, str], None] | None = None,
+    ) -> None:
         """Initialize RecipeExecutor with a parsed recipe.
 
         Args:
             recipe: The Recipe object containing steps to execute.
+            token_callback: Optional callback(step, delta) invoked for each
+                streamed LLM token. When set, LLM steps use chat_stream().
+            output_callback: Optional callback(step, stream, line) invoked
+                for each line a shell step prints, while it runs.
 
         """
         self.recipe = recipe
         self.console = Console()
+        self.token_callback = token_callback
+        self.output_callback = output_callback
+        # Compiled patterns and verdicts are shared process-wide
+        self.sanitizer = CommandSanitizer(strict_mode=True)
+        self.process_runner = get_process_runner()
+        self._cancel = threading.Event()
+
+    def cancel(self) -> None:
+        """Kill the running shell step's process group and stop retrying.
+
+        Later shell steps of the same run return "cancelled" without starting;
+        the next :meth:`run` clears the request.
+        """
+        self._cancel.set()
 
     def _is_safe_command(self, command: str) -> bool:
         """Check command against dangerous patterns before execution.
@@ -47,11 +69,7 @@ class RecipeExecutor:
             False if any dangerous pattern matches, True if safe.
 
         """
-        lower = command.lower()
-        for pattern in DANGEROUS_PATTERNS:
-            if re.search(pattern, lower, re.IGNORECASE):
-                return False
-        return True
+        return self.sanitizer.is_command_safe(command)
 
     def execute_step(self, step: RecipeStep) -> ExecutionResult:
         """Execute a single step.
@@ -102,21 +120,29 @@ class RecipeExecutor:
                 messages.append({"role": "system", "content": system_prompt})
             messages.append({"role": "user", "content": prompt})
 
-            response = client.chat(messages)
-            output = response.content[:2000]
+            if self.token_callback:
+                parts = []
+                for delta in client.chat_stream(messages):
+                    parts.append(delta)
+                    self.token_callback(step, delta)
+                content, model = "".join(parts), client.model
+            else:
+                response = client.chat(messages)
+                content, model = response.content, response.model
+
             self.console.print(
                 Panel(
-                    output,
-                    title=f"LLM Output ({response.model})",
+                    content[:2000],
+                    title=f"LLM Output ({model})",
                     border_style="cyan",
                     expand=False,
                 ),
             )
             return ExecutionResult(
                 exit_code=0,
-                stdout=response.content,
+                stdout=content,
                 stderr="",
-                metadata={"mode": "llm", "model": response.model},
+                metadata={"mode": "llm", "model": model},
             )
 
         except Exception as e:
@@ -331,9 +357,8 @@ class RecipeExecutor:
                 metadata={"mode": "shell", "command": command, "security_blocked": True},
             )
 
-        # SECURITY: Sanitize command before execution
-        sanitizer = CommandSanitizer(strict_mode=True)
-        sanitization_result = sanitizer.sanitize(command)
+        # SECURITY: Sanitize command before execution (cached verdict from the check above)
+        sanitization_result = self.sanitizer.sanitize(command)
 
         if not sanitization_result.is_safe:
             error_msg = f"Command blocked - dangerous patterns detected: {', '.join(sanitization_result.blocked_patterns)}"
@@ -357,6 +382,13 @@ class RecipeExecutor:
         for warning in sanitization_result.warnings:
             self.console.print(f"[yellow]Security Warning:[/yellow] {warning}")
 
+        on_line = None
+        if self.output_callback:
+            output_callback = self.output_callback
+
+            def on_line(stream: str, line: str) -> None:
+                output_callback(step, stream, line)
+
         max_attempts = step.params.get("retry", 1) + 1 if step.params else 2
         retry_delay = step.params.get("retry_delay", 2) if step.params else 2
 
@@ -369,10 +401,31 @@ class RecipeExecutor:
 
             self.console.print(f"[dim]Running:[/dim] {command}")
 
+            metadata = {"mode": "shell", "command": command, "attempt": attempt}
             try:
-                process = subprocess.run(
-                    shlex.split(command), check=True, text=True, capture_output=True, timeout=300,
+                process = self.process_runner.run(
+                    shlex.split(command), timeout=SHELL_TIMEOUT, on_line=on_line, cancel=self._cancel,
                 )
+                if process.timed_out:
+                    process.discard_spills()  # Timeouts are not retried or reported with output
+                if process.spill_paths:
+                    metadata["output_files"] = process.spill_paths
+                if process.cancelled:
+                    self.console.print(f"[yellow]Step {step.order} cancelled[/yellow]")
+                    return ExecutionResult(
+                        exit_code=process.returncode or 1,
+                        stdout=process.stdout,
+                        stderr=process.stderr,
+                        metadata={**metadata, "cancelled": True},
+                    )
+                if process.timed_out:
+                    raise subprocess.TimeoutExpired(
+                        process.argv, SHELL_TIMEOUT, process.stdout, process.stderr,
+                    )
+                if process.returncode != 0:
+                    raise subprocess.CalledProcessError(
+                        process.returncode, process.argv, process.stdout, process.stderr,
+                    )
 
                 if process.stdout:
                     self.console.print(
@@ -398,16 +451,13 @@ class RecipeExecutor:
                     exit_code=process.returncode,
                     stdout=process.stdout or "",
                     stderr=process.stderr or "",
-                    metadata={
-                        "mode": "shell",
-                        "command": command,
-                        "attempt": attempt,
-                    },
+                    metadata=metadata,
                 )
 
             except subprocess.CalledProcessError as e:
                 # Retry if not on last attempt
-                if attempt < max_attempts:
+                if attempt < max_attempts and not self._cancel.is_set():
+                    process.discard_spills()  # Only the final attempt's output is reported
                     self.console.print(
                         f"[yellow]Step {step.order} failed (exit {e.returncode})[/yellow]",
                     )
@@ -439,11 +489,7 @@ class RecipeExecutor:
                     stdout=e.stdout or "",
                     stderr=e.stderr or "",
                     error=e,
-                    metadata={
-                        "mode": "shell",
-                        "command": command,
-                        "attempt": attempt,
-                    },
+                    metadata=metadata,
                 )
             except Exception as e:
                 self.console.print(f"[bold red]Unexpected error:[/bold red] {e!s}")
@@ -452,11 +498,7 @@ class RecipeExecutor:
                     stdout="",
                     stderr=str(e),
                     error=e,
-                    metadata={
-                        "mode": "shell",
-                        "command": command,
-                        "attempt": attempt,
-                    },
+                    metadata=metadata,
                 )
 
         # Should not reach here, but safety fallback
@@ -469,6 +511,7 @@ class RecipeExecutor:
 
     def run(self) -> bool:
         """Run the full recipe (legacy mode, returns bool for backward compat)."""
+        self._cancel.clear()
         self.console.print(
             Panel(
                 Text(self.recipe.description, style="italic"),
@@ -0,0 +1,339 @@
+"""
+Mekong CLI - File Tree Index
+
+Incremental, depth-limited index of a working tree for the World Model.
+Each directory's listing is cached and only re-read when it changes:
+inotify (via ctypes, Linux) marks changed directories, and everywhere
+else a directory's mtime gates its re-listing. Noise directories are
+pruned instead of walked.
+
+Every directory becomes an immutable TreeNode with a structural digest
+(file names plus child digests). Unchanged directories keep the same node
+object across refreshes, so two snapshots share their unchanged subtrees
+and ``diff_trees`` skips any subtree whose digest matches.
+"""
+
+import ctypes
+import ctypes.util
+import hashlib
+import logging
+import os
+import struct
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Iterator, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EXCLUSIONS: FrozenSet[str] = frozenset({
+    ".git", "node_modules", "__pycache__", ".venv",
+    "venv", ".tox", ".mypy_cache", ".pytest_cache",
+    "dist", "build", ".egg-info",
+})
+
+# A listing taken in the same mtime tick as a change may miss it, so
+# mtime-gated reuse only trusts directories older than this
+_MTIME_SETTLE_NS = 1_000_000_000
+
+# inotify(7) constants
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ONLYDIR = 0x01000000
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_LISTING_EVENTS = _IN_CREATE | _IN_DELETE | _IN_MOVED_FROM | _IN_MOVED_TO
+_SELF_EVENTS = _IN_DELETE_SELF | _IN_MOVE_SELF
+_WATCH_MASK = _LISTING_EVENTS | _SELF_EVENTS | _IN_CLOSE_WRITE | _IN_ONLYDIR
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+@dataclass(frozen=True, eq=False)
+class TreeNode:
+    """One indexed directory: its files, indexed subdirectories and digest."""
+
+    files: Tuple[str, ...] = ()
+    dirs: Dict[str, "TreeNode"] = field(default_factory=dict)
+    digest: bytes = b""
+    file_count: int = 0
+
+    def paths(self, prefix: str = "") -> Iterator[str]:
+        """Relative file paths, each directory's files before its subdirectories."""
+        for name in self.files:
+            yield os.path.join(prefix, name) if prefix else name
+        for name, child in self.dirs.items():
+            yield from child.paths(os.path.join(prefix, name) if prefix else name)
+
+
+def _make_node(files: Tuple[str, ...], dirs: Dict[str, TreeNode]) -> TreeNode:
+    h = hashlib.blake2b(digest_size=16)
+    for name in files:
+        h.update(b"f" + os.fsencode(name) + b"\0")
+    for name, child in dirs.items():
+        h.update(b"d" + os.fsencode(name) + b"\0" + child.digest)
+    return TreeNode(
+        files=files,
+        dirs=dirs,
+        digest=h.digest(),
+        file_count=len(files) + sum(child.file_count for child in dirs.values()),
+    )
+
+
+def diff_trees(
+    before: TreeNode, after: TreeNode, prefix: str = "",
+) -> Tuple[List[str], List[str]]:
+    """
+    Files added and removed between two trees, sorted.
+
+    Subtrees with equal digests are skipped without being visited.
+    """
+    added: List[str] = []
+    removed: List[str] = []
+
+    def walk(a: TreeNode, b: TreeNode, base: str) -> None:
+        if a is b or a.digest == b.digest:
+            return
+        join = (lambda name: os.path.join(base, name)) if base else (lambda name: name)
+        a_files, b_files = set(a.files), set(b.files)
+        added.extend(join(name) for name in b_files - a_files)
+        removed.extend(join(name) for name in a_files - b_files)
+        for name in a.dirs.keys() | b.dirs.keys():
+            old, new = a.dirs.get(name), b.dirs.get(name)
+            if old is None:
+                added.extend(new.paths(join(name)))
+            elif new is None:
+                removed.extend(old.paths(join(name)))
+            else:
+                walk(old, new, join(name))
+
+    walk(before, after, prefix)
+    return sorted(added), sorted(removed)
+
+
+class _DirWatch:
+    """inotify watches on indexed directories, reporting which ones changed."""
+
+    def __init__(self) -> None:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self._fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._rels: Dict[int, str] = {}
+
+    def add(self, path: str, rel: str) -> None:
+        wd = self._add_watch(self._fd, os.fsencode(path), _WATCH_MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {path}")
+        self._rels[wd] = rel
+
+    def read(self) -> Tuple[Set[str], bool, bool]:
+        """Drain pending events: (directories to re-list, any file written, overflowed)."""
+        dirty: Set[str] = set()
+        written = overflow = False
+        while True:
+            try:
+                buf = os.read(self._fd, 65536)
+            except BlockingIOError:
+                break
+            if not buf:
+                break
+            offset = 0
+            while offset < len(buf):
+                wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(buf, offset)
+                offset += _EVENT_HEADER.size + length
+                if mask & _IN_Q_OVERFLOW:
+                    overflow = True
+                    continue
+                rel = self._rels.get(wd)
+                if mask & _IN_IGNORED:
+                    self._rels.pop(wd, None)
+                    continue
+                if rel is None:
+                    continue
+                if mask & _LISTING_EVENTS:
+                    dirty.add(rel)
+                if mask & _SELF_EVENTS:
+                    dirty.add(os.path.dirname(rel))
+                if mask & _IN_CLOSE_WRITE:
+                    written = True
+        return dirty, written, overflow
+
+    def close(self) -> None:
+        if getattr(self, "_fd", -1) >= 0:
+            try:
+                os.close(self._fd)
+            except OSError:
+                pass
+            self._fd = -1
+
+    def __del__(self) -> None:
+        self.close()
+
+
+@dataclass
+class _Listing:
+    mtime_ns: int
+    files: Tuple[str, ...]
+    subdirs: Tuple[str, ...]
+    node: Optional[TreeNode] = None
+
+
+class FileTreeIndex:
+    """
+    Cached, incrementally refreshed index of files under a directory.
+
+    Args:
+        root: Directory to index
+        max_depth: Deepest relative path length indexed (files in root = 1)
+        exclusions: Directory and file names skipped everywhere
+        use_inotify: Track changes with inotify when the platform has it
+    """
+
+    def __init__(
+        self,
+        root: str,
+        max_depth: int = 3,
+        exclusions: FrozenSet[str] = DEFAULT_EXCLUSIONS,
+        use_inotify: bool = True,
+    ) -> None:
+        self.root = root
+        self.max_depth = max_depth
+        self.exclusions = exclusions
+        self.generation = 0
+        self._listings: Dict[str, _Listing] = {}
+        self._root_node: Optional[TreeNode] = None
+        self._dirty: Set[str] = set()
+        self._lock = threading.Lock()
+        self._watch: Optional[_DirWatch] = None
+        if use_inotify:
+            try:
+                self._watch = _DirWatch()
+            except (OSError, AttributeError) as e:
+                logger.debug("inotify unavailable, using mtime checks: %s", e)
+
+    @property
+    def backend(self) -> str:
+        """How changes are detected: "inotify" or "mtime"."""
+        return "inotify" if self._watch is not None else "mtime"
+
+    def refresh(self) -> TreeNode:
+        """
+        Bring the index up to date and return its root.
+
+        With inotify and no pending events this returns the previous root
+        without touching the filesystem. Otherwise only directories whose
+        listing changed are re-read; everything else keeps its node.
+        """
+        with self._lock:
+            if self._watch is not None:
+                dirty, written, overflow = self._watch.read()
+                if overflow:
+                    self._listings.clear()
+                self._dirty |= dirty
+                if written:
+                    self.generation += 1
+                if self._root_node is not None and not self._dirty and not overflow:
+                    return self._root_node
+
+            visited: Set[str] = set()
+            node = self._refresh_dir("", 0, visited) or _make_node((), {})
+            self._dirty.clear()
+            if len(visited) != len(self._listings):
+                self._listings = {rel: self._listings[rel] for rel in visited}
+            if node is not self._root_node:
+                self.generation += 1
+                self._root_node = node
+            return node
+
+    def close(self) -> None:
+        """Release inotify resources."""
+        if self._watch is not None:
+            self._watch.close()
+            self._watch = None
+
+    def _refresh_dir(self, rel: str, depth: int, visited: Set[str]) -> Optional[TreeNode]:
+        listing = self._listing(rel)
+        if listing is None:
+            return None
+        visited.add(rel)
+
+        dirs: Dict[str, TreeNode] = {}
+        if depth + 1 < self.max_depth:
+            for name in listing.subdirs:
+                child = self._refresh_dir(os.path.join(rel, name) if rel else name, depth + 1, visited)
+                if child is not None:
+                    dirs[name] = child
+
+        node = listing.node
+        if (
+            node is None
+            or node.files is not listing.files
+            or node.dirs.keys() != dirs.keys()
+            or any(node.dirs[name] is not child for name, child in dirs.items())
+        ):
+            node = listing.node = _make_node(listing.files, dirs)
+        return node
+
+    def _listing(self, rel: str) -> Optional[_Listing]:
+        """A directory's listing, re-read only when it may have changed."""
+        cached = self._listings.get(rel)
+        if cached is not None and self._watch is not None and rel not in self._dirty:
+            return cached
+
+        path = os.path.join(self.root, rel) if rel else self.root
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+        if (
+            cached is not None
+            and cached.mtime_ns == mtime_ns
+            and time.time_ns() - mtime_ns >= _MTIME_SETTLE_NS
+        ):
+            return cached
+
+        if self._watch is not None:
+            # Watch before listing so no change after the listing is missed
+            try:
+                self._watch.add(path, rel)
+            except OSError as e:
+                logger.debug("inotify watch failed, using mtime checks: %s", e)
+                self._watch.close()
+                self._watch = None
+
+        files: List[str] = []
+        subdirs: List[str] = []
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    if entry.name in self.exclusions:
+                        continue
+                    try:
+                        # Same rules as Path.rglob: symlinked dirs are not entered
+                        if entry.is_dir() and not entry.is_symlink():
+                            subdirs.append(entry.name)
+                        elif entry.is_file():
+                            files.append(entry.name)
+                    except OSError:
+                        continue
+        except OSError:
+            return None
+
+        listing = _Listing(mtime_ns, tuple(sorted(files)), tuple(sorted(subdirs)))
+        if cached is not None and cached.files == listing.files:
+            listing.files = cached.files  # keep identity so the node can be reused
+            listing.node = cached.node
+        self._listings[rel] = listing
+        return listing
+
+
+__all__ = ["DEFAULT_EXCLUSIONS", "FileTreeIndex", "TreeNode", "diff_trees"]
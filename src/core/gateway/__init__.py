@@ -6,6 +6,8 @@ from src.core.gateway.gateway_main import (
     PRESET_ACTIONS,
     VERSION,
     AutoRecipeInfo,
+    CommandBatchRequest,
+    CommandBatchResponse,
     CommandRequest,
     CommandResponse,
     GovernanceCheckRequest,
@@ -44,6 +46,8 @@ __all__ = [
     "PRESET_ACTIONS",
     "VERSION",
     "AutoRecipeInfo",
+    "CommandBatchRequest",
+    "CommandBatchResponse",
     "CommandRequest",
     "CommandResponse",
     "GovernanceCheckRequest",
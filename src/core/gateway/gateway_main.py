@@ -9,6 +9,8 @@ import asyncio
 import contextlib
 import json
 import os
+import threading
+from collections import deque
 from collections.abc import AsyncGenerator
 from dataclasses import asdict
 from pathlib import Path
@@ -22,6 +24,8 @@ from fastapi.responses import HTMLResponse
 from src.core.event_bus import EventType, get_event_bus
 from src.core.gateway.models import (
     AutoRecipeInfo,
+    CommandBatchRequest,
+    CommandBatchResponse,
     CommandRequest,
     CommandResponse,
     GovernanceCheckRequest,
@@ -58,6 +62,7 @@ GATEWAY_CONFIG: GatewayConfig = load_config()
 PRESET_ACTIONS: list[dict[str, str]] = GATEWAY_CONFIG.presets
 
 VERSION = "1.0.0"
+WS_OUTPUT_BACKLOG = 10_000  # Output lines queued for a slow /ws client before dropping
 
 
 # -- Token verification --
@@ -75,6 +80,102 @@ def verify_token(token: str) -> None:
         raise HTTPException(status_code=401, detail="Invalid token")
 
 
+class _WsOutbox:
+    """Ordered, non-blocking outbound queue for one /ws connection.
+
+    Worker and pump threads enqueue and return at once; a single sender
+    task on the event loop drains whatever piled up since its last send,
+    merging consecutive output lines of one step/stream into a single
+    ``{"type": "output", "lines": [...]}`` message and consecutive tokens
+    of one step into one delta. Past ``max_lines`` queued output lines,
+    further lines are dropped and reported in a status message (the full
+    output stays in the step result).
+    """
+
+    def __init__(
+        self, websocket: WebSocket, loop: asyncio.AbstractEventLoop,
+        max_lines: int = WS_OUTPUT_BACKLOG,
+    ) -> None:
+        self._websocket = websocket
+        self._loop = loop
+        self._max_lines = max_lines
+        self._lock = threading.Lock()
+        self._items: deque[dict[str, Any]] = deque()
+        self._lines = 0
+        self._dropped = 0
+        self._closed = False
+        self._wake = asyncio.Event()
+
+    def put(self, msg: dict[str, Any]) -> None:
+        """Queue a message (any thread)."""
+        self._enqueue(msg, is_line=False)
+
+    def put_output(self, order: int, stream: str, line: str) -> None:
+        """Queue one output line (any thread); dropped if the backlog is full."""
+        self._enqueue({"type": "output", "order": order, "stream": stream, "lines": [line]}, is_line=True)
+
+    def _enqueue(self, msg: dict[str, Any], is_line: bool) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            if is_line:
+                if self._lines >= self._max_lines:
+                    self._dropped += 1
+                    return
+                self._lines += 1
+            wake = not self._items
+            self._items.append(msg)
+        if wake:
+            self._loop.call_soon_threadsafe(self._wake.set)
+
+    async def run(self) -> None:
+        """Sender task: drain and send until :meth:`close` (event loop only)."""
+        try:
+            while True:
+                await self._wake.wait()
+                self._wake.clear()
+                with self._lock:
+                    items = list(self._items)
+                    self._items.clear()
+                    self._lines = 0
+                    dropped, self._dropped = self._dropped, 0
+                    done = self._closed
+                for msg in self._coalesce(items):
+                    await self._websocket.send_json(msg)
+                if dropped:
+                    await self._websocket.send_json(
+                        {"type": "status", "message": f"{dropped} output lines not streamed (client too slow)"},
+                    )
+                if done:
+                    return
+        except BaseException:
+            with self._lock:
+                self._closed = True  # Client gone: stop queuing for it
+                self._items.clear()
+            raise
+
+    def close(self) -> None:
+        """Stop accepting messages; the sender exits once the queue is sent."""
+        with self._lock:
+            self._closed = True
+        self._wake.set()
+
+    @staticmethod
+    def _coalesce(items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        merged: list[dict[str, Any]] = []
+        for msg in items:
+            last = merged[-1] if merged else None
+            if last is not None and last["type"] == msg["type"] and last.get("order") == msg.get("order"):
+                if msg["type"] == "output" and last["stream"] == msg["stream"]:
+                    last["lines"].extend(msg["lines"])
+                    continue
+                if msg["type"] == "token":
+                    last["delta"] += msg["delta"]
+                    continue
+            merged.append(msg)
+        return merged
+
+
 def build_human_summary(result: OrchestrationResult) -> HumanSummary:
     """Generate a non-dev friendly summary from orchestration result."""
     status = result.status.value
@@ -234,9 +335,26 @@ def create_app() -> FastAPI:
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
 
+    @gateway.post("/cmd/batch")
+    def execute_command_batch(req: CommandBatchRequest) -> CommandBatchResponse:
+        """Execute several independent goals (swarm batch dispatch).
+
+        A failing goal is reported in its slot and does not stop the rest.
+        """
+        verify_token(req.token)
+        results: list[dict[str, Any]] = []
+        for goal in req.goals:
+            try:
+                orchestrator = _build_orchestrator()
+                result = orchestrator.run_from_goal(goal)
+                results.append(_build_cmd_response(result, goal, orchestrator).model_dump())
+            except Exception as e:
+                results.append({"status": "error", "goal": goal, "error": str(e)})
+        return CommandBatchResponse(results=results)
+
     @gateway.websocket("/ws")
     async def ws_execute(websocket: WebSocket) -> None:
-        """Execute a goal with real-time step-by-step progress streaming."""
+        """Execute a goal with real-time step and LLM token streaming."""
         await websocket.accept()
         try:
             data = await websocket.receive_json()
@@ -261,11 +379,11 @@ def create_app() -> FastAPI:
                 {"type": "status", "message": "Planning..."},
             )
 
-            loop = asyncio.get_running_loop()
+            outbox = _WsOutbox(websocket, asyncio.get_running_loop())
 
             def progress_callback(step_result: Any, current_result: Any) -> None:
-                """Send step progress over WebSocket (called from worker thread)."""
-                msg = {
+                """Queue step progress for the client (called from worker thread)."""
+                outbox.put({
                     "type": "step",
                     "order": step_result.step.order,
                     "title": step_result.step.title,
@@ -274,21 +392,49 @@ def create_app() -> FastAPI:
                     "summary": step_result.verification.summary,
                     "completed": current_result.completed_steps,
                     "total": current_result.total_steps,
-                }
-                future = asyncio.run_coroutine_threadsafe(
-                    websocket.send_json(msg), loop,
-                )
-                future.result(timeout=10)
+                })
+
+            def token_callback(step: Any, delta: str) -> None:
+                """Queue each streamed LLM token (worker thread)."""
+                outbox.put({"type": "token", "order": step.order, "delta": delta})
+
+            def output_callback(step: Any, stream: str, line: str) -> None:
+                """Queue each shell output line (pump thread; never waits on the client)."""
+                outbox.put_output(step.order, stream, line)
+
+            running: list[RecipeOrchestrator] = []
+            disconnected = threading.Event()
 
             def run_goal() -> tuple[OrchestrationResult, RecipeOrchestrator]:
                 """Execute the orchestration pipeline in a worker thread."""
                 orchestrator = _build_orchestrator()
+                running.append(orchestrator)
+                if disconnected.is_set():
+                    orchestrator.cancel()
                 result = orchestrator.run_from_goal(
-                    goal, progress_callback=progress_callback,
+                    goal,
+                    progress_callback=progress_callback,
+                    token_callback=token_callback,
+                    output_callback=output_callback,
                 )
                 return result, orchestrator
 
-            result, _orchestrator = await asyncio.to_thread(run_goal)
+            async def cancel_on_disconnect() -> None:
+                """Stop the run (and kill its shell step) once the client goes away."""
+                while (await websocket.receive())["type"] != "websocket.disconnect":
+                    pass
+                disconnected.set()
+                for orchestrator in running:
+                    orchestrator.cancel()
+
+            sender = asyncio.create_task(outbox.run())
+            watcher = asyncio.create_task(cancel_on_disconnect())
+            try:
+                result, _orchestrator = await asyncio.to_thread(run_goal)
+            finally:
+                watcher.cancel()
+                outbox.close()
+                await sender
 
             human_summary = build_human_summary(result)
             await websocket.send_json({
@@ -428,6 +574,12 @@ def create_app() -> FastAPI:
     # -- Memory endpoints --
     memory_store = MemoryStore()
 
+    @gateway.get("/events/stats")
+    def event_bus_stats() -> dict[str, Any]:
+        """Event bus dispatch mode plus per-subscriber lag and drop counters."""
+        bus = get_event_bus()
+        return {"dispatch": bus.dispatch, "subscribers": bus.stats()}
+
     @gateway.get("/memory/recent")
     def memory_recent(limit: int = 20) -> list[MemoryEntryInfo]:
         """Get recent execution memory entries."""
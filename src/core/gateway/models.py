@@ -16,6 +16,13 @@ class CommandRequest(BaseModel):
     token: str = Field(..., min_length=1, description="API authentication token")
 
 
+class CommandBatchRequest(BaseModel):
+    """Several independent goals for one node, sent in one request."""
+
+    goals: list[str] = Field(..., min_length=1, description="Goals to execute in order")
+    token: str = Field(..., min_length=1, description="API authentication token")
+
+
 class StepSummary(BaseModel):
     """Summary of a single execution step."""
 
@@ -49,6 +56,12 @@ class CommandResponse(BaseModel):
     human_summary: HumanSummary | None = None
 
 
+class CommandBatchResponse(BaseModel):
+    """Per-goal results of a batch, in request order."""
+
+    results: list[dict[str, Any]]
+
+
 class HealthResponse(BaseModel):
     """Health check response."""
 
@@ -0,0 +1,129 @@
+"""Mekong CLI - Keyword Matcher.
+
+Aho–Corasick automaton over labelled keyword groups. One pass over a
+string finds every keyword occurrence, including overlapping ones and
+keywords that are prefixes of others, so results are identical to
+checking ``keyword in text`` for each keyword, but the cost no longer
+grows with the number of keywords.
+
+``scan_goal`` runs the shared goal matcher, compiled from the NLU intent
+keywords and the task classifier signal tables. Both classifiers read
+their signals from the same (cached) scan of a goal.
+"""
+
+from __future__ import annotations
+
+import functools
+from collections import deque
+from collections.abc import Hashable, Iterable, Mapping
+
+KeywordHits = dict[Hashable, list[str]]
+
+
+class KeywordMatcher:
+    """Compiled multi-keyword matcher.
+
+    Matching is case-sensitive; callers lowercase both keywords and text,
+    as the classifiers already do.
+    """
+
+    def __init__(self, groups: Mapping[Hashable, Iterable[str]]) -> None:
+        """Compile keyword groups.
+
+        Args:
+            groups: Label -> keywords. Order is kept: ``scan`` lists each
+                group's hits in definition order, duplicates included.
+
+        """
+        # One entry per (label, keyword) definition, in definition order
+        self._entries: list[tuple[Hashable, str]] = [
+            (label, keyword) for label, keywords in groups.items() for keyword in keywords
+        ]
+        entry_ids: dict[str, list[int]] = {}
+        for entry_id, (_, keyword) in enumerate(self._entries):
+            entry_ids.setdefault(keyword, []).append(entry_id)
+
+        # Empty keywords are in every string
+        self._always = sorted(entry_ids.pop("", []))
+
+        # Trie
+        goto: list[dict[str, int]] = [{}]
+        outputs: list[list[int]] = [[]]
+        for keyword, ids in entry_ids.items():
+            state = 0
+            for ch in keyword:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    goto.append({})
+                    outputs.append([])
+                    nxt = goto[state][ch] = len(goto) - 1
+                state = nxt
+            outputs[state].extend(ids)
+
+        # Failure links (BFS), folded into a full transition table so the
+        # scan loop is one dict lookup per character
+        fail = [0] * len(goto)
+        delta: list[dict[str, int]] = [dict(goto[0])] + [{} for _ in goto[1:]]
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            outputs[state].extend(outputs[fail[state]])
+            delta[state] = {**delta[fail[state]], **goto[state]}
+            for ch, nxt in goto[state].items():
+                fail[nxt] = delta[fail[state]].get(ch, 0)
+                queue.append(nxt)
+        for transitions in delta:
+            for ch in [ch for ch, nxt in transitions.items() if nxt == 0]:
+                del transitions[ch]
+
+        self._delta = delta
+        self._outputs = [tuple(ids) for ids in outputs]
+
+    def scan(self, text: str) -> KeywordHits:
+        """Keywords found in ``text``, by label.
+
+        Labels without hits are absent. Within a label, keywords follow
+        definition order and repeat if defined more than once.
+        """
+        delta = self._delta
+        outputs = self._outputs
+        found: set[int] = set(self._always)
+        state = 0
+        for ch in text:
+            state = delta[state].get(ch, 0)
+            if outputs[state]:
+                found.update(outputs[state])
+
+        hits: KeywordHits = {}
+        entries = self._entries
+        for entry_id in sorted(found):
+            label, keyword = entries[entry_id]
+            hits.setdefault(label, []).append(keyword)
+        return hits
+
+
+@functools.lru_cache(maxsize=1)
+def goal_matcher() -> KeywordMatcher:
+    """Shared matcher over every goal-classification keyword table.
+
+    Labels are ``("intent", Intent)`` for NLU intents plus the labels of
+    ``task_classifier.SIGNAL_GROUPS``. Built on first use; later edits to
+    those tables are not picked up.
+    """
+    from src.core.nlu import KEYWORD_MAP
+    from src.core.task_classifier import SIGNAL_GROUPS
+
+    groups: dict[Hashable, Iterable[str]] = {
+        ("intent", intent): keywords for intent, keywords in KEYWORD_MAP.items()
+    }
+    groups.update(SIGNAL_GROUPS)
+    return KeywordMatcher(groups)
+
+
+@functools.lru_cache(maxsize=4096)
+def scan_goal(goal_lower: str) -> KeywordHits:
+    """Scan a lowercased goal with the shared matcher (cached; do not mutate)."""
+    return goal_matcher().scan(goal_lower)
+
+
+__all__ = ["KeywordHits", "KeywordMatcher", "goal_matcher", "scan_goal"]
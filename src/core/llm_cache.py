@@ -3,6 +3,9 @@
 Portkey-inspired caching layer for LLM responses.
 Simple hash-based cache with TTL support and hit rate tracking.
 Reduces cost and latency for repeated or similar prompts.
+
+Optionally backed by a persistent DiskCacheTier (llm_cache_store) so
+entries survive across processes; the in-memory LRU stays in front.
 """
 
 from __future__ import annotations
@@ -13,7 +16,10 @@ import logging
 import time
 from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .llm_cache_store import DiskCacheTier
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +50,7 @@ class CacheStats:
 
     hits: int = 0
     misses: int = 0
+    disk_hits: int = 0
     evictions: int = 0
     total_entries: int = 0
     estimated_cost_saved: float = 0.0
@@ -62,6 +69,7 @@ class LLMCache:
 
     Uses ordered dict for O(1) LRU eviction.
     Cache key is SHA-256 hash of (messages + model + temperature).
+    A lookup counts as exactly one hit or one miss, whichever tier answers.
     """
 
     def __init__(
@@ -69,6 +77,7 @@ class LLMCache:
         max_entries: int = 1000,
         default_ttl: int = 3600,
         cost_per_hit: float = 0.001,
+        disk_tier: DiskCacheTier | None = None,
     ) -> None:
         """Initialize LLM cache.
 
@@ -76,12 +85,14 @@ class LLMCache:
             max_entries: Maximum cache entries before LRU eviction
             default_ttl: Default time-to-live in seconds
             cost_per_hit: Estimated cost saved per cache hit (USD)
+            disk_tier: Optional persistent tier consulted on memory misses
 
         """
         self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
         self.max_entries = max_entries
         self.default_ttl = default_ttl
         self.cost_per_hit = cost_per_hit
+        self.disk_tier = disk_tier
         self.stats = CacheStats()
 
     @staticmethod
@@ -127,20 +138,22 @@ class LLMCache:
         """
         key = self._make_key(messages, model, temperature)
 
-        if key not in self._cache:
-            self.stats.misses += 1
-            return None
-
-        entry = self._cache[key]
-
-        if entry.is_expired:
+        entry = self._cache.get(key)
+        if entry is not None and entry.is_expired:
             del self._cache[key]
-            self.stats.misses += 1
             self.stats.total_entries = len(self._cache)
-            return None
+            entry = None
+
+        if entry is None:
+            entry = self._get_from_disk(key)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            self.stats.disk_hits += 1
+        else:
+            # Move to end (most recently used)
+            self._cache.move_to_end(key)
 
-        # Move to end (most recently used)
-        self._cache.move_to_end(key)
         entry.hit_count += 1
         self.stats.hits += 1
         self.stats.estimated_cost_saved += self.cost_per_hit
@@ -148,6 +161,30 @@ class LLMCache:
         logger.debug(f"[Cache] HIT key={key[:12]}... model={model}")
         return entry
 
+    def _get_from_disk(self, key: str) -> CacheEntry | None:
+        """Look up the persistent tier and promote a hit into memory."""
+        if self.disk_tier is None:
+            return None
+        try:
+            entry = self.disk_tier.get(key)
+        except Exception as e:
+            logger.warning("[Cache] Disk tier read failed: %s", e)
+            return None
+        if entry is None:
+            return None
+        self._store(entry)
+        return entry
+
+    def _store(self, entry: CacheEntry) -> None:
+        """Insert into the memory tier, evicting LRU entries at capacity."""
+        self._cache.pop(entry.key, None)
+        while len(self._cache) >= self.max_entries:
+            evicted_key, _ = self._cache.popitem(last=False)
+            self.stats.evictions += 1
+            logger.debug(f"[Cache] EVICT key={evicted_key[:12]}...")
+        self._cache[entry.key] = entry
+        self.stats.total_entries = len(self._cache)
+
     def put(
         self,
         messages: list[dict[str, str]],
@@ -173,12 +210,6 @@ class LLMCache:
         """
         key = self._make_key(messages, model, temperature)
 
-        # Evict LRU if at capacity
-        while len(self._cache) >= self.max_entries:
-            evicted_key, _ = self._cache.popitem(last=False)
-            self.stats.evictions += 1
-            logger.debug(f"[Cache] EVICT key={evicted_key[:12]}...")
-
         entry = CacheEntry(
             key=key,
             content=content,
@@ -187,8 +218,13 @@ class LLMCache:
             created_at=time.time(),
             ttl=ttl if ttl is not None else self.default_ttl,
         )
-        self._cache[key] = entry
-        self.stats.total_entries = len(self._cache)
+        self._store(entry)
+
+        if self.disk_tier is not None:
+            try:
+                self.disk_tier.put(entry)
+            except Exception as e:
+                logger.warning("[Cache] Disk tier write failed: %s", e)
 
         logger.debug(f"[Cache] PUT key={key[:12]}... model={model} ttl={entry.ttl}s")
         return key
@@ -203,11 +239,14 @@ class LLMCache:
             True if entry was found and removed
 
         """
+        removed = False
         if key in self._cache:
             del self._cache[key]
             self.stats.total_entries = len(self._cache)
-            return True
-        return False
+            removed = True
+        if self.disk_tier is not None:
+            removed = self.disk_tier.delete(key) or removed
+        return removed
 
     def clear(self) -> int:
         """Clear all cache entries.
@@ -219,6 +258,8 @@ class LLMCache:
         count = len(self._cache)
         self._cache.clear()
         self.stats.total_entries = 0
+        if self.disk_tier is not None:
+            self.disk_tier.clear()
         return count
 
     def cleanup_expired(self) -> int:
@@ -234,6 +275,8 @@ class LLMCache:
         for key in expired_keys:
             del self._cache[key]
         self.stats.total_entries = len(self._cache)
+        if self.disk_tier is not None:
+            self.disk_tier.cleanup_expired()
         return len(expired_keys)
 
     def get_stats(self) -> dict[str, Any]:
@@ -243,7 +286,7 @@ class LLMCache:
             Dict with hit rate, counts, and cost savings
 
         """
-        return {
+        stats = {
             "hit_rate": round(self.stats.hit_rate, 1),
             "hits": self.stats.hits,
             "misses": self.stats.misses,
@@ -252,6 +295,10 @@ class LLMCache:
             "max_entries": self.max_entries,
             "estimated_cost_saved_usd": round(self.stats.estimated_cost_saved, 4),
         }
+        if self.disk_tier is not None:
+            stats["disk_hits"] = self.stats.disk_hits
+            stats["disk"] = self.disk_tier.get_stats()
+        return stats
 
 
 __all__ = [
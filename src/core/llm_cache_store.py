@@ -0,0 +1,244 @@
+"""Mekong CLI - Persistent LLM Cache Tier.
+
+SQLite (WAL) store that sits behind the in-memory LLMCache so cached
+responses survive across CLI invocations, daemon missions and gateway
+workers. Safe for concurrent use by several processes.
+
+Enforces a byte-size budget with LRU eviction (by last access), honours
+per-entry TTL, and compresses large responses with zstd when the
+``zstandard`` package is installed, zlib otherwise.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any
+
+from .llm_cache import CacheEntry
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DB_PATH = Path.home() / ".mekong" / "cache" / "llm_cache.db"
+
+_DDL = """
+CREATE TABLE IF NOT EXISTS llm_cache (
+    key          TEXT PRIMARY KEY,
+    content      BLOB NOT NULL,
+    codec        TEXT NOT NULL,
+    model        TEXT NOT NULL,
+    usage        TEXT NOT NULL,
+    created_at   REAL NOT NULL,
+    ttl          INTEGER NOT NULL,
+    last_access  REAL NOT NULL,
+    size         INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_llm_cache_access ON llm_cache (last_access);
+CREATE TABLE IF NOT EXISTS llm_cache_meta (
+    id          INTEGER PRIMARY KEY CHECK (id = 0),
+    total_bytes INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO llm_cache_meta (id, total_bytes) VALUES (0, 0);
+CREATE TRIGGER IF NOT EXISTS trg_llm_cache_ins AFTER INSERT ON llm_cache BEGIN
+    UPDATE llm_cache_meta SET total_bytes = total_bytes + NEW.size WHERE id = 0;
+END;
+CREATE TRIGGER IF NOT EXISTS trg_llm_cache_del AFTER DELETE ON llm_cache BEGIN
+    UPDATE llm_cache_meta SET total_bytes = total_bytes - OLD.size WHERE id = 0;
+END;
+"""
+
+
+def _zstd() -> Any:
+    try:
+        import zstandard  # type: ignore[import-not-found]
+    except ImportError:
+        return None
+    return zstandard
+
+
+class DiskCacheTier:
+    """Byte-budgeted, TTL-aware persistent cache tier.
+
+    Keys are the same SHA-256 digests LLMCache uses, so both tiers agree
+    on identity. Each process keeps one connection; SQLite's WAL mode and
+    busy timeout serialise writers across processes.
+    """
+
+    def __init__(
+        self,
+        db_path: Path | str = DEFAULT_DB_PATH,
+        max_bytes: int = 64 * 1024 * 1024,
+        compress_threshold: int = 4096,
+    ) -> None:
+        """Open (or create) the cache database.
+
+        Args:
+            db_path: SQLite file path
+            max_bytes: Byte budget for stored content before LRU eviction
+            compress_threshold: Compress content larger than this many bytes
+
+        """
+        self.db_path = Path(db_path)
+        self.max_bytes = max_bytes
+        self.compress_threshold = compress_threshold
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            str(self.db_path), timeout=10, check_same_thread=False, isolation_level=None,
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_DDL)
+
+    # ------------------------------------------------------------------
+    # Encoding
+    # ------------------------------------------------------------------
+
+    def _encode(self, content: str) -> tuple[bytes, str]:
+        raw = content.encode("utf-8")
+        if len(raw) <= self.compress_threshold:
+            return raw, "none"
+        zstd = _zstd()
+        if zstd is not None:
+            return zstd.ZstdCompressor().compress(raw), "zstd"
+        return zlib.compress(raw, 6), "zlib"
+
+    @staticmethod
+    def _decode(blob: bytes, codec: str) -> str:
+        if codec == "zlib":
+            blob = zlib.decompress(blob)
+        elif codec == "zstd":
+            zstd = _zstd()
+            if zstd is None:
+                msg = "zstandard not installed — cannot read zstd cache entry"
+                raise RuntimeError(msg)
+            blob = zstd.ZstdDecompressor().decompress(blob)
+        return blob.decode("utf-8")
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def get(self, key: str) -> CacheEntry | None:
+        """Return the entry for key, or None if missing or expired."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT content, codec, model, usage, created_at, ttl "
+                "FROM llm_cache WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            blob, codec, model, usage, created_at, ttl = row
+            if ttl > 0 and now - created_at > ttl:
+                self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                return None
+            self._conn.execute(
+                "UPDATE llm_cache SET last_access = ? WHERE key = ?", (now, key),
+            )
+        try:
+            content = self._decode(blob, codec)
+        except (zlib.error, RuntimeError, UnicodeDecodeError) as e:
+            logger.warning("[DiskCache] Unreadable entry %s...: %s", key[:12], e)
+            self.delete(key)
+            return None
+        return CacheEntry(
+            key=key,
+            content=content,
+            model=model,
+            usage=json.loads(usage),
+            created_at=created_at,
+            ttl=ttl,
+        )
+
+    def put(self, entry: CacheEntry) -> None:
+        """Store an entry, then evict LRU entries beyond the byte budget."""
+        blob, codec = self._encode(entry.content)
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (entry.key,))
+                self._conn.execute(
+                    "INSERT INTO llm_cache "
+                    "(key, content, codec, model, usage, created_at, ttl, last_access, size) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        entry.key, blob, codec, entry.model, json.dumps(entry.usage),
+                        entry.created_at, entry.ttl, time.time(), len(blob),
+                    ),
+                )
+                self._evict_locked()
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def _evict_locked(self) -> None:
+        total = self._total_bytes_locked()
+        while total > self.max_bytes:
+            rows = self._conn.execute(
+                "SELECT key, size FROM llm_cache ORDER BY last_access LIMIT 32",
+            ).fetchall()
+            if not rows:
+                break
+            for key, size in rows:
+                if total <= self.max_bytes:
+                    break
+                self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                total -= size
+                self.evictions += 1
+
+    def _total_bytes_locked(self) -> int:
+        return int(
+            self._conn.execute(
+                "SELECT total_bytes FROM llm_cache_meta WHERE id = 0",
+            ).fetchone()[0],
+        )
+
+    def delete(self, key: str) -> bool:
+        """Remove one entry. Returns True if it existed."""
+        with self._lock:
+            cur = self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+        return cur.rowcount > 0
+
+    def clear(self) -> int:
+        """Remove all entries. Returns number removed."""
+        with self._lock:
+            cur = self._conn.execute("DELETE FROM llm_cache")
+        return cur.rowcount
+
+    def cleanup_expired(self) -> int:
+        """Remove entries past their TTL. Returns number removed."""
+        with self._lock:
+            cur = self._conn.execute(
+                "DELETE FROM llm_cache WHERE ttl > 0 AND ? - created_at > ttl",
+                (time.time(),),
+            )
+        return cur.rowcount
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return entry count, stored bytes and eviction count."""
+        with self._lock:
+            count = self._conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+            total = self._total_bytes_locked()
+        return {
+            "entries": count,
+            "bytes": total,
+            "max_bytes": self.max_bytes,
+            "evictions": self.evictions,
+        }
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+__all__ = ["DEFAULT_DB_PATH", "DiskCacheTier"]
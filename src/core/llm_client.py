@@ -24,12 +24,15 @@ Legacy mode: set LLM_MODE=legacy to restore proxy-first behaviour.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import os
 import re
+import sqlite3
 import time
 import hashlib
+from collections.abc import Iterator
 from dataclasses import dataclass
 from typing import Any
 
@@ -37,6 +40,8 @@ import requests  # type: ignore[import-untyped]
 
 from .hooks import HookContext, HookPhase, HookPipeline, create_default_pipeline
 from .llm_cache import LLMCache
+from .llm_cache_store import DEFAULT_DB_PATH, DiskCacheTier
+from .llm_semantic_cache import SemanticCache
 from .providers import (
     GeminiProvider,
     LLMProvider,
@@ -96,6 +101,8 @@ class LLMClient:
         enable_cache: bool = True,
         enable_hooks: bool = True,
         providers: list[LLMProvider] | None = None,
+        persistent_cache: bool = False,
+        semantic_cache: bool | SemanticCache = False,
     ) -> None:
         """Initialize LLMClient.
 
@@ -108,6 +115,12 @@ class LLMClient:
             enable_cache: Enable LRU response caching.
             enable_hooks: Enable hooks middleware pipeline.
             providers: Explicit provider list. If None, auto-detects from env vars.
+            persistent_cache: Back the LRU cache with the on-disk tier shared
+                across processes (path from LLM_CACHE_PATH; LLM_CACHE_DISK=0
+                disables it).
+            semantic_cache: Reuse responses for near-duplicate prompts when the
+                exact cache misses. Pass a SemanticCache to set the threshold or
+                plug in a different embedding function.
 
         """
         self.model = model
@@ -120,10 +133,19 @@ class LLMClient:
 
         # Portkey-inspired: hooks pipeline + LRU cache
         self.hooks: HookPipeline | None = create_default_pipeline() if enable_hooks else None
-        self.cache: LLMCache | None = LLMCache() if enable_cache else None
+        self.cache: LLMCache | None = (
+            LLMCache(disk_tier=self._open_disk_tier() if persistent_cache else None)
+            if enable_cache else None
+        )
+        self.semantic_cache: SemanticCache | None = None
+        if isinstance(semantic_cache, SemanticCache):
+            self.semantic_cache = semantic_cache
+        elif semantic_cache:
+            self.semantic_cache = SemanticCache()
 
-        # Request deduplication — in-flight requests
-        self._pending_requests: dict[str, LLMResponse | None] = {}  # Keyed by hash
+        # Request deduplication — in-flight async requests keyed by hash
+        self._pending_requests: dict[str, asyncio.Future[LLMResponse]] = {}
+        self.coalesced_requests = 0
 
         # Build provider list
         if providers is not None:
@@ -309,6 +331,17 @@ class LLMClient:
         built.append(OfflineProvider())
         return built
 
+    @staticmethod
+    def _open_disk_tier() -> DiskCacheTier | None:
+        """Open the persistent cache tier, or None if disabled/unusable."""
+        if os.getenv("LLM_CACHE_DISK", "1") == "0":
+            return None
+        try:
+            return DiskCacheTier(os.getenv("LLM_CACHE_PATH", "") or DEFAULT_DB_PATH)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning("[LLMClient] Persistent cache disabled: %s", e)
+            return None
+
     def _check_ollama_running(self) -> bool:
         """Probe Ollama health endpoint (port 11434). Returns False on any error."""
         try:
@@ -389,30 +422,11 @@ class LLMClient:
         Portkey-inspired: hooks → cache → status-code failover.
         """
         use_model = model or self.model
-        call_start = time.time()
-
-        # Pre-request hooks
-        hook_ctx = HookContext(
-            messages=messages, model=use_model,
-            temperature=temperature, max_tokens=max_tokens,
-            start_time=call_start,
+        hook_ctx, early = self._before_request(
+            messages, use_model, temperature, max_tokens, json_mode,
         )
-        if self.hooks:
-            pre_results = self.hooks.run_phase(HookPhase.PRE_REQUEST, hook_ctx)
-            for r in pre_results:
-                if not r.passed:
-                    logger.warning("[LLM] Pre-request hook failed: %s", r.error_message)
-                    return self._offline_response(messages, error=f"hook: {r.error_message}")
-
-        # Cache check (skip for json_mode)
-        if self.cache and not json_mode:
-            cached = self.cache.get(messages, use_model, temperature)
-            if cached:
-                logger.debug("[LLM] Cache hit for model=%s", use_model)
-                return LLMResponse(
-                    content=cached.content, model=cached.model,
-                    usage=cached.usage, raw={"cache": True},
-                )
+        if early is not None:
+            return early
 
         # Provider failover with circuit breaker
         candidates = self._get_healthy_providers()
@@ -437,46 +451,202 @@ class LLMClient:
                     max_tokens=max_tokens,
                     json_mode=json_mode,
                 )
-                self._provider_health[provider.name].record_success()
+                return self._after_success(
+                    provider, result, hook_ctx, messages, temperature, json_mode,
+                )
 
-                # Cache successful response
-                if self.cache and not json_mode and result.content:
-                    self.cache.put(
-                        messages, result.content, result.model,
-                        temperature, result.usage,
-                    )
+            except requests.HTTPError as e:
+                last_error, fatal = self._on_http_error(provider, e, messages)
+                if fatal is not None:
+                    return fatal
+                continue
 
-                # Post-request hooks
-                if self.hooks:
-                    hook_ctx.response_content = result.content
-                    hook_ctx.response_model = result.model
-                    hook_ctx.usage = result.usage or {}
-                    self.hooks.run_phase(HookPhase.POST_REQUEST, hook_ctx)
+            except Exception as e:
+                last_error = self._on_provider_error(provider, e, hook_ctx)
+                continue
 
-                return result
+        return self._offline_response(messages, error=f"all providers failed: {last_error}")
 
-            except requests.HTTPError as e:
-                status_code = e.response.status_code if e.response is not None else 0
-                last_error = f"{provider.name}:{status_code}:{e}"
-                logger.warning("[LLM] Provider %s HTTP %d: %s", provider.name, status_code, e)
-                self._provider_health[provider.name].record_failure()
+    def chat_stream(
+        self,
+        messages: list[dict[str, str]],
+        model: str | None = None,
+        temperature: float = 0.7,
+        max_tokens: int = 2048,
+        json_mode: bool = False,
+    ) -> Iterator[str]:
+        """Stream chat completion text as it is generated.
 
-                if status_code == 400:
-                    return self._offline_response(messages, error=f"bad request: {e}")
-                continue
+        Same hooks → cache → failover pipeline as chat(). A cache hit yields
+        the cached content in one chunk; a completed stream is cached as the
+        assembled response. Failover only happens before the first chunk —
+        a provider failing mid-stream raises RuntimeError.
+        """
+        use_model = model or self.model
+        hook_ctx, early = self._before_request(
+            messages, use_model, temperature, max_tokens, json_mode,
+        )
+        if early is not None:
+            yield early.content
+            return
+
+        candidates = self._get_healthy_providers()
+        last_error = ""
+        for provider in candidates:
+            if provider.name == "offline":
+                break
+
+            if provider.name not in self._provider_health:
+                self._provider_health[provider.name] = ProviderHealth()
 
+            hook_ctx.provider = provider.name
+            parts: list[str] = []
+            try:
+                for delta in provider.chat_stream(
+                    messages=messages,
+                    model=use_model,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    json_mode=json_mode,
+                ):
+                    parts.append(delta)
+                    yield delta
             except Exception as e:
-                last_error = str(e)
-                logger.warning("[LLM] Provider %s failed: %s", provider.name, e)
-                self._provider_health[provider.name].record_failure()
+                last_error = self._on_provider_error(provider, e, hook_ctx)
+                if parts:
+                    msg = f"{provider.name} failed mid-stream: {e}"
+                    raise RuntimeError(msg) from e
+                continue
+
+            result = LLMResponse(content="".join(parts), model=use_model, raw={"stream": True})
+            self._after_success(provider, result, hook_ctx, messages, temperature, json_mode)
+            return
+
+        yield self._offline_response(
+            messages, error=f"all providers failed: {last_error}",
+        ).content
+
+    async def achat(
+        self,
+        messages: list[dict[str, str]],
+        model: str | None = None,
+        temperature: float = 0.7,
+        max_tokens: int = 2048,
+        json_mode: bool = False,
+    ) -> LLMResponse:
+        """Async chat completion — same hooks → cache → failover pipeline as chat().
+
+        Identical concurrent requests (same _request_hash, json_mode and
+        max_tokens) are coalesced into a single upstream call.
+        """
+        use_model = model or self.model
+        key = (
+            f"{self._request_hash(messages, use_model, temperature)}"
+            f":{int(json_mode)}:{max_tokens}"
+        )
+        pending = self._pending_requests.get(key)
+        if pending is not None and pending.get_loop() is asyncio.get_running_loop():
+            self.coalesced_requests += 1
+            return await asyncio.shield(pending)
+
+        future: asyncio.Future[LLMResponse] = asyncio.get_running_loop().create_future()
+        self._pending_requests[key] = future
+        try:
+            result = await self._achat_uncoalesced(
+                messages, use_model, temperature, max_tokens, json_mode,
+            )
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved when nobody else was waiting
+            raise
+        finally:
+            if self._pending_requests.get(key) is future:
+                del self._pending_requests[key]
+
+    async def _achat_uncoalesced(
+        self,
+        messages: list[dict[str, str]],
+        use_model: str,
+        temperature: float,
+        max_tokens: int,
+        json_mode: bool,
+    ) -> LLMResponse:
+        hook_ctx, early = self._before_request(
+            messages, use_model, temperature, max_tokens, json_mode,
+        )
+        if early is not None:
+            return early
+
+        candidates = self._get_healthy_providers()
+        if not candidates:
+            return self._offline_response(messages, error="no providers available")
+
+        last_error = ""
+        for provider in candidates:
+            if provider.name == "offline":
+                break
 
-                if self.hooks:
-                    hook_ctx.error = e
-                    self.hooks.run_phase(HookPhase.ON_ERROR, hook_ctx)
+            if provider.name not in self._provider_health:
+                self._provider_health[provider.name] = ProviderHealth()
+
+            hook_ctx.provider = provider.name
+            try:
+                result = await provider.achat(
+                    messages=messages,
+                    model=use_model,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    json_mode=json_mode,
+                )
+                return self._after_success(
+                    provider, result, hook_ctx, messages, temperature, json_mode,
+                )
+
+            except requests.HTTPError as e:
+                last_error, fatal = self._on_http_error(provider, e, messages)
+                if fatal is not None:
+                    return fatal
+                continue
+
+            except Exception as e:
+                last_error = self._on_provider_error(provider, e, hook_ctx)
                 continue
 
         return self._offline_response(messages, error=f"all providers failed: {last_error}")
 
+    async def chat_many(
+        self,
+        requests_: list[dict[str, Any]],
+        concurrency: int = 8,
+    ) -> list[LLMResponse]:
+        """Run many chat requests concurrently, at most `concurrency` at a time.
+
+        Args:
+            requests_: List of achat() keyword dicts, each with at least "messages"
+            concurrency: Maximum requests in flight
+
+        Returns:
+            Responses in the same order as the requests
+
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def _one(kwargs: dict[str, Any]) -> LLMResponse:
+            async with semaphore:
+                return await self.achat(**kwargs)
+
+        return list(await asyncio.gather(*(_one(r) for r in requests_)))
+
+    async def aclose(self) -> None:
+        """Close pooled async connections held by providers."""
+        for provider in self.providers:
+            await provider.aclose()
+
     def generate(self, prompt: str, **kwargs: Any) -> str:
         """Simple text generation helper."""
         messages = [{"role": "user", "content": prompt}]
@@ -508,6 +678,115 @@ class LLMClient:
     # Internal helpers
     # ------------------------------------------------------------------
 
+    def _before_request(
+        self,
+        messages: list[dict[str, str]],
+        use_model: str,
+        temperature: float,
+        max_tokens: int,
+        json_mode: bool,
+    ) -> tuple[HookContext, LLMResponse | None]:
+        """Run pre-request hooks and cache lookup.
+
+        Returns:
+            (hook context, early response) — early response is set when a
+            hook rejected the request or the cache answered it.
+
+        """
+        hook_ctx = HookContext(
+            messages=messages, model=use_model,
+            temperature=temperature, max_tokens=max_tokens,
+            start_time=time.time(),
+        )
+        if self.hooks:
+            pre_results = self.hooks.run_phase(HookPhase.PRE_REQUEST, hook_ctx)
+            for r in pre_results:
+                if not r.passed:
+                    logger.warning("[LLM] Pre-request hook failed: %s", r.error_message)
+                    return hook_ctx, self._offline_response(
+                        messages, error=f"hook: {r.error_message}",
+                    )
+
+        # Cache check (skip for json_mode)
+        if self.cache and not json_mode:
+            cached = self.cache.get(messages, use_model, temperature)
+            if cached:
+                logger.debug("[LLM] Cache hit for model=%s", use_model)
+                return hook_ctx, LLMResponse(
+                    content=cached.content, model=cached.model,
+                    usage=cached.usage, raw={"cache": True},
+                )
+        if self.semantic_cache is not None and not json_mode:
+            similar = self.semantic_cache.get(messages, use_model, temperature)
+            if similar:
+                entry, score = similar
+                logger.debug("[LLM] Semantic cache hit for model=%s sim=%.3f", use_model, score)
+                return hook_ctx, LLMResponse(
+                    content=entry.content, model=entry.model, usage=entry.usage,
+                    raw={"cache": True, "semantic": True, "similarity": score},
+                )
+        return hook_ctx, None
+
+    def _after_success(
+        self,
+        provider: LLMProvider,
+        result: LLMResponse,
+        hook_ctx: HookContext,
+        messages: list[dict[str, str]],
+        temperature: float,
+        json_mode: bool,
+    ) -> LLMResponse:
+        """Record provider health, cache the response and run post hooks."""
+        self._provider_health[provider.name].record_success()
+
+        # Cache successful response
+        if self.cache and not json_mode and result.content:
+            self.cache.put(
+                messages, result.content, result.model,
+                temperature, result.usage,
+            )
+        if self.semantic_cache is not None and not json_mode and result.content:
+            self.semantic_cache.put(
+                messages, result.content, hook_ctx.model,
+                temperature, result.usage,
+            )
+
+        # Post-request hooks
+        if self.hooks:
+            hook_ctx.response_content = result.content
+            hook_ctx.response_model = result.model
+            hook_ctx.usage = result.usage or {}
+            self.hooks.run_phase(HookPhase.POST_REQUEST, hook_ctx)
+
+        return result
+
+    def _on_http_error(
+        self,
+        provider: LLMProvider,
+        e: requests.HTTPError,
+        messages: list[dict[str, str]],
+    ) -> tuple[str, LLMResponse | None]:
+        """Record an HTTP failure. Returns (error text, response if non-retryable)."""
+        status_code = e.response.status_code if e.response is not None else 0
+        logger.warning("[LLM] Provider %s HTTP %d: %s", provider.name, status_code, e)
+        self._provider_health[provider.name].record_failure()
+
+        if status_code == 400:
+            return str(e), self._offline_response(messages, error=f"bad request: {e}")
+        return f"{provider.name}:{status_code}:{e}", None
+
+    def _on_provider_error(
+        self, provider: LLMProvider, e: Exception, hook_ctx: HookContext,
+    ) -> str:
+        """Record a generic provider failure and run error hooks."""
+        logger.warning("[LLM] Provider %s failed: %s", provider.name, e)
+        self._provider_health[provider.name].record_failure()
+
+        if self.hooks:
+            hook_ctx.error = e
+            self.hooks.run_phase(HookPhase.ON_ERROR, hook_ctx)
+        return str(e)
+
     def _get_healthy_providers(self) -> list[LLMProvider]:
         """Return providers in order, skipping circuit-broken ones."""
         available = [p for p in self.providers if p.is_available()]
@@ -558,7 +837,7 @@ def get_client() -> LLMClient:
     """Get or create default LLM client (env-var auto-detection)."""
     global _default_client
     if _default_client is None:
-        _default_client = LLMClient()
+        _default_client = LLMClient(persistent_cache=True)
     return _default_client
 
 
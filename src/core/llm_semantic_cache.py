@@ -0,0 +1,359 @@
+"""Mekong CLI - Semantic LLM Response Cache.
+
+Near-duplicate layer that sits behind the exact-hash LLMCache. Only the
+last user message is compared by similarity: it is normalised (whitespace
+collapsed, plus any caller-declared volatile patterns masked), embedded,
+and looked up in a random-hyperplane LSH index so a rephrased or reordered
+question still reuses a response.
+
+Entries are partitioned by (model, temperature, context), where context is
+the system prompt and every other turn, which must match exactly (modulo
+whitespace): a hit never crosses models, sampling settings or
+conversations. The embedding function is pluggable; the default is an
+offline hashed word n-gram embedding that needs no model or network.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import math
+import random
+import re
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+from .llm_cache import CacheEntry
+
+logger = logging.getLogger(__name__)
+
+EmbeddingFn = Callable[[str], list[float]]
+
+_WS = re.compile(r"\s+")
+_TOKEN = re.compile(r"[\w<>]+")
+
+
+def normalize_prompt(messages: list[dict[str, str]]) -> str:
+    """Flatten messages into a canonical string (whitespace collapsed only)."""
+    return "\n".join(
+        f"{m.get('role', 'user')}: {_WS.sub(' ', m.get('content', '') or '').strip()}"
+        for m in messages
+    )
+
+
+def split_prompt(messages: list[dict[str, str]]) -> tuple[str, str]:
+    """Split messages into (context, query).
+
+    The query is the last user message; the context is every other message,
+    in order, with a marker where the query sat.
+    """
+    for i in range(len(messages) - 1, -1, -1):
+        if messages[i].get("role", "user") == "user":
+            query = _WS.sub(" ", messages[i].get("content", "") or "").strip()
+            rest = [*messages[:i], {"role": "query", "content": ""}, *messages[i + 1:]]
+            return normalize_prompt(rest), query
+    return normalize_prompt(messages), ""
+
+
+def hashed_ngram_embedding(text: str, dimension: int = 256) -> list[float]:
+    """Embed text as signed feature-hashed word unigrams and bigrams.
+
+    Order-insensitive at block level and stable across runs, so
+    reordered context or small edits keep a high cosine similarity.
+    """
+    vector = [0.0] * dimension
+    tokens = _TOKEN.findall(text.lower())
+    features = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+    for feat in features:
+        digest = hashlib.blake2b(feat.encode(), digest_size=8).digest()
+        h = int.from_bytes(digest, "little")
+        vector[h % dimension] += 1.0 if (h >> 63) & 1 else -1.0
+    norm = math.sqrt(sum(x * x for x in vector))
+    if norm > 0:
+        vector = [x / norm for x in vector]
+    return vector
+
+
+@dataclass
+class SemanticCacheStats:
+    """Semantic lookup counters."""
+
+    lookups: int = 0
+    hits: int = 0
+    exact_hits: int = 0
+    misses: int = 0
+    saved_calls: int = 0
+    estimated_cost_saved: float = 0.0
+
+
+@dataclass
+class _Item:
+    entry: CacheEntry
+    text: str
+    vector: list[float]
+    partition: tuple[str, float, str]
+    signatures: list[int] = field(default_factory=list)
+
+
+class _Partition:
+    """LSH tables for one (model, temperature, context) bucket."""
+
+    def __init__(self) -> None:
+        self.by_text: dict[str, str] = {}
+        self.tables: list[dict[int, set[str]]] = []
+
+
+class SemanticCache:
+    """Similarity-thresholded response cache over an LSH index.
+
+    Each of ``n_tables`` tables hashes a vector to ``n_bits`` hyperplane
+    sign bits; candidates from any matching bucket are re-ranked by exact
+    cosine similarity, and the best one at or above ``threshold`` wins.
+    The index is guarded by a lock; embeddings are computed outside it.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.92,
+        max_entries: int = 1000,
+        default_ttl: int = 3600,
+        embed_fn: EmbeddingFn | None = None,
+        dimension: int = 256,
+        n_tables: int = 8,
+        n_bits: int = 8,
+        cost_per_hit: float = 0.001,
+        seed: int = 1337,
+        volatile_patterns: Iterable[str | re.Pattern[str]] = (),
+    ) -> None:
+        """Initialize semantic cache.
+
+        Args:
+            threshold: Minimum cosine similarity for a hit (0-1)
+            max_entries: Maximum entries across partitions before LRU eviction
+            default_ttl: Default time-to-live in seconds
+            embed_fn: Text -> vector function; defaults to hashed n-grams
+            dimension: Vector dimension produced by embed_fn
+            n_tables: Number of LSH hash tables
+            n_bits: Hyperplanes (signature bits) per table
+            cost_per_hit: Estimated cost saved per avoided call (USD)
+            seed: Seed for the hyperplane generator
+            volatile_patterns: Regexes for values in the user message that
+                never change the answer (e.g. a request id); matches are
+                masked before comparison. Nothing is masked by default.
+
+        """
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self.dimension = dimension
+        self.cost_per_hit = cost_per_hit
+        self.embed_fn: EmbeddingFn = embed_fn or (
+            lambda text: hashed_ngram_embedding(text, dimension)
+        )
+        rng = random.Random(seed)
+        self._planes = [
+            [[rng.gauss(0.0, 1.0) for _ in range(dimension)] for _ in range(n_bits)]
+            for _ in range(n_tables)
+        ]
+        self._volatile = [re.compile(p) if isinstance(p, str) else p for p in volatile_patterns]
+        self._items: OrderedDict[str, _Item] = OrderedDict()
+        self._partitions: dict[tuple[str, float, str], _Partition] = {}
+        self._lock = threading.Lock()
+        self.stats = SemanticCacheStats()
+
+    # ------------------------------------------------------------------
+    # Index helpers
+    # ------------------------------------------------------------------
+
+    def _prepare(
+        self, messages: list[dict[str, str]], model: str, temperature: float,
+    ) -> tuple[tuple[str, float, str], str]:
+        """(partition key, normalised query) for a prompt."""
+        context, query = split_prompt(messages)
+        for pattern in self._volatile:
+            query = pattern.sub("<var>", query)
+        context_hash = hashlib.sha256(context.encode()).hexdigest()
+        return (model, round(temperature, 2), context_hash), query
+
+    def _signatures(self, vector: list[float]) -> list[int]:
+        sigs = []
+        for planes in self._planes:
+            sig = 0
+            for plane in planes:
+                dot = sum(p * v for p, v in zip(plane, vector))
+                sig = (sig << 1) | (dot >= 0.0)
+            sigs.append(sig)
+        return sigs
+
+    @staticmethod
+    def _cosine(a: list[float], b: list[float]) -> float:
+        dot = sum(x * y for x, y in zip(a, b))
+        mag = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+        return dot / mag if mag else 0.0
+
+    def _remove(self, key: str) -> None:
+        """Drop one entry from the index (caller holds the lock)."""
+        item = self._items.pop(key, None)
+        if item is None:
+            return
+        part = self._partitions.get(item.partition)
+        if part is None:
+            return
+        for table, sig in zip(part.tables, item.signatures):
+            bucket = table.get(sig)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del table[sig]
+        if part.by_text.get(item.text) == key:
+            del part.by_text[item.text]
+        if not part.by_text:
+            del self._partitions[item.partition]
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def get(
+        self,
+        messages: list[dict[str, str]],
+        model: str = "",
+        temperature: float = 0.7,
+    ) -> tuple[CacheEntry, float] | None:
+        """Find a cached response for a near-duplicate prompt.
+
+        Returns:
+            (entry, similarity) for the best match above threshold, else None
+
+        """
+        pkey, text = self._prepare(messages, model, temperature)
+        with self._lock:
+            self.stats.lookups += 1
+            part = self._partitions.get(pkey)
+            if part is None:
+                self.stats.misses += 1
+                return None
+            best_key, best_score = part.by_text.get(text), 1.0
+
+        if best_key is None:
+            vector = self.embed_fn(text)
+            sigs = self._signatures(vector)
+            best_score = -1.0
+            with self._lock:
+                part = self._partitions.get(pkey)
+                candidates: set[str] = set()
+                for table, sig in zip(part.tables if part else [], sigs):
+                    candidates |= table.get(sig, set())
+                for key in candidates:
+                    score = self._cosine(vector, self._items[key].vector)
+                    if score > best_score:
+                        best_key, best_score = key, score
+
+        with self._lock:
+            item = self._items.get(best_key) if best_key is not None else None
+            if item is None or best_score < self.threshold:
+                self.stats.misses += 1
+                return None
+            if item.entry.is_expired:
+                self._remove(best_key)
+                self.stats.misses += 1
+                return None
+
+            self._items.move_to_end(best_key)
+            item.entry.hit_count += 1
+            self.stats.hits += 1
+            if best_score >= 1.0:
+                self.stats.exact_hits += 1
+            self.stats.saved_calls += 1
+            self.stats.estimated_cost_saved += self.cost_per_hit
+        logger.debug(
+            "[SemanticCache] HIT key=%s... model=%s sim=%.3f",
+            best_key[:12], model, best_score,
+        )
+        return item.entry, best_score
+
+    def put(
+        self,
+        messages: list[dict[str, str]],
+        content: str,
+        model: str = "",
+        temperature: float = 0.7,
+        usage: dict[str, int] | None = None,
+        ttl: int | None = None,
+    ) -> str:
+        """Index a response under its context and normalised query. Returns the key."""
+        pkey, text = self._prepare(messages, model, temperature)
+        key = hashlib.sha256(f"{pkey[0]}|{pkey[1]}|{pkey[2]}|{text}".encode()).hexdigest()
+        vector = self.embed_fn(text)
+        if len(vector) != self.dimension:
+            msg = f"Embedding dimension {len(vector)} != cache dimension {self.dimension}."
+            raise ValueError(msg)
+        sigs = self._signatures(vector)
+
+        with self._lock:
+            self._remove(key)
+            while len(self._items) >= self.max_entries:
+                self._remove(next(iter(self._items)))
+
+            part = self._partitions.get(pkey)
+            if part is None:
+                part = _Partition()
+                part.tables = [{} for _ in self._planes]
+                self._partitions[pkey] = part
+            for table, sig in zip(part.tables, sigs):
+                table.setdefault(sig, set()).add(key)
+            part.by_text[text] = key
+            self._items[key] = _Item(
+                entry=CacheEntry(
+                    key=key, content=content, model=model, usage=usage or {},
+                    created_at=time.time(),
+                    ttl=ttl if ttl is not None else self.default_ttl,
+                ),
+                text=text,
+                vector=vector,
+                partition=pkey,
+                signatures=sigs,
+            )
+        return key
+
+    def clear(self) -> int:
+        """Drop every entry. Returns number removed."""
+        with self._lock:
+            count = len(self._items)
+            self._items.clear()
+            self._partitions.clear()
+        return count
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return lookup counters and the number of upstream calls saved."""
+        with self._lock:
+            lookups = self.stats.lookups
+            return {
+                "entries": len(self._items),
+                "partitions": len(self._partitions),
+                "threshold": self.threshold,
+                "lookups": lookups,
+                "hits": self.stats.hits,
+                "exact_hits": self.stats.exact_hits,
+                "misses": self.stats.misses,
+                "hit_rate": round(self.stats.hits / lookups * 100, 1) if lookups else 0.0,
+                "saved_calls": self.stats.saved_calls,
+                "estimated_cost_saved_usd": round(self.stats.estimated_cost_saved, 4),
+            }
+
+
+__all__ = [
+    "EmbeddingFn",
+    "SemanticCache",
+    "SemanticCacheStats",
+    "hashed_ngram_embedding",
+    "normalize_prompt",
+    "split_prompt",
+]
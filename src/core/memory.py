@@ -1,18 +1,28 @@
 """
 Mekong CLI - Memory Store (AGI v2)
 
-Long-term execution memory with YAML persistence + vector semantic index.
+Long-term execution memory with an append-only JSONL log + vector semantic index.
 Records goal outcomes, enables semantic search, and supports memory compression.
 
-Vector backend (VectorMemoryStore) provides semantic search alongside YAML.
+Records are appended by a single background writer that coalesces bursts
+into one write; the log is compacted once it holds twice MAX_ENTRIES lines
+or after entries are removed. Legacy ``memory.yaml`` files are imported on
+first load and renamed to ``memory.yaml.migrated``.
+
+Vector backend (VectorMemoryStore) provides semantic search alongside the log.
 """
 
 from __future__ import annotations
 
+import atexit
 import hashlib
+import json
 import logging
+import os
+import queue
 import threading
 import time
+import weakref
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List
@@ -45,8 +55,102 @@ class MemoryEntry:
     reflection: str = ""  # Post-task reflection from ReflectionEngine
 
 
+def _entry_id(entry: MemoryEntry) -> str:
+    """Stable id shared by the log indexes and the vector store."""
+    return hashlib.md5(f"{entry.goal}:{entry.timestamp}".encode()).hexdigest()
+
+
+class _LogWriter:
+    """Single background writer for one append-only JSONL log.
+
+    ``append`` only enqueues; the writer thread drains everything queued
+    so far and writes it with one call. ``compact`` asks the writer to
+    rewrite the log from a snapshot, ordered after preceding appends.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._queue: queue.Queue[tuple[str, Any]] = queue.Queue()
+        self._thread: threading.Thread | None = None
+        self._start_lock = threading.Lock()
+        self.lines = 0
+
+    def append(self, line: str) -> None:
+        self._ensure_thread()
+        self._queue.put(("append", line))
+
+    def compact(self, lines: list[str]) -> None:
+        self._ensure_thread()
+        self._queue.put(("compact", lines))
+
+    def join(self) -> None:
+        """Block until everything queued so far is on disk."""
+        if self._thread is not None:
+            self._queue.join()
+
+    def write_now(self, ops: list[tuple[str, Any]]) -> None:
+        """Apply ops synchronously (caller ensures no concurrent writer)."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        pending: list[str] = []
+        for op, arg in ops:
+            if op == "append":
+                pending.append(arg)
+                continue
+            self._append(pending)
+            pending = []
+            self._rewrite(arg)
+        self._append(pending)
+
+    def _ensure_thread(self) -> None:
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name=f"memory-writer:{self.path.name}", daemon=True,
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            ops = [self._queue.get()]
+            while True:
+                try:
+                    ops.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self.write_now(ops)
+            except OSError as e:
+                logger.warning("Memory log write failed: %s", e)
+            finally:
+                for _ in ops:
+                    self._queue.task_done()
+
+    def _append(self, lines: list[str]) -> None:
+        if not lines:
+            return
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write("".join(line + "\n" for line in lines))
+        self.lines += len(lines)
+
+    def _rewrite(self, lines: list[str]) -> None:
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        tmp.write_text("".join(line + "\n" for line in lines), encoding="utf-8")
+        os.replace(tmp, self.path)
+        self.lines = len(lines)
+
+
+def _flush_at_exit(ref: weakref.ref[MemoryStore]) -> None:
+    store = ref()
+    if store is not None:
+        store.flush()
+
+
 class MemoryStore:
-    """Long-term execution memory with YAML + vector semantic index."""
+    """Long-term execution memory with an append-only log + vector semantic index.
+
+    Keeps an id -> entry index (for vector hit resolution) and secondary
+    indexes by ``recipe_used`` and ``status``.
+    """
 
     MAX_ENTRIES: int = 2000
     VECTOR_DIM: int = 64
@@ -56,14 +160,23 @@ class MemoryStore:
         """Initialize memory store.
 
         Args:
-            store_path: Path to YAML file. Defaults to .mekong/memory.yaml
+            store_path: Legacy YAML path (default .mekong/memory.yaml). The
+                log lives beside it with a ``.jsonl`` suffix.
             sync_save: If True, save synchronously (for testing).
 
         """
         self._path = Path(store_path) if store_path else Path(".mekong/memory.yaml")
+        self.log_path = self._path.with_suffix(".jsonl")
         self._sync_save = sync_save  # Flag for testing
+        self._lock = threading.RLock()
+        self._writer = _LogWriter(self.log_path)
         self._entries: list[MemoryEntry] = []
+        self._by_id: dict[str, MemoryEntry] = {}
+        self._by_recipe: dict[str, list[MemoryEntry]] = {}
+        self._by_status: dict[str, list[MemoryEntry]] = {}
         self._load()
+        if not sync_save:
+            atexit.register(_flush_at_exit, weakref.ref(self))
 
         # Initialize vector store for semantic search
         vector_path = str(self._path.parent / "vector_index.json")
@@ -77,21 +190,24 @@ class MemoryStore:
 
     def record(self, entry: MemoryEntry) -> None:
         """Record an execution outcome and persist (async I/O)."""
-        self._entries.append(entry)
-        self._evict()
+        line = json.dumps(asdict(entry), ensure_ascii=False)
+        with self._lock:
+            self._add_to_indexes(entry)
+            self._evict()
+            # Index in vector store for semantic search
+            self._index_entry(entry)
+
+            # Append via the background writer; sync_save writes inline (testing)
+            if self._sync_save:
+                self._writer.write_now([("append", line)])
+            else:
+                self._writer.append(line)
+            if self._writer.lines >= 2 * self.MAX_ENTRIES:
+                self._save()
+
         bus = get_event_bus()
         bus.emit(EventType.MEMORY_RECORDED, asdict(entry))
 
-        # Index in vector store for semantic search
-        self._index_entry(entry)
-
-        # Async save — does not block main thread (daemon thread)
-        # Unless sync_save flag is set (for testing)
-        if self._sync_save:
-            self._save()
-        else:
-            threading.Thread(target=self._save, daemon=True).start()
-
         # Mirror to external vector backend when available
         if _FACADE_AVAILABLE:
             try:
@@ -114,8 +230,9 @@ class MemoryStore:
                 pass
 
     def flush(self) -> None:
-        """Force synchronous save (for testing)."""
-        self._save()
+        """Block until all recorded entries are written to the log."""
+        self._writer.join()
+        self._vector_store.flush()
 
     def query(self, goal_pattern: str) -> list[MemoryEntry]:
         """Find entries matching goal pattern.
@@ -164,15 +281,32 @@ class MemoryStore:
 
     def get_success_rate(self, goal_pattern: str = "") -> float:
         """Calculate success rate (0-100) for entries matching pattern."""
-        entries = self.query(goal_pattern) if goal_pattern else self._entries
+        if not goal_pattern:
+            if not self._entries:
+                return 0.0
+            return len(self._by_status.get("success", ())) / len(self._entries) * 100
+        entries = self.query(goal_pattern)
         if not entries:
             return 0.0
         successes = sum(1 for e in entries if e.status == "success")
         return (successes / len(entries)) * 100
 
+    def entries_for_recipe(self, recipe_name: str) -> list[MemoryEntry]:
+        """Entries recorded with recipe_used == recipe_name, oldest first."""
+        return list(self._by_recipe.get(recipe_name, ()))
+
+    def entries_with_status(self, status: str) -> list[MemoryEntry]:
+        """Entries with the given status, oldest first."""
+        return list(self._by_status.get(status, ()))
+
     def get_last_failure(self, goal_pattern: str = "") -> MemoryEntry | None:
         """Get most recent failed entry matching pattern."""
-        entries = self.query(goal_pattern) if goal_pattern else self._entries
+        if not goal_pattern:
+            for entry in reversed(self._entries):
+                if entry.status != "success":
+                    return entry
+            return None
+        entries = self.query(goal_pattern)
         failures = [e for e in entries if e.status != "success"]
         return failures[-1] if failures else None
 
@@ -290,24 +424,30 @@ class MemoryStore:
             )
 
             # Remove old entries and add summary
-            for entry in entries:
-                if entry in self._entries:
-                    self._entries.remove(entry)
-                    compressed_count += 1
+            removed = {id(e) for e in entries}
+            before = len(self._entries)
+            self._entries = [e for e in self._entries if id(e) not in removed]
+            compressed_count += before - len(self._entries)
 
             self._entries.append(summary)
 
         if compressed_count > 0:
-            self._entries.sort(key=lambda e: e.timestamp)
-            self._save()
+            with self._lock:
+                self._entries.sort(key=lambda e: e.timestamp)
+                self._rebuild_indexes()
+                self._save()
 
         return compressed_count
 
     def clear(self) -> None:
         """Remove all entries and delete persistence files."""
-        self._entries.clear()
-        if self._path.exists():
-            self._path.unlink()
+        with self._lock:
+            self._writer.join()
+            self._entries.clear()
+            self._rebuild_indexes()
+            for path in (self.log_path, self._path):
+                if path.exists():
+                    path.unlink()
         # Clear vector store
         try:
             self._vector_store.delete_collection(self.VECTOR_COLLECTION)
@@ -326,9 +466,7 @@ class MemoryStore:
             vector = VectorMemoryStore.text_to_hash_vector(
                 text, self.VECTOR_DIM,
             )
-            entry_id = hashlib.md5(
-                f"{entry.goal}:{entry.timestamp}".encode(),
-            ).hexdigest()
+            entry_id = _entry_id(entry)
 
             mem_type = MemoryType.EPISODIC
             if entry.recipe_used:
@@ -368,37 +506,96 @@ class MemoryStore:
             for vec_entry, score in results:
                 if score < 0.3:
                     continue
-                goal = vec_entry.payload.get("goal", "")
-                for entry in self._entries:
-                    if entry.goal == goal:
-                        matched_entries.append(entry)
-                        break
+                entry = self._by_id.get(vec_entry.id)
+                if entry is not None:
+                    matched_entries.append(entry)
 
             return matched_entries
         except (KeyError, Exception):
             return []
 
     def _load(self) -> None:
-        """Load entries from YAML file."""
-        if not self._path.exists():
+        """Load entries from the JSONL log, migrating a legacy YAML file."""
+        if not self.log_path.exists() and self._path.exists():
+            self._migrate_yaml()
+        if not self.log_path.exists():
             return
+        entries: list[MemoryEntry] = []
+        lines = 0
+        with open(self.log_path, encoding="utf-8") as f:
+            for raw in f:
+                lines += 1
+                if not raw.strip():
+                    continue
+                try:
+                    entries.append(MemoryEntry(**json.loads(raw)))
+                except (ValueError, TypeError) as e:
+                    # Torn trailing write or foreign line — skip it
+                    logger.debug("Skipping unreadable memory log line: %s", e)
+        self._writer.lines = lines
+        self._entries = entries[-self.MAX_ENTRIES:]
+        self._rebuild_indexes()
+
+    def _migrate_yaml(self) -> None:
+        """Import a legacy YAML memory file into the log, then set it aside."""
         try:
             data = yaml.safe_load(self._path.read_text()) or []
-            self._entries = [MemoryEntry(**item) for item in data]
+            entries = [MemoryEntry(**item) for item in data]
         except Exception as e:
             logger.debug("Failed to load memory entries: %s", e)
-            self._entries = []
+            return
+        self._writer.write_now([
+            ("compact", [json.dumps(asdict(e), ensure_ascii=False) for e in entries]),
+        ])
+        self._path.rename(self._path.with_name(self._path.name + ".migrated"))
+        logger.info("Migrated %d memory entries to %s", len(entries), self.log_path)
 
     def _save(self) -> None:
-        """Persist entries to YAML file."""
-        self._path.parent.mkdir(parents=True, exist_ok=True)
-        data = [asdict(e) for e in self._entries]
-        self._path.write_text(yaml.dump(data, default_flow_style=False))
+        """Compact the log down to the current entries."""
+        with self._lock:
+            lines = [json.dumps(asdict(e), ensure_ascii=False) for e in self._entries]
+            if self._sync_save:
+                self._writer.write_now([("compact", lines)])
+            else:
+                self._writer.compact(lines)
+            # Count the rewrite now so appends racing the writer don't retrigger it
+            self._writer.lines = len(lines)
+
+    def _add_to_indexes(self, entry: MemoryEntry) -> None:
+        self._entries.append(entry)
+        self._by_id[_entry_id(entry)] = entry
+        self._by_recipe.setdefault(entry.recipe_used, []).append(entry)
+        self._by_status.setdefault(entry.status, []).append(entry)
+
+    def _rebuild_indexes(self) -> None:
+        entries = self._entries
+        self._entries = []
+        self._by_id, self._by_recipe, self._by_status = {}, {}, {}
+        for entry in entries:
+            self._add_to_indexes(entry)
 
     def _evict(self) -> None:
         """Remove oldest entries when exceeding MAX_ENTRIES (FIFO)."""
-        if len(self._entries) > self.MAX_ENTRIES:
-            self._entries = self._entries[-self.MAX_ENTRIES:]
+        overflow = len(self._entries) - self.MAX_ENTRIES
+        if overflow <= 0:
+            return
+        evicted = self._entries[:overflow]
+        self._entries = self._entries[overflow:]
+        for entry in evicted:
+            # Oldest entries sit at the front of every secondary index
+            for index, key in ((self._by_recipe, entry.recipe_used), (self._by_status, entry.status)):
+                bucket = index.get(key)
+                if bucket and bucket[0] is entry:
+                    bucket.pop(0)
+                    if not bucket:
+                        del index[key]
+            entry_id = _entry_id(entry)
+            if self._by_id.get(entry_id) is entry:
+                del self._by_id[entry_id]
+                try:
+                    self._vector_store.delete_point(self.VECTOR_COLLECTION, entry_id)
+                except (KeyError, AttributeError):
+                    pass
 
 
 __all__ = [
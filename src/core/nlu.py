@@ -11,9 +11,12 @@ import json
 import logging
 import re
 import time
-from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional
+
+from src.core.keyword_matcher import scan_goal
 
 logger = logging.getLogger(__name__)
 
@@ -139,6 +142,8 @@ KEYWORD_MAP: dict[Intent, list[str]] = {
     ],
 }
 
+_ALL_KEYWORDS = frozenset(kw for kws in KEYWORD_MAP.values() for kw in kws)
+
 # Entity extraction patterns
 _PROJECT_RE = re.compile(
     r"(?:deploy|ship|audit|check|create|fix|refactor|optimize|migrate|"
@@ -238,32 +243,78 @@ class IntentClassifier:
         # Record this goal in conversation context
         self.conversation.add_turn("user", goal)
 
-        # Fast path: keyword matching
-        intent, confidence = self._keyword_match(goal)
-        entities = self._extract_entities(goal, intent)
+        result = self._keyword_result(goal)
+
+        # LLM upgrade for low confidence or UNKNOWN intent
+        if self._needs_llm(result):
+            result = self._llm_upgrade(result, self.conversation.get_context_summary())
 
-        result = IntentResult(
+        return result
+
+    def classify_batch(
+        self, goals: list[str], max_workers: int = 8,
+    ) -> list[IntentResult]:
+        """Classify multiple goals; results match calling ``classify`` in order.
+
+        Identical goals are classified once, and LLM fallbacks for the
+        distinct ambiguous goals run concurrently (up to ``max_workers``),
+        each with the conversation context it would have seen serially.
+        """
+        results: Dict[str, IntentResult] = {}
+        contexts: Dict[str, str] = {}
+        for goal in goals:
+            self.conversation.add_turn("user", goal)
+            if goal not in results:
+                results[goal] = self._keyword_result(goal)
+                if self._needs_llm(results[goal]):
+                    contexts[goal] = self.conversation.get_context_summary()
+
+        if contexts:
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(contexts)))) as pool:
+                upgraded = pool.map(
+                    lambda goal: self._llm_upgrade(results[goal], contexts[goal]),
+                    contexts,
+                )
+                results.update(zip(contexts, upgraded))
+
+        # Duplicates get their own copies, as separate classify calls would
+        out: list[IntentResult] = []
+        seen: set[str] = set()
+        for goal in goals:
+            result = results[goal]
+            if goal in seen:
+                result = replace(
+                    result,
+                    entities=dict(result.entities),
+                    secondary_intents=list(result.secondary_intents),
+                )
+            seen.add(goal)
+            out.append(result)
+        return out
+
+    def _keyword_result(self, goal: str) -> IntentResult:
+        """Fast path: keyword matching plus regex entities."""
+        intent, confidence = self._keyword_match(goal)
+        return IntentResult(
             intent=intent,
             confidence=confidence,
-            entities=entities,
+            entities=self._extract_entities(goal, intent),
             raw_goal=goal,
         )
 
-        # LLM upgrade for low confidence or UNKNOWN intent
-        if (confidence < 0.5 or intent == Intent.UNKNOWN) and self._has_llm():
-            try:
-                llm_result = self._llm_classify(goal)
-                if llm_result.confidence > result.confidence:
-                    result = llm_result
-            except Exception:
-                pass  # Stick with keyword result
+    def _needs_llm(self, result: IntentResult) -> bool:
+        return (result.confidence < 0.5 or result.intent == Intent.UNKNOWN) and self._has_llm()
 
+    def _llm_upgrade(self, result: IntentResult, context: str) -> IntentResult:
+        """LLM result if it is more confident than the keyword one."""
+        try:
+            llm_result = self._llm_classify(result.raw_goal, context)
+            if llm_result.confidence > result.confidence:
+                return llm_result
+        except Exception:
+            pass  # Stick with keyword result
         return result
 
-    def classify_batch(self, goals: list[str]) -> list[IntentResult]:
-        """Classify multiple goals."""
-        return [self.classify(goal) for goal in goals]
-
     def _has_llm(self) -> bool:
         """Check if LLM client is available and functional."""
         return (
@@ -272,25 +323,30 @@ class IntentClassifier:
         )
 
     def _keyword_match(self, goal: str) -> tuple[Intent, float]:
-        """Match goal against keyword map. Returns (intent, confidence)."""
+        """Match goal against keyword map. Returns (intent, confidence).
+
+        Whole-word (or multi-word) matches score 0.9, substrings 0.7; ties
+        go to the earlier intent and keyword in KEYWORD_MAP.
+        """
         goal_lower = goal.lower()
-        matches: List[Tuple[Intent, float]] = []
-
-        for intent, keywords in KEYWORD_MAP.items():
-            for keyword in keywords:
-                if keyword in goal_lower:
-                    words = goal_lower.split()
-                    if keyword in words or " " in keyword:
-                        matches.append((intent, 0.9))
-                    else:
-                        matches.append((intent, 0.7))
-
-        if not matches:
+        hits = scan_goal(goal_lower)
+        first_partial: Optional[Intent] = None
+        words: Optional[set[str]] = None
+
+        for intent in KEYWORD_MAP:
+            for keyword in hits.get(("intent", intent), ()):
+                if " " in keyword:
+                    return intent, 0.9
+                if words is None:
+                    words = set(goal_lower.split())
+                if keyword in words:
+                    return intent, 0.9
+                if first_partial is None:
+                    first_partial = intent
+
+        if first_partial is None:
             return Intent.UNKNOWN, 0.1
-
-        # Return highest confidence match
-        matches.sort(key=lambda x: x[1], reverse=True)
-        return matches[0]
+        return first_partial, 0.7
 
     def _extract_entities(self, goal: str, intent: Intent) -> dict[str, str]:
         """Extract entities from goal string using regex patterns."""
@@ -300,8 +356,7 @@ class IntentClassifier:
         match = _PROJECT_RE.search(goal)
         if match:
             candidate = match.group(1).lower()
-            all_keywords = [kw for kws in KEYWORD_MAP.values() for kw in kws]
-            if candidate not in all_keywords:
+            if candidate not in _ALL_KEYWORDS:
                 entities["project"] = candidate
 
         # Time interval
@@ -324,12 +379,13 @@ class IntentClassifier:
 
         return entities
 
-    def _llm_classify(self, goal: str) -> IntentResult:
+    def _llm_classify(self, goal: str, context: Optional[str] = None) -> IntentResult:
         """Use LLM with chain-of-thought to classify ambiguous goals.
 
         Returns structured IntentResult with reasoning trace.
         """
-        context = self.conversation.get_context_summary()
+        if context is None:
+            context = self.conversation.get_context_summary()
         prompt = _LLM_CLASSIFY_PROMPT.format(context=context, goal=goal)
 
         if self.llm_client is None:
@@ -12,6 +12,7 @@ import asyncio
 import importlib
 import logging
 import subprocess
+import threading
 import time
 import uuid
 from collections.abc import Callable
@@ -28,8 +29,9 @@ from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
-from .dag_scheduler import DAGScheduler, validate_dag
+from .dag_scheduler import validate_dag
 from .event_bus import EventType, get_event_bus
+from .event_dag_scheduler import EventDrivenDAGScheduler
 from .execution_history import EventKind, ExecutionEvent, ExecutionHistory
 from .executor import RecipeExecutor
 from .health_endpoint import (
@@ -357,6 +359,7 @@ class RecipeOrchestrator:
         self.history = ExecutionHistory()
 
         self.step_executor: StepExecutor | None = None
+        self._cancel_requested = threading.Event()
         self.rollback_handler = RollbackHandler(enable_rollback=enable_rollback)
         self.report_formatter = ReportFormatter()
 
@@ -661,8 +664,14 @@ class RecipeOrchestrator:
         goal: str,
         context: PlanningContext | None = None,
         progress_callback: Callable[..., None] | None = None,
+        token_callback: Callable[..., None] | None = None,
+        output_callback: Callable[..., None] | None = None,
     ) -> OrchestrationResult:
-        """Execute complete workflow from high-level goal."""
+        """Execute complete workflow from high-level goal.
+
+        token_callback(step, delta), when given, receives streamed LLM tokens;
+        output_callback(step, stream, line) receives shell output lines.
+        """
         self.console.print(
             Panel(
                 f"[bold]Goal:[/bold] {goal}",
@@ -694,6 +703,8 @@ class RecipeOrchestrator:
                     result = self.run_from_recipe(
                         recipe,
                         progress_callback=progress_callback,
+                        token_callback=token_callback,
+                        output_callback=output_callback,
                     )
                     self._finalize_workflow(result, goal, goal_start_time)
                     return result
@@ -719,7 +730,12 @@ class RecipeOrchestrator:
         self.console.print(f"[green]✓[/green] Generated {len(recipe.steps)} steps")
 
         # PHASE 2 & 3: EXECUTE → VERIFY
-        result = self.run_from_recipe(recipe, progress_callback=progress_callback)
+        result = self.run_from_recipe(
+            recipe,
+            progress_callback=progress_callback,
+            token_callback=token_callback,
+            output_callback=output_callback,
+        )
         self._finalize_workflow(result, goal, goal_start_time)
         return result
 
@@ -782,10 +798,22 @@ class RecipeOrchestrator:
         except Exception as e:
             self.console.print(f"[yellow]⚠ Phase completion check error: {e}[/yellow]")
 
+    def cancel(self) -> None:
+        """Stop the current run: kill its shell step and skip the remaining ones.
+
+        A request made before execution starts (e.g. while planning) applies
+        once the executor exists; it is cleared when the recipe run ends.
+        """
+        self._cancel_requested.set()
+        if self.step_executor is not None:
+            self.step_executor.executor.cancel()
+
     def run_from_recipe(
         self,
         recipe: Recipe,
         progress_callback: Callable[..., None] | None = None,
+        token_callback: Callable[..., None] | None = None,
+        output_callback: Callable[..., None] | None = None,
     ) -> OrchestrationResult:
         """Execute existing recipe with verification."""
         workflow_id = uuid.uuid4().hex[:12]
@@ -811,25 +839,32 @@ class RecipeOrchestrator:
             "\n[bold yellow]⚙️  PHASE 2: EXECUTION & VERIFICATION[/bold yellow]",
         )
 
-        executor = RecipeExecutor(recipe)
+        executor = RecipeExecutor(
+            recipe, token_callback=token_callback, output_callback=output_callback,
+        )
         step_executor = self._init_step_executor(executor)
+        if self._cancel_requested.is_set():
+            executor.cancel()
 
-        dag = DAGScheduler(recipe.steps)
-        if dag.has_dependencies():
-            return self._run_dag_workflow(dag, step_executor, result, workflow_id)
-
-        return self._run_sequential_workflow(
-            recipe,
-            step_executor,
-            result,
-            workflow_id,
-            wf_state,
-            progress_callback,
-        )
+        try:
+            dag = EventDrivenDAGScheduler(recipe.steps)
+            if dag.has_dependencies():
+                return self._run_dag_workflow(dag, step_executor, result, workflow_id)
+
+            return self._run_sequential_workflow(
+                recipe,
+                step_executor,
+                result,
+                workflow_id,
+                wf_state,
+                progress_callback,
+            )
+        finally:
+            self._cancel_requested.clear()
 
     def _run_dag_workflow(
         self,
-        dag: DAGScheduler,
+        dag: EventDrivenDAGScheduler,
         step_executor: StepExecutor,
         result: OrchestrationResult,
         workflow_id: str,
@@ -0,0 +1,362 @@
+"""
+Mekong CLI - Process Runner
+
+Shared subprocess execution for recipe shell steps, daemon missions and
+command-template tools:
+
+- Bounded concurrency: at most ``max_concurrency`` children at once
+  (MEKONG_MAX_PROCESSES), further callers wait for a slot.
+- Streaming capture: stdout/stderr are read line by line on a reusable
+  pool of pump threads, so callers can watch progress while the command
+  runs (``on_line``).
+- Bounded memory: each stream keeps only its most recent
+  ``max_output_chars`` in memory; once a stream outgrows that, the full
+  output is spilled to a temp file and the result points at it. Callers
+  that do not hand those files on call ``ProcessResult.discard_spills()``.
+- Process groups: every child leads its own group, so a timeout or
+  cancel terminates the whole tree (shell pipelines, test runners'
+  workers), not just the direct child.
+"""
+
+import io
+import logging
+import os
+import signal
+import subprocess
+import tempfile
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import IO, Callable, Deque, Dict, List, Mapping, Optional, Sequence, Set
+
+logger = logging.getLogger(__name__)
+
+_POSIX = os.name == "posix"
+_READ_CHUNK = 64 * 1024  # Longest piece of a line handled at once
+_POLL_SECONDS = 0.1  # Cancellation check interval while a child runs
+_KILL_POLL_SECONDS = 0.02  # How often a terminating group is checked for exit
+
+DEFAULT_MAX_OUTPUT_CHARS = 256 * 1024
+
+# on_line(stream, line): stream is "stdout" or "stderr", line has no newline
+LineCallback = Callable[[str, str], None]
+
+
+class OutputBuffer:
+    """Tail of one output stream in memory, full copy on disk once it grows."""
+
+    def __init__(
+        self,
+        name: str,
+        max_chars: int = DEFAULT_MAX_OUTPUT_CHARS,
+        spill_dir: Optional[str] = None,
+    ) -> None:
+        self.name = name
+        self.max_chars = max_chars
+        self.spill_dir = spill_dir
+        self.spill_path: Optional[str] = None
+        self.total_chars = 0
+        self.dropped_chars = 0
+        self._chunks: Deque[str] = deque()
+        self._size = 0
+        self._spill: Optional[IO[str]] = None
+        self._spill_failed = False
+
+    def append(self, text: str) -> None:
+        self.total_chars += len(text)
+        if self._size + len(text) > self.max_chars and self._spill is None and not self._spill_failed:
+            self._open_spill()
+        if self._spill is not None:
+            self._spill.write(text)
+        self._chunks.append(text)
+        self._size += len(text)
+        while self._size > self.max_chars and len(self._chunks) > 1:
+            dropped = self._chunks.popleft()
+            self._size -= len(dropped)
+            self.dropped_chars += len(dropped)
+
+    def getvalue(self) -> str:
+        """Captured text; prefixed with a note when the head was dropped."""
+        text = "".join(self._chunks)
+        if not self.dropped_chars:
+            return text
+        where = f"full output in {self.spill_path}" if self.spill_path else "full output not kept"
+        return f"[... {self.dropped_chars} chars of {self.name} omitted; {where} ...]\n{text}"
+
+    def close(self) -> None:
+        if self._spill is not None:
+            self._spill.close()
+            self._spill = None
+
+    def _open_spill(self) -> None:
+        try:
+            if self.spill_dir:
+                os.makedirs(self.spill_dir, exist_ok=True)
+            self._spill = tempfile.NamedTemporaryFile(
+                "w", encoding="utf-8", errors="replace", delete=False,
+                prefix=f"mekong-{self.name}-", suffix=".log", dir=self.spill_dir,
+            )
+        except OSError as e:
+            logger.warning("Output spill file unavailable, keeping tail only: %s", e)
+            self._spill_failed = True
+            return
+        self.spill_path = self._spill.name
+        self._spill.writelines(self._chunks)
+
+
+@dataclass
+class ProcessResult:
+    """Outcome of one command run through the ProcessRunner."""
+
+    argv: List[str]
+    returncode: int
+    stdout: str = ""
+    stderr: str = ""
+    duration: float = 0.0
+    timed_out: bool = False
+    cancelled: bool = False
+    # Stream name -> file holding its complete output (only when spilled)
+    spill_paths: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return self.returncode == 0 and not self.timed_out and not self.cancelled
+
+    def discard_spills(self) -> None:
+        """Delete the spilled output files (for callers that only keep the tail)."""
+        for path in self.spill_paths.values():
+            try:
+                os.remove(path)
+            except OSError as e:
+                logger.debug("Could not remove spill file %s: %s", path, e)
+        self.spill_paths.clear()
+
+
+class ProcessRunner:
+    """
+    Runs commands with bounded concurrency and streamed, bounded capture.
+
+    Args:
+        max_concurrency: Children allowed at once (default MEKONG_MAX_PROCESSES
+            or 2 x CPUs, capped at 32)
+        max_output_chars: In-memory tail kept per stream
+        spill_dir: Where oversized outputs are written (default: system temp)
+        kill_grace: Seconds between SIGTERM and SIGKILL for a process group
+    """
+
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = None,
+        max_output_chars: int = DEFAULT_MAX_OUTPUT_CHARS,
+        spill_dir: Optional[str] = None,
+        kill_grace: float = 2.0,
+    ) -> None:
+        self.max_concurrency = max_concurrency or int(
+            os.getenv("MEKONG_MAX_PROCESSES", "0")
+        ) or min(32, (os.cpu_count() or 1) * 2)
+        self.max_output_chars = max_output_chars
+        self.spill_dir = spill_dir
+        self.kill_grace = kill_grace
+        self._slots = threading.BoundedSemaphore(self.max_concurrency)
+        self._pumps = ThreadPoolExecutor(
+            max_workers=2 * self.max_concurrency, thread_name_prefix="proc-pump",
+        )
+        self._active: Set[subprocess.Popen] = set()
+        self._cancelled: Set[int] = set()
+        self._lock = threading.Lock()
+
+    @property
+    def active_count(self) -> int:
+        """Children currently running."""
+        with self._lock:
+            return len(self._active)
+
+    def run(
+        self,
+        argv: Sequence[str],
+        *,
+        cwd: Optional[str] = None,
+        env: Optional[Mapping[str, str]] = None,
+        timeout: Optional[float] = None,
+        on_line: Optional[LineCallback] = None,
+        cancel: Optional[threading.Event] = None,
+    ) -> ProcessResult:
+        """
+        Run a command to completion (blocking until a slot is free).
+
+        Args:
+            argv: Program and arguments (no shell)
+            cwd: Working directory
+            env: Environment (default: inherited)
+            timeout: Seconds before the process group is killed
+            on_line: Called from a pump thread for every output line
+            cancel: Setting this event kills the process group
+
+        Returns:
+            ProcessResult; on timeout or cancel, returncode is the
+            signal-terminated code and stdout/stderr hold partial output.
+
+        Raises:
+            OSError: The program could not be started (e.g. not found)
+        """
+        argv = list(argv)
+        with self._slots:
+            if cancel is not None and cancel.is_set():
+                return ProcessResult(argv=argv, returncode=-signal.SIGTERM, cancelled=True)
+            started = time.monotonic()
+            deadline = None if timeout is None else started + timeout
+            proc = subprocess.Popen(
+                argv, cwd=cwd, env=env,
+                stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                start_new_session=_POSIX,
+            )
+            with self._lock:
+                self._active.add(proc)
+
+            out = OutputBuffer("stdout", self.max_output_chars, self.spill_dir)
+            err = OutputBuffer("stderr", self.max_output_chars, self.spill_dir)
+            pumps = [
+                self._pumps.submit(self._pump, proc.stdout, out, on_line),
+                self._pumps.submit(self._pump, proc.stderr, err, on_line),
+            ]
+            timed_out = cancelled = False
+            try:
+                timed_out, cancelled = self._wait(proc, deadline, cancel)
+                # Grandchildren may still hold the pipes open after the leader exits
+                remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+                _, pending = wait(pumps, timeout=remaining)
+                if pending:
+                    timed_out = True
+                    self._kill_group(proc)
+                    wait(pumps)
+            finally:
+                with self._lock:
+                    self._active.discard(proc)
+                    cancelled = cancelled or proc.pid in self._cancelled
+                    self._cancelled.discard(proc.pid)
+                out.close()
+                err.close()
+
+        return ProcessResult(
+            argv=argv,
+            returncode=proc.returncode,
+            stdout=out.getvalue(),
+            stderr=err.getvalue(),
+            duration=time.monotonic() - started,
+            timed_out=timed_out,
+            cancelled=cancelled,
+            spill_paths={b.name: b.spill_path for b in (out, err) if b.spill_path},
+        )
+
+    def cancel_all(self) -> int:
+        """Kill the process groups of every running child; returns how many."""
+        with self._lock:
+            procs = list(self._active)
+            self._cancelled.update(p.pid for p in procs)
+        for proc in procs:
+            self._kill_group(proc)
+        return len(procs)
+
+    def shutdown(self) -> None:
+        """Cancel running children and stop the pump threads."""
+        self.cancel_all()
+        self._pumps.shutdown(wait=False)
+
+    def _wait(
+        self,
+        proc: subprocess.Popen,
+        deadline: Optional[float],
+        cancel: Optional[threading.Event],
+    ) -> tuple:
+        """Wait for exit; kill the group on deadline or cancel. Returns (timed_out, cancelled)."""
+        while True:
+            step = _POLL_SECONDS
+            if deadline is not None:
+                step = min(step, max(0.0, deadline - time.monotonic()))
+            try:
+                proc.wait(timeout=step)
+                return False, False
+            except subprocess.TimeoutExpired:
+                pass
+            if cancel is not None and cancel.is_set():
+                self._kill_group(proc)
+                return False, True
+            if deadline is not None and time.monotonic() >= deadline:
+                self._kill_group(proc)
+                return True, False
+
+    def _kill_group(self, proc: subprocess.Popen) -> None:
+        """SIGTERM the child's process group, SIGKILL it after the grace period.
+
+        The grace period covers the whole group: grandchildren get the same
+        time to clean up even when the leader exits on SIGTERM straight away.
+        """
+        if not _POSIX:
+            proc.terminate()
+            try:
+                proc.wait(timeout=self.kill_grace)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+            return
+        try:
+            os.killpg(proc.pid, signal.SIGTERM)
+        except ProcessLookupError:
+            return  # Group already gone
+        except (PermissionError, OSError):
+            pass
+        deadline = time.monotonic() + self.kill_grace
+        while time.monotonic() < deadline:
+            proc.poll()  # Reap the leader so a zombie doesn't keep the group alive
+            try:
+                os.killpg(proc.pid, 0)
+            except ProcessLookupError:
+                return
+            except (PermissionError, OSError):
+                pass
+            time.sleep(_KILL_POLL_SECONDS)
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError, OSError):
+            pass
+        try:
+            proc.wait(timeout=self.kill_grace)
+        except subprocess.TimeoutExpired:
+            pass
+
+    @staticmethod
+    def _pump(pipe: IO[bytes], buffer: OutputBuffer, on_line: Optional[LineCallback]) -> None:
+        reader = io.TextIOWrapper(pipe, encoding="utf-8", errors="replace")
+        with reader:
+            for line in iter(lambda: reader.readline(_READ_CHUNK), ""):
+                buffer.append(line)
+                if on_line is not None:
+                    try:
+                        on_line(buffer.name, line.rstrip("\n"))
+                    except Exception as e:
+                        logger.debug("Output line callback failed: %s", e)
+
+
+# Shared runner
+_default_runner: Optional[ProcessRunner] = None
+_runner_lock = threading.Lock()
+
+
+def get_process_runner() -> ProcessRunner:
+    """Get or create the shared process runner."""
+    global _default_runner
+    if _default_runner is None:
+        with _runner_lock:
+            if _default_runner is None:
+                _default_runner = ProcessRunner()
+    return _default_runner
+
+
+__all__ = [
+    "DEFAULT_MAX_OUTPUT_CHARS",
+    "OutputBuffer",
+    "ProcessResult",
+    "ProcessRunner",
+    "get_process_runner",
+]
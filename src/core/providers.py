@@ -7,15 +7,20 @@ Built-in: GeminiProvider, OpenAICompatibleProvider, OfflineProvider.
 """
 
 from abc import ABC, abstractmethod  # noqa: E402
+from collections.abc import Iterator  # noqa: E402
 from dataclasses import dataclass  # noqa: E402
 from typing import Any, Optional  # noqa: E402
 
+import asyncio  # noqa: E402
+import base64  # noqa: E402
+import http.client  # noqa: E402
 import json  # noqa: E402
 import logging  # noqa: E402
 import os  # noqa: E402
 import random  # noqa: E402
+import threading  # noqa: E402
 import time  # noqa: E402
-import urllib.error  # noqa: E402
+import urllib.parse  # noqa: E402
 import urllib.request  # noqa: E402
 
 logger = logging.getLogger(__name__)
@@ -63,6 +68,34 @@ class LLMProvider(ABC):
         """Return True if provider is configured and usable."""
         ...
 
+    def chat_stream(
+        self,
+        messages: list[dict[str, str]],
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        json_mode: bool,
+    ) -> Iterator[str]:
+        """Yield response text incrementally. Default yields chat() in one chunk."""
+        yield self.chat(messages, model, temperature, max_tokens, json_mode).content
+
+    async def achat(
+        self,
+        messages: list[dict[str, str]],
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        json_mode: bool,
+    ) -> LLMResponse:
+        """Async chat request. Default runs chat() in a worker thread."""
+        return await asyncio.to_thread(
+            self.chat, messages, model, temperature, max_tokens, json_mode,
+        )
+
+    async def aclose(self) -> None:
+        """Release async resources (connection pools). No-op by default."""
+        return None
+
 
 # ---------------------------------------------------------------------------
 # GeminiProvider
@@ -98,14 +131,14 @@ class GeminiProvider(LLMProvider):
     def is_available(self) -> bool:
         return self._available
 
-    def chat(
+    def _prepare(
         self,
         messages: list[dict[str, str]],
-        model: str,
         temperature: float,
         max_tokens: int,
         json_mode: bool,
-    ) -> LLMResponse:
+    ) -> tuple[str, dict[str, Any]]:
+        """Build (prompt_text, config) for the google-genai SDK."""
         if not self._client:
             msg = "GeminiProvider not available (SDK missing or no key)"
             raise RuntimeError(msg)
@@ -113,11 +146,6 @@ class GeminiProvider(LLMProvider):
         # Remove GOOGLE_API_KEY at call time too
         os.environ.pop("GOOGLE_API_KEY", None)
 
-        # Ensure client is initialized (may be needed after key set post-init)
-        if not self._client:
-            from google import genai  # type: ignore
-            self._client = genai.Client(api_key=self._api_key)
-
         system_instruction = None
         prompt_parts: list[str] = []
 
@@ -144,6 +172,35 @@ class GeminiProvider(LLMProvider):
             config["response_mime_type"] = "application/json"
         if system_instruction:
             config["system_instruction"] = system_instruction
+        return prompt_text, config
+
+    def chat_stream(
+        self,
+        messages: list[dict[str, str]],
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        json_mode: bool,
+    ) -> Iterator[str]:
+        prompt_text, config = self._prepare(messages, temperature, max_tokens, json_mode)
+        for chunk in self._client.models.generate_content_stream(
+            model=model,
+            contents=prompt_text,
+            config=config,
+        ):
+            text = getattr(chunk, "text", None)
+            if text:
+                yield text
+
+    def chat(
+        self,
+        messages: list[dict[str, str]],
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        json_mode: bool,
+    ) -> LLMResponse:
+        prompt_text, config = self._prepare(messages, temperature, max_tokens, json_mode)
 
         max_retries = 3
         for attempt in range(max_retries):
@@ -216,6 +273,221 @@ class GeminiProvider(LLMProvider):
         raise RuntimeError(msg)
 
 
+# ---------------------------------------------------------------------------
+# Keep-alive connection pool (stdlib)
+# ---------------------------------------------------------------------------
+
+class _StatusError(Exception):
+    """HTTP error status seen while streaming."""
+
+    def __init__(self, status: int, reason: str) -> None:
+        super().__init__(f"HTTP {status}: {reason}")
+        self.status = status
+        self.reason = reason
+
+
+_REDIRECT_CODES = (301, 302, 303, 307, 308)
+MAX_REDIRECTS = 5
+
+# (scheme, host, port) of one HTTP endpoint
+_Origin = tuple[str, str, Optional[int]]
+
+
+def _proxy_for(origin: _Origin) -> Optional[tuple[str, int, dict[str, str]]]:
+    """(host, port, auth headers) of the environment's proxy for *origin*, if any.
+
+    Reads HTTP(S)_PROXY / NO_PROXY the same way urllib's default opener does.
+    """
+    scheme, host, port = origin
+    proxy = urllib.request.getproxies().get(scheme)
+    netloc = f"{host}:{port}" if port else host
+    if not proxy or urllib.request.proxy_bypass(netloc):
+        return None
+    if "://" not in proxy:
+        proxy = "http://" + proxy
+    parts = urllib.parse.urlsplit(proxy)
+    headers: dict[str, str] = {}
+    if parts.username:
+        credentials = f"{urllib.parse.unquote(parts.username)}:{urllib.parse.unquote(parts.password or '')}"
+        headers["Proxy-Authorization"] = "Basic " + base64.b64encode(credentials.encode()).decode("ascii")
+    return parts.hostname or "", parts.port or (443 if parts.scheme == "https" else 80), headers
+
+
+class KeepAlivePool:
+    """Pool of idle keep-alive HTTP(S) connections to a single origin.
+
+    Reusing connections skips the TCP + TLS handshake on every call.
+    A reused connection that the server already closed is retried once
+    on a fresh connection.
+
+    Like the urllib client it replaced, the pool honours HTTP(S)_PROXY and
+    NO_PROXY (plain HTTP is sent to the proxy, HTTPS is tunnelled through
+    it with CONNECT) and follows up to ``MAX_REDIRECTS`` redirects: 307/308
+    resend the same request, 301/302/303 become a bodiless GET. A redirect
+    to another origin uses a one-off connection and drops Authorization.
+    """
+
+    _STALE_ERRORS = (
+        http.client.RemoteDisconnected,
+        http.client.CannotSendRequest,
+        BrokenPipeError,
+        ConnectionResetError,
+    )
+
+    def __init__(self, base_url: str, timeout: float = 60, max_idle: int = 8) -> None:
+        parts = urllib.parse.urlsplit(base_url)
+        self._origin: _Origin = (parts.scheme, parts.hostname or "", parts.port)
+        self._prefix = parts.path.rstrip("/")
+        self._timeout = timeout
+        self._max_idle = max_idle
+        self._idle: list[http.client.HTTPConnection] = []
+        self._lock = threading.Lock()
+        self._proxies: dict[_Origin, Optional[tuple[str, int, dict[str, str]]]] = {}
+        self.connections_opened = 0
+
+    def _proxy(self, origin: _Origin) -> Optional[tuple[str, int, dict[str, str]]]:
+        if origin not in self._proxies:
+            self._proxies[origin] = _proxy_for(origin)
+        return self._proxies[origin]
+
+    def _connect(self, origin: _Origin) -> http.client.HTTPConnection:
+        scheme, host, port = origin
+        https = scheme == "https"
+        proxy = self._proxy(origin)
+        if proxy is None:
+            conn_cls = http.client.HTTPSConnection if https else http.client.HTTPConnection
+            return conn_cls(host, port, timeout=self._timeout)
+        proxy_host, proxy_port, proxy_headers = proxy
+        if not https:
+            return http.client.HTTPConnection(proxy_host, proxy_port, timeout=self._timeout)
+        conn = http.client.HTTPSConnection(proxy_host, proxy_port, timeout=self._timeout)
+        conn.set_tunnel(host, port, headers=proxy_headers)
+        return conn
+
+    def _acquire(self) -> tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            if self._idle:
+                return self._idle.pop(), True
+            self.connections_opened += 1
+        return self._connect(self._origin), False
+
+    def _release(self, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            if len(self._idle) < self._max_idle:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    def _finish(self, conn: http.client.HTTPConnection, resp: http.client.HTTPResponse, pooled: bool) -> None:
+        """Return a fully read connection to the pool, or close it."""
+        if pooled and not resp.will_close:
+            self._release(conn)
+        else:
+            conn.close()
+
+    def _send(
+        self, origin: _Origin, method: str, target: str, body: Optional[bytes], headers: dict[str, str],
+    ) -> tuple[http.client.HTTPConnection, http.client.HTTPResponse, bool]:
+        """Send one request; returns (connection, response, pooled)."""
+        pooled = origin == self._origin
+        proxy = self._proxy(origin)
+        if proxy is not None and origin[0] == "http":
+            # Plain HTTP through a proxy: absolute-form target, credentials per request
+            scheme, host, port = origin
+            target = f"{scheme}://{host}{f':{port}' if port else ''}{target}"
+            headers = {**headers, **proxy[2]}
+        for attempt in range(2):
+            if pooled:
+                conn, reused = self._acquire()
+            else:
+                conn, reused = self._connect(origin), False
+            try:
+                conn.request(method, target, body=body, headers=headers)
+                return conn, conn.getresponse(), pooled
+            except self._STALE_ERRORS:
+                conn.close()
+                if reused and attempt == 0:
+                    continue
+                raise
+            except Exception:
+                conn.close()
+                raise
+        msg = "unreachable"
+        raise RuntimeError(msg)
+
+    def _open(
+        self, method: str, path: str, body: Optional[bytes], headers: dict[str, str],
+    ) -> tuple[http.client.HTTPConnection, http.client.HTTPResponse, bool]:
+        """Send a request, following redirects; returns the final (connection, response, pooled)."""
+        origin, target = self._origin, self._prefix + path
+        for _ in range(MAX_REDIRECTS + 1):
+            conn, resp, pooled = self._send(origin, method, target, body, headers)
+            location = resp.getheader("Location")
+            if resp.status not in _REDIRECT_CODES or not location:
+                return conn, resp, pooled
+            resp.read()
+            self._finish(conn, resp, pooled)
+
+            scheme, host, port = origin
+            current = f"{scheme}://{host}{f':{port}' if port else ''}{target}"
+            parts = urllib.parse.urlsplit(urllib.parse.urljoin(current, location))
+            if parts.scheme not in ("http", "https"):
+                msg = f"Unsupported redirect to {location}"
+                raise http.client.HTTPException(msg)
+            origin = (parts.scheme, parts.hostname or "", parts.port)
+            target = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+            if origin != self._origin:
+                headers = {k: v for k, v in headers.items() if k.lower() != "authorization"}
+            if resp.status in (301, 302, 303) and method != "HEAD":
+                method, body = "GET", None
+                headers = {k: v for k, v in headers.items() if k.lower() not in ("content-type", "content-length")}
+        msg = f"More than {MAX_REDIRECTS} redirects"
+        raise http.client.HTTPException(msg)
+
+    def request(
+        self, method: str, path: str, body: bytes, headers: dict[str, str],
+    ) -> tuple[int, str, bytes]:
+        """Send a request and return (status, reason, body)."""
+        conn, resp, pooled = self._open(method, path, body, headers)
+        try:
+            data = resp.read()
+        except Exception:
+            conn.close()
+            raise
+        self._finish(conn, resp, pooled)
+        return resp.status, resp.reason, data
+
+    def stream_lines(
+        self, method: str, path: str, body: bytes, headers: dict[str, str],
+    ) -> Iterator[bytes]:
+        """Send a request and yield response body lines as they arrive.
+
+        The connection returns to the pool only if the body is fully read.
+        An HTTP status >= 400 raises _StatusError before any line is yielded.
+        """
+        conn, resp, pooled = self._open(method, path, body, headers)
+        try:
+            if resp.status >= 400:
+                resp.read()
+                raise _StatusError(resp.status, resp.reason)
+            while True:
+                line = resp.readline()
+                if not line:
+                    break
+                yield line
+        except BaseException:
+            conn.close()
+            raise
+        self._finish(conn, resp, pooled)
+
+    def close(self) -> None:
+        """Close all idle connections."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+
 # ---------------------------------------------------------------------------
 # OpenAICompatibleProvider
 # ---------------------------------------------------------------------------
@@ -225,7 +497,9 @@ class OpenAICompatibleProvider(LLMProvider):
 
     Works with: OpenAI, Anthropic proxy, Ollama, vLLM, any OpenAI-compatible,
     and any endpoint that implements /chat/completions.
-    Uses urllib (stdlib) — no requests dependency.
+    Sync calls use a stdlib keep-alive pool — no requests dependency.
+    Async calls use a pooled httpx.AsyncClient when httpx is installed,
+    otherwise the sync pool in a worker thread.
     """
 
     def __init__(
@@ -235,12 +509,17 @@ class OpenAICompatibleProvider(LLMProvider):
         model: str = "",
         provider_name: str = "openai_compatible",
         timeout: int = 60,
+        max_connections: int = 8,
     ) -> None:
         self._base_url = base_url.rstrip("/") if base_url else ""
         self._api_key = api_key
         self._default_model = model
         self._provider_name = provider_name
         self._timeout = timeout
+        self._max_connections = max_connections
+        self._pool: KeepAlivePool | None = None
+        self._async_client: Any = None
+        self._async_loop: asyncio.AbstractEventLoop | None = None
 
     @property
     def name(self) -> str:
@@ -249,14 +528,15 @@ class OpenAICompatibleProvider(LLMProvider):
     def is_available(self) -> bool:
         return bool(self._base_url)
 
-    def chat(
+    def _build_request(
         self,
         messages: list[dict[str, str]],
         model: str,
         temperature: float,
         max_tokens: int,
         json_mode: bool,
-    ) -> LLMResponse:
+        stream: bool = False,
+    ) -> tuple[str, bytes, dict[str, str]]:
         if not self._base_url:
             msg = f"{self.name}: no base_url configured"
             raise RuntimeError(msg)
@@ -270,38 +550,142 @@ class OpenAICompatibleProvider(LLMProvider):
         }
         if json_mode:
             payload["response_format"] = {"type": "json_object"}
+        if stream:
+            payload["stream"] = True
 
         headers: dict[str, str] = {"Content-Type": "application/json"}
         if self._api_key:
             headers["Authorization"] = f"Bearer {self._api_key}"
 
-        url = f"{self._base_url}/chat/completions"
-        logger.debug("[%s] POST %s model=%s", self.name, url, use_model)
+        logger.debug("[%s] POST %s/chat/completions model=%s", self.name, self._base_url, use_model)
+        return use_model, json.dumps(payload).encode("utf-8"), headers
 
-        body = json.dumps(payload).encode("utf-8")
-        req = urllib.request.Request(url, data=body, headers=headers, method="POST")
+    @staticmethod
+    def _parse_response(data: dict[str, Any], use_model: str) -> LLMResponse:
+        content = data["choices"][0]["message"]["content"]
+        return LLMResponse(
+            content=content,
+            model=data.get("model", use_model),
+            usage=data.get("usage", {}),
+            raw=data,
+        )
 
+    def chat(
+        self,
+        messages: list[dict[str, str]],
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        json_mode: bool,
+    ) -> LLMResponse:
+        use_model, body, headers = self._build_request(
+            messages, model, temperature, max_tokens, json_mode,
+        )
         try:
-            with urllib.request.urlopen(req, timeout=self._timeout) as resp:
-                data = json.loads(resp.read().decode("utf-8"))
-        except urllib.error.HTTPError as e:
-            msg = f"{self.name} HTTP {e.code}: {e.reason}"
-            raise RuntimeError(
-                msg,
-            ) from e
-        except urllib.error.URLError as e:
+            status, reason, raw = self._get_pool().request("POST", "/chat/completions", body, headers)
+        except (OSError, http.client.HTTPException) as e:
             msg = f"{self.name} connection error: {e}"
             raise RuntimeError(msg) from e
+        if status >= 400:
+            msg = f"{self.name} HTTP {status}: {reason}"
+            raise RuntimeError(msg)
 
-        content = data["choices"][0]["message"]["content"]
-        usage = data.get("usage", {})
+        return self._parse_response(json.loads(raw.decode("utf-8")), use_model)
 
-        return LLMResponse(
-            content=content,
-            model=data.get("model", use_model),
-            usage=usage,
-            raw=data,
+    def chat_stream(
+        self,
+        messages: list[dict[str, str]],
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        json_mode: bool,
+    ) -> Iterator[str]:
+        """Stream tokens via the OpenAI server-sent-events protocol."""
+        _, body, headers = self._build_request(
+            messages, model, temperature, max_tokens, json_mode, stream=True,
         )
+        pool = self._get_pool()
+        try:
+            for raw_line in pool.stream_lines("POST", "/chat/completions", body, headers):
+                line = raw_line.decode("utf-8").strip()
+                if not line.startswith("data:"):
+                    continue
+                data = line[len("data:"):].strip()
+                if data == "[DONE]":
+                    continue  # Drain to end so the connection can be reused
+                choices = json.loads(data).get("choices") or [{}]
+                delta = (choices[0].get("delta") or {}).get("content")
+                if delta:
+                    yield delta
+        except _StatusError as e:
+            msg = f"{self.name} HTTP {e.status}: {e.reason}"
+            raise RuntimeError(msg) from e
+        except (OSError, http.client.HTTPException) as e:
+            msg = f"{self.name} connection error: {e}"
+            raise RuntimeError(msg) from e
+
+    def _get_pool(self) -> KeepAlivePool:
+        if self._pool is None:
+            self._pool = KeepAlivePool(
+                self._base_url, timeout=self._timeout, max_idle=self._max_connections,
+            )
+        return self._pool
+
+    def _get_async_client(self) -> Any:
+        """Return an httpx.AsyncClient bound to the running loop, or None."""
+        try:
+            import httpx
+        except ImportError:
+            return None
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_loop is not loop:
+            self._async_client = httpx.AsyncClient(
+                base_url=self._base_url,
+                timeout=self._timeout,
+                follow_redirects=True,  # Proxies come from the environment (trust_env)
+                limits=httpx.Limits(
+                    max_connections=self._max_connections,
+                    max_keepalive_connections=self._max_connections,
+                ),
+            )
+            self._async_loop = loop
+        return self._async_client
+
+    async def achat(
+        self,
+        messages: list[dict[str, str]],
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        json_mode: bool,
+    ) -> LLMResponse:
+        client = self._get_async_client()
+        if client is None:
+            return await super().achat(messages, model, temperature, max_tokens, json_mode)
+
+        import httpx
+
+        use_model, body, headers = self._build_request(
+            messages, model, temperature, max_tokens, json_mode,
+        )
+        try:
+            resp = await client.post("/chat/completions", content=body, headers=headers)
+        except httpx.HTTPError as e:
+            msg = f"{self.name} connection error: {e}"
+            raise RuntimeError(msg) from e
+        if resp.status_code >= 400:
+            msg = f"{self.name} HTTP {resp.status_code}: {resp.reason_phrase}"
+            raise RuntimeError(msg)
+
+        return self._parse_response(resp.json(), use_model)
+
+    async def aclose(self) -> None:
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+            self._async_loop = None
+        if self._pool is not None:
+            self._pool.close()
 
 
 # ---------------------------------------------------------------------------
@@ -338,6 +722,7 @@ class OfflineProvider(LLMProvider):
 
 __all__ = [
     "GeminiProvider",
+    "KeepAlivePool",
     "LLMProvider",
     "LLMResponse",
     "OfflineProvider",
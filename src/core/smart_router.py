@@ -172,7 +172,7 @@ class SmartRouter:
         """Check if recipe is viable based on memory success rate."""
         if not self.memory:
             return True
-        entries = [e for e in self.memory._entries if e.recipe_used == recipe_name]
+        entries = self.memory.entries_for_recipe(recipe_name)
         if len(entries) < 3:
             return True  # Not enough data
         recent = entries[-10:]
@@ -1,19 +1,25 @@
 """Mekong CLI - Swarm Registry.
 
 Multi-node orchestration for distributed Mekong gateways.
-Manages a registry of remote nodes with health checking.
+Manages a registry of remote nodes with health checking, and spreads
+work across healthy nodes by their live load.
 """
 
 from __future__ import annotations
 
 import logging
+import random
+import threading
 import time
 import uuid
-from dataclasses import dataclass
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from pathlib import Path
 from typing import Any
 
 import requests  # type: ignore[import-untyped]
+from requests.adapters import HTTPAdapter  # type: ignore[import-untyped]
 
 logger = logging.getLogger(__name__)
 
@@ -89,13 +95,20 @@ class SwarmRegistry:
         node.last_heartbeat = time.time()
         return node.status
 
-    def check_all_health(self, timeout: float = 3.0) -> dict[str, str]:
-        """Run health checks on all registered nodes."""
-        results: dict[str, str] = {}
-        for node in self._nodes.values():
-            results[node.id] = self.check_health(node, timeout)
+    def check_all_health(
+        self, timeout: float = 3.0, max_workers: int = 16,
+    ) -> dict[str, str]:
+        """Run health checks on all registered nodes concurrently.
+
+        Total wall time is bounded by the slowest node rather than the sum.
+        """
+        nodes = list(self._nodes.values())
+        if not nodes:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(nodes))) as pool:
+            statuses = list(pool.map(lambda n: self.check_health(n, timeout), nodes))
         self._save()
-        return results
+        return {node.id: status for node, status in zip(nodes, statuses)}
 
     def dispatch_goal(
         self, node_id: str, goal: str, timeout: float = 60.0,
@@ -163,13 +176,32 @@ class SwarmRegistry:
                 self._nodes[node.id] = node
 
 
+@dataclass
+class NodeLoad:
+    """Live load of one node as seen by a dispatcher."""
+
+    in_flight: int = 0
+    ewma_latency: float = 0.0  # Seconds per step; 0.0 until the first sample
+    dispatched: int = 0
+    failures: int = 0
+
+    def score(self, default_latency: float) -> float:
+        """Expected wait for one more step: queue depth x latency."""
+        return (self.in_flight + 1) * (self.ewma_latency or default_latency)
+
+
 class SwarmDispatcher:
     """Dispatches RecipeStep tasks to local agents or remote swarm nodes.
 
     Routing logic:
-    - If healthy remote nodes exist, dispatch to first available (V1: round-robin not needed)
+    - Healthy remote nodes are picked by live load: fewest in-flight steps
+      weighted by EWMA latency ("least_outstanding", default), or the
+      better of two random nodes ("p2c", power-of-two-choices)
     - Fallback to local agent execution when no healthy nodes
 
+    Each node gets a keep-alive ``requests.Session``. ``dispatch_batch``
+    sends several ready steps to a node in one POST /cmd/batch request.
+
     Local agent routing:
     - step type "git"   -> GitAgent
     - step type "file"  -> FileAgent
@@ -183,8 +215,43 @@ class SwarmDispatcher:
         "shell": "shell",
     }
 
-    def __init__(self, registry: SwarmRegistry) -> None:
+    STRATEGIES = ("least_outstanding", "p2c")
+
+    def __init__(
+        self,
+        registry: SwarmRegistry,
+        strategy: str = "least_outstanding",
+        timeout: float = 60.0,
+        max_batch: int = 8,
+        ewma_alpha: float = 0.3,
+        pool_size: int = 16,
+        session_factory: Callable[[], requests.Session] = requests.Session,
+    ) -> None:
+        """Initialize SwarmDispatcher.
+
+        Args:
+            registry: Swarm node registry.
+            strategy: Node selection, "least_outstanding" or "p2c".
+            timeout: Per-request timeout in seconds.
+            max_batch: Most steps sent to a node in one batch request.
+            ewma_alpha: Weight of the newest latency sample.
+            pool_size: Keep-alive connections per node.
+            session_factory: Builds per-node sessions (for testing).
+
+        """
+        if strategy not in self.STRATEGIES:
+            raise ValueError(f"Unknown strategy {strategy!r}; expected one of {self.STRATEGIES}")
         self.registry = registry
+        self.strategy = strategy
+        self.timeout = timeout
+        self.max_batch = max(1, max_batch)
+        self.ewma_alpha = ewma_alpha
+        self._pool_size = pool_size
+        self._session_factory = session_factory
+        self._lock = threading.Lock()
+        self._loads: dict[str, NodeLoad] = {}
+        self._sessions: dict[str, requests.Session] = {}
+        self._rotation = 0
         self._local_agents: dict[str, Any] = {}
         self._init_local_agents()
 
@@ -254,35 +321,206 @@ class SwarmDispatcher:
             stderr=result.error or "",
         )
 
-    def _dispatch_remote(self, step: Any, node: SwarmNode) -> Any:
-        """Send step to remote node via POST /cmd. Returns ExecutionResult."""
+    # -- Load tracking --
+
+    def _load(self, node_id: str) -> NodeLoad:
+        load = self._loads.get(node_id)
+        if load is None:
+            load = self._loads[node_id] = NodeLoad()
+        return load
+
+    def _default_latency(self) -> float:
+        """Latency assumed for nodes without samples.
+
+        Optimistic (the fastest known node) so new nodes get tried.
+        """
+        samples = [load.ewma_latency for load in self._loads.values() if load.ewma_latency]
+        return min(samples) if samples else 1.0
+
+    def _pick(self, nodes: list[SwarmNode]) -> SwarmNode:
+        """Choose a node; caller holds ``self._lock``."""
+        default = self._default_latency()
+        if self.strategy == "p2c" and len(nodes) > 2:
+            candidates = random.sample(nodes, 2)
+        else:
+            # Rotate the start so ties spread instead of piling onto nodes[0]
+            self._rotation = (self._rotation + 1) % len(nodes)
+            candidates = nodes[self._rotation:] + nodes[:self._rotation]
+        return min(candidates, key=lambda n: self._load(n.id).score(default))
+
+    def select_node(self, nodes: list[SwarmNode] | None = None) -> SwarmNode | None:
+        """Return the healthy node that should take the next step."""
+        nodes = self.get_healthy_nodes() if nodes is None else nodes
+        if not nodes:
+            return None
+        with self._lock:
+            return self._pick(nodes)
+
+    def _reserve(self, node: SwarmNode, steps: int = 1) -> None:
+        with self._lock:
+            self._load(node.id).in_flight += steps
+
+    def _release(self, node: SwarmNode, steps: int, elapsed: float, failed: int) -> None:
+        per_step = elapsed / steps if steps else elapsed
+        with self._lock:
+            load = self._load(node.id)
+            load.in_flight -= steps
+            load.dispatched += steps
+            load.failures += failed
+            if load.ewma_latency:
+                load.ewma_latency += self.ewma_alpha * (per_step - load.ewma_latency)
+            else:
+                load.ewma_latency = per_step
+
+    def load_snapshot(self) -> dict[str, NodeLoad]:
+        """Copy of the per-node load counters, keyed by node ID."""
+        with self._lock:
+            return {node_id: replace(load) for node_id, load in self._loads.items()}
+
+    # -- Remote transport --
+
+    def _session(self, node: SwarmNode) -> requests.Session:
+        """Keep-alive session for a node, created on first use."""
+        with self._lock:
+            session = self._sessions.get(node.id)
+            if session is None:
+                session = self._session_factory()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self._pool_size)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._sessions[node.id] = session
+            return session
+
+    def close(self) -> None:
+        """Close all per-node sessions."""
+        with self._lock:
+            sessions, self._sessions = list(self._sessions.values()), {}
+        for session in sessions:
+            session.close()
+
+    @staticmethod
+    def _to_result(data: dict[str, Any]) -> Any:
         from .verifier import ExecutionResult
+        error = data.get("error") or "; ".join(str(e) for e in data.get("errors") or [])
+        return ExecutionResult(
+            exit_code=0 if data.get("status") == "success" else 1,
+            stdout=str(data.get("result", "")),
+            stderr=str(error),
+        )
+
+    @staticmethod
+    def _error_result(message: str) -> Any:
+        from .verifier import ExecutionResult
+        return ExecutionResult(exit_code=1, stdout="", stderr=message)
+
+    def _post_step(self, step: Any, node: SwarmNode) -> Any:
+        """POST /cmd for one step over the node's session."""
         url = f"http://{node.host}:{node.port}/cmd"
         try:
-            resp = requests.post(
+            resp = self._session(node).post(
                 url,
                 json={"goal": getattr(step, "description", ""), "token": node.token},
-                timeout=60.0,
+                timeout=self.timeout,
             )
-            data = resp.json()
-            return ExecutionResult(
-                exit_code=0 if data.get("status") == "success" else 1,
-                stdout=str(data.get("result", "")),
-                stderr=str(data.get("error", "")),
+            return self._to_result(resp.json())
+        except (requests.RequestException, ValueError, AttributeError) as e:
+            return self._error_result(str(e))
+
+    def _post_batch(self, steps: list[Any], node: SwarmNode) -> list[Any]:
+        """POST /cmd/batch for several steps; per-step /cmd on older nodes."""
+        url = f"http://{node.host}:{node.port}/cmd/batch"
+        try:
+            resp = self._session(node).post(
+                url,
+                json={
+                    "goals": [getattr(step, "description", "") for step in steps],
+                    "token": node.token,
+                },
+                timeout=self.timeout * len(steps),
             )
-        except requests.RequestException as e:
-            return ExecutionResult(exit_code=1, stdout="", stderr=str(e))
+            if resp.status_code in (404, 405):
+                return [self._post_step(step, node) for step in steps]
+            results = resp.json().get("results") or []
+            if len(results) != len(steps):
+                raise ValueError(f"expected {len(steps)} results, got {len(results)}")
+            return [self._to_result(data) for data in results]
+        except (requests.RequestException, ValueError, AttributeError) as e:
+            return [self._error_result(str(e)) for _ in steps]
+
+    def _dispatch_remote(self, step: Any, node: SwarmNode) -> Any:
+        """Send step to remote node via POST /cmd. Returns ExecutionResult."""
+        self._reserve(node)
+        started = time.perf_counter()
+        failed = 1
+        try:
+            result = self._post_step(step, node)
+            failed = int(result.exit_code != 0)
+            return result
+        finally:
+            self._release(node, 1, time.perf_counter() - started, failed)
+
+    def _dispatch_remote_batch(self, steps: list[Any], node: SwarmNode) -> list[Any]:
+        """Send already-reserved steps to a node in one request."""
+        started = time.perf_counter()
+        failed = len(steps)
+        try:
+            results = self._post_batch(steps, node)
+            failed = sum(1 for r in results if r.exit_code != 0)
+            return results
+        finally:
+            self._release(node, len(steps), time.perf_counter() - started, failed)
 
     def dispatch(self, step: Any) -> Any:
         """Dispatch a single RecipeStep. Returns ExecutionResult.
 
-        Priority: healthy remote node -> local agent fallback.
+        Priority: least-loaded healthy remote node -> local agent fallback.
         """
         agent_type = self._route_step(step)
-        healthy = self.get_healthy_nodes()
-        if healthy:
-            return self._dispatch_remote(step, healthy[0])
+        node = self.select_node()
+        if node is not None:
+            return self._dispatch_remote(step, node)
         return self._dispatch_local(step, agent_type)
 
+    def dispatch_batch(self, steps: list[Any]) -> list[Any]:
+        """Dispatch independent (DAG-ready) steps; results in input order.
+
+        Steps are assigned one at a time to the least-loaded node, counting
+        earlier assignments as in flight, then each node's share is sent in
+        requests of up to ``max_batch`` steps, all nodes concurrently.
+        """
+        if not steps:
+            return []
+        healthy = self.get_healthy_nodes()
+        if not healthy:
+            return [self._dispatch_local(step, self._route_step(step)) for step in steps]
+
+        assigned: dict[str, list[int]] = {}
+        nodes: dict[str, SwarmNode] = {}
+        with self._lock:
+            for index in range(len(steps)):
+                node = self._pick(healthy)
+                self._load(node.id).in_flight += 1
+                nodes[node.id] = node
+                assigned.setdefault(node.id, []).append(index)
+
+        chunks = [
+            (nodes[node_id], indices[i:i + self.max_batch])
+            for node_id, indices in assigned.items()
+            for i in range(0, len(indices), self.max_batch)
+        ]
+        results: list[Any] = [None] * len(steps)
+
+        def send(chunk: tuple[SwarmNode, list[int]]) -> None:
+            node, indices = chunk
+            for index, result in zip(indices, self._dispatch_remote_batch([steps[i] for i in indices], node)):
+                results[index] = result
+
+        if len(chunks) == 1:
+            send(chunks[0])
+        else:
+            with ThreadPoolExecutor(max_workers=len(chunks)) as pool:
+                list(pool.map(send, chunks))
+        return results
+
 
-__all__ = ["SwarmDispatcher", "SwarmNode", "SwarmRegistry"]
+__all__ = ["NodeLoad", "SwarmDispatcher", "SwarmNode", "SwarmRegistry"]
@@ -9,6 +9,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Literal
 
+from src.core.keyword_matcher import KeywordHits, scan_goal
+
 
 @dataclass
 class TaskProfile:
@@ -71,6 +73,30 @@ SENSITIVITY_KEYWORDS = {
     ],
 }
 
+AGENT_OVERRIDE_KEYWORDS: dict[str, list[str]] = {
+    "editor": ["changelog", "docs", "tutorial"],
+    "cfo": ["revenue", "polar", "invoice"],
+}
+
+SCOPE_KEYWORDS: dict[str, list[str]] = {
+    "files": ["file", "module", "system", "architecture"],
+    "breadth": ["multiple", "several", "all"],
+}
+
+REASONING_KEYWORDS = ["design", "architecture", "strategy", "why"]
+CREATIVITY_KEYWORDS = ["engaging", "compelling", "creative", "catchy"]
+
+# Every keyword table above, labelled for the shared goal matcher
+SIGNAL_GROUPS: dict[tuple[str, str], list[str]] = {
+    **{("domain", domain): kws for domain, kws in DOMAIN_SIGNALS.items()},
+    **{("agent", agent): kws for agent, kws in AGENT_OVERRIDE_KEYWORDS.items()},
+    ("agent", "cmo"): ["marketing", "email"],  # Needs both
+    **{("scope", scope): kws for scope, kws in SCOPE_KEYWORDS.items()},
+    ("reasoning", "any"): REASONING_KEYWORDS,
+    ("creativity", "any"): CREATIVITY_KEYWORDS,
+    **{("sensitivity", level): kws for level, kws in SENSITIVITY_KEYWORDS.items()},
+}
+
 MCU_MAP = {"simple": 1, "standard": 3, "complex": 5}
 
 TOKEN_ESTIMATE = {
@@ -85,11 +111,16 @@ def _count_signals(goal_lower: str, keywords: list[str]) -> int:
     return sum(1 for kw in keywords if kw in goal_lower)
 
 
-def _detect_domain(goal_lower: str) -> str:
+def _hits(goal_lower: str, hits: KeywordHits | None) -> KeywordHits:
+    return scan_goal(goal_lower) if hits is None else hits
+
+
+def _detect_domain(goal_lower: str, hits: KeywordHits | None = None) -> str:
     """Step 1: Detect domain from goal keywords."""
+    hits = _hits(goal_lower, hits)
     scores = {
-        domain: _count_signals(goal_lower, keywords)
-        for domain, keywords in DOMAIN_SIGNALS.items()
+        domain: len(hits.get(("domain", domain), ()))
+        for domain in DOMAIN_SIGNALS
     }
     best = max(scores, key=scores.get)  # type: ignore[arg-type]
     if scores[best] == 0:
@@ -97,23 +128,25 @@ def _detect_domain(goal_lower: str) -> str:
     return best
 
 
-def _assign_agent(goal_lower: str, domain: str) -> str:
+def _assign_agent(goal_lower: str, domain: str, hits: KeywordHits | None = None) -> str:
     """Step 2: Assign agent role with override rules."""
+    hits = _hits(goal_lower, hits)
     agent = DOMAIN_TO_AGENT.get(domain, "cto")
 
     # Override rules
-    if any(kw in goal_lower for kw in ["changelog", "docs", "tutorial"]):
+    if ("agent", "editor") in hits:
         agent = "editor"
-    if any(kw in goal_lower for kw in ["revenue", "polar", "invoice"]):
+    if ("agent", "cfo") in hits:
         agent = "cfo"
-    if "marketing" in goal_lower and "email" in goal_lower:
+    if len(hits.get(("agent", "cmo"), ())) == 2:  # marketing + email
         agent = "cmo"
 
     return agent
 
 
-def _score_complexity(goal_lower: str, domain: str) -> str:
+def _score_complexity(goal_lower: str, domain: str, hits: KeywordHits | None = None) -> str:
     """Step 3: Score complexity from goal signals."""
+    hits = _hits(goal_lower, hits)
     score = 0
     word_count = len(goal_lower.split())
 
@@ -126,9 +159,9 @@ def _score_complexity(goal_lower: str, domain: str) -> str:
         score += 3
 
     # File scope signals
-    if any(kw in goal_lower for kw in ["file", "module", "system", "architecture"]):
+    if ("scope", "files") in hits:
         score += 2
-    if any(kw in goal_lower for kw in ["multiple", "several", "all"]):
+    if ("scope", "breadth") in hits:
         score += 1
 
     # Domain weight
@@ -147,32 +180,31 @@ def _score_complexity(goal_lower: str, domain: str) -> str:
     return "complex"
 
 
-def _detect_reasoning(goal_lower: str, domain: str, complexity: str) -> bool:
+def _detect_reasoning(
+    goal_lower: str, domain: str, complexity: str, hits: KeywordHits | None = None,
+) -> bool:
     """Step 4: Determine if task requires reasoning."""
     if domain in ("code", "sales"):
         return True
     if complexity == "complex":
         return True
-    reasoning_kws = ["design", "architecture", "strategy", "why"]
-    return any(kw in goal_lower for kw in reasoning_kws)
+    return ("reasoning", "any") in _hits(goal_lower, hits)
 
 
-def _detect_creativity(goal_lower: str, domain: str) -> bool:
+def _detect_creativity(goal_lower: str, domain: str, hits: KeywordHits | None = None) -> bool:
     """Step 4: Determine if task requires creativity."""
     if domain in ("creative", "sales"):
         return True
-    creativity_kws = ["engaging", "compelling", "creative", "catchy"]
-    return any(kw in goal_lower for kw in creativity_kws)
+    return ("creativity", "any") in _hits(goal_lower, hits)
 
 
-def _detect_sensitivity(goal_lower: str) -> str:
+def _detect_sensitivity(goal_lower: str, hits: KeywordHits | None = None) -> str:
     """Step 5: Detect data sensitivity level."""
-    for kw in SENSITIVITY_KEYWORDS["sensitive"]:
-        if kw in goal_lower:
-            return "sensitive"
-    for kw in SENSITIVITY_KEYWORDS["internal"]:
-        if kw in goal_lower:
-            return "internal"
+    hits = _hits(goal_lower, hits)
+    if ("sensitivity", "sensitive") in hits:
+        return "sensitive"
+    if ("sensitivity", "internal") in hits:
+        return "internal"
     return "public"
 
 
@@ -202,13 +234,14 @@ def classify_task(goal: str, context: dict | None = None) -> TaskProfile:
         TaskProfile with all routing information.
     """
     goal_lower = goal.lower()
-
-    domain = _detect_domain(goal_lower)
-    agent_role = _assign_agent(goal_lower, domain)
-    complexity = _score_complexity(goal_lower, domain)
-    requires_reasoning = _detect_reasoning(goal_lower, domain, complexity)
-    requires_creativity = _detect_creativity(goal_lower, domain)
-    data_sensitivity = _detect_sensitivity(goal_lower)
+    hits = scan_goal(goal_lower)  # One pass over the goal for every signal
+
+    domain = _detect_domain(goal_lower, hits)
+    agent_role = _assign_agent(goal_lower, domain, hits)
+    complexity = _score_complexity(goal_lower, domain, hits)
+    requires_reasoning = _detect_reasoning(goal_lower, domain, complexity, hits)
+    requires_creativity = _detect_creativity(goal_lower, domain, hits)
+    data_sensitivity = _detect_sensitivity(goal_lower, hits)
     mcu_cost = MCU_MAP[complexity]
     tokens = TOKEN_ESTIMATE[complexity]
     estimated_tokens = tokens["input"] + tokens["output"]
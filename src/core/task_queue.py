@@ -5,6 +5,8 @@ and dead letter queue (DLQ) for failed tasks.
 
 Maps to Temporal's Task Queue: workers poll for tasks,
 priority determines dispatch order, DLQ captures exhausted retries.
+For a crash-safe queue shared by several processes, see
+durable_task_queue.DurableTaskQueue.
 """
 
 from __future__ import annotations
@@ -38,6 +40,7 @@ class QueuedTask:
     attempt: int = field(compare=False, default=0)
     max_attempts: int = field(compare=False, default=3)
     source: str = field(compare=False, default="manual")
+    lease_token: str = field(compare=False, default="")  # Set by DurableTaskQueue
 
 
 @dataclass
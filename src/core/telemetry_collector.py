@@ -7,20 +7,31 @@ Collects anonymized usage events:
 - session_ended
 - error_occurred
 
+Events are appended to a segmented JSONL log (see telemetry_log.py);
+the legacy ``telemetry-buffer.json`` array is migrated on first use.
+
 Reference: plans/260307-1602-telemetry-consent-opt-in/plan.md
 """
 
 import atexit
 import hashlib
 import json
+import logging
+import os
 import time
 import uuid
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from .telemetry_consent import ConsentManager
+from .telemetry_log import LogOffset, TelemetryLog
+
+logger = logging.getLogger(__name__)
+
+# Consumer name under which the uploader's read position is persisted
+UPLOADER_CONSUMER = "uploader"
 
 
 @dataclass
@@ -50,6 +61,7 @@ class TelemetryCollector:
         self,
         consent_manager: Optional[ConsentManager] = None,
         output_dir: Optional[str] = None,
+        log_dir: Optional[str] = None,
     ):
         self._consent_manager = consent_manager or ConsentManager()
         self._buffer: List[TelemetryEvent] = []
@@ -58,6 +70,8 @@ class TelemetryCollector:
         self._commands_count = 0
         self._max_buffer_size = 50
         self._storage_file = Path.home() / ".mekong" / "telemetry-buffer.json"
+        self._log_dir = Path(log_dir) if log_dir else Path.home() / ".mekong" / "telemetry"
+        self._log: Optional[TelemetryLog] = None
         self._initialized = False
         self._output_dir: Optional[Path] = Path(output_dir) if output_dir else None
 
@@ -162,8 +176,7 @@ class TelemetryCollector:
             import sys
             return f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
         except Exception as e:
-            import logging
-            logging.debug(f"Failed to get Python version: {e}")
+            logger.debug("Failed to get Python version: %s", e)
             return "unknown"
 
     def _get_os_info(self) -> str:
@@ -172,8 +185,7 @@ class TelemetryCollector:
             import platform
             return platform.system()
         except Exception as e:
-            import logging
-            logging.debug(f"Failed to get OS info: {e}")
+            logger.debug("Failed to get OS info: %s", e)
             return "unknown"
 
     def session_start(self) -> None:
@@ -291,26 +303,24 @@ class TelemetryCollector:
         if len(self._buffer) >= self._max_buffer_size:
             self._flush()
 
+    def get_log(self) -> TelemetryLog:
+        """Open the event log (lazily), migrating the legacy buffer file once."""
+        if self._log is None:
+            self._log = TelemetryLog(
+                self._log_dir,
+                fsync=os.getenv("MEKONG_TELEMETRY_FSYNC", "interval"),
+            )
+            migrated = self._log.migrate_json_array(self._storage_file)
+            if migrated:
+                logger.info("Migrated %d telemetry events to %s", migrated, self._log_dir)
+        return self._log
+
     def _flush(self) -> None:
-        """Flush buffer to storage."""
+        """Append the buffered events to the telemetry log as one batch."""
         if not self._buffer:
             return
 
-        self._storage_file.parent.mkdir(parents=True, exist_ok=True)
-
-        existing = []
-        if self._storage_file.exists():
-            try:
-                with open(self._storage_file, "r") as f:
-                    existing = json.load(f)
-            except json.JSONDecodeError:
-                existing = []
-
-        existing.extend([e.to_dict() for e in self._buffer])
-
-        with open(self._storage_file, "w") as f:
-            json.dump(existing, f, indent=2)
-
+        self.get_log().append([e.to_dict() for e in self._buffer])
         self._buffer = []
 
     def _flush_on_exit(self) -> None:
@@ -319,20 +329,24 @@ class TelemetryCollector:
         self._flush()
 
     def get_pending_events(self) -> List[dict]:
-        """Get pending events from storage."""
-        if not self._storage_file.exists():
-            return []
+        """Get every event the uploader has not acknowledged yet."""
+        log = self.get_log()
+        return list(log.iter_records(log.load_offset(UPLOADER_CONSUMER)))
 
-        try:
-            with open(self._storage_file, "r") as f:
-                return json.load(f)
-        except json.JSONDecodeError:
-            return []
+    def read_pending(self, limit: int) -> Tuple[List[dict], LogOffset]:
+        """Read up to ``limit`` unacknowledged events and the offset after them."""
+        log = self.get_log()
+        return log.read(log.load_offset(UPLOADER_CONSUMER), limit=limit)
+
+    def ack(self, offset: LogOffset) -> None:
+        """Persist the uploader's position and drop fully consumed segments."""
+        log = self.get_log()
+        log.commit_offset(UPLOADER_CONSUMER, offset)
+        log.release(offset)
 
     def clear_buffer(self) -> None:
-        """Clear local buffer."""
-        if self._storage_file.exists():
-            self._storage_file.unlink()
+        """Mark every stored event as consumed."""
+        self.ack(self.get_log().end_offset())
 
 
 _collector: Optional[TelemetryCollector] = None
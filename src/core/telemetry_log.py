@@ -0,0 +1,340 @@
+"""
+Telemetry Log — Append-only segmented JSONL storage for telemetry events
+
+Events are appended as JSON lines to the active segment
+(``segment-000001.jsonl``). When it grows past ``segment_bytes`` it is
+sealed and, optionally, gzip-compressed; a new segment takes over.
+Appends are one ``write`` per batch under an exclusive file lock, so
+several CLI processes can flush concurrently without losing events, and
+a torn tail left by a crash is trimmed before the next append.
+
+Readers address records by :class:`LogOffset` — a segment number plus a
+byte position in its uncompressed stream — and consumers persist their
+offset under ``offsets/`` so they resume where they left off instead of
+re-reading the whole log.
+"""
+
+import gzip
+import json
+import logging
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Iterator, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: in-process lock only
+    fcntl = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+FSYNC_POLICIES = ("always", "interval", "never")
+
+_SEGMENT_RE = re.compile(r"^segment-(\d{6,})\.jsonl(\.gz)?$")
+
+
+@dataclass(frozen=True, order=True)
+class LogOffset:
+    """Position in the log: segment number and byte offset within it."""
+
+    segment: int = 0
+    position: int = 0
+
+    def to_dict(self) -> dict:
+        return {"segment": self.segment, "position": self.position}
+
+
+class TelemetryLog:
+    """
+    Size-rotated, append-only JSONL segments with resumable readers.
+
+    Args:
+        directory: Directory holding the segments (created if missing)
+        segment_bytes: Seal the active segment once it reaches this size
+        compress_sealed: Gzip sealed segments
+        fsync: "always" (every append), "interval" (at most every
+            ``fsync_interval`` seconds) or "never" (leave it to the OS)
+        fsync_interval: Seconds between fsyncs for the "interval" policy
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        segment_bytes: int = 4 * 1024 * 1024,
+        compress_sealed: bool = True,
+        fsync: str = "interval",
+        fsync_interval: float = 1.0,
+    ):
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"fsync must be one of {FSYNC_POLICIES}, got {fsync!r}")
+        self._dir = Path(directory)
+        self._dir.mkdir(parents=True, exist_ok=True)
+        self._segment_bytes = segment_bytes
+        self._compress = compress_sealed
+        self._fsync = fsync
+        self._fsync_interval = fsync_interval
+        self._last_fsync = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def directory(self) -> Path:
+        return self._dir
+
+    # ===== Segments =====
+
+    def segments(self) -> List[int]:
+        """Segment numbers present on disk, oldest first."""
+        found = set()
+        for entry in os.scandir(self._dir):
+            match = _SEGMENT_RE.match(entry.name)
+            if match:
+                found.add(int(match.group(1)))
+        return sorted(found)
+
+    def _plain_path(self, segment: int) -> Path:
+        return self._dir / f"segment-{segment:06d}.jsonl"
+
+    def _segment_path(self, segment: int) -> Optional[Path]:
+        """Current file for a segment (it may have been compressed since)."""
+        plain = self._plain_path(segment)
+        if plain.exists():
+            return plain
+        packed = plain.with_name(plain.name + ".gz")
+        return packed if packed.exists() else None
+
+    @contextmanager
+    def _exclusive(self) -> Iterator[None]:
+        """Serialise writers across threads and processes."""
+        with self._lock:
+            if fcntl is None:
+                yield
+                return
+            with open(self._dir / ".lock", "a") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _seal(self, segment: int) -> None:
+        """Compress a sealed segment; the plain file stays until the .gz is complete."""
+        plain = self._plain_path(segment)
+        if not self._compress or not plain.exists():
+            return
+        packed = plain.with_name(plain.name + ".gz")
+        tmp = plain.with_name(plain.name + ".gz.tmp")
+        try:
+            with open(plain, "rb") as src, gzip.open(tmp, "wb") as dst:
+                while chunk := src.read(1024 * 1024):
+                    dst.write(chunk)
+            os.replace(tmp, packed)
+            plain.unlink()
+        except OSError as e:
+            logger.warning("Telemetry segment %d compression failed: %s", segment, e)
+            tmp.unlink(missing_ok=True)
+
+    @staticmethod
+    def _repair_tail(f: IO[bytes]) -> None:
+        """Drop a partial last line left by a crashed writer."""
+        size = f.seek(0, os.SEEK_END)
+        if size == 0:
+            return
+        f.seek(size - 1)
+        if f.read(1) == b"\n":
+            return
+        back = min(size, 64 * 1024)
+        while True:
+            f.seek(size - back)
+            cut = f.read(back).rfind(b"\n")
+            if cut >= 0 or back == size:
+                break
+            back = min(size, back * 2)
+        keep = size - back + cut + 1 if cut >= 0 else 0
+        f.truncate(keep)
+        logger.warning("Telemetry log: trimmed %d byte(s) of torn tail", size - keep)
+
+    # ===== Writing =====
+
+    def append(self, records: List[dict]) -> LogOffset:
+        """
+        Append records as one batch.
+
+        Returns:
+            Offset just past the last record written
+        """
+        if not records:
+            return self.end_offset()
+        payload = "".join(json.dumps(r, separators=(",", ":")) + "\n" for r in records).encode()
+
+        with self._exclusive():
+            existing = self.segments()
+            segment = existing[-1] if existing else 1
+            plain = self._plain_path(segment)
+            # Roll over when the newest segment is already sealed or full
+            if existing and (not plain.exists() or plain.stat().st_size >= self._segment_bytes):
+                self._seal(segment)
+                segment += 1
+                plain = self._plain_path(segment)
+
+            with open(plain, "ab+") as f:
+                self._repair_tail(f)
+                f.write(payload)
+                f.flush()
+                end = f.tell()
+                if self._should_fsync():
+                    os.fsync(f.fileno())
+
+            if end >= self._segment_bytes:
+                self._seal(segment)
+                return LogOffset(segment + 1, 0)
+        return LogOffset(segment, end)
+
+    def _should_fsync(self) -> bool:
+        if self._fsync == "always":
+            return True
+        if self._fsync == "never":
+            return False
+        now = time.monotonic()
+        if now - self._last_fsync >= self._fsync_interval:
+            self._last_fsync = now
+            return True
+        return False
+
+    # ===== Reading =====
+
+    def end_offset(self) -> LogOffset:
+        """Offset just past the last complete record."""
+        existing = self.segments()
+        if not existing:
+            return LogOffset(1, 0)
+        segment = existing[-1]
+        path = self._segment_path(segment)
+        if path is None or path.suffix == ".gz":
+            return LogOffset(segment + 1, 0)
+        with open(path, "rb") as f:
+            data_end = f.seek(0, os.SEEK_END)
+            # Don't count a partial last line as written
+            if data_end:
+                f.seek(max(0, data_end - 64 * 1024))
+                tail = f.read()
+                data_end -= len(tail) - (tail.rfind(b"\n") + 1)
+        return LogOffset(segment, data_end)
+
+    def read(
+        self, offset: Optional[LogOffset] = None, limit: Optional[int] = None,
+    ) -> Tuple[List[dict], LogOffset]:
+        """
+        Read complete records starting at ``offset``.
+
+        Returns:
+            (records, offset to resume from)
+        """
+        offset = offset or LogOffset()
+        records: List[dict] = []
+        current = offset
+        for segment in self.segments():
+            if segment < current.segment:
+                continue
+            if segment > current.segment:
+                current = LogOffset(segment, 0)
+            path = self._segment_path(segment)
+            if path is None:
+                continue
+            opener = gzip.open if path.suffix == ".gz" else open
+            try:
+                with opener(path, "rb") as f:
+                    f.seek(current.position)
+                    position = current.position
+                    for line in f:
+                        if not line.endswith(b"\n"):
+                            break  # In-flight or torn write; retry later
+                        position += len(line)
+                        try:
+                            records.append(json.loads(line))
+                        except ValueError:
+                            logger.warning("Telemetry log: skipping corrupt record in segment %d", segment)
+                        current = LogOffset(segment, position)
+                        if limit is not None and len(records) >= limit:
+                            return records, current
+            except FileNotFoundError:
+                # Compressed under us; the next read picks it up again
+                break
+            if path.suffix == ".gz":
+                current = LogOffset(segment + 1, 0)
+        return records, current
+
+    def iter_records(self, offset: Optional[LogOffset] = None, batch: int = 1000) -> Iterator[dict]:
+        """Stream every record from ``offset`` without loading the whole log."""
+        while True:
+            records, next_offset = self.read(offset, limit=batch)
+            yield from records
+            if len(records) < batch:
+                return
+            offset = next_offset
+
+    # ===== Consumer offsets =====
+
+    def _offset_file(self, consumer: str) -> Path:
+        return self._dir / "offsets" / f"{consumer}.json"
+
+    def load_offset(self, consumer: str) -> LogOffset:
+        """Persisted offset for a consumer (start of the log if none)."""
+        try:
+            data = json.loads(self._offset_file(consumer).read_text())
+            return LogOffset(int(data["segment"]), int(data["position"]))
+        except (OSError, ValueError, KeyError, TypeError):
+            return LogOffset()
+
+    def commit_offset(self, consumer: str, offset: LogOffset) -> None:
+        """Atomically persist a consumer's offset."""
+        path = self._offset_file(consumer)
+        path.parent.mkdir(exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(offset.to_dict()))
+        os.replace(tmp, path)
+
+    def release(self, offset: LogOffset) -> int:
+        """
+        Delete segments wholly before ``offset`` (already consumed).
+
+        Returns:
+            Number of segments deleted
+        """
+        removed = 0
+        with self._exclusive():
+            existing = self.segments()
+            for segment in existing[:-1]:  # Never the active segment
+                if segment >= offset.segment:
+                    break
+                path = self._segment_path(segment)
+                if path is not None:
+                    path.unlink(missing_ok=True)
+                    removed += 1
+        return removed
+
+    def migrate_json_array(self, legacy_file: Path) -> int:
+        """
+        Import a legacy JSON-array buffer file, then remove it.
+
+        Returns:
+            Number of records imported
+        """
+        if not legacy_file.exists():
+            return 0
+        try:
+            records = json.loads(legacy_file.read_text() or "[]")
+        except (OSError, ValueError) as e:
+            logger.warning("Telemetry migration: unreadable %s (%s)", legacy_file, e)
+            records = []
+        if isinstance(records, list) and records:
+            self.append([r for r in records if isinstance(r, dict)])
+        legacy_file.unlink(missing_ok=True)
+        return len(records) if isinstance(records, list) else 0
+
+
+__all__ = ["FSYNC_POLICIES", "LogOffset", "TelemetryLog"]
@@ -40,22 +40,27 @@ class TelemetryUploader:
         self._batch_size = 100
 
     def upload_batch(self) -> int:
-        """Upload pending events to backend."""
-        if not self._consent_manager.has_consent():
-            return 0
+        """
+        Upload pending events to backend.
 
-        events = self._collector.get_pending_events()
-        if not events:
+        Streams the log from the persisted offset one batch at a time and
+        acknowledges each batch after it is accepted, so a failure (or a
+        crash) resumes from the first unsent batch next time.
+        """
+        if not self._consent_manager.has_consent():
             return 0
 
         uploaded = 0
-        for i in range(0, len(events), self._batch_size):
-            batch = events[i : i + self._batch_size]
-            if self._upload_events(batch):
-                uploaded += len(batch)
-
-        if uploaded > 0:
-            self._collector.clear_buffer()
+        while True:
+            batch, next_offset = self._collector.read_pending(self._batch_size)
+            if not batch:
+                break
+            if not self._upload_events(batch):
+                break
+            self._collector.ack(next_offset)
+            uploaded += len(batch)
+            if len(batch) < self._batch_size:
+                break
 
         return uploaded
 
@@ -18,6 +18,7 @@ from typing import Any, Callable, Dict, List, Optional
 import yaml  # type: ignore[import-untyped]
 
 from .event_bus import EventType, get_event_bus
+from .process_runner import get_process_runner
 
 logger = logging.getLogger(__name__)
 
@@ -236,11 +237,11 @@ class ToolRegistry:
                 cmd = tool.command_template.format(**{
                     k: shlex.quote(str(v)) for k, v in params.items()
                 })
-                proc = subprocess.run(
-                    shlex.split(cmd), capture_output=True, text=True,
-                    timeout=30,
-                )
+                proc = get_process_runner().run(shlex.split(cmd), timeout=30)
+                proc.discard_spills()  # Tool results carry the tail only
                 output = proc.stdout or proc.stderr
+                if proc.timed_out:
+                    raise RuntimeError(f"Timed out after 30s: {output}")
                 if proc.returncode != 0:
                     raise RuntimeError(f"Exit code {proc.returncode}: {output}")
             else:
@@ -1,20 +1,37 @@
 """
 Mekong CLI - Vector Memory Store (AGI v2)
 
-Persistent vector store for semantic search with JSON file backing.
+Persistent vector store for semantic search.
 Supports cosine similarity, memory types (episodic/semantic/procedural),
 and automatic persistence.
+
+Each collection keeps its vectors contiguously in a float32 NumPy matrix:
+search is one matrix-vector product plus an ``argpartition`` top-k, type
+filters use precomputed boolean masks, and large collections can opt into
+an IVF (inverted-file, k-means coarse quantizer) index. Snapshots are
+binary ``.npy`` files loaded memory-mapped; legacy JSON snapshots are
+read once and migrated.
 """
 
+import atexit
 import hashlib
 import json
+import logging
 import math
+import os
+import shutil
+import threading
 import time
+import weakref
+from collections.abc import Iterator, Mapping
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
 
+logger = logging.getLogger(__name__)
 
 class MemoryType(str, Enum):
     """Categories of memory for the AGI system."""
@@ -24,6 +41,39 @@ class MemoryType(str, Enum):
     PROCEDURAL = "procedural"  # Skills/recipes/patterns
 
 
+_TYPE_CODES: Dict[MemoryType, int] = {t: i for i, t in enumerate(MemoryType)}
+_CODE_TYPES: List[MemoryType] = list(MemoryType)
+
+SNAPSHOT_VERSION = 2
+
+# Saves to one snapshot directory are serialized process-wide, even across
+# store instances, so cleanup never races another save's manifest
+_SNAPSHOT_LOCKS: Dict[str, threading.Lock] = {}
+_SNAPSHOT_LOCKS_GUARD = threading.Lock()
+
+
+def _snapshot_lock(snap: Path) -> threading.Lock:
+    key = os.path.abspath(snap)
+    with _SNAPSHOT_LOCKS_GUARD:
+        return _SNAPSHOT_LOCKS.setdefault(key, threading.Lock())
+
+
+def _manifest_dirs(snap: Path) -> Set[str]:
+    """Collection directories referenced by the manifest on disk (empty if none)."""
+    try:
+        manifest = json.loads((snap / "manifest.json").read_text())
+        return {c["dir"] for c in manifest.get("collections", {}).values()}
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return set()
+
+
+def _dir_generation(name: str) -> int:
+    try:
+        return int(name.rsplit(".", 1)[1])
+    except (IndexError, ValueError):
+        return 0
+
+
 @dataclass
 class VectorEntry:
     """Single vector record with payload metadata."""
@@ -35,34 +85,306 @@ class VectorEntry:
     created_at: float = field(default_factory=time.time)
 
 
+class _IVFIndex:
+    """Inverted-file index: spherical k-means centroids + row assignments."""
+
+    def __init__(self, centroids: np.ndarray, assign: np.ndarray, built_size: int) -> None:
+        self.centroids = centroids
+        self.assign = assign
+        self.built_size = built_size
+
+    @classmethod
+    def build(cls, unit: np.ndarray, capacity: int, seed: int = 0) -> "_IVFIndex":
+        n = unit.shape[0]
+        nlist = int(min(4096, n, max(16, math.sqrt(n))))
+        rng = np.random.default_rng(seed)
+        sample = unit[rng.choice(n, size=min(n, nlist * 32), replace=False)]
+        centroids = sample[rng.choice(sample.shape[0], size=nlist, replace=False)].copy()
+        for _ in range(8):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, labels, sample)
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            filled = norms[:, 0] > 0
+            centroids[filled] = sums[filled] / norms[filled]
+        assign = np.zeros(capacity, dtype=np.int32)
+        for start in range(0, n, 16384):
+            chunk = unit[start:start + 16384]
+            assign[start:start + chunk.shape[0]] = np.argmax(chunk @ centroids.T, axis=1)
+        return cls(centroids, assign, n)
+
+    def nearest(self, unit_rows: np.ndarray) -> np.ndarray:
+        return np.argmax(unit_rows @ self.centroids.T, axis=1).astype(np.int32)
+
+
+class _MatrixIndex:
+    """Row-major vector matrix plus per-row ids, payloads and type masks.
+
+    Rows are dense in ``[0, size)``; deletes move the last row into the
+    freed slot so the matrix never has holes.
+    """
+
+    def __init__(self, dimension: int) -> None:
+        self.dimension = dimension
+        self.size = 0
+        self.vectors = np.zeros((0, dimension), dtype=np.float32)
+        self.inv_norms = np.zeros(0, dtype=np.float32)
+        self.types = np.zeros(0, dtype=np.int8)
+        self.created = np.zeros(0, dtype=np.float64)
+        self.masks: Dict[MemoryType, np.ndarray] = {t: np.zeros(0, dtype=bool) for t in MemoryType}
+        self.ids: List[str] = []
+        self.payloads: List[Dict[str, Any]] = []
+        self.row_of: Dict[str, int] = {}
+        self.ivf: Optional[_IVFIndex] = None
+        self._writable = True
+
+    # --- Storage ---
+
+    @classmethod
+    def from_arrays(
+        cls,
+        dimension: int,
+        vectors: np.ndarray,
+        types: np.ndarray,
+        created: np.ndarray,
+        ids: List[str],
+        payloads: List[Dict[str, Any]],
+    ) -> "_MatrixIndex":
+        index = cls(dimension)
+        index.size = len(ids)
+        index.vectors = vectors  # may be a read-only memory map
+        index.types = np.asarray(types, dtype=np.int8)
+        index.created = np.asarray(created, dtype=np.float64)
+        index.inv_norms = cls._inverse_norms(vectors)
+        index.masks = {t: index.types == code for t, code in _TYPE_CODES.items()}
+        index.ids = ids
+        index.payloads = payloads
+        index.row_of = {id_: row for row, id_ in enumerate(ids)}
+        index._writable = False
+        return index
+
+    @staticmethod
+    def _inverse_norms(vectors: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(vectors, axis=1) if len(vectors) else np.zeros(0)
+        with np.errstate(divide="ignore"):
+            inv = np.where(norms > 0, 1.0 / np.maximum(norms, 1e-30), 0.0)
+        return inv.astype(np.float32)
+
+    def _reserve(self, needed: int) -> None:
+        capacity = self.vectors.shape[0]
+        if self._writable and needed <= capacity:
+            return
+        new_cap = max(needed, 16, capacity * 2 if self._writable else capacity)
+
+        def grow(arr: np.ndarray) -> np.ndarray:
+            out = np.zeros((new_cap,) + arr.shape[1:], dtype=arr.dtype)
+            out[:self.size] = arr[:self.size]
+            return out
+
+        self.vectors = grow(self.vectors)
+        self.inv_norms = grow(self.inv_norms)
+        self.types = grow(self.types)
+        self.created = grow(self.created)
+        self.masks = {t: grow(m) for t, m in self.masks.items()}
+        if self.ivf is not None:
+            self.ivf.assign = grow(self.ivf.assign)
+        self._writable = True
+
+    def put(
+        self, id: str, vector: Sequence[float], payload: Dict[str, Any],
+        memory_type: MemoryType, created_at: float,
+    ) -> None:
+        row = self.row_of.get(id)
+        if row is None:
+            self._reserve(self.size + 1)
+            row = self.size
+            self.size += 1
+            self.ids.append(id)
+            self.payloads.append(payload)
+            self.row_of[id] = row
+        else:
+            self._reserve(self.size)
+            self.payloads[row] = payload
+
+        vec = np.asarray(vector, dtype=np.float32)
+        norm = float(np.linalg.norm(vec))
+        self.vectors[row] = vec
+        self.inv_norms[row] = 1.0 / norm if norm > 0 else 0.0
+        self.types[row] = _TYPE_CODES[memory_type]
+        self.created[row] = created_at
+        for t, mask in self.masks.items():
+            mask[row] = t is memory_type
+        if self.ivf is not None:
+            unit = (vec * self.inv_norms[row])[None, :]
+            self.ivf.assign[row] = self.ivf.nearest(unit)[0]
+
+    def remove(self, id: str) -> None:
+        row = self.row_of.pop(id)
+        self._reserve(self.size)
+        last = self.size - 1
+        if row != last:
+            moved = self.ids[last]
+            self.ids[row] = moved
+            self.payloads[row] = self.payloads[last]
+            self.row_of[moved] = row
+            for arr in (self.vectors, self.inv_norms, self.types, self.created, *self.masks.values()):
+                arr[row] = arr[last]
+            if self.ivf is not None:
+                self.ivf.assign[row] = self.ivf.assign[last]
+        self.ids.pop()
+        self.payloads.pop()
+        self.size = last
+
+    def entry(self, row: int) -> VectorEntry:
+        return VectorEntry(
+            id=self.ids[row],
+            vector=self.vectors[row].tolist(),
+            payload=self.payloads[row],
+            memory_type=_CODE_TYPES[int(self.types[row])],
+            created_at=float(self.created[row]),
+        )
+
+    def unit_rows(self, rows: Any = None) -> np.ndarray:
+        if rows is None:
+            return self.vectors[:self.size] * self.inv_norms[:self.size, None]
+        return self.vectors[rows] * self.inv_norms[rows, None]
+
+    # --- Search ---
+
+    def search(
+        self,
+        query: np.ndarray,
+        top_k: int,
+        memory_type: Optional[MemoryType],
+        ann_threshold: Optional[int],
+        nprobe: int,
+    ) -> List[Tuple[int, float]]:
+        n = self.size
+        if n == 0 or top_k <= 0:
+            return []
+        q_norm = float(np.linalg.norm(query))
+        if q_norm == 0.0:
+            q = query
+        else:
+            q = query / q_norm
+
+        rows: Optional[np.ndarray] = None
+        if ann_threshold is not None and n >= ann_threshold:
+            if self.ivf is None or n > 2 * self.ivf.built_size:
+                self._reserve(n)
+                self.ivf = _IVFIndex.build(self.unit_rows(), self.vectors.shape[0])
+            ivf = self.ivf
+            centroid_scores = ivf.centroids @ q
+            probe = min(nprobe, len(centroid_scores))
+            probed = np.zeros(len(centroid_scores), dtype=bool)
+            probed[np.argpartition(-centroid_scores, probe - 1)[:probe]] = True
+            selected = probed[ivf.assign[:n]]
+            if memory_type is not None:
+                selected &= self.masks[memory_type][:n]
+            rows = np.flatnonzero(selected)
+            if len(rows) < top_k:
+                rows = None  # Too few candidates — fall back to exact scan
+        if rows is None:
+            if memory_type is not None:
+                rows = np.flatnonzero(self.masks[memory_type][:n])
+                scores = (self.vectors[rows] @ q) * self.inv_norms[rows]
+            else:
+                scores = (self.vectors[:n] @ q) * self.inv_norms[:n]
+        else:
+            scores = (self.vectors[rows] @ q) * self.inv_norms[rows]
+
+        if len(scores) == 0:
+            return []
+        k = min(top_k, len(scores))
+        if k < len(scores):
+            best = np.argpartition(-scores, k - 1)[:k]
+        else:
+            best = np.arange(len(scores))
+        best = best[np.argsort(-scores[best], kind="stable")]
+        picked = rows[best] if rows is not None else best
+        return [(int(r), float(scores[b])) for r, b in zip(picked, best)]
+
+
+class _EntryView(Mapping):
+    """Read-only ``id -> VectorEntry`` view materialised on access."""
+
+    def __init__(self, index: _MatrixIndex) -> None:
+        self._index = index
+
+    def __getitem__(self, id: str) -> VectorEntry:
+        return self._index.entry(self._index.row_of[id])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._index.ids))
+
+    def __len__(self) -> int:
+        return self._index.size
+
+    def __contains__(self, id: object) -> bool:
+        return id in self._index.row_of
+
+
 @dataclass
 class VectorCollection:
     """Named collection of vectors with fixed dimensionality."""
 
     name: str
     dimension: int
-    entries: dict[str, VectorEntry] = field(default_factory=dict)
-    metadata: dict[str, Any] = field(default_factory=dict)
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    index: _MatrixIndex = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.index = _MatrixIndex(self.dimension)
+
+    @property
+    def entries(self) -> Mapping[str, VectorEntry]:
+        """Entries keyed by id (materialised from the matrix on access)."""
+        return _EntryView(self.index)
+
+
+def _flush_at_exit(ref: "weakref.ref[VectorMemoryStore]") -> None:
+    store = ref()
+    if store is not None:
+        store.flush()
 
 
 class VectorMemoryStore:
     """Persistent vector store with cosine similarity search.
 
-    Supports three memory types (episodic, semantic, procedural)
-    and auto-persists to JSON.  Suitable for small-to-medium
-    datasets (< 10k vectors).
+    Supports three memory types (episodic, semantic, procedural).
+    Mutations are persisted in the background, coalesced over
+    ``persist_delay`` seconds; call ``flush()`` to write immediately.
 
     Args:
-        persist_path: Optional path for JSON persistence file.
+        persist_path: Optional snapshot path. Binary snapshots live in the
+            sibling ``.vec`` directory (``vector_index.json`` ->
+            ``vector_index.vec/``); an existing JSON file there is migrated.
+        ann_threshold: Collections at least this large are searched via
+            an IVF index (approximate). None keeps every search exact.
+        ann_nprobe: Number of IVF lists probed per query.
+        persist_delay: Seconds to coalesce mutations before writing.
     """
 
-    def __init__(self, persist_path: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        persist_path: Optional[str] = None,
+        ann_threshold: Optional[int] = None,
+        ann_nprobe: int = 8,
+        persist_delay: float = 1.0,
+    ) -> None:
         """Initialize vector store with optional persistence."""
         self._collections: Dict[str, VectorCollection] = {}
         self._persist_path: Optional[Path] = None
+        self.ann_threshold = ann_threshold
+        self.ann_nprobe = ann_nprobe
+        self.persist_delay = persist_delay
+        self._lock = threading.RLock()
+        self._dirty = False
+        self._timer: Optional[threading.Timer] = None
         if persist_path:
             self._persist_path = Path(persist_path)
             self._load_snapshot()
+            atexit.register(_flush_at_exit, weakref.ref(self))
 
     def create_collection(
         self, name: str, dimension: int,
@@ -80,11 +402,12 @@ class VectorMemoryStore:
             ValueError: If collection already exists.
 
         """
-        if name in self._collections:
-            msg = f"Collection '{name}' already exists."
-            raise ValueError(msg)
-        collection = VectorCollection(name=name, dimension=dimension)
-        self._collections[name] = collection
+        with self._lock:
+            if name in self._collections:
+                msg = f"Collection '{name}' already exists."
+                raise ValueError(msg)
+            collection = VectorCollection(name=name, dimension=dimension)
+            self._collections[name] = collection
         self._auto_persist()
         return collection
 
@@ -106,10 +429,11 @@ class VectorMemoryStore:
             KeyError: If collection does not exist.
 
         """
-        if name not in self._collections:
-            msg = f"Collection '{name}' not found."
-            raise KeyError(msg)
-        del self._collections[name]
+        with self._lock:
+            if name not in self._collections:
+                msg = f"Collection '{name}' not found."
+                raise KeyError(msg)
+            del self._collections[name]
         self._auto_persist()
 
     def upsert(
@@ -142,13 +466,47 @@ class VectorMemoryStore:
             msg = f"Vector dimension {len(vector)} != collection dimension {col.dimension}."
             raise ValueError(msg)
         entry = VectorEntry(
-            id=id, vector=vector, payload=payload or {},
+            id=id, vector=list(vector), payload=payload or {},
             memory_type=memory_type,
         )
-        col.entries[id] = entry
+        with self._lock:
+            col.index.put(id, vector, entry.payload, memory_type, entry.created_at)
         self._auto_persist()
         return entry
 
+    def upsert_many(
+        self,
+        collection: str,
+        ids: Sequence[str],
+        vectors: Any,
+        payloads: Optional[Sequence[Dict[str, Any]]] = None,
+        memory_type: MemoryType = MemoryType.EPISODIC,
+    ) -> int:
+        """Bulk insert/update; vectors may be a list of lists or a 2-D array.
+
+        Returns:
+            Number of entries written.
+
+        Raises:
+            KeyError: If collection does not exist.
+            ValueError: If shapes do not match the collection.
+
+        """
+        col = self._get_collection(collection)
+        matrix = np.asarray(vectors, dtype=np.float32)
+        if matrix.ndim != 2 or matrix.shape[1] != col.dimension or matrix.shape[0] != len(ids):
+            msg = f"Expected {len(ids)} x {col.dimension} vectors, got shape {matrix.shape}."
+            raise ValueError(msg)
+        now = time.time()
+        with self._lock:
+            for i, id_ in enumerate(ids):
+                col.index.put(
+                    id_, matrix[i], dict(payloads[i]) if payloads else {},
+                    memory_type, now,
+                )
+        self._auto_persist()
+        return len(ids)
+
     def search(
         self,
         collection: str,
@@ -176,19 +534,12 @@ class VectorMemoryStore:
         if len(query_vector) != col.dimension:
             msg = f"Query dimension {len(query_vector)} != collection dimension {col.dimension}."
             raise ValueError(msg)
-        if not col.entries:
-            return []
-
-        entries = col.entries.values()
-        if memory_type is not None:
-            entries = [e for e in entries if e.memory_type == memory_type]
-
-        scored: List[Tuple[VectorEntry, float]] = [
-            (entry, self._cosine_similarity(query_vector, entry.vector))
-            for entry in entries
-        ]
-        scored.sort(key=lambda x: x[1], reverse=True)
-        return scored[:top_k]
+        query = np.asarray(query_vector, dtype=np.float32)
+        with self._lock:
+            hits = col.index.search(
+                query, top_k, memory_type, self.ann_threshold, self.ann_nprobe,
+            )
+            return [(col.index.entry(row), score) for row, score in hits]
 
     def search_by_payload(
         self,
@@ -208,14 +559,12 @@ class VectorMemoryStore:
         """
         col = self._get_collection(collection)
         results: List[VectorEntry] = []
-        for entry in col.entries.values():
-            match = all(
-                entry.payload.get(k) == v for k, v in filters.items()
-            )
-            if match:
-                results.append(entry)
-                if len(results) >= limit:
-                    break
+        with self._lock:
+            for row, payload in enumerate(col.index.payloads):
+                if all(payload.get(k) == v for k, v in filters.items()):
+                    results.append(col.index.entry(row))
+                    if len(results) >= limit:
+                        break
         return results
 
     def delete_point(self, collection: str, id: str) -> None:
@@ -230,16 +579,17 @@ class VectorMemoryStore:
 
         """
         col = self._get_collection(collection)
-        if id not in col.entries:
-            msg = f"Entry '{id}' not found in collection '{collection}'."
-            raise KeyError(msg)
-        del col.entries[id]
+        with self._lock:
+            if id not in col.index.row_of:
+                msg = f"Entry '{id}' not found in collection '{collection}'."
+                raise KeyError(msg)
+            col.index.remove(id)
         self._auto_persist()
 
     def count(self, collection: str) -> int:
         """Return number of entries in a collection."""
         col = self._get_collection(collection)
-        return len(col.entries)
+        return col.index.size
 
     def get_collection_info(self, name: str) -> Dict[str, Any]:
         """Return stats for a collection.
@@ -248,22 +598,26 @@ class VectorMemoryStore:
             name: Collection name.
 
         Returns:
-            Dict with 'name', 'dimension', 'count', 'memory_types', and 'metadata'.
+            Dict with 'name', 'dimension', 'count', 'memory_types', 'index'
+            and 'metadata'.
 
         Raises:
             KeyError: If collection does not exist.
 
         """
         col = self._get_collection(name)
+        index = col.index
         type_counts: Dict[str, int] = {}
-        for entry in col.entries.values():
-            t = entry.memory_type.value
-            type_counts[t] = type_counts.get(t, 0) + 1
+        for t, mask in index.masks.items():
+            n = int(mask[:index.size].sum())
+            if n:
+                type_counts[t.value] = n
         return {
             "name": col.name,
             "dimension": col.dimension,
-            "count": len(col.entries),
+            "count": index.size,
             "memory_types": type_counts,
+            "index": "ivf" if index.ivf is not None else "flat",
             "metadata": col.metadata,
         }
 
@@ -273,52 +627,147 @@ class VectorMemoryStore:
 
     # --- Persistence ---
 
+    @staticmethod
+    def _snapshot_dir(path: Path) -> Path:
+        return path if path.suffix == ".vec" else path.with_suffix(".vec")
+
     def save_snapshot(self, path: Optional[str] = None) -> str:
-        """Save entire store to JSON file.
+        """Save entire store as a binary snapshot directory.
+
+        Layout: ``manifest.json`` plus one sub-directory per collection with
+        ``vectors.npy`` (float32), ``types.npy``, ``created.npy`` and
+        ``records.json`` (ids + payloads). The manifest is replaced last,
+        so readers never observe a half-written snapshot.
 
         Args:
-            path: File path. Uses init path if not specified.
+            path: Snapshot path. Uses init path if not specified.
 
         Returns:
-            Path of saved file.
+            Path of the snapshot directory.
         """
-        save_path = Path(path) if path else self._persist_path
-        if save_path is None:
-            save_path = Path(".mekong/vector_store.json")
-
-        save_path.parent.mkdir(parents=True, exist_ok=True)
-
-        data: Dict[str, Any] = {}
-        for col_name, col in self._collections.items():
-            entries_data = []
-            for entry in col.entries.values():
-                entries_data.append({
-                    "id": entry.id,
-                    "vector": entry.vector,
-                    "payload": entry.payload,
-                    "memory_type": entry.memory_type.value,
-                    "created_at": entry.created_at,
-                })
-            data[col_name] = {
-                "dimension": col.dimension,
-                "metadata": col.metadata,
-                "entries": entries_data,
-            }
-
-        save_path.write_text(json.dumps(data, indent=2))
-        return str(save_path)
+        base = Path(path) if path else self._persist_path
+        if base is None:
+            base = Path(".mekong/vector_store.json")
+        snap = self._snapshot_dir(base)
+
+        # The whole save (collection dirs, manifest swap, cleanup) is one
+        # critical section; see _snapshot_lock
+        with self._lock, _snapshot_lock(snap):
+            snap.mkdir(parents=True, exist_ok=True)
+            previous = _manifest_dirs(snap)
+            generation = time.time_ns()
+            manifest: Dict[str, Any] = {"version": SNAPSHOT_VERSION, "collections": {}}
+            for col_name, col in self._collections.items():
+                index = col.index
+                digest = hashlib.md5(col_name.encode()).hexdigest()[:12]
+                col_dir_name = f"{digest}.{generation}"
+                col_dir = snap / col_dir_name
+                col_dir.mkdir()
+                np.save(col_dir / "vectors.npy", np.ascontiguousarray(index.vectors[:index.size]))
+                np.save(col_dir / "types.npy", index.types[:index.size])
+                np.save(col_dir / "created.npy", index.created[:index.size])
+                (col_dir / "records.json").write_text(
+                    json.dumps({"ids": index.ids, "payloads": index.payloads}),
+                )
+                manifest["collections"][col_name] = {
+                    "dimension": col.dimension,
+                    "metadata": col.metadata,
+                    "dir": col_dir_name,
+                }
+
+            tmp = snap / f"manifest.json.{os.getpid()}.{threading.get_ident()}.tmp"
+            tmp.write_text(json.dumps(manifest, indent=2))
+            os.replace(tmp, snap / "manifest.json")
+            self._dirty = False
+
+            # Keep what the manifest on disk references, plus the generation it
+            # replaced (a reader may have just parsed the old manifest), plus
+            # anything newer than this save (another process still writing)
+            keep = _manifest_dirs(snap) | previous
+            for child in snap.iterdir():
+                if (
+                    child.is_dir()
+                    and child.name not in keep
+                    and _dir_generation(child.name) < generation
+                ):
+                    shutil.rmtree(child, ignore_errors=True)
+        return str(snap)
+
+    def flush(self) -> None:
+        """Write pending changes now (no-op without a persist path)."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if self._persist_path is None or not self._dirty:
+                return
+            if not self._persist_path.parent.exists():
+                return  # Workspace removed underneath us — nothing to write into
+            self.save_snapshot(str(self._persist_path))
 
     def _load_snapshot(self) -> None:
-        """Load store from JSON file if it exists."""
-        if self._persist_path is None or not self._persist_path.exists():
+        """Load the binary snapshot, or migrate a legacy JSON file."""
+        if self._persist_path is None:
+            return
+        snap = self._snapshot_dir(self._persist_path)
+        manifest_path = snap / "manifest.json"
+        if manifest_path.exists():
+            error: Optional[Exception] = None
+            for _ in range(3):
+                try:
+                    self._collections = self._read_snapshot(snap)
+                    return
+                except FileNotFoundError as e:
+                    # A concurrent save swapped the manifest mid-read; re-read it
+                    error = e
+                except (OSError, ValueError, KeyError, TypeError) as e:
+                    error = e
+                    break
+            # Never overwrite an unreadable snapshot with an empty store
+            logger.error(
+                "Vector snapshot %s is unreadable (%s); starting empty with "
+                "persistence disabled so the snapshot is left untouched",
+                snap, error,
+            )
+            self._persist_path = None
             return
+
+        if self._persist_path.suffix == ".json" and self._persist_path.exists():
+            self._load_legacy_json(self._persist_path)
+            if self._collections:
+                self._dirty = True
+
+    @staticmethod
+    def _read_snapshot(snap: Path) -> Dict[str, VectorCollection]:
+        """Read every collection listed in the snapshot manifest."""
+        manifest = json.loads((snap / "manifest.json").read_text())
+        collections: Dict[str, VectorCollection] = {}
+        for col_name, info in manifest.get("collections", {}).items():
+            col_dir = snap / info["dir"]
+            records = json.loads((col_dir / "records.json").read_text())
+            col = VectorCollection(
+                name=col_name, dimension=info["dimension"],
+                metadata=info.get("metadata", {}),
+            )
+            col.index = _MatrixIndex.from_arrays(
+                info["dimension"],
+                np.load(col_dir / "vectors.npy", mmap_mode="r"),
+                np.load(col_dir / "types.npy"),
+                np.load(col_dir / "created.npy"),
+                records["ids"],
+                records["payloads"],
+            )
+            collections[col_name] = col
+        return collections
+
+    def _load_legacy_json(self, path: Path) -> None:
+        """Load the pre-binary JSON snapshot format."""
         try:
-            data = json.loads(self._persist_path.read_text())
+            data = json.loads(path.read_text())
             for col_name, col_data in data.items():
-                dimension = col_data["dimension"]
-                metadata = col_data.get("metadata", {})
                 col = VectorCollection(
-                    name=col_name, dimension=dimension, metadata=metadata,
+                    name=col_name, dimension=col_data["dimension"],
+                    metadata=col_data.get("metadata", {}),
                 )
                 for entry_data in col_data.get("entries", []):
                     try:
@@ -327,22 +776,30 @@ class VectorMemoryStore:
                         )
                     except ValueError:
                         mem_type = MemoryType.EPISODIC
-                    entry = VectorEntry(
-                        id=entry_data["id"],
-                        vector=entry_data["vector"],
-                        payload=entry_data.get("payload", {}),
-                        memory_type=mem_type,
-                        created_at=entry_data.get("created_at", time.time()),
+                    col.index.put(
+                        entry_data["id"],
+                        entry_data["vector"],
+                        entry_data.get("payload", {}),
+                        mem_type,
+                        entry_data.get("created_at", time.time()),
                     )
-                    col.entries[entry.id] = entry
                 self._collections[col_name] = col
-        except (json.JSONDecodeError, KeyError):
+        except (json.JSONDecodeError, KeyError, ValueError):
             self._collections = {}
 
     def _auto_persist(self) -> None:
-        """Auto-save if persistence path is configured."""
-        if self._persist_path:
-            self.save_snapshot(str(self._persist_path))
+        """Schedule a coalesced save if persistence path is configured."""
+        if self._persist_path is None:
+            return
+        with self._lock:
+            self._dirty = True
+            if self.persist_delay > 0:
+                if self._timer is None:
+                    self._timer = threading.Timer(self.persist_delay, self.flush)
+                    self._timer.daemon = True
+                    self._timer.start()
+                return
+        self.flush()
 
     # --- Embedding helpers ---
 
@@ -396,12 +853,12 @@ class VectorMemoryStore:
             Similarity score in [-1.0, 1.0]. Returns 0.0 for zero-magnitude vectors.
 
         """
-        dot = sum(x * y for x, y in zip(a, b, strict=False))
-        mag_a = math.sqrt(sum(x * x for x in a))
-        mag_b = math.sqrt(sum(x * x for x in b))
-        if mag_a == 0.0 or mag_b == 0.0:
+        va = np.asarray(a, dtype=np.float64)
+        vb = np.asarray(b, dtype=np.float64)
+        mag = float(np.linalg.norm(va) * np.linalg.norm(vb))
+        if mag == 0.0:
             return 0.0
-        return dot / (mag_a * mag_b)
+        return float(va @ vb) / mag
 
     def _get_collection(self, name: str) -> VectorCollection:
         """Retrieve collection or raise KeyError."""
@@ -3,15 +3,24 @@ Mekong CLI - World Model (AGI v2)
 
 Snapshots the environment state (files, git, processes, ports) to enable
 context-aware planning and side-effect prediction. Pure Python, no external deps.
+
+Snapshots are incremental: the file tree comes from a cached FileTreeIndex,
+git is only re-run when HEAD, the git index or the tree changes, and the
+process/port probes are cached for a short TTL. Probes run in parallel and
+their latencies are recorded on each WorldState.
 """
 
 import logging
 import os
 import subprocess
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from itertools import islice
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from src.core.file_index import FileTreeIndex, TreeNode, diff_trees
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +40,10 @@ class WorldState:
     open_ports: List[int] = field(default_factory=list)
     env_vars: Dict[str, str] = field(default_factory=dict)
     disk_usage_mb: float = 0.0
+    # Probe name -> milliseconds spent (near zero when served from cache)
+    probe_ms: Dict[str, float] = field(default_factory=dict)
+    # Structural file index; lets diff() skip unchanged subtrees
+    tree: Optional[TreeNode] = field(default=None, repr=False, compare=False)
 
 
 @dataclass
@@ -85,6 +98,15 @@ class SideEffectPrediction:
     warnings: List[str] = field(default_factory=list)
 
 
+@dataclass
+class _ProbeCache:
+    """Last result of a probe, the key it was taken under and when."""
+
+    value: Any = None
+    key: Any = None
+    taken_at: float = 0.0
+
+
 class WorldModel:
     """
     Environment state tracker for context-aware planning.
@@ -93,10 +115,14 @@ class WorldModel:
     running processes) and computes diffs to understand what changed.
     """
 
+    MAX_FILES = 500  # file_tree entries kept per snapshot
+
     def __init__(
         self,
         working_dir: Optional[str] = None,
         llm_client: Optional[Any] = None,
+        probe_ttl: float = 2.0,
+        git_max_age: float = 5.0,
     ) -> None:
         """
         Initialize world model.
@@ -104,41 +130,78 @@ class WorldModel:
         Args:
             working_dir: Directory to monitor. Defaults to cwd.
             llm_client: Optional LLM for side-effect prediction.
+            probe_ttl: Seconds process and port listings are reused by
+                ``snapshot(fresh=False)``.
+            git_max_age: Upper bound on reusing git status in
+                ``snapshot(fresh=False)`` while HEAD, the git index and the
+                file tree look unchanged.
         """
         self.working_dir = working_dir or os.getcwd()
         self.llm_client = llm_client
+        self.probe_ttl = probe_ttl
+        self.git_max_age = git_max_age
         self._snapshots: List[WorldState] = []
+        self._index: Optional[FileTreeIndex] = None
+        self._git_dir: Optional[str] = None
+        self._probe_cache: Dict[str, _ProbeCache] = {
+            name: _ProbeCache() for name in ("files", "git", "processes", "ports")
+        }
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
 
-    def snapshot(self) -> WorldState:
+    def snapshot(self, fresh: bool = True) -> WorldState:
         """
         Take a snapshot of the current environment state.
 
         Captures: file tree, git status, running processes, open ports.
+        The probes run in parallel; per-probe latency is in
+        ``state.probe_ms``.
+
+        Args:
+            fresh: Re-run git, process and port probes (the file index is
+                refreshed incrementally either way). Before/after snapshots
+                for ``diff`` need this; ``fresh=False`` reuses recent probe
+                results (``probe_ttl``, ``git_max_age``) for cheap context
+                lookups, and can miss edits to tracked files or processes
+                started since.
 
         Returns:
             WorldState with current environment data.
         """
-        state = WorldState(working_directory=self.working_dir)
+        with self._lock:
+            started = time.perf_counter()
+            state = WorldState(working_directory=self.working_dir)
+            pool = self._executor()
+
+            files = pool.submit(self._timed, self._probe_files)
+
+            def git_after_files() -> Tuple[Any, float]:
+                # Git's gate key needs the refreshed index; timed after that wait
+                files.result()
+                return self._timed(lambda: self._probe_git(fresh))
 
-        # File tree (limited depth, exclude common noise)
-        state.file_tree = self._get_file_tree()
-        state.file_count = len(state.file_tree)
+            git = pool.submit(git_after_files)
+            processes = pool.submit(self._timed, lambda: self._probe_processes(fresh))
+            ports = pool.submit(self._timed, lambda: self._probe_ports(fresh))
 
-        # Git state
-        state.git_branch = self._run_cmd("git rev-parse --abbrev-ref HEAD")
-        state.git_status = self._run_cmd("git status --short")
-        if state.git_status:
-            state.git_dirty_files = [
-                line.strip().split()[-1]
-                for line in state.git_status.strip().split("\n")
-                if line.strip()
-            ]
+            # File tree (limited depth, exclude common noise)
+            (state.tree, state.file_tree), state.probe_ms["files"] = files.result()
+            state.file_count = len(state.file_tree)
 
-        # Running processes (relevant ones only)
-        state.running_processes = self._get_relevant_processes()
+            # Git state
+            (state.git_branch, state.git_status), state.probe_ms["git"] = git.result()
+            if state.git_status:
+                state.git_dirty_files = [
+                    line.strip().split()[-1]
+                    for line in state.git_status.strip().split("\n")
+                    if line.strip()
+                ]
 
-        # Open ports
-        state.open_ports = self._get_open_ports()
+            # Running processes (relevant ones only)
+            state.running_processes, state.probe_ms["processes"] = processes.result()
+
+            # Open ports
+            state.open_ports, state.probe_ms["ports"] = ports.result()
 
         # Relevant environment variables — mask sensitive values
         _SENSITIVE = {"KEY", "SECRET", "TOKEN", "PASSWORD", "CREDENTIAL"}
@@ -153,6 +216,9 @@ class WorldModel:
                 else:
                     state.env_vars[k] = v
 
+        state.probe_ms["total"] = (time.perf_counter() - started) * 1000
+        logger.debug("World snapshot probes (ms): %s", state.probe_ms)
+
         # Store snapshot
         self._snapshots.append(state)
         if len(self._snapshots) > 20:
@@ -160,6 +226,15 @@ class WorldModel:
 
         return state
 
+    def close(self) -> None:
+        """Stop the probe pool and release file-change tracking."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+        if self._index is not None:
+            self._index.close()
+            self._index = None
+
     def diff(
         self,
         before: WorldState,
@@ -168,6 +243,10 @@ class WorldModel:
         """
         Compute difference between two snapshots.
 
+        File changes come from the structural trees when both snapshots
+        have one (unchanged subtrees are skipped, and the result is not
+        limited to the MAX_FILES listed in file_tree).
+
         Args:
             before: Earlier snapshot.
             after: Later snapshot.
@@ -175,12 +254,17 @@ class WorldModel:
         Returns:
             WorldDiff describing all changes.
         """
-        before_files = set(before.file_tree)
-        after_files = set(after.file_tree)
+        if before.tree is not None and after.tree is not None:
+            files_added, files_removed = diff_trees(before.tree, after.tree)
+        else:
+            before_files = set(before.file_tree)
+            after_files = set(after.file_tree)
+            files_added = sorted(after_files - before_files)
+            files_removed = sorted(before_files - after_files)
 
         result = WorldDiff(
-            files_added=sorted(after_files - before_files),
-            files_removed=sorted(before_files - after_files),
+            files_added=files_added,
+            files_removed=files_removed,
             git_changed=(
                 before.git_branch != after.git_branch
                 or before.git_status != after.git_status
@@ -296,7 +380,7 @@ class WorldModel:
         """
         state = self.get_latest_snapshot()
         if not state:
-            state = self.snapshot()
+            state = self.snapshot(fresh=False)
 
         lines = [
             f"Working dir: {state.working_directory}",
@@ -317,31 +401,84 @@ class WorldModel:
 
     # --- Internal helpers ---
 
-    def _get_file_tree(self, max_depth: int = 3) -> List[str]:
-        """Get file listing (excluding noise directories)."""
-        exclusions = {
-            ".git", "node_modules", "__pycache__", ".venv",
-            "venv", ".tox", ".mypy_cache", ".pytest_cache",
-            "dist", "build", ".egg-info",
-        }
-        files: List[str] = []
-        root = Path(self.working_dir)
+    def _executor(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="world-probe")
+        return self._pool
+
+    @staticmethod
+    def _timed(probe: Callable[[], Any]) -> Tuple[Any, float]:
+        started = time.perf_counter()
+        value = probe()
+        return value, (time.perf_counter() - started) * 1000
+
+    def _probe_files(self) -> Tuple[TreeNode, List[str]]:
+        """Refresh the file index; re-flatten the listing only if the tree changed."""
+        if self._index is None:
+            self._index = FileTreeIndex(self.working_dir)
+        tree = self._index.refresh()
+        cache = self._probe_cache["files"]
+        if cache.key is not tree:
+            cache.value = list(islice(tree.paths(), self.MAX_FILES))
+            cache.key = tree
+        return tree, list(cache.value)
+
+    def _probe_git(self, fresh: bool = True) -> Tuple[str, str]:
+        """Branch and short status; unless fresh, re-run only when the gate key moves."""
+        cache = self._probe_cache["git"]
+        now = time.monotonic()
+        if (
+            not fresh
+            and cache.value is not None
+            and now - cache.taken_at < self.git_max_age
+            and cache.key == self._git_key()
+        ):
+            return cache.value
+        branch = self._run_cmd("git rev-parse --abbrev-ref HEAD")
+        status = self._run_cmd("git status --short")
+        # Keyed after running: git status may itself rewrite the index
+        cache.value, cache.key, cache.taken_at = (branch, status), self._git_key(), now
+        return cache.value
+
+    def _git_key(self) -> Tuple[Any, ...]:
+        """HEAD, current ref and index stats plus the file index generation."""
+        generation = self._index.generation if self._index is not None else 0
+        if self._git_dir is None:
+            self._git_dir = self._run_cmd("git rev-parse --absolute-git-dir")
+        if not self._git_dir:
+            return (generation,)
+
+        def stat(name: str) -> Optional[Tuple[int, int]]:
+            try:
+                st = os.stat(os.path.join(self._git_dir, name))
+                return st.st_mtime_ns, st.st_size
+            except OSError:
+                return None
+
         try:
-            for item in root.rglob("*"):
-                # Check depth
-                rel = item.relative_to(root)
-                if len(rel.parts) > max_depth:
-                    continue
-                # Skip excluded dirs
-                if any(part in exclusions for part in rel.parts):
-                    continue
-                if item.is_file():
-                    files.append(str(rel))
-                if len(files) >= 500:
-                    break
-        except Exception:
-            pass
-        return files
+            with open(os.path.join(self._git_dir, "HEAD")) as f:
+                head = f.read().strip()
+        except OSError:
+            head = ""
+        ref = head[5:].strip() if head.startswith("ref:") else ""
+        return (
+            generation, head, stat("index"),
+            stat(ref) if ref else None, stat("packed-refs"),
+        )
+
+    def _probe_processes(self, fresh: bool = True) -> List[Dict[str, str]]:
+        cache = self._probe_cache["processes"]
+        now = time.monotonic()
+        if fresh or cache.value is None or now - cache.taken_at >= self.probe_ttl:
+            cache.value, cache.taken_at = self._get_relevant_processes(), now
+        return [dict(p) for p in cache.value]
+
+    def _probe_ports(self, fresh: bool = True) -> List[int]:
+        cache = self._probe_cache["ports"]
+        now = time.monotonic()
+        if fresh or cache.value is None or now - cache.taken_at >= self.probe_ttl:
+            cache.value, cache.taken_at = self._get_open_ports(), now
+        return list(cache.value)
 
     def _get_relevant_processes(self) -> List[Dict[str, str]]:
         """Get running processes relevant to development."""
@@ -8,15 +8,20 @@ import logging
 from dataclasses import dataclass
 from typing import Dict, Optional
 
+from src.core.keyword_matcher import KeywordMatcher
+
 logger = logging.getLogger(__name__)
 
 DEFAULT_KEYWORDS = {
-    "simple": {"keywords": ["add", "update", "fix", "rename", "remove"], "timeout": 900},
-    "medium": {"keywords": ["implement", "create", "migrate", "optimize"], "timeout": 1800},
-    "complex": {"keywords": ["refactor", "redesign", "architecture", "rewrite"], "timeout": 3600},
-    "strategic": {"keywords": ["audit", "overhaul", "platform", "infrastructure"], "timeout": 5400},
+    "simple": {"keywords": ["add", "update", "fix", "rename", "remove"], "timeout": 900, "concurrency": 4},
+    "medium": {"keywords": ["implement", "create", "migrate", "optimize"], "timeout": 1800, "concurrency": 2},
+    "complex": {"keywords": ["refactor", "redesign", "architecture", "rewrite"], "timeout": 3600, "concurrency": 1},
+    "strategic": {"keywords": ["audit", "overhaul", "platform", "infrastructure"], "timeout": 5400, "concurrency": 1},
 }
 
+# Cheapest first: also the dispatch priority order
+LEVELS = ["simple", "medium", "complex", "strategic"]
+
 
 @dataclass
 class ClassificationResult:
@@ -25,6 +30,11 @@ class ClassificationResult:
     timeout: int
     matched_keyword: Optional[str] = None
 
+    @property
+    def rank(self) -> int:
+        """Dispatch priority (0 = cheapest, runs first)."""
+        return LEVELS.index(self.level) if self.level in LEVELS else len(LEVELS)
+
 
 class ComplexityClassifier:
     """
@@ -36,24 +46,33 @@ class ComplexityClassifier:
 
     def __init__(self, keyword_config: Optional[Dict] = None) -> None:
         self._config = keyword_config or DEFAULT_KEYWORDS
+        # All levels' keywords in one automaton: one pass per mission
+        self._matcher = KeywordMatcher({
+            level: self._config.get(level, {}).get("keywords", []) for level in LEVELS
+        })
 
     def classify(self, text: str) -> ClassificationResult:
         """Classify mission text. Returns highest matching complexity."""
-        text_lower = text.lower()
-        levels = ["strategic", "complex", "medium", "simple"]
-
-        for level in levels:
-            cfg = self._config.get(level, {})
-            keywords = cfg.get("keywords", [])
-            for kw in keywords:
-                if kw in text_lower:
-                    return ClassificationResult(
-                        level=level,
-                        timeout=cfg.get("timeout", 1800),
-                        matched_keyword=kw,
-                    )
+        hits = self._matcher.scan(text.lower())
+
+        for level in reversed(LEVELS):
+            if level in hits:
+                return ClassificationResult(
+                    level=level,
+                    timeout=self._config[level].get("timeout", 1800),
+                    matched_keyword=hits[level][0],
+                )
 
         return ClassificationResult(level="simple", timeout=900)
 
+    def concurrency_limits(self) -> Dict[str, int]:
+        """Max missions of each level that may run at once."""
+        return {
+            level: int(self._config.get(level, {}).get(
+                "concurrency", DEFAULT_KEYWORDS[level]["concurrency"],
+            ))
+            for level in LEVELS
+        }
+
 
-__all__ = ["ComplexityClassifier", "ClassificationResult"]
+__all__ = ["ComplexityClassifier", "ClassificationResult", "LEVELS"]
@@ -1,17 +1,18 @@
 """
 Mekong Daemon - Mission Executor
 
-Runs missions via subprocess (shell) or LLM client.
+Runs missions via the shared process runner (shell) or LLM client.
 Abstract enough to swap execution backends.
 """
 
 import logging
 import shlex
-import subprocess
 import time
 from dataclasses import dataclass
 from typing import Optional
 
+from src.core.process_runner import get_process_runner
+
 logger = logging.getLogger(__name__)
 
 
@@ -43,10 +44,13 @@ class MissionExecutor:
         t = timeout or self._timeout
         start = time.time()
         try:
-            proc = subprocess.run(
-                shlex.split(command), capture_output=True, text=True,
-                cwd=self._cwd, timeout=t,
-            )
+            proc = get_process_runner().run(shlex.split(command), cwd=self._cwd, timeout=t)
+            proc.discard_spills()  # Missions only report the tail
+            if proc.timed_out:
+                return MissionResult(
+                    success=False, error=f"Timeout after {t}s",
+                    duration=round(time.time() - start, 2),
+                )
             return MissionResult(
                 success=proc.returncode == 0,
                 output=proc.stdout[-2000:] if proc.stdout else "",
@@ -54,11 +58,6 @@ class MissionExecutor:
                 duration=round(time.time() - start, 2),
                 exit_code=proc.returncode,
             )
-        except subprocess.TimeoutExpired:
-            return MissionResult(
-                success=False, error=f"Timeout after {t}s",
-                duration=round(time.time() - start, 2),
-            )
         except Exception as e:
             return MissionResult(
                 success=False, error=str(e),
@@ -7,6 +7,7 @@ Appends JSON records to a journal file.
 
 import json
 import logging
+import threading
 import time
 from dataclasses import asdict, dataclass
 from pathlib import Path
@@ -38,11 +39,12 @@ class LearningJournal:
     def __init__(self, journal_path: str = ".mekong/daemon-journal.jsonl") -> None:
         self._path = Path(journal_path)
         self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()  # Pool workers record concurrently
 
     def record(self, entry: JournalEntry) -> None:
         """Append entry to journal."""
         try:
-            with open(self._path, "a") as f:
+            with self._lock, open(self._path, "a") as f:
                 f.write(json.dumps(asdict(entry)) + "\n")
         except Exception as e:
             logger.warning("Journal write failed: %s", e)
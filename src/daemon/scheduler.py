@@ -1,18 +1,26 @@
 """
 Mekong Daemon - Scheduler
 
-Main loop: watch → classify → execute → gate → journal → archive/dlq.
-Single-process daemon with graceful shutdown.
+Main loop: watch → classify → queue → execute → gate → journal → archive/dlq.
+Missions run on a bounded worker pool. Each complexity level has its own
+concurrency cap, so one long strategic mission never blocks the small
+ones queued behind it. Graceful shutdown waits for in-flight missions.
 """
 
+import heapq
+import itertools
 import logging
 import signal
+import threading
 import time
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Deque, Dict, List, Optional, Set
 
 from .watcher import TaskWatcher
-from .classifier import ComplexityClassifier
+from .classifier import ClassificationResult, ComplexityClassifier
 from .executor import MissionExecutor
 from .gate import PostGate
 from .journal import LearningJournal
@@ -20,13 +28,28 @@ from .dlq import DeadLetterQueue
 
 logger = logging.getLogger(__name__)
 
+THROUGHPUT_WINDOW_SECS = 900
+
+
+@dataclass(order=True)
+class _QueuedMission:
+    """Priority-queue entry: cheapest complexity first, then oldest file."""
+    rank: int
+    queued_at: float
+    seq: int
+    path: Path = field(compare=False)
+    content: str = field(compare=False)
+    classification: ClassificationResult = field(compare=False)
+    not_before: float = field(default=0.0, compare=False)
+
 
 class DaemonScheduler:
     """
     Autonomous daemon that watches for missions and executes them.
 
     Args:
-        config: Dict with watch_dir, poll_interval, max_retries, projects, etc.
+        config: Dict with watch_dir, poll_interval, max_retries, projects,
+            max_workers, concurrency (level → limit), watch_backend, etc.
     """
 
     def __init__(self, config: Optional[Dict] = None) -> None:
@@ -39,6 +62,7 @@ class DaemonScheduler:
         self.watcher = TaskWatcher(
             watch_dir=self._watch_dir,
             poll_interval=self._poll_interval,
+            backend=cfg.get("watch_backend", "auto"),
         )
         self.classifier = ComplexityClassifier(cfg.get("complexity"))
         self.executor = MissionExecutor(
@@ -53,46 +77,166 @@ class DaemonScheduler:
         self.dlq = DeadLetterQueue(cfg.get("dlq_dir", f"{self._watch_dir}/dead-letter"))
         self._retry_counts: Dict[str, int] = {}
 
+        # Worker pool: per-level caps; by default the pool has room for all
+        # of them at once, so no level can starve another.
+        self._limits = self.classifier.concurrency_limits()
+        self._limits.update(cfg.get("concurrency", {}))
+        self._max_workers = cfg.get("max_workers", sum(self._limits.values()))
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._queue: List[_QueuedMission] = []
+        self._tracked: Set[str] = set()
+        self._in_flight: Counter = Counter()
+        self._seq = itertools.count()
+
+        # Throughput metrics
+        self._started_at: Optional[float] = None
+        self._completed = 0
+        self._failed = 0
+        self._finished_at: Deque[float] = deque()
+        self._durations: Deque[float] = deque(maxlen=100)
+
     def start(self) -> None:
         """Start the daemon main loop. Blocks until stopped."""
         self._running = True
-        signal.signal(signal.SIGTERM, self._handle_signal)
-        signal.signal(signal.SIGINT, self._handle_signal)
-
-        logger.info("Daemon started — watching %s (poll: %ds)", self._watch_dir, self._poll_interval)
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, self._handle_signal)
+            signal.signal(signal.SIGINT, self._handle_signal)
 
-        while self._running:
-            missions = self.watcher.scan_once()
-            for mission_path in missions:
-                if not self._running:
-                    break
-                self._process_mission(mission_path)
-            time.sleep(self._poll_interval)
+        logger.info(
+            "Daemon started — watching %s (%s, %d workers)",
+            self._watch_dir, self.watcher.backend, self._max_workers,
+        )
+        self._open_pool()
+        try:
+            while self._running:
+                self._enqueue_new()
+                self._dispatch()
+                self.watcher.wait(self._poll_interval)
+        finally:
+            self._close_pool()
 
         logger.info("Daemon stopped gracefully")
 
+    def run_until_idle(self, timeout: Optional[float] = None) -> None:
+        """Process everything currently in the inbox, then return."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        self._open_pool()
+        try:
+            while deadline is None or time.monotonic() < deadline:
+                self._enqueue_new()
+                self._dispatch()
+                with self._lock:
+                    if not self._queue and not sum(self._in_flight.values()):
+                        return
+                self.watcher.wait(0.1)
+        finally:
+            self._close_pool()
+
     def stop(self) -> None:
-        """Signal the daemon to stop."""
+        """Signal the daemon to stop; in-flight missions finish first."""
         self._running = False
+        self.watcher.notify()
 
     def _handle_signal(self, signum: int, frame) -> None:
         logger.info("Received signal %d — shutting down", signum)
         self.stop()
 
-    def _process_mission(self, mission_path: Path) -> None:
-        """Process a single mission file."""
-        name = mission_path.name
-        logger.info("Processing mission: %s", name)
+    def _open_pool(self) -> None:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix="mission",
+            )
+            self._started_at = self._started_at or time.time()
+
+    def _close_pool(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+    def _enqueue_new(self) -> None:
+        """Classify newly seen mission files and push them on the queue."""
+        for mission_path in self.watcher.scan_once():
+            name = mission_path.name
+            if name in self._tracked:
+                continue
+            try:
+                content = mission_path.read_text().strip()
+                queued_at = mission_path.stat().st_mtime
+            except Exception as e:
+                logger.error("Cannot read mission %s: %s", name, e)
+                self.watcher.mark_processed(mission_path)
+                continue
 
+            classification = self.classifier.classify(content)
+            with self._lock:
+                self._tracked.add(name)
+                heapq.heappush(self._queue, _QueuedMission(
+                    rank=classification.rank, queued_at=queued_at, seq=next(self._seq),
+                    path=mission_path, content=content, classification=classification,
+                ))
+            logger.info("Queued: %s → %s (timeout: %ds)", name, classification.level, classification.timeout)
+
+    def _dispatch(self) -> None:
+        """Start every queued mission whose level and the pool have capacity."""
+        if self._pool is None:
+            return
+        now = time.time()
+        with self._lock:
+            deferred: List[_QueuedMission] = []
+            while self._queue and sum(self._in_flight.values()) < self._max_workers:
+                item = heapq.heappop(self._queue)
+                level = item.classification.level
+                if item.not_before > now or self._in_flight[level] >= self._limits.get(level, 1):
+                    deferred.append(item)
+                    continue
+                self._in_flight[level] += 1
+                self._pool.submit(self._run_queued, item)
+            for item in deferred:
+                heapq.heappush(self._queue, item)
+
+    def _run_queued(self, item: _QueuedMission) -> None:
+        """Worker: run one mission, then requeue it or release its slot."""
+        level = item.classification.level
+        done = True
+        start = time.time()
         try:
-            content = mission_path.read_text().strip()
+            done = self._process_mission(item.path, item.content, item.classification)
         except Exception as e:
-            logger.error("Cannot read mission %s: %s", name, e)
-            self.watcher.mark_processed(mission_path)
-            return
+            logger.error("Mission crashed: %s (%s)", item.path.name, e)
+        finally:
+            with self._lock:
+                self._in_flight[level] -= 1
+                if done:
+                    self._tracked.discard(item.path.name)
+                    self._finished_at.append(time.time())
+                    self._durations.append(time.time() - start)
+                else:
+                    item.not_before = time.time() + self._poll_interval
+                    heapq.heappush(self._queue, item)
+            self.watcher.notify()
+
+    def _process_mission(
+        self,
+        mission_path: Path,
+        content: Optional[str] = None,
+        classification: Optional[ClassificationResult] = None,
+    ) -> bool:
+        """Process a single mission file. Returns False if it should be retried."""
+        name = mission_path.name
+        logger.info("Processing mission: %s", name)
 
-        classification = self.classifier.classify(content)
-        logger.info("Classified: %s → %s (timeout: %ds)", name, classification.level, classification.timeout)
+        if content is None:
+            try:
+                content = mission_path.read_text().strip()
+            except Exception as e:
+                logger.error("Cannot read mission %s: %s", name, e)
+                self.watcher.mark_processed(mission_path)
+                return True
+
+        if classification is None:
+            classification = self.classifier.classify(content)
+            logger.info("Classified: %s → %s (timeout: %ds)", name, classification.level, classification.timeout)
 
         result = self.executor.run_shell(content, timeout=classification.timeout)
 
@@ -102,32 +246,63 @@ class DaemonScheduler:
                 success=True, duration=result.duration,
             )
             self.watcher.archive(mission_path)
+            with self._lock:
+                self._completed += 1
             logger.info("Mission completed: %s (%.1fs)", name, result.duration)
-        else:
+            return True
+
+        with self._lock:
             retries = self._retry_counts.get(name, 0) + 1
             self._retry_counts[name] = retries
 
-            if retries >= self._max_retries:
-                reason = result.error or "Max retries exceeded"
-                self.dlq.move_to_dlq(mission_path, reason)
-                self.journal.record_mission(
-                    mission=name, complexity=classification.level,
-                    success=False, duration=result.duration, error=reason,
-                )
+        if retries >= self._max_retries:
+            reason = result.error or "Max retries exceeded"
+            self.dlq.move_to_dlq(mission_path, reason)
+            self.journal.record_mission(
+                mission=name, complexity=classification.level,
+                success=False, duration=result.duration, error=reason,
+            )
+            with self._lock:
                 del self._retry_counts[name]
-                logger.warning("Mission failed → DLQ: %s (%s)", name, reason)
-            else:
-                logger.info("Mission retry %d/%d: %s", retries, self._max_retries, name)
+                self._failed += 1
+            logger.warning("Mission failed → DLQ: %s (%s)", name, reason)
+            return True
+
+        logger.info("Mission retry %d/%d: %s", retries, self._max_retries, name)
+        return False
+
+    def _throughput(self) -> float:
+        """Missions finished per minute over the recent window."""
+        now = time.time()
+        while self._finished_at and self._finished_at[0] < now - THROUGHPUT_WINDOW_SECS:
+            self._finished_at.popleft()
+        if not self._finished_at or self._started_at is None:
+            return 0.0
+        window = min(THROUGHPUT_WINDOW_SECS, max(now - self._started_at, 1.0))
+        return round(len(self._finished_at) / window * 60, 2)
 
     def status(self) -> Dict:
-        """Return daemon status summary."""
-        return {
-            "running": self._running,
-            "watch_dir": self._watch_dir,
-            "pending": len(self.watcher.scan_once()),
-            "dead_letters": self.dlq.count,
-            "success_rate": self.journal.success_rate(),
-        }
+        """Return daemon status summary, including pool throughput."""
+        untracked = [p for p in self.watcher.scan_once() if p.name not in self._tracked]
+        with self._lock:
+            return {
+                "running": self._running,
+                "watch_dir": self._watch_dir,
+                "watcher_backend": self.watcher.backend,
+                "pending": len(self._queue) + len(untracked),
+                "in_flight": sum(self._in_flight.values()),
+                "in_flight_by_level": {k: v for k, v in self._in_flight.items() if v},
+                "max_workers": self._max_workers,
+                "concurrency_limits": dict(self._limits),
+                "completed": self._completed,
+                "failed": self._failed,
+                "throughput_per_min": self._throughput(),
+                "avg_duration_secs": (
+                    round(sum(self._durations) / len(self._durations), 2) if self._durations else 0.0
+                ),
+                "dead_letters": self.dlq.count,
+                "success_rate": self.journal.success_rate(),
+            }
 
 
 __all__ = ["DaemonScheduler"]
@@ -1,26 +1,211 @@
 """
 Mekong Daemon - Task Watcher
 
-Polls a directory for mission files (*.txt, *.json, *.md).
-Yields discovered missions in FIFO order for dispatch.
+Watches a directory for mission files (*.txt, *.json, *.md).
+Uses inotify (via ctypes, Linux) or watchdog when available, and
+degrades to cheap mtime-checked polling everywhere else.
+The processed-set is persisted next to the missions so restarts
+don't re-run files that were deliberately skipped.
 """
 
+import ctypes
+import ctypes.util
+import fnmatch
 import logging
+import os
+import re
+import select
+import threading
 import time
 from pathlib import Path
-from typing import Iterator, List, Optional
+from typing import Iterator, List, Optional, Set
 
 logger = logging.getLogger(__name__)
 
+# inotify(7) constants
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_DELETE = 0x00000200
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_WATCH_MASK = _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_MOVED_FROM | _IN_DELETE
+
+
+class _InotifyBackend:
+    """Directory change notifications through libc inotify."""
+
+    name = "inotify"
+
+    def __init__(self, path: Path) -> None:
+        libc_name = ctypes.util.find_library("c") or "libc.so.6"
+        libc = ctypes.CDLL(libc_name, use_errno=True)
+        self._fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        if libc.inotify_add_watch(self._fd, os.fsencode(str(path)), _WATCH_MASK) < 0:
+            err = ctypes.get_errno()
+            os.close(self._fd)
+            raise OSError(err, "inotify_add_watch failed")
+        self._pipe_r, self._pipe_w = os.pipe()
+        os.set_blocking(self._pipe_r, False)
+
+    def wait(self, timeout: Optional[float]) -> bool:
+        ready, _, _ = select.select([self._fd, self._pipe_r], [], [], timeout)
+        for fd in ready:
+            try:
+                while os.read(fd, 65536):
+                    pass
+            except BlockingIOError:
+                pass
+        return bool(ready)
+
+    def notify(self) -> None:
+        try:
+            os.write(self._pipe_w, b"x")
+        except OSError:
+            pass
+
+    def close(self) -> None:
+        for fd in (self._fd, self._pipe_r, self._pipe_w):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+
+class _WatchdogBackend:
+    """Directory change notifications through the optional watchdog package."""
+
+    name = "watchdog"
+
+    def __init__(self, path: Path) -> None:
+        from watchdog.events import FileSystemEventHandler
+        from watchdog.observers import Observer
+
+        event = self._event = threading.Event()
+
+        class _Handler(FileSystemEventHandler):
+            def on_any_event(self, _evt) -> None:
+                event.set()
+
+        self._observer = Observer()
+        self._observer.schedule(_Handler(), str(path), recursive=False)
+        self._observer.daemon = True
+        self._observer.start()
+
+    def wait(self, timeout: Optional[float]) -> bool:
+        fired = self._event.wait(timeout)
+        self._event.clear()
+        return fired
+
+    def notify(self) -> None:
+        self._event.set()
+
+    def close(self) -> None:
+        self._observer.stop()
+
+
+class _PollBackend:
+    """Fallback: wake every interval, report a change only when mtime moves."""
+
+    name = "poll"
+
+    def __init__(self, path: Path, interval: float) -> None:
+        self._path = path
+        self._interval = interval
+        self._event = threading.Event()
+        self._mtime = self._stat()
+
+    def _stat(self) -> int:
+        try:
+            return self._path.stat().st_mtime_ns
+        except OSError:
+            return 0
+
+    def wait(self, timeout: Optional[float]) -> bool:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            step = self._interval
+            if deadline is not None:
+                step = min(step, max(0.0, deadline - time.monotonic()))
+            if self._event.wait(step):
+                self._event.clear()
+                return True
+            mtime = self._stat()
+            if mtime != self._mtime:
+                self._mtime = mtime
+                return True
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+
+    def notify(self) -> None:
+        self._event.set()
+
+    def close(self) -> None:
+        pass
+
+
+class _ProcessedSet:
+    """Append-only persisted set of mission names, compacted as it grows."""
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._names: Set[str] = set()
+        self._lines = 0
+        self._lock = threading.Lock()
+        if path.exists():
+            try:
+                for line in path.read_text().splitlines():
+                    if line:
+                        self._names.add(line)
+                        self._lines += 1
+            except OSError as e:
+                logger.warning("Processed-set read failed: %s", e)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._names
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def add(self, name: str) -> None:
+        with self._lock:
+            if name in self._names:
+                return
+            self._names.add(name)
+            try:
+                with open(self._path, "a") as f:
+                    f.write(name + "\n")
+                self._lines += 1
+            except OSError as e:
+                logger.warning("Processed-set write failed: %s", e)
+
+    def retain(self, present: Set[str]) -> None:
+        """Forget names no longer on disk; rewrite the file once it has bloated."""
+        with self._lock:
+            self._names &= present
+            if self._lines <= 2 * len(self._names) + 64:
+                return
+            tmp = self._path.with_name(self._path.name + ".tmp")
+            try:
+                tmp.write_text("".join(n + "\n" for n in sorted(self._names)))
+                os.replace(tmp, self._path)
+                self._lines = len(self._names)
+            except OSError as e:
+                logger.warning("Processed-set compaction failed: %s", e)
+
 
 class TaskWatcher:
     """
     Watches a directory for new mission files.
 
     Args:
-        watch_dir: Directory to poll for mission files
-        poll_interval: Seconds between polls (default: 5)
+        watch_dir: Directory to watch for mission files
+        poll_interval: Seconds between polls when no event backend is available
         patterns: Glob patterns for mission files
+        backend: "auto", "inotify", "watchdog", or "poll"
+        state_path: Persisted processed-set (default: <watch_dir>/.mekong-processed)
     """
 
     def __init__(
@@ -28,24 +213,87 @@ class TaskWatcher:
         watch_dir: str = "./tasks",
         poll_interval: float = 5.0,
         patterns: Optional[List[str]] = None,
+        backend: str = "auto",
+        state_path: Optional[str] = None,
     ) -> None:
         self._dir = Path(watch_dir)
         self._interval = poll_interval
         self._patterns = patterns or ["mission_*.txt", "mission_*.json", "*.md"]
-        self._processed: set = set()
+        self._matchers = [re.compile(fnmatch.translate(p)) for p in self._patterns]
         self._dir.mkdir(parents=True, exist_ok=True)
+        self._processed = _ProcessedSet(
+            Path(state_path) if state_path else self._dir / ".mekong-processed"
+        )
+        self._listing: Optional[List[Path]] = None
+        self._listing_mtime = 0
+        self._backend = self._open_backend(backend)
+
+    def _open_backend(self, backend: str):
+        """Pick the first notification backend that works here."""
+        candidates = [backend] if backend != "auto" else ["inotify", "watchdog", "poll"]
+        for name in candidates:
+            try:
+                if name == "inotify":
+                    return _InotifyBackend(self._dir)
+                if name == "watchdog":
+                    return _WatchdogBackend(self._dir)
+                if name == "poll":
+                    return _PollBackend(self._dir, self._interval)
+            except (ImportError, OSError, AttributeError) as e:
+                logger.debug("Watcher backend %s unavailable: %s", name, e)
+        return _PollBackend(self._dir, self._interval)
+
+    @property
+    def backend(self) -> str:
+        """Name of the active change-notification backend."""
+        return self._backend.name
+
+    def _list_missions(self) -> List[Path]:
+        """One scandir per directory change, cached while mtime is unchanged."""
+        try:
+            mtime = self._dir.stat().st_mtime_ns
+        except OSError:
+            return []
+        # A listing taken within the mtime granularity window may miss a
+        # file created in the same tick, so only trust older snapshots.
+        fresh = time.time_ns() - mtime < 1_000_000_000
+        if self._listing is not None and mtime == self._listing_mtime and not fresh:
+            return self._listing
+
+        by_pattern: List[List[Path]] = [[] for _ in self._matchers]
+        present: Set[str] = set()
+        with os.scandir(self._dir) as it:
+            for entry in it:
+                if not entry.is_file():
+                    continue
+                present.add(entry.name)
+                for i, matcher in enumerate(self._matchers):
+                    if matcher.match(entry.name):
+                        by_pattern[i].append(Path(entry.path))
+                        break
+        self._processed.retain(present)
+        self._listing = [p for group in by_pattern for p in sorted(group)]
+        self._listing_mtime = mtime
+        return self._listing
 
     def scan_once(self) -> List[Path]:
         """Scan directory once for new mission files."""
-        missions: List[Path] = []
-        for pattern in self._patterns:
-            for fpath in sorted(self._dir.glob(pattern)):
-                if fpath.name not in self._processed and fpath.is_file():
-                    missions.append(fpath)
-        return missions
+        return [p for p in self._list_missions() if p.name not in self._processed]
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the directory changes, notify() is called, or timeout."""
+        return self._backend.wait(timeout)
+
+    def notify(self) -> None:
+        """Wake a thread blocked in wait()."""
+        self._backend.notify()
+
+    def close(self) -> None:
+        """Release the notification backend."""
+        self._backend.close()
 
     def mark_processed(self, fpath: Path) -> None:
-        """Mark a mission file as processed."""
+        """Mark a mission file as processed (persisted across restarts)."""
         self._processed.add(fpath.name)
 
     def poll(self) -> Iterator[Path]:
@@ -57,7 +305,7 @@ class TaskWatcher:
             missions = self.scan_once()
             for m in missions:
                 yield m
-            time.sleep(self._interval)
+            self.wait(self._interval)
 
     def archive(self, fpath: Path) -> Path:
         """Move processed file to processed/ subdirectory."""
@@ -51,6 +51,16 @@ class LicenseRepository:
         query = "SELECT * FROM licenses WHERE license_key = $1"
         return await self._db.fetch_one(query, (license_key,))
 
+    async def list_active_licenses(self) -> list[Dict]:
+        """List active licenses (key, key_id, email, tier) ordered by license key."""
+        query = """
+            SELECT license_key, key_id, email, tier FROM licenses
+            WHERE status = 'active'
+            ORDER BY license_key
+        """
+        rows = await self._db.fetch_all(query)
+        return [dict(row) for row in rows] if rows else []
+
     async def get_license_by_key_id(self, key_id: str) -> Optional[Dict]:
         """Get license by key_id."""
         query = "SELECT * FROM licenses WHERE key_id = $1"
@@ -225,6 +235,42 @@ class LicenseRepository:
         rows = await self._db.fetch_all(query, (license_key, start_date, end_date))
         return [dict(row) for row in rows] if rows else []
 
+    async def get_licenses_by_keys(self, license_keys: list[str]) -> list[Dict]:
+        """Get licenses for many license keys in one query."""
+        query = "SELECT * FROM licenses WHERE license_key = ANY($1)"
+        rows = await self._db.fetch_all(query, (list(license_keys),))
+        return [dict(row) for row in rows] if rows else []
+
+    async def get_active_rate_cards(self, plan_tiers: list[str]) -> list[Dict]:
+        """Get the current rate card per (tier, event type, model) for many tiers."""
+        query = """
+            SELECT DISTINCT ON (plan_tier, event_type, model_name) * FROM rate_cards
+            WHERE plan_tier = ANY($1)
+              AND is_active = TRUE
+              AND valid_from <= CURRENT_DATE
+              AND (valid_to IS NULL OR valid_to > CURRENT_DATE)
+            ORDER BY plan_tier, event_type, model_name, valid_from DESC
+        """
+        rows = await self._db.fetch_all(query, (list(plan_tiers),))
+        return [dict(row) for row in rows] if rows else []
+
+    async def get_usage_events_batch(
+        self,
+        license_keys: list[str],
+        start_date: datetime,
+        end_date: datetime,
+    ) -> list[Dict]:
+        """Get usage events for many licenses within date range, grouped by license."""
+        query = """
+            SELECT * FROM usage_events_staging
+            WHERE license_key = ANY($1)
+              AND timestamp >= $2
+              AND timestamp <= $3
+            ORDER BY license_key, timestamp ASC
+        """
+        rows = await self._db.fetch_all(query, (list(license_keys), start_date, end_date))
+        return [dict(row) for row in rows] if rows else []
+
     async def create_billing_period(
         self,
         license_key: str,
@@ -5,7 +5,9 @@ Scheduled jobs for billing, reconciliation, and maintenance.
 """
 
 from src.jobs.nightly_reconciliation import (
+    LicenseOutcome,
     NightlyReconciliationService,
+    ReconciliationCheckpoint,
     ReconciliationReport,
     StripeDiscrepancy,
     StripeReconciliationAdapter,
@@ -13,7 +15,9 @@ from src.jobs.nightly_reconciliation import (
 )
 
 __all__ = [
+    "LicenseOutcome",
     "NightlyReconciliationService",
+    "ReconciliationCheckpoint",
     "ReconciliationReport",
     "StripeDiscrepancy",
     "StripeReconciliationAdapter",
@@ -6,24 +6,34 @@ Automatically reconciles usage records against Stripe billing data.
 Compares metered usage with Stripe invoice line items, logs discrepancies,
 and triggers alerts for unresolved mismatches.
 
+Licenses are reconciled concurrently (bounded by a semaphore), Stripe calls
+are paced by a token bucket, and each finished license is appended to a
+checkpoint file so an interrupted run resumes where it stopped.
+
 Usage:
     python3 -m src.jobs.nightly_reconciliation [--dry-run] [--date YYYY-MM-DD]
+        [--concurrency N] [--no-resume]
 
 Environment Variables:
     DATABASE_URL: PostgreSQL connection string
     STRIPE_SECRET_KEY: Stripe API key (sk_live_* or sk_test_*)
+    STRIPE_RATE_LIMIT_RPS: Optional, Stripe requests/second (default: 100 live, 25 test)
+    RECONCILIATION_CONCURRENCY: Optional, licenses reconciled at once (default: 16)
     TELEGRAM_BOT_TOKEN: Optional, for alert notifications
     TELEGRAM_OPS_CHANNEL_ID: Optional, for alert notifications
     RECONCILIATION_WEBHOOK_URL: Optional, for webhook alerts
 """
 
 import asyncio
+import json
 import logging
 import os
 import sys
+import time
+from contextlib import contextmanager
 from datetime import date, datetime, timedelta, timezone
 from decimal import Decimal
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, TextIO
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -40,10 +50,24 @@ from src.billing.reconciliation import (
     get_reconciliation_service,
 )
 from src.core.event_bus import get_event_bus, EventType
+from src.auth.rate_limiter import TokenBucket
 
 console = Console()
 logger = logging.getLogger(__name__)
 
+# Stripe read limits: 100 requests/second in live mode, 25 in test mode
+STRIPE_LIVE_RPS = 100.0
+STRIPE_TEST_RPS = 25.0
+DEFAULT_CONCURRENCY = 16
+CHECKPOINT_DIR = Path.home() / ".mekong" / "reconciliation"
+
+
+def _unix_time(value: Any) -> int:
+    """Unix timestamp for a date (UTC midnight) or datetime."""
+    if not isinstance(value, datetime):
+        value = datetime.combine(value, datetime.min.time(), tzinfo=timezone.utc)
+    return int(value.timestamp())
+
 
 # =============================================================================
 # Stripe Integration
@@ -57,14 +81,47 @@ class StripeReconciliationAdapter:
     Compares local usage records with Stripe invoice line items.
     """
 
-    def __init__(self, api_key: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        requests_per_second: Optional[float] = None,
+        client: Any = None,
+    ) -> None:
+        """
+        Args:
+            api_key: Stripe secret key (default: STRIPE_SECRET_KEY)
+            requests_per_second: Pacing for Stripe API calls (default:
+                STRIPE_RATE_LIMIT_RPS, else Stripe's live/test limit)
+            client: Pre-configured ``stripe`` module or stand-in (for testing)
+        """
         self._api_key = api_key or os.getenv("STRIPE_SECRET_KEY")
-        self._initialized = False
-        self._stripe = None
+        self._initialized = client is not None
+        self._stripe = client
 
-        if not self._api_key:
+        if not self._api_key and client is None:
             logger.warning("STRIPE_SECRET_KEY not set - Stripe reconciliation disabled")
 
+        if requests_per_second is None:
+            requests_per_second = float(os.getenv("STRIPE_RATE_LIMIT_RPS", "0")) or (
+                STRIPE_TEST_RPS if (self._api_key or "").startswith("sk_test") else STRIPE_LIVE_RPS
+            )
+        self._bucket = TokenBucket(capacity=requests_per_second, refill_rate=requests_per_second)
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        """Zero the call and pacing counters (once per reconciliation run)."""
+        self.api_calls = 0
+        self.paced_seconds = 0.0
+
+    async def _call(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run a blocking Stripe call in a thread once the token bucket allows it."""
+        while not await self._bucket.consume():
+            wait = await self._bucket.wait_time()
+            self.paced_seconds += wait
+            await asyncio.sleep(wait)
+        self.api_calls += 1
+        return await asyncio.to_thread(fn, *args, **kwargs)
+
     async def initialize(self) -> bool:
         """Initialize Stripe client."""
         if not self._api_key:
@@ -107,7 +164,7 @@ class StripeReconciliationAdapter:
 
         try:
             # Lookup customer by email
-            customers = self._stripe.Customer.list(email=customer_email, limit=1)
+            customers = await self._call(self._stripe.Customer.list, email=customer_email, limit=1)
             if not customers.data:
                 logger.warning(f"No Stripe customer found for {customer_email}")
                 return []
@@ -115,11 +172,12 @@ class StripeReconciliationAdapter:
             customer_id = customers.data[0].id
 
             # Fetch invoices for period
-            invoices = self._stripe.Invoice.list(
+            invoices = await self._call(
+                self._stripe.Invoice.list,
                 customer=customer_id,
                 created={
-                    "gte": int(period_start.timestamp()),
-                    "lte": int(period_end.timestamp()),
+                    "gte": _unix_time(period_start),
+                    "lte": _unix_time(period_end),
                 },
                 limit=100,
             )
@@ -177,7 +235,8 @@ class StripeReconciliationAdapter:
                 return None
 
         try:
-            usage_records = self._stripe.SubscriptionItem.list_usage_records(
+            usage_records = await self._call(
+                self._stripe.SubscriptionItem.list_usage_records,
                 subscription_item_id,
                 limit=100,
             )
@@ -238,6 +297,146 @@ class StripeDiscrepancy:
             "created_at": self.created_at.isoformat(),
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "StripeDiscrepancy":
+        """Deserialize from dictionary."""
+        return cls(
+            license_key=data["license_key"],
+            key_id=data["key_id"],
+            period_start=date.fromisoformat(data["period_start"]),
+            period_end=date.fromisoformat(data["period_end"]),
+            local_amount=Decimal(data["local_amount"]),
+            stripe_amount=Decimal(data["stripe_amount"]),
+            variance=Decimal(data["variance"]),
+            variance_percent=data["variance_percent"],
+            local_line_items=data.get("local_line_items", []),
+            stripe_line_items=data.get("stripe_line_items", []),
+            status=data.get("status", "open"),
+            notes=data.get("notes"),
+            created_at=datetime.fromisoformat(data["created_at"]),
+        )
+
+
+def _audit_result_from_dict(data: Dict[str, Any]) -> AuditResult:
+    return AuditResult(
+        audit_id=data["audit_id"],
+        license_key=data["license_key"],
+        key_id=data["key_id"],
+        audit_date=date.fromisoformat(data["audit_date"]),
+        expected_amount=Decimal(data["expected_amount"]),
+        actual_amount=Decimal(data["actual_amount"]),
+        variance=Decimal(data["variance"]),
+        variance_percent=data["variance_percent"],
+        status=data["status"],
+        discrepancies=data.get("discrepancies", []),
+        details=data.get("details", {}),
+        timestamp=datetime.fromisoformat(data["timestamp"]),
+    )
+
+
+@dataclass
+class LicenseOutcome:
+    """Reconciliation outcome for one license; one checkpoint line."""
+
+    license_key: str
+    local: Optional[AuditResult] = None
+    stripe: Optional[StripeDiscrepancy] = None
+    stripe_checked: bool = False
+    warnings: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to dictionary."""
+        return {
+            "license_key": self.license_key,
+            "local": self.local.to_dict() if self.local else None,
+            "stripe": self.stripe.to_dict() if self.stripe else None,
+            "stripe_checked": self.stripe_checked,
+            "warnings": self.warnings,
+            "error": self.error,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LicenseOutcome":
+        """Deserialize from dictionary."""
+        return cls(
+            license_key=data["license_key"],
+            local=_audit_result_from_dict(data["local"]) if data.get("local") else None,
+            stripe=StripeDiscrepancy.from_dict(data["stripe"]) if data.get("stripe") else None,
+            stripe_checked=data.get("stripe_checked", False),
+            warnings=data.get("warnings", []),
+            error=data.get("error"),
+        )
+
+
+class ReconciliationCheckpoint:
+    """
+    Append-only JSONL of finished licenses for one audit date.
+
+    A line is written (and flushed) as each license finishes, so an
+    interrupted run loses at most the licenses in flight. A torn last line
+    is ignored on load.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._file: Optional[TextIO] = None
+
+    def load(self) -> Dict[str, LicenseOutcome]:
+        """Outcomes recorded so far, by license key."""
+        outcomes: Dict[str, LicenseOutcome] = {}
+        if not self.path.exists():
+            return outcomes
+        with self.path.open(encoding="utf-8") as f:
+            for line in f:
+                try:
+                    outcome = LicenseOutcome.from_dict(json.loads(line))
+                except (ValueError, KeyError, TypeError):
+                    logger.warning(f"Skipping unreadable checkpoint line in {self.path}")
+                    continue
+                outcomes[outcome.license_key] = outcome
+        return outcomes
+
+    def append(self, outcome: LicenseOutcome) -> None:
+        """Record a finished license."""
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = self.path.open("a", encoding="utf-8")
+        self._file.write(json.dumps(outcome.to_dict()) + "\n")
+        self._file.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def clear(self) -> None:
+        """Remove the checkpoint once a run completes."""
+        self.close()
+        self.path.unlink(missing_ok=True)
+
+
+@dataclass
+class StageTiming:
+    """Accumulated timing for one pipeline stage."""
+
+    count: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+
+    def to_dict(self) -> Dict[str, float]:
+        """Serialize to dictionary."""
+        return {
+            "count": self.count,
+            "total_seconds": round(self.total_seconds, 4),
+            "max_seconds": round(self.max_seconds, 4),
+        }
+
 
 @dataclass
 class ReconciliationReport:
@@ -253,6 +452,8 @@ class ReconciliationReport:
     critical_count: int
     warnings: List[str] = field(default_factory=list)
     duration_seconds: float = 0
+    resumed_count: int = 0
+    stage_timings: Dict[str, StageTiming] = field(default_factory=dict)
 
     def to_dict(self) -> Dict[str, Any]:
         """Serialize to dictionary."""
@@ -267,6 +468,8 @@ class ReconciliationReport:
             "critical_count": self.critical_count,
             "warnings": self.warnings,
             "duration_seconds": self.duration_seconds,
+            "resumed_count": self.resumed_count,
+            "stage_timings": {name: t.to_dict() for name, t in self.stage_timings.items()},
             "discrepancies": [d.to_dict() for d in self.discrepancies],
         }
 
@@ -283,22 +486,49 @@ class NightlyReconciliationService:
     Runs automated reconciliation of:
     1. Local usage records vs local billing records
     2. Local billing records vs Stripe invoices
+
+    Up to ``concurrency`` licenses are reconciled at once; finished
+    licenses are checkpointed under ``checkpoint_dir`` so a rerun for the
+    same date skips them.
     """
 
     def __init__(
         self,
         repository: Optional[LicenseRepository] = None,
         stripe_adapter: Optional[StripeReconciliationAdapter] = None,
+        audit_service: Optional[Any] = None,
+        concurrency: Optional[int] = None,
+        checkpoint_dir: Optional[Path] = None,
     ) -> None:
         self._repo = repository or get_repository()
         self._stripe = stripe_adapter or StripeReconciliationAdapter()
+        self._audit_service = audit_service
         self._event_bus = get_event_bus()
         self._config = ReconciliationConfig()
+        self._concurrency = max(1, concurrency or int(
+            os.getenv("RECONCILIATION_CONCURRENCY", DEFAULT_CONCURRENCY)
+        ))
+        self._checkpoint_dir = checkpoint_dir or CHECKPOINT_DIR
+        self._timings: Dict[str, StageTiming] = {}
+
+    @contextmanager
+    def _timed(self, stage: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._timings.setdefault(stage, StageTiming()).add(time.perf_counter() - started)
+
+    def checkpoint_for(self, audit_date: date, dry_run: bool = False) -> ReconciliationCheckpoint:
+        """Checkpoint file for an audit date (dry runs are kept separate)."""
+        suffix = ".dry-run" if dry_run else ""
+        return ReconciliationCheckpoint(self._checkpoint_dir / f"{audit_date.isoformat()}{suffix}.jsonl")
 
     async def run_full_reconciliation(
         self,
         audit_date: Optional[date] = None,
         dry_run: bool = False,
+        resume: bool = True,
     ) -> ReconciliationReport:
         """
         Run full reconciliation with Stripe comparison.
@@ -306,12 +536,14 @@ class NightlyReconciliationService:
         Args:
             audit_date: Date to reconcile (defaults to yesterday)
             dry_run: If True, don't save results
+            resume: If True, skip licenses finished by an interrupted run
 
         Returns:
             ReconciliationReport
         """
-        import time
         start_time = time.time()
+        self._timings = {}
+        self._stripe.reset_stats()
 
         if audit_date is None:
             audit_date = date.today() - timedelta(days=1)
@@ -321,11 +553,38 @@ class NightlyReconciliationService:
         console.print(f"Dry Run: [yellow]{dry_run}[/yellow]\n")
 
         # Get all active licenses
-        licenses = await self._get_active_licenses()
+        with self._timed("licenses"):
+            licenses = await self._get_active_licenses()
         total_licenses = len(licenses)
 
         console.print(f"Found [cyan]{total_licenses}[/cyan] active licenses\n")
 
+        checkpoint = self.checkpoint_for(audit_date, dry_run)
+        if resume:
+            outcomes = checkpoint.load()
+        else:
+            checkpoint.clear()
+            outcomes = {}
+        resumed_count = sum(1 for info in licenses if info["license_key"] in outcomes)
+        if resumed_count:
+            console.print(f"Resuming: [cyan]{resumed_count}[/cyan] licenses already reconciled\n")
+
+        semaphore = asyncio.Semaphore(self._concurrency)
+
+        async def reconcile(license_info: Dict[str, Any]) -> None:
+            async with semaphore:
+                outcome = await self._reconcile_license(license_info, audit_date)
+            outcomes[outcome.license_key] = outcome
+            if outcome.error is None:
+                checkpoint.append(outcome)
+
+        try:
+            await asyncio.gather(*(
+                reconcile(info) for info in licenses if info["license_key"] not in outcomes
+            ))
+        finally:
+            checkpoint.close()
+
         reconciled_count = 0
         stripe_reconciled_count = 0
         discrepancies: List[StripeDiscrepancy] = []
@@ -333,48 +592,18 @@ class NightlyReconciliationService:
         warnings: List[str] = []
 
         for license_info in licenses:
-            license_key = license_info["license_key"]
-            key_id = license_info["key_id"]
-            email = license_info.get("email", "")
-
-            try:
-                # 1. Run local reconciliation
-                local_result = await self._reconcile_local(license_key, key_id, audit_date)
-
-                if local_result.status != "matched":
-                    local_only_discrepancies.append(local_result)
-                    warnings.append(
-                        f"{license_key}: Local variance ${local_result.variance} "
-                        f"({local_result.variance_percent:.2f}%)"
-                    )
-                else:
-                    reconciled_count += 1
-
-                # 2. Run Stripe reconciliation
-                if email:
-                    stripe_result = await self._reconcile_with_stripe(
-                        license_key=license_key,
-                        key_id=key_id,
-                        customer_email=email,
-                        period_start=audit_date,
-                        period_end=audit_date + timedelta(days=1),
-                        local_amount=local_result.actual_amount,
-                    )
-
-                    if stripe_result:
-                        discrepancies.append(stripe_result)
-                        warnings.append(
-                            f"{license_key}: Stripe variance ${stripe_result.variance} "
-                            f"({stripe_result.variance_percent:.2f}%)"
-                        )
-                    else:
-                        stripe_reconciled_count += 1
-                else:
-                    warnings.append(f"{license_key}: No email for Stripe lookup")
-
-            except Exception as e:
-                logger.error(f"Reconciliation failed for {license_key}: {e}")
-                warnings.append(f"{license_key}: Error - {str(e)}")
+            outcome = outcomes[license_info["license_key"]]
+            warnings.extend(outcome.warnings)
+            if outcome.local is None:
+                continue
+            if outcome.local.status != "matched":
+                local_only_discrepancies.append(outcome.local)
+            else:
+                reconciled_count += 1
+            if outcome.stripe:
+                discrepancies.append(outcome.stripe)
+            elif outcome.stripe_checked:
+                stripe_reconciled_count += 1
 
         # Calculate totals
         total_variance = sum(d.variance for d in discrepancies)
@@ -383,7 +612,10 @@ class NightlyReconciliationService:
             if d.variance_percent > 10  # >10% variance is critical
         )
 
-        duration = time.time() - start_time
+        if self._stripe.paced_seconds:
+            self._timings["stripe_pacing"] = StageTiming(
+                count=self._stripe.api_calls, total_seconds=self._stripe.paced_seconds,
+            )
 
         report = ReconciliationReport(
             run_date=audit_date,
@@ -395,54 +627,95 @@ class NightlyReconciliationService:
             total_variance=total_variance,
             critical_count=critical_count,
             warnings=warnings,
-            duration_seconds=duration,
+            resumed_count=resumed_count,
+            stage_timings=self._timings,
         )
 
-        # Print report
-        self._print_report(report)
-
         # Save results (unless dry run)
         if not dry_run:
-            await self._save_report(report)
+            with self._timed("save"):
+                await self._save_report(report)
 
         # Send alerts if needed
         if report.critical_count > 0 or report.total_variance > Decimal("100"):
-            await self._trigger_alerts(report)
+            with self._timed("alerts"):
+                await self._trigger_alerts(report)
+
+        checkpoint.clear()
+        report.duration_seconds = time.time() - start_time
+
+        # Print report
+        self._print_report(report)
 
         return report
 
+    async def _reconcile_license(
+        self,
+        license_info: Dict[str, Any],
+        audit_date: date,
+    ) -> LicenseOutcome:
+        """Run local then Stripe reconciliation for one license."""
+        license_key = license_info["license_key"]
+        key_id = license_info["key_id"]
+        email = license_info.get("email", "")
+        outcome = LicenseOutcome(license_key=license_key)
+
+        try:
+            # 1. Run local reconciliation
+            with self._timed("local"):
+                local_result = await self._reconcile_local(license_key, key_id, audit_date)
+            outcome.local = local_result
+
+            if local_result.status != "matched":
+                outcome.warnings.append(
+                    f"{license_key}: Local variance ${local_result.variance} "
+                    f"({local_result.variance_percent:.2f}%)"
+                )
+
+            # 2. Run Stripe reconciliation
+            if email:
+                with self._timed("stripe"):
+                    stripe_result = await self._reconcile_with_stripe(
+                        license_key=license_key,
+                        key_id=key_id,
+                        customer_email=email,
+                        period_start=audit_date,
+                        period_end=audit_date + timedelta(days=1),
+                        local_amount=local_result.actual_amount,
+                    )
+                outcome.stripe_checked = True
+
+                if stripe_result:
+                    outcome.stripe = stripe_result
+                    outcome.warnings.append(
+                        f"{license_key}: Stripe variance ${stripe_result.variance} "
+                        f"({stripe_result.variance_percent:.2f}%)"
+                    )
+            else:
+                outcome.warnings.append(f"{license_key}: No email for Stripe lookup")
+
+        except Exception as e:
+            logger.error(f"Reconciliation failed for {license_key}: {e}")
+            outcome.error = str(e)
+            outcome.warnings.append(f"{license_key}: Error - {str(e)}")
+
+        return outcome
+
     async def _reconcile_local(
         self,
         license_key: str,
         key_id: str,
         audit_date: date,
     ) -> AuditResult:
-        """Run local reconciliation (usage vs billing records)."""
-        service = get_reconciliation_service()
-        results = await service.run_daily_reconciliation(audit_date=audit_date)
-
-        # Find result for this license
-        result = next(
-            (r for r in results if r.license_key == license_key),
-            None
+        """Run local reconciliation (usage vs billing records) for one license."""
+        if self._audit_service is None:
+            self._audit_service = get_reconciliation_service()
+        return await self._audit_service.reconcile_license(
+            license_key=license_key,
+            key_id=key_id,
+            audit_date=audit_date,
         )
 
-        if not result:
-            # Create a default matched result
-            return AuditResult(
-                audit_id=f"local_{license_key}_{audit_date}",
-                license_key=license_key,
-                key_id=key_id,
-                audit_date=audit_date,
-                expected_amount=Decimal(0),
-                actual_amount=Decimal(0),
-                variance=Decimal(0),
-                variance_percent=0,
-                status="matched",
-            )
-
-        return result
-
     async def _reconcile_with_stripe(
         self,
         license_key: str,
@@ -511,9 +784,7 @@ class NightlyReconciliationService:
 
     async def _get_active_licenses(self) -> List[Dict[str, Any]]:
         """Get all active licenses."""
-        # This would require a repository method to list all licenses
-        # For now, return empty list - implementation needs DB query
-        return []
+        return await self._repo.list_active_licenses()
 
     def _print_report(self, report: ReconciliationReport) -> None:
         """Print reconciliation report to console."""
@@ -531,10 +802,29 @@ class NightlyReconciliationService:
         table.add_row("Discrepancies", str(len(report.discrepancies)))
         table.add_row("Critical (>10%)", f"[red]{report.critical_count}[/red]")
         table.add_row("Total Variance", f"${report.total_variance}")
+        if report.resumed_count:
+            table.add_row("Resumed From Checkpoint", str(report.resumed_count))
         table.add_row("Duration", f"{report.duration_seconds:.2f}s")
 
         console.print(table)
 
+        # Per-stage timing (local/stripe overlap across licenses, so their
+        # totals can exceed the wall-clock duration)
+        if report.stage_timings:
+            timing_table = Table(show_header=True, header_style="bold cyan")
+            timing_table.add_column("Stage")
+            timing_table.add_column("Count", justify="right")
+            timing_table.add_column("Total", justify="right")
+            timing_table.add_column("Max", justify="right")
+            for stage, timing in report.stage_timings.items():
+                timing_table.add_row(
+                    stage,
+                    str(timing.count),
+                    f"{timing.total_seconds:.2f}s",
+                    f"{timing.max_seconds:.2f}s",
+                )
+            console.print(timing_table)
+
         # Discrepancies
         if report.discrepancies:
             console.print("\n[bold red]Discrepancies:[/bold red]")
@@ -646,7 +936,12 @@ class NightlyReconciliationService:
 # =============================================================================
 
 
-async def main_async(dry_run: bool = False, audit_date: Optional[str] = None) -> None:
+async def main_async(
+    dry_run: bool = False,
+    audit_date: Optional[str] = None,
+    concurrency: Optional[int] = None,
+    resume: bool = True,
+) -> None:
     """Main async entry point."""
     # Parse date
     if audit_date:
@@ -659,10 +954,11 @@ async def main_async(dry_run: bool = False, audit_date: Optional[str] = None) ->
         audit_dt = None
 
     # Run reconciliation
-    service = NightlyReconciliationService()
+    service = NightlyReconciliationService(concurrency=concurrency)
     report = await service.run_full_reconciliation(
         audit_date=audit_dt,
         dry_run=dry_run,
+        resume=resume,
     )
 
     # Exit with error if critical discrepancies
@@ -686,6 +982,16 @@ def main() -> None:
         type=str,
         help="Audit date (YYYY-MM-DD, default: yesterday)",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        help=f"Licenses reconciled at once (default: {DEFAULT_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--no-resume",
+        action="store_true",
+        help="Ignore the checkpoint of an interrupted run and start over",
+    )
     parser.add_argument(
         "--verbose",
         action="store_true",
@@ -702,7 +1008,12 @@ def main() -> None:
 
     # Run async main
     try:
-        asyncio.run(main_async(dry_run=args.dry_run, audit_date=args.date))
+        asyncio.run(main_async(
+            dry_run=args.dry_run,
+            audit_date=args.date,
+            concurrency=args.concurrency,
+            resume=not args.no_resume,
+        ))
     except KeyboardInterrupt:
         console.print("\n[yellow]Reconciliation cancelled[/yellow]")
         raise SystemExit(0)
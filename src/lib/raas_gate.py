@@ -7,16 +7,23 @@ Reference: /Users/macbookprom1/mekong-cli/docs/HIEN_PHAP_ROIAAS.md
 """
 
 import os
-import asyncio
 import time
 import logging
 import requests
-from typing import Optional, Tuple, Dict, Any, Coroutine, TypeVar, List
+from typing import Optional, Tuple, Dict, Any, List
 from dataclasses import dataclass, field
 
 from src.lib.raas_gate_utils import get_upgrade_message, format_license_preview
 from src.lib.license_generator import validate_license
-from src.lib.usage_meter import record_usage, get_usage_summary
+from src.lib.usage_meter import UsageMeter, get_meter, get_usage_summary, record_usage
+from src.lib.license_generator import get_tier_limits
+from src.lib.raas_gate_cache import (
+    GateCache,
+    QuotaSnapshot,
+    get_background_loop,
+    get_gate_cache,
+    schedule_usage_flush,
+)
 from src.lib.free_tier_tracker import track_free_tier_command
 from src.lib.quota_error_messages import (
     format_quota_error,
@@ -40,38 +47,6 @@ from src.core.license_monitor import record_failure as record_license_failure
 logger = logging.getLogger(__name__)
 
 
-# Fix 3: Async Refactor - Helper to run async operations from sync context
-T = TypeVar("T")
-
-
-def _run_async_safe(coro: Coroutine[Any, Any, T]) -> Optional[T]:
-    """
-    Run async coroutine from sync context safely.
-
-    Args:
-        coro: Coroutine to run
-
-    Returns:
-        Result of coroutine or None if failed
-    """
-    try:
-        # Try to get existing event loop
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            # In async context - create task but don't await (fire-and-forget)
-            asyncio.create_task(coro)
-            return None
-        else:
-            # In sync context - run the coroutine
-            return loop.run_until_complete(coro)
-    except RuntimeError:
-        # No event loop exists - create new one
-        return asyncio.run(coro)
-    except Exception:
-        # Silently fail for analytics (don't block main flow)
-        return None
-
-
 class RaasLicenseGate:
     """RaaS License validation and feature gating with Phase 2 features."""
 
@@ -102,7 +77,10 @@ class RaasLicenseGate:
     FREE_COMMANDS = {"init", "version", "list", "search", "status", "config", "doctor", "help", "dash"}
     PREMIUM_COMMANDS = {"cook", "gateway", "binh-phap", "swarm", "schedule", "telegram", "autonomous", "agi"}
 
-    def __init__(self, enable_remote: bool = True) -> None:
+    # Seconds to wait for a quota snapshot before failing open
+    QUOTA_FETCH_TIMEOUT = 2.0
+
+    def __init__(self, enable_remote: bool = True, cache: Optional[GateCache] = None) -> None:
         self._license_key: Optional[str] = os.getenv("RAAS_LICENSE_KEY")
         self._validated: bool = False
         self._license_tier: Optional[str] = None
@@ -125,6 +103,14 @@ class RaasLicenseGate:
         # Phase 6: Gateway sync state
         self._last_gateway_sync: Optional[int] = None  # Unix timestamp
         self._gateway_rate_limit: Optional[Dict[str, Any]] = None
+        # Decision cache (JWT claims, quota snapshots, pending usage, latency)
+        self._cache = cache
+
+    @property
+    def cache(self) -> GateCache:
+        if self._cache is None:
+            self._cache = get_gate_cache()
+        return self._cache
 
     def get_command_cost(self, command: str) -> int:
         """
@@ -138,17 +124,21 @@ class RaasLicenseGate:
         """
         return self.COMMAND_COSTS.get(command.lower(), 3)  # Default to 3 credits
 
-    def _show_quota_warning(self, command: str, tier_limits: dict) -> None:
+    def _show_quota_warning(
+        self, command: str, tier_limits: dict, daily_used: int, refreshed: bool = False,
+    ) -> None:
         """
         Show quota warning if usage >= 80% or >= 90%.
 
         Args:
             command: Current command name
             tier_limits: Tier limit dict with daily limit
+            daily_used: Usage so far today (cached snapshot plus pending)
+            refreshed: True when ``daily_used`` was just fetched from the backend
 
         Side Effects:
             - Prints warning to console if threshold exceeded
-            - Caches quota state
+            - Caches quota state when the snapshot was refreshed
         """
         if not self._key_id or not self._license_tier:
             return
@@ -174,18 +164,6 @@ class RaasLicenseGate:
             console.print(f"\n{format_license_expired(expiry_date)}\n")
             return
 
-        # Get current usage
-        try:
-            from src.db.repository import get_repository
-            repo = get_repository()
-            import asyncio
-            usage = asyncio.get_event_loop().run_until_complete(
-                repo.get_usage(self._key_id)
-            )
-            daily_used = usage["commands_count"] if usage else 0
-        except Exception:
-            return  # Don't fail on warning
-
         daily_limit = tier_limits.get("daily", 0)
 
         # Skip if unlimited
@@ -196,16 +174,17 @@ class RaasLicenseGate:
         percentage = (daily_used / daily_limit) * 100
         remaining = max(0, daily_limit - daily_used)
 
-        # Cache quota state with license status
+        # Cache quota state with license status (only when it actually changed)
         try:
-            cache_quota(
-                key_id=self._key_id,
-                daily_used=daily_used,
-                daily_limit=daily_limit,
-                tier=self._license_tier,
-                status=self._license_status,
-                expires_at_ts=self._license_expires_at or 0,
-            )
+            if refreshed:
+                cache_quota(
+                    key_id=self._key_id,
+                    daily_used=daily_used,
+                    daily_limit=daily_limit,
+                    tier=self._license_tier,
+                    status=self._license_status,
+                    expires_at_ts=self._license_expires_at or 0,
+                )
         except Exception:
             pass  # Don't fail on caching
 
@@ -253,11 +232,20 @@ class RaasLicenseGate:
         if not license_key.startswith("raasjwt-"):
             return False, None, None
 
-        # Validate JWT
-        is_valid, payload, error = validate_jwt_license(license_key)
+        # Claims verified earlier (any process) stay valid until the token's exp
+        try:
+            payload = self.cache.get_claims(license_key)
+        except Exception:
+            payload = None
 
-        if not is_valid:
-            return False, error, None
+        if payload is None:
+            is_valid, payload, error = validate_jwt_license(license_key)
+            if not is_valid:
+                return False, error, None
+            try:
+                self.cache.put_claims(license_key, payload)
+            except Exception:
+                pass  # Cache is an optimisation only
 
         # Extract info from payload
         self._jwt_payload = payload
@@ -441,14 +429,16 @@ class RaasLicenseGate:
         Check license and quota for command execution.
 
         Validation sequence:
-        1. Check if JWT token (raasjwt-*) → validate offline with RSA public key
+        1. Check if JWT token (raasjwt-*) → verified claims from the decision
+           cache, else validate offline with RSA public key and cache them
         2. Check cached license status (revoked/expired) - FAST (< 10ms)
         3. Validate license format
         4. Validate with remote API (or local fallback)
         5. Check grace period if remote unavailable
         6. Check rate limits (sliding window)
-        7. Check monthly quota (PostgreSQL backend)
-        8. Check daily quota (PostgreSQL backend)
+        7. Check monthly and daily quota against a cached usage snapshot
+           (refreshed from PostgreSQL every few seconds) plus local pending usage
+        8. Record usage locally; it is flushed to PostgreSQL in the background
 
         Args:
             command: Command name to check
@@ -461,48 +451,56 @@ class RaasLicenseGate:
             - Caches quota state for 5 minutes
             - Records violation if blocked
             - Logs all validation attempts
+            - Records the gate latency of premium commands
         """
-        import time
+        if self.is_free_command(command) or not self.is_premium_command(command):
+            return True, None
+
+        start = time.perf_counter()
+        allowed, error = self._check_premium(command)
+        try:
+            self.cache.record_latency(
+                command, "allowed" if allowed else "denied", (time.perf_counter() - start) * 1000,
+            )
+        except Exception:
+            pass  # Instrumentation must never block a command
+        return allowed, error
+
+    def _check_premium(self, command: str) -> Tuple[bool, Optional[str]]:
+        """Run the validation sequence documented on :meth:`check`."""
         start_time = time.time()
         offline_mode = False
         grace_period_remaining = None
 
-        if self.is_free_command(command):
-            return True, None
-
-        if self.is_premium_command(command):
-            if not self.has_license:
-                return False, get_upgrade_message(command)
-
-            # PHASE 7: Check if JWT token (raasjwt-*)
-            if self._license_key and self._license_key.startswith("raasjwt-"):
-                jwt_valid, jwt_error, jwt_payload = self._validate_jwt_token(self._license_key)
-                if not jwt_valid:
-                    return False, format_jwt_error(jwt_error or "Invalid JWT token")
-
-                # JWT valid - extract quotas from payload
-                self._jwt_payload = jwt_payload
-                quotas = jwt_payload.get("quotas", {})
-                self._license_tier = jwt_payload.get("tier")
-                self._key_id = jwt_payload.get("key_id")
-
-                # Use embedded quotas from JWT
-                tier_limits = {
-                    "daily": quotas.get("commands_per_day", 10),
-                    "monthly": quotas.get("commands_per_month", 300),
-                }
-
-                # Check quota from JWT payload (offline - no DB needed)
-                # Note: For full offline mode, we track usage in local cache
-                # For hybrid mode, we still check PostgreSQL
-                if self._enable_remote:
-                    # Hybrid mode: check PostgreSQL for usage tracking
-                    pass  # Continue to quota check below
-                else:
-                    # Full offline mode: skip DB checks, trust JWT quotas
-                    self._validated = True
-                    return True, None
-
+        if not self.has_license:
+            return False, get_upgrade_message(command)
+
+        usage_limits: Optional[Dict[str, Any]] = None
+
+        # PHASE 7: Check if JWT token (raasjwt-*)
+        if self._license_key and self._license_key.startswith("raasjwt-"):
+            jwt_valid, jwt_error, jwt_payload = self._validate_jwt_token(self._license_key)
+            if not jwt_valid:
+                return False, format_jwt_error(jwt_error or "Invalid JWT token")
+
+            # JWT valid - extract quotas from payload
+            self._jwt_payload = jwt_payload
+            quotas = jwt_payload.get("quotas", {})
+            self._license_tier = jwt_payload.get("tier")
+            self._key_id = jwt_payload.get("key_id")
+
+            # Use embedded quotas from JWT
+            usage_limits = {
+                "commands_per_day": quotas.get("commands_per_day", 10),
+                "monthly": quotas.get("commands_per_month", 300),
+            }
+
+            if not self._enable_remote:
+                # Full offline mode: skip DB checks, trust JWT quotas
+                self._validated = True
+                return True, None
+            # Hybrid mode: the signature is the validation; only quota remains
+        else:
             # Validate format (non-JWT licenses)
             is_valid, error = self.validate_license_format()
             if not is_valid:
@@ -557,121 +555,163 @@ class RaasLicenseGate:
                 )
                 return False, f"License validation failed: {error}"
 
-            # Phase 6: Check quota and rate limits BEFORE allowing
-            if self._key_id and self._license_tier:
-                tier_limits = TIER_LIMITS.get(self._license_tier, TIER_LIMITS["free"])
+            if self._license_tier:
+                usage_limits = get_tier_limits(self._license_tier)
 
-                # Check rate limit first (sliding window)
-                self._rate_limiter = CreditRateLimiter(
-                    daily_limit=tier_limits["daily"],
-                    monthly_limit=tier_limits["monthly"],
-                )
+        # Phase 6: Check quota and rate limits BEFORE allowing
+        if self._key_id and self._license_tier:
+            quota_error = self._enforce_quota(command, usage_limits or {})
+            if quota_error:
+                return False, quota_error
 
-                rate_status = self._rate_limiter.check_limit(self._key_id)
+        self._validated = True
 
-                if not rate_status.allowed:
-                    # Record violation for analytics
-                    violation = ViolationEvent(
-                        key_id=self._key_id,
-                        tier=self._license_tier,
-                        violation_type="rate_limit",
-                        command=command,
-                        daily_used=rate_status.daily_used,
-                        daily_limit=rate_status.daily_limit,
-                        monthly_used=rate_status.monthly_used,
-                        monthly_limit=rate_status.monthly_limit,
-                        retry_after_seconds=rate_status.retry_after_seconds,
-                    )
-                    # Fire and forget - Fix 3: Use _run_async_safe instead of asyncio.run()
-                    try:
-                        _run_async_safe(get_violation_tracker().record_violation(violation))
-                    except Exception:
-                        pass
+        # Log successful validation off the hot path
+        duration_ms = (time.time() - start_time) * 1000
+        try:
+            log = ValidationLog(
+                key_id=self._key_id or "unknown",
+                result="offline_grace" if offline_mode else "success",
+                command=command,
+                duration_ms=duration_ms,
+                offline_mode=offline_mode,
+                grace_period_remaining=grace_period_remaining,
+            )
+            get_background_loop().submit(lambda: get_validation_logger().log_validation(log))
+        except Exception:
+            pass  # Don't fail on logging
 
-                    ctx = QuotaErrorContext(
-                        tier=self._license_tier,
-                        daily_used=rate_status.daily_used,
-                        daily_limit=rate_status.daily_limit,
-                        command=command,
-                        monthly_used=rate_status.monthly_used,
-                        monthly_limit=rate_status.monthly_limit,
-                        retry_after_seconds=rate_status.retry_after_seconds,
-                        violation_type="rate_limit",
-                    )
-                    return False, format_quota_error(ctx)
-
-                # Check monthly and daily quota (PostgreSQL backend)
-                # Fix 2: Use command cost tiers instead of always 1 credit
-                command_cost = self.get_command_cost(command)
-                allowed, usage_error = record_usage(self._key_id, self._license_tier, commands_count=command_cost)
-                if not allowed:
-                    # Record violation for analytics
-                    usage_parts = usage_error.split("/")
-                    daily_used_val = (
-                        int(usage_parts[0].split(":")[1].strip())
-                        if ":" in usage_parts[0] and len(usage_parts) > 0
-                        else 0
-                    )
-                    violation = ViolationEvent(
-                        key_id=self._key_id,
-                        tier=self._license_tier,
-                        violation_type="quota_exceeded",
-                        command=command,
-                        daily_used=daily_used_val,
-                        daily_limit=tier_limits["daily"],
-                        monthly_used=int(usage_parts[0].strip()) if "Monthly" in usage_error else 0,
-                        monthly_limit=tier_limits["monthly"],
-                        retry_after_seconds=None,
-                    )
-                    try:
-                        _run_async_safe(get_violation_tracker().record_violation(violation))
-                    except Exception:
-                        pass
+        return True, None
 
-                    ctx = QuotaErrorContext(
-                        tier=self._license_tier,
-                        daily_used=daily_used_val,
-                        daily_limit=tier_limits["daily"],
-                        command=command,
-                        monthly_used=int(usage_parts[0].strip()) if "Monthly" in usage_error else 0,
-                        monthly_limit=tier_limits["monthly"],
-                        violation_type="quota_exceeded",
-                    )
+    def _rate_limiter_for(self, tier_limits: Dict[str, int]) -> CreditRateLimiter:
+        """Reuse the limiter across checks; rebuild only when the tier changes."""
+        limiter = self._rate_limiter
+        if (
+            limiter is None
+            or limiter.daily_limit != tier_limits["daily"]
+            or limiter.monthly_limit != tier_limits["monthly"]
+        ):
+            limiter = CreditRateLimiter(
+                daily_limit=tier_limits["daily"],
+                monthly_limit=tier_limits["monthly"],
+            )
+            self._rate_limiter = limiter
+        return limiter
+
+    def _quota_snapshot(self, key_id: str) -> Tuple[Optional[QuotaSnapshot], bool]:
+        """
+        Cached usage counters for ``key_id``, fetched from the backend on a miss.
+
+        Returns:
+            (snapshot or None when the backend is unavailable, refreshed)
+        """
+        cache = self.cache
+        snapshot = cache.get_snapshot(key_id)
+        if snapshot is not None or cache.fetch_backed_off(key_id):
+            return snapshot, False
+        try:
+            counters = get_background_loop().submit(
+                lambda: get_meter().get_quota_snapshot(key_id)
+            ).result(timeout=self.QUOTA_FETCH_TIMEOUT)
+        except Exception as e:
+            logger.debug("Quota snapshot fetch failed for %s: %s", key_id, e)
+            cache.note_fetch_failed(key_id)
+            return None, False
+        return cache.put_snapshot(key_id, counters["daily_used"], counters["monthly_used"]), True
+
+    def _record_violation(self, violation: ViolationEvent) -> None:
+        """Send a violation to analytics without waiting for it."""
+        try:
+            get_background_loop().submit(lambda: get_violation_tracker().record_violation(violation))
+        except Exception:
+            pass
 
-                # SUCCESS: Cache quota state and check for warnings
-                self._show_quota_warning(command, tier_limits)
+    def _enforce_quota(self, command: str, usage_limits: Dict[str, Any]) -> Optional[str]:
+        """
+        Rate-limit and quota checks for a validated license.
+
+        Returns:
+            Formatted error when the command must be blocked, else None
+        """
+        key_id, tier = self._key_id, self._license_tier
+        tier_limits = TIER_LIMITS.get(tier, TIER_LIMITS["free"])
+
+        # Check rate limit first (sliding window)
+        rate_status = self._rate_limiter_for(tier_limits).check_limit(key_id)
+        if not rate_status.allowed:
+            self._record_violation(ViolationEvent(
+                key_id=key_id,
+                tier=tier,
+                violation_type="rate_limit",
+                command=command,
+                daily_used=rate_status.daily_used,
+                daily_limit=rate_status.daily_limit,
+                monthly_used=rate_status.monthly_used,
+                monthly_limit=rate_status.monthly_limit,
+                retry_after_seconds=rate_status.retry_after_seconds,
+            ))
+            return format_quota_error(QuotaErrorContext(
+                tier=tier,
+                daily_used=rate_status.daily_used,
+                daily_limit=rate_status.daily_limit,
+                command=command,
+                monthly_used=rate_status.monthly_used,
+                monthly_limit=rate_status.monthly_limit,
+                retry_after_seconds=rate_status.retry_after_seconds,
+                violation_type="rate_limit",
+            ))
+
+        # Check monthly and daily quota: cached backend counters plus usage
+        # recorded locally that hasn't been flushed yet. Fails open when the
+        # usage backend is unreachable.
+        # Fix 2: Use command cost tiers instead of always 1 credit
+        command_cost = self.get_command_cost(command)
+        cache = self.cache
+        snapshot, refreshed = self._quota_snapshot(key_id)
+        if snapshot is not None:
+            pending = cache.pending_usage(key_id)
+            daily_used = snapshot.daily_used + pending
+            monthly_used = snapshot.monthly_used + pending
+            usage_error = UsageMeter.quota_error(usage_limits, daily_used, monthly_used)
+            if usage_error:
+                self._record_violation(ViolationEvent(
+                    key_id=key_id,
+                    tier=tier,
+                    violation_type="quota_exceeded",
+                    command=command,
+                    daily_used=daily_used,
+                    daily_limit=usage_limits.get("commands_per_day", tier_limits["daily"]),
+                    monthly_used=monthly_used,
+                    monthly_limit=usage_limits.get("monthly", tier_limits["monthly"]),
+                    retry_after_seconds=None,
+                ))
+                return format_quota_error(QuotaErrorContext(
+                    tier=tier,
+                    daily_used=daily_used,
+                    daily_limit=usage_limits.get("commands_per_day", tier_limits["daily"]),
+                    command=command,
+                    monthly_used=monthly_used,
+                    monthly_limit=usage_limits.get("monthly", tier_limits["monthly"]),
+                    violation_type="quota_exceeded",
+                ))
 
-                # Fix 4: Track free tier usage for analytics
-                if self._license_tier == "free" and self._key_id:
-                    try:
-                        track_free_tier_command(
-                            key_id=self._key_id,
-                            command=command,
-                            command_cost=command_cost,
-                        )
-                    except Exception:
-                        pass  # Don't fail on analytics
+            # SUCCESS: Cache quota state and check for warnings
+            self._show_quota_warning(command, tier_limits, daily_used, refreshed=refreshed)
 
-            self._validated = True
+        cache.add_usage(key_id, command_cost)
+        schedule_usage_flush(cache)
 
-            # Log successful validation - Fix 3: Use _run_async_safe instead of asyncio.run()
-            duration_ms = (time.time() - start_time) * 1000
+        # Fix 4: Track free tier usage for analytics
+        if tier == "free":
             try:
-                log = ValidationLog(
-                    key_id=self._key_id or "unknown",
-                    result="offline_grace" if offline_mode else "success",
+                track_free_tier_command(
+                    key_id=key_id,
                     command=command,
-                    duration_ms=duration_ms,
-                    offline_mode=offline_mode,
-                    grace_period_remaining=grace_period_remaining,
+                    command_cost=command_cost,
                 )
-                _run_async_safe(get_validation_logger().log_validation(log))
             except Exception:
-                pass  # Don't fail on logging
-
-            return True, None
-
-        return True, None
+                pass  # Don't fail on analytics
+        return None
 
     def get_license_info(self) -> dict:
         if not self.has_license:
@@ -878,4 +918,6 @@ __all__ = [
     "LicenseService",
     "LicenseTier",
     "PREMIUM_FEATURES",
+    # re-exported; callers and tests patch it here
+    "record_usage",
 ]
@@ -0,0 +1,534 @@
+"""
+RaaS License Gate - Decision Cache
+
+Layered cache behind ``RaasLicenseGate.check`` so premium commands don't pay
+for RSA verification, quota queries and analytics round-trips on every run:
+
+- Verified JWT claims, keyed by token hash and kept until the token's ``exp``
+- Quota snapshots (daily/monthly usage per key_id) with a short TTL
+- Usage increments recorded locally and flushed to the backend in batches,
+  in the background or at process exit
+- Gate latency samples for p50/p99 reporting
+
+Each layer is an in-process dict in front of one SQLite (WAL) file shared by
+every CLI process, so a fresh ``mekong`` invocation still hits warm entries.
+The cache file lives next to the rest of the local RaaS state and is trusted
+to the same degree as the JWT public key on disk.
+"""
+
+import asyncio
+import atexit
+import hashlib
+import json
+import logging
+import math
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DB_PATH = Path.home() / ".mekong" / "raas" / "gate_cache.db"
+
+# Quota snapshots older than this are re-fetched from the usage backend
+QUOTA_TTL_SECONDS = 30
+# A failed quota fetch is not retried for this long (fail open meanwhile)
+FETCH_BACKOFF_SECONDS = 30
+# Claimed-but-unacknowledged usage rows become flushable again after this
+CLAIM_TIMEOUT_SECONDS = 60
+# Long-running processes push pending usage at most this often
+FLUSH_INTERVAL_SECONDS = 30
+# Latency samples kept on disk
+MAX_LATENCY_SAMPLES = 5000
+
+_DDL = """
+CREATE TABLE IF NOT EXISTS jwt_claims (
+    token_hash  TEXT PRIMARY KEY,
+    claims      TEXT NOT NULL,
+    exp         REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS quota_snapshots (
+    key_id        TEXT PRIMARY KEY,
+    daily_used    INTEGER NOT NULL,
+    monthly_used  INTEGER NOT NULL,
+    fetched_at    REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS pending_usage (
+    id          INTEGER PRIMARY KEY AUTOINCREMENT,
+    key_id      TEXT NOT NULL,
+    credits     INTEGER NOT NULL,
+    created_at  REAL NOT NULL,
+    claimed_by  TEXT,
+    claimed_at  REAL
+);
+CREATE INDEX IF NOT EXISTS idx_pending_usage_key ON pending_usage (key_id);
+CREATE TABLE IF NOT EXISTS gate_latency (
+    id           INTEGER PRIMARY KEY AUTOINCREMENT,
+    command      TEXT NOT NULL,
+    outcome      TEXT NOT NULL,
+    duration_ms  REAL NOT NULL,
+    recorded_at  REAL NOT NULL
+);
+"""
+
+
+@dataclass(frozen=True)
+class QuotaSnapshot:
+    """Backend usage counters for one key, as of ``fetched_at``."""
+
+    key_id: str
+    daily_used: int
+    monthly_used: int
+    fetched_at: float
+
+    def is_fresh(self, ttl: float = QUOTA_TTL_SECONDS, now: Optional[float] = None) -> bool:
+        return ((now or time.time()) - self.fetched_at) < ttl
+
+
+def token_hash(token: str) -> str:
+    """Stable cache key for a license token (the token itself is never stored)."""
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of ``values`` (0.0 when empty)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100.0 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+class GateCache:
+    """
+    Shared SQLite cache for license gate decisions.
+
+    Args:
+        db_path: SQLite file (``None`` keeps everything in memory)
+        quota_ttl: Seconds a quota snapshot stays valid
+    """
+
+    def __init__(self, db_path: Optional[Path] = DB_PATH, quota_ttl: float = QUOTA_TTL_SECONDS) -> None:
+        self._quota_ttl = quota_ttl
+        self._lock = threading.RLock()
+        self._claims: Dict[str, Dict[str, Any]] = {}
+        self._snapshots: Dict[str, QuotaSnapshot] = {}
+        self._fetch_failed: Dict[str, float] = {}
+        self._latency: List[tuple] = []
+        self._last_flush = time.monotonic()
+        self._dirty = False
+        self._worker_id = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        target = ":memory:"
+        if db_path is not None:
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+            target = str(db_path)
+        try:
+            self._conn = sqlite3.connect(target, timeout=10, check_same_thread=False, isolation_level=None)
+            self._conn.row_factory = sqlite3.Row
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_DDL)
+        except sqlite3.Error as exc:
+            raise RuntimeError(f"Failed to initialise gate cache DB: {exc}") from exc
+
+    @property
+    def quota_ttl(self) -> float:
+        return self._quota_ttl
+
+    @property
+    def dirty(self) -> bool:
+        """True once this process has recorded usage."""
+        return self._dirty
+
+    # ===== JWT claims =====
+
+    def get_claims(self, token: str, now: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Verified claims for ``token``, or None if unknown or past ``exp``."""
+        now = now or time.time()
+        key = token_hash(token)
+        with self._lock:
+            claims = self._claims.get(key)
+            if claims is None:
+                row = self._conn.execute(
+                    "SELECT claims, exp FROM jwt_claims WHERE token_hash = ? AND exp > ?", (key, now),
+                ).fetchone()
+                if row is None:
+                    return None
+                claims = json.loads(row["claims"])
+                self._claims[key] = claims
+        if claims.get("exp", 0) <= now:
+            self.forget_claims(token)
+            return None
+        return claims
+
+    def put_claims(self, token: str, claims: Dict[str, Any]) -> None:
+        """Remember claims that passed signature verification."""
+        exp = claims.get("exp")
+        if not exp:
+            return  # Never cache a token that doesn't expire
+        key = token_hash(token)
+        with self._lock:
+            self._claims[key] = claims
+            self._conn.execute(
+                "INSERT OR REPLACE INTO jwt_claims (token_hash, claims, exp) VALUES (?, ?, ?)",
+                (key, json.dumps(claims, default=str), float(exp)),
+            )
+            self._conn.execute("DELETE FROM jwt_claims WHERE exp <= ?", (time.time(),))
+
+    def forget_claims(self, token: str) -> None:
+        key = token_hash(token)
+        with self._lock:
+            self._claims.pop(key, None)
+            self._conn.execute("DELETE FROM jwt_claims WHERE token_hash = ?", (key,))
+
+    # ===== Quota snapshots =====
+
+    def get_snapshot(self, key_id: str, now: Optional[float] = None) -> Optional[QuotaSnapshot]:
+        """Fresh snapshot for ``key_id``, or None if missing or stale."""
+        now = now or time.time()
+        with self._lock:
+            snap = self._snapshots.get(key_id)
+            if snap is None or not snap.is_fresh(self._quota_ttl, now):
+                row = self._conn.execute(
+                    "SELECT * FROM quota_snapshots WHERE key_id = ?", (key_id,),
+                ).fetchone()
+                if row is None:
+                    return None
+                snap = QuotaSnapshot(
+                    key_id, row["daily_used"], row["monthly_used"], row["fetched_at"],
+                )
+                self._snapshots[key_id] = snap
+        return snap if snap.is_fresh(self._quota_ttl, now) else None
+
+    def put_snapshot(self, key_id: str, daily_used: int, monthly_used: int) -> QuotaSnapshot:
+        snap = QuotaSnapshot(key_id, int(daily_used), int(monthly_used), time.time())
+        with self._lock:
+            self._snapshots[key_id] = snap
+            self._fetch_failed.pop(key_id, None)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO quota_snapshots (key_id, daily_used, monthly_used, fetched_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key_id, snap.daily_used, snap.monthly_used, snap.fetched_at),
+            )
+        return snap
+
+    def invalidate_snapshot(self, key_id: str) -> None:
+        with self._lock:
+            self._snapshots.pop(key_id, None)
+            self._conn.execute("DELETE FROM quota_snapshots WHERE key_id = ?", (key_id,))
+
+    def note_fetch_failed(self, key_id: str) -> None:
+        with self._lock:
+            self._fetch_failed[key_id] = time.time() + FETCH_BACKOFF_SECONDS
+
+    def fetch_backed_off(self, key_id: str) -> bool:
+        """True while a recent fetch failure says not to retry yet."""
+        with self._lock:
+            return self._fetch_failed.get(key_id, 0.0) > time.time()
+
+    # ===== Pending usage =====
+
+    def add_usage(self, key_id: str, credits: int) -> None:
+        """Record credits locally; they reach the backend on the next flush."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO pending_usage (key_id, credits, created_at) VALUES (?, ?, ?)",
+                (key_id, int(credits), time.time()),
+            )
+            self._dirty = True
+
+    def pending_usage(self, key_id: str) -> int:
+        """Credits recorded locally for ``key_id`` but not yet flushed."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT COALESCE(SUM(credits), 0) FROM pending_usage WHERE key_id = ?", (key_id,),
+            ).fetchone()
+        return int(row[0])
+
+    def has_pending_usage(self) -> bool:
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM pending_usage LIMIT 1").fetchone() is not None
+
+    def flush_due(self, interval: float) -> bool:
+        """True (and restart the interval) when a periodic flush should run."""
+        with self._lock:
+            now = time.monotonic()
+            if now - self._last_flush < interval:
+                return False
+            self._last_flush = now
+            return True
+
+    def claim_usage(self) -> Dict[str, int]:
+        """Claim unflushed usage for this process, summed per key_id."""
+        now = time.time()
+        with self._lock:
+            rows = self._conn.execute(
+                "UPDATE pending_usage SET claimed_by = ?, claimed_at = ? "
+                "WHERE claimed_by IS NULL OR claimed_at < ? RETURNING key_id, credits",
+                (self._worker_id, now, now - CLAIM_TIMEOUT_SECONDS),
+            ).fetchall()
+        totals: Dict[str, int] = {}
+        for row in rows:
+            totals[row["key_id"]] = totals.get(row["key_id"], 0) + row["credits"]
+        return totals
+
+    def ack_usage(self, key_id: str, credits: int, sent_at: float) -> None:
+        """Drop flushed rows and fold them into snapshots taken before the send."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    "DELETE FROM pending_usage WHERE key_id = ? AND claimed_by = ?",
+                    (key_id, self._worker_id),
+                )
+                self._conn.execute(
+                    "UPDATE quota_snapshots SET daily_used = daily_used + ?, "
+                    "monthly_used = monthly_used + ? WHERE key_id = ? AND fetched_at <= ?",
+                    (credits, credits, key_id, sent_at),
+                )
+                self._conn.execute("COMMIT")
+            except sqlite3.Error:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._snapshots.pop(key_id, None)
+
+    def release_usage(self, key_id: str) -> None:
+        """Return claimed rows after a failed send so a later flush retries them."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE pending_usage SET claimed_by = NULL, claimed_at = NULL "
+                "WHERE key_id = ? AND claimed_by = ?",
+                (key_id, self._worker_id),
+            )
+
+    # ===== Latency =====
+
+    def record_latency(self, command: str, outcome: str, duration_ms: float) -> None:
+        """Buffer one gate timing sample (written out by :meth:`flush_latency`)."""
+        with self._lock:
+            self._latency.append((command, outcome, duration_ms, time.time()))
+            flush = len(self._latency) >= 100
+        if flush:
+            self.flush_latency()
+
+    def flush_latency(self) -> int:
+        with self._lock:
+            samples, self._latency = self._latency, []
+            if not samples:
+                return 0
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(
+                    "INSERT INTO gate_latency (command, outcome, duration_ms, recorded_at) VALUES (?, ?, ?, ?)",
+                    samples,
+                )
+                self._conn.execute(
+                    "DELETE FROM gate_latency WHERE id <= (SELECT MAX(id) FROM gate_latency) - ?",
+                    (MAX_LATENCY_SAMPLES,),
+                )
+                self._conn.execute("COMMIT")
+            except sqlite3.Error:
+                self._conn.execute("ROLLBACK")
+                raise
+        return len(samples)
+
+    def latency_stats(self, command: Optional[str] = None) -> Dict[str, Any]:
+        """p50/p99/max gate latency over the retained samples."""
+        self.flush_latency()
+        query = "SELECT outcome, duration_ms FROM gate_latency"
+        params: tuple = ()
+        if command:
+            query += " WHERE command = ?"
+            params = (command,)
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        durations = [row["duration_ms"] for row in rows]
+        outcomes: Dict[str, int] = {}
+        for row in rows:
+            outcomes[row["outcome"]] = outcomes.get(row["outcome"], 0) + 1
+        return {
+            "count": len(durations),
+            "p50_ms": round(percentile(durations, 50), 3),
+            "p99_ms": round(percentile(durations, 99), 3),
+            "max_ms": round(max(durations), 3) if durations else 0.0,
+            "outcomes": outcomes,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            try:
+                self.flush_latency()
+            except sqlite3.Error:
+                pass
+            self._conn.close()
+
+
+class BackgroundLoop:
+    """
+    One daemon thread running an asyncio loop for fire-and-forget coroutines
+    (analytics, usage flushes), instead of a fresh event loop per call.
+    """
+
+    def __init__(self) -> None:
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+        self._pending: set = set()
+
+    def _ensure(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="raas-gate-bg", daemon=True).start()
+                self._loop = loop
+            return self._loop
+
+    def submit(self, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Schedule ``factory()`` on the loop thread.
+
+        The coroutine is built on the loop thread, so constructing it (and
+        any client it needs) stays off the caller's hot path.
+
+        Returns:
+            concurrent.futures.Future for the result
+        """
+        async def _run() -> Any:
+            return await factory()
+
+        future = asyncio.run_coroutine_threadsafe(_run(), self._ensure())
+        with self._lock:
+            self._pending.add(future)
+        future.add_done_callback(self._done)
+        return future
+
+    def _done(self, future: Any) -> None:
+        with self._lock:
+            self._pending.discard(future)
+        if not future.cancelled() and future.exception() is not None:
+            logger.debug("RaaS gate background task failed: %s", future.exception())
+
+    def drain(self, timeout: float = 2.0) -> bool:
+        """Wait up to ``timeout`` seconds for submitted work; True if all finished."""
+        deadline = time.monotonic() + timeout
+        while True:
+            with self._lock:
+                pending = list(self._pending)
+            if not pending:
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            try:
+                pending[0].result(timeout=remaining)
+            except Exception:
+                pass
+
+
+async def _send_usage(key_id: str, credits: int) -> None:
+    from src.lib.usage_meter import get_meter
+
+    await get_meter().add_usage(key_id, credits)
+
+
+async def flush_usage_async(
+    cache: GateCache, send: Callable[[str, int], Awaitable[Any]] = _send_usage,
+) -> int:
+    """
+    Push claimed usage to the backend via ``send(key_id, credits)``.
+
+    Rows whose send fails are released for the next flush.
+
+    Returns:
+        Credits acknowledged by the backend
+    """
+    sent = 0
+    for key_id, credits in cache.claim_usage().items():
+        sent_at = time.time()
+        try:
+            await send(key_id, credits)
+        except Exception as exc:
+            logger.debug("RaaS usage flush for %s failed: %s", key_id, exc)
+            cache.release_usage(key_id)
+            continue
+        cache.ack_usage(key_id, credits, sent_at)
+        sent += credits
+    return sent
+
+
+def flush_usage(
+    cache: Optional[GateCache] = None,
+    send: Callable[[str, int], Awaitable[Any]] = _send_usage,
+    timeout: float = 5.0,
+) -> int:
+    """Flush pending usage on the background loop and wait for the result."""
+    cache = cache or get_gate_cache()
+    return get_background_loop().submit(lambda: flush_usage_async(cache, send)).result(timeout=timeout)
+
+
+def schedule_usage_flush(cache: GateCache, interval: float = FLUSH_INTERVAL_SECONDS) -> bool:
+    """Start a background flush if none ran in the last ``interval`` seconds."""
+    if not cache.flush_due(interval):
+        return False
+    get_background_loop().submit(lambda: flush_usage_async(cache))
+    return True
+
+
+_cache: Optional[GateCache] = None
+_loop: Optional[BackgroundLoop] = None
+_singleton_lock = threading.Lock()
+
+
+def get_gate_cache() -> GateCache:
+    """Return the process-wide GateCache (created on first use)."""
+    global _cache
+    with _singleton_lock:
+        if _cache is None:
+            _cache = GateCache(Path(os.environ.get("MEKONG_GATE_CACHE_DB", DB_PATH)))
+        return _cache
+
+
+def get_background_loop() -> BackgroundLoop:
+    """Return the process-wide BackgroundLoop (thread starts on first submit)."""
+    global _loop
+    with _singleton_lock:
+        if _loop is None:
+            _loop = BackgroundLoop()
+        return _loop
+
+
+def _flush_at_exit() -> None:
+    if _cache is None:
+        return
+    try:
+        if _loop is not None:
+            _loop.drain()
+        _cache.flush_latency()
+        # Only processes that ran premium commands pay for the flush
+        if _cache.dirty and _cache.has_pending_usage():
+            flush_usage(_cache, timeout=2.0)
+    except Exception as exc:  # Never fail interpreter shutdown
+        logger.debug("RaaS gate cache exit flush failed: %s", exc)
+
+
+atexit.register(_flush_at_exit)
+
+
+__all__ = [
+    "BackgroundLoop",
+    "DB_PATH",
+    "GateCache",
+    "QUOTA_TTL_SECONDS",
+    "QuotaSnapshot",
+    "flush_usage",
+    "flush_usage_async",
+    "get_background_loop",
+    "get_gate_cache",
+    "percentile",
+    "schedule_usage_flush",
+    "token_hash",
+]
@@ -43,26 +43,61 @@ class UsageMeter:
         limits = get_tier_limits(tier)
 
         # Check monthly limit FIRST (30-day rolling window)
-        max_monthly = limits.get("monthly", 0)
-        if max_monthly > 0:
+        monthly_used = 0
+        if limits.get("monthly", 0) > 0:
             monthly_usage = await self._repo.get_usage_summary(key_id, days=30)
             monthly_used = monthly_usage.get("total_commands", 0)
 
-            if monthly_used >= max_monthly:
-                return False, f"Monthly limit reached: {monthly_used}/{max_monthly}"
-
-        # Then check daily limit
-        max_daily = limits["commands_per_day"]
         usage = await self._repo.get_usage(key_id)
         daily_used = usage["commands_count"] if usage else 0
 
-        if max_daily >= 0 and daily_used >= max_daily:
-            return False, f"Daily limit reached: {daily_used}/{max_daily}"
+        error = self.quota_error(limits, daily_used, monthly_used)
+        if error:
+            return False, error
 
         # Record usage
         await self._repo.record_usage(key_id, commands_count=commands_count)
         return True, ""
 
+    @staticmethod
+    def quota_error(limits: Dict, daily_used: int, monthly_used: int) -> str:
+        """
+        Check usage counters against tier limits (monthly first, then daily).
+
+        Args:
+            limits: Tier limits with ``commands_per_day`` and optional ``monthly``
+            daily_used: Commands used today
+            monthly_used: Commands used in the last 30 days
+
+        Returns:
+            Error message, or empty string when within quota
+        """
+        max_monthly = limits.get("monthly", 0)
+        if max_monthly > 0 and monthly_used >= max_monthly:
+            return f"Monthly limit reached: {monthly_used}/{max_monthly}"
+        max_daily = limits.get("commands_per_day", -1)
+        if max_daily >= 0 and daily_used >= max_daily:
+            return f"Daily limit reached: {daily_used}/{max_daily}"
+        return ""
+
+    async def get_quota_snapshot(self, key_id: str) -> Dict[str, int]:
+        """
+        Current usage counters for a key, for caching by the license gate.
+
+        Returns:
+            Dict with ``daily_used`` and ``monthly_used``
+        """
+        usage = await self._repo.get_usage(key_id)
+        monthly = await self._repo.get_usage_summary(key_id, days=30)
+        return {
+            "daily_used": usage["commands_count"] if usage else 0,
+            "monthly_used": monthly.get("total_commands", 0) if monthly else 0,
+        }
+
+    async def add_usage(self, key_id: str, commands_count: int) -> None:
+        """Record usage that was already admitted (no quota check)."""
+        await self._repo.record_usage(key_id, commands_count=commands_count)
+
     async def get_usage(self, key_id: str) -> Optional[Dict]:
         """Get usage record for a key."""
         return await self._repo.get_usage(key_id)
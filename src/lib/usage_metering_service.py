@@ -2,15 +2,18 @@
 Usage Metering Service — ROIaaS Phase 4
 
 Production-ready service for tracking API calls, feature usage, and runtime durations.
-Buffers events locally with SQLite, batches transmission to analytics backend.
-Implements retry logic, circuit breaker, and HMAC-SHA256 authentication.
+Buffers events locally with SQLite; a background uploader ships them to the
+analytics backend in large batches over one pooled client (gzip opt-in).
+Implements retry backoff, circuit breaker, and HMAC-SHA256 authentication.
 """
 
+import gzip
 import hashlib
 import hmac
 import json
 import os
 import sqlite3
+import threading
 import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
@@ -180,6 +183,22 @@ class CircuitBreaker:
                 )
 
 
+@dataclass
+class UploaderStats:
+    """Background uploader counters, surfaced through ``get_stats()``."""
+    events_enqueued: int = 0
+    events_uploaded: int = 0
+    events_rejected: int = 0
+    batches_sent: int = 0
+    batches_failed: int = 0
+    bytes_raw: int = 0
+    bytes_sent: int = 0
+    last_batch_size: int = 0
+    last_upload_ms: int = 0
+    consecutive_failures: int = 0
+    pending_high_water: int = 0
+
+
 class UsageMeteringService:
     """
     Production-ready usage metering service.
@@ -187,10 +206,12 @@ class UsageMeteringService:
     Features:
         - Track API calls, feature usage, runtime durations
         - SQLite local buffer (~/.mekong/metrics_buffer.db)
-        - Batch transmission with retry logic
+        - Background uploader: size- and time-triggered batches, one
+          pooled keep-alive HTTP client, optional gzip-compressed bodies
         - Circuit breaker for resilience
         - HMAC-SHA256 authentication
-        - Exponential backoff (1s → 2s → 4s → 8s → 16s)
+        - Exponential backoff (1s → 2s → 4s … max_backoff) scheduled on the
+          uploader thread, never slept on the caller's thread
     """
 
     def __init__(
@@ -198,10 +219,14 @@ class UsageMeteringService:
         db_path: Optional[str] = None,
         api_endpoint: Optional[str] = None,
         license_key: Optional[str] = None,
-        batch_size: int = 10,
+        batch_size: int = 500,
         flush_interval: float = 10.0,
         request_timeout: float = 30.0,
         max_retries: int = 5,
+        compress: bool = False,
+        max_backoff: float = 60.0,
+        max_rejections: int = 5,
+        background: bool = True,
     ) -> None:
         """
         Initialize usage metering service.
@@ -210,10 +235,16 @@ class UsageMeteringService:
             db_path: Path to SQLite database (default: ~/.mekong/metrics_buffer.db)
             api_endpoint: Analytics API endpoint URL
             license_key: RAAS license key for HMAC auth
-            batch_size: Number of events per batch
-            flush_interval: Seconds between automatic flushes
+            batch_size: Max events per upload; a full batch wakes the uploader
+            flush_interval: Seconds between time-triggered uploads
             request_timeout: HTTP request timeout in seconds
-            max_retries: Maximum retry attempts
+            max_retries: Attempts per batch during an explicit flush()
+            compress: Gzip request bodies (Content-Encoding: gzip). Opt-in:
+                the receiver must accept it; a 415 turns compression off
+            max_backoff: Upper bound for the uploader's retry delay in seconds
+            max_rejections: 4xx responses an event survives before it is
+                dead-lettered (status "failed"); until then it stays pending
+            background: Start the uploader thread on the first tracked event
         """
         # Database path
         if db_path is None:
@@ -228,27 +259,47 @@ class UsageMeteringService:
         # Batch configuration
         self._batch_size = batch_size
         self._flush_interval = flush_interval
+        self._compress = compress
+        self._max_backoff = max_backoff
+        self._max_rejections = max_rejections
+        self._background = background
 
-        # HTTP client
+        # HTTP client (created lazily, reused across batches)
         self._timeout = httpx.Timeout(request_timeout)
         self._max_retries = max_retries
+        self._client: Optional[httpx.Client] = None
 
         # Circuit breaker
         self._circuit_breaker = CircuitBreaker(failure_threshold=5, recovery_timeout=30.0)
 
-        # Connection
+        # Connection (shared by callers and the uploader thread)
         self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+
+        # Uploader state
+        self._send_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._retry_at = 0.0
+        self._pending_count = 0
+        self._stats = UploaderStats()
 
         # Logging
         self._logger = get_logger(__name__)
 
     def _get_connection(self) -> sqlite3.Connection:
         """Get or create SQLite connection."""
-        if self._conn is None:
-            self._conn = sqlite3.connect(self._db_path)
-            self._conn.row_factory = sqlite3.Row
-            self._init_db()
-        return self._conn
+        with self._lock:
+            if self._conn is None:
+                self._conn = sqlite3.connect(self._db_path, check_same_thread=False)
+                self._conn.row_factory = sqlite3.Row
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._init_db()
+                self._pending_count = self._conn.execute(
+                    "SELECT COUNT(*) FROM metrics_events WHERE status = 'pending'"
+                ).fetchone()[0]
+            return self._conn
 
     def _init_db(self) -> None:
         """Initialize database schema."""
@@ -263,10 +314,16 @@ class UsageMeteringService:
                 metadata TEXT,
                 status TEXT DEFAULT 'pending',
                 retry_count INTEGER DEFAULT 0,
+                rejection_count INTEGER DEFAULT 0,
                 last_error TEXT,
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
         """)
+        # Migration: rejection_count for databases created before it existed
+        try:
+            conn.execute("ALTER TABLE metrics_events ADD COLUMN rejection_count INTEGER DEFAULT 0")
+        except sqlite3.OperationalError:
+            pass  # Column already exists
         conn.execute("""
             CREATE TABLE IF NOT EXISTS metrics_batches (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -284,10 +341,63 @@ class UsageMeteringService:
         conn.commit()
 
     def close(self) -> None:
-        """Close database connection."""
-        if self._conn:
-            self._conn.close()
-            self._conn = None
+        """Stop the uploader and close the HTTP client and database."""
+        self.stop()
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+        with self._lock:
+            if self._conn:
+                self._conn.close()
+                self._conn = None
+
+    # ------------------------------------------------------------------
+    # Background uploader
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Start the background uploader thread (idempotent)."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run_uploader, name="metrics-uploader", daemon=True,
+            )
+            self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Signal the uploader to exit and wait for it."""
+        thread = self._thread
+        if thread is None:
+            return
+        self._stop.set()
+        self._wake.set()
+        thread.join(timeout)
+        self._thread = None
+
+    def _run_uploader(self) -> None:
+        """Upload on size trigger, every ``flush_interval``, or after backoff."""
+        while not self._stop.is_set():
+            self._wake.wait(max(self._flush_interval, self._retry_at - time.time()))
+            self._wake.clear()
+            if self._stop.is_set():
+                break
+            if time.time() < self._retry_at:
+                continue
+            try:
+                self._drain(attempts=1)
+            except Exception as e:
+                self._logger.error("metrics.uploader_error", error=str(e))
+
+    def _get_client(self) -> httpx.Client:
+        """Return the pooled keep-alive client, creating it on first use."""
+        if self._client is None:
+            self._client = httpx.Client(
+                timeout=self._timeout,
+                limits=httpx.Limits(max_connections=4, max_keepalive_connections=2),
+            )
+        return self._client
 
     def _generate_signature(self, payload: dict[str, Any]) -> str:
         """
@@ -311,6 +421,23 @@ class UsageMeteringService:
 
         return signature
 
+    def _encode(self, payload: dict[str, Any]) -> tuple[bytes, dict[str, str], int]:
+        """Serialize (canonically, as signed) and optionally gzip a payload.
+
+        Returns:
+            (body, headers, uncompressed size in bytes)
+        """
+        body = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
+        headers = {
+            "Content-Type": "application/json",
+            "X-Signature": self._generate_signature(payload),
+        }
+        raw_size = len(body)
+        if self._compress:
+            body = gzip.compress(body, compresslevel=6)
+            headers["Content-Encoding"] = "gzip"
+        return body, headers, raw_size
+
     def _log_api_call(
         self,
         tenant_id: str,
@@ -351,27 +478,44 @@ class UsageMeteringService:
             INSERT INTO metrics_events (event_type, tenant_id, timestamp, duration_ms, metadata)
             VALUES (?, ?, ?, ?, ?)
         """
-        conn.execute(
-            query,
-            (
-                event.event_type,
-                event.tenant_id,
-                event.timestamp,
-                event.duration_ms,
-                json.dumps(event.metadata),
-            ),
-        )
-        conn.commit()
-
-    def _send_batch(self, batch: MetricsBatch) -> bool:
+        with self._lock:
+            conn.execute(
+                query,
+                (
+                    event.event_type,
+                    event.tenant_id,
+                    event.timestamp,
+                    event.duration_ms,
+                    json.dumps(event.metadata),
+                ),
+            )
+            conn.commit()
+            self._stats.events_enqueued += 1
+            self._pending_count += 1
+            pending = self._pending_count
+            self._stats.pending_high_water = max(self._stats.pending_high_water, pending)
+
+        if self._background:
+            self.start()
+            # Size trigger; while backing off the uploader keeps its schedule
+            if pending >= self._batch_size and time.time() >= self._retry_at:
+                self._wake.set()
+
+    def _send_batch(self, batch: MetricsBatch, attempts: Optional[int] = None) -> str:
         """
-        Send batch to analytics API with retry logic.
+        Send batch to analytics API over the pooled client.
+
+        Attempts are made back-to-back; spacing retries out is the
+        uploader's job (see ``_retry_at``), so no call here ever sleeps.
 
         Args:
             batch: MetricsBatch to send
+            attempts: Max attempts (default: ``max_retries``)
 
         Returns:
-            True if successful, False otherwise
+            "sent" on HTTP 200, "rejected" on a 4xx (not retried here;
+            ``_drain`` keeps the events pending until ``max_rejections``),
+            "retry" otherwise
         """
         if not self._circuit_breaker.allow_request():
             self._logger.warning(
@@ -379,62 +523,64 @@ class UsageMeteringService:
                 reason="circuit_breaker_open",
                 batch_size=len(batch.events),
             )
-            return False
-
-        payload = batch.to_payload()
-        signature = self._generate_signature(payload)
-
-        headers = {
-            "Content-Type": "application/json",
-            "X-Signature": signature,
-        }
+            return "retry"
 
+        body, headers, raw_size = self._encode(batch.to_payload())
+        client = self._get_client()
+        max_attempts = attempts or self._max_retries
         last_error: Optional[str] = None
 
-        for attempt in range(self._max_retries):
+        for attempt in range(max_attempts):
+            if attempt and not self._circuit_breaker.allow_request():
+                break
             try:
                 start_time = time.time()
+                response = client.post(self._api_endpoint, content=body, headers=headers)
+                duration_ms = int((time.time() - start_time) * 1000)
+
+                if response.status_code == 415 and self._compress:
+                    # Receiver does not take gzip: send plain bodies from now on
+                    self._logger.warning("metrics.compression_unsupported", endpoint=self._api_endpoint)
+                    self._compress = False
+                    body, headers, raw_size = self._encode(batch.to_payload())
+                    response = client.post(self._api_endpoint, content=body, headers=headers)
+                    duration_ms = int((time.time() - start_time) * 1000)
 
-                with httpx.Client(timeout=self._timeout) as client:
-                    response = client.post(
-                        self._api_endpoint,
-                        json=payload,
-                        headers=headers,
+                if response.status_code == 200:
+                    self._circuit_breaker.record_success()
+                    self._stats.bytes_raw += raw_size
+                    self._stats.bytes_sent += len(body)
+                    self._stats.last_upload_ms = duration_ms
+                    self._logger.info(
+                        "metrics.batch_sent",
+                        batch_size=len(batch.events),
+                        bytes=len(body),
+                        duration_ms=duration_ms,
+                        attempt=attempt + 1,
                     )
+                    return "sent"
 
-                    duration_ms = int((time.time() - start_time) * 1000)
+                # Non-200 response
+                last_error = f"HTTP {response.status_code}: {response.text[:200]}"
+                self._circuit_breaker.record_failure()
 
-                    if response.status_code == 200:
-                        self._circuit_breaker.record_success()
-                        self._logger.info(
-                            "metrics.batch_sent",
-                            batch_size=len(batch.events),
-                            duration_ms=duration_ms,
-                            attempt=attempt + 1,
-                        )
-                        return True
-
-                    # Non-200 response
-                    last_error = f"HTTP {response.status_code}: {response.text[:200]}"
-                    self._circuit_breaker.record_failure()
-
-                    # Client errors (4xx) - don't retry
-                    if 400 <= response.status_code < 500:
-                        self._logger.error(
-                            "metrics.batch_client_error",
-                            status_code=response.status_code,
-                            error=last_error,
-                        )
-                        return False
-
-                    # Server errors (5xx) - retry with backoff
-                    self._logger.warning(
-                        "metrics.batch_server_error",
+                # Client errors (4xx) - don't retry
+                if 400 <= response.status_code < 500:
+                    self._logger.error(
+                        "metrics.batch_client_error",
                         status_code=response.status_code,
                         error=last_error,
-                        attempt=attempt + 1,
-                        max_retries=self._max_retries,
                     )
+                    return "rejected"
+
+                # Server errors (5xx) - retry
+                self._logger.warning(
+                    "metrics.batch_server_error",
+                    status_code=response.status_code,
+                    error=last_error,
+                    attempt=attempt + 1,
+                    max_retries=max_attempts,
+                )
 
             except httpx.TimeoutException as e:
                 last_error = f"Timeout: {str(e)}"
@@ -462,112 +608,155 @@ class UsageMeteringService:
                     attempt=attempt + 1,
                     error=last_error,
                 )
-                return False
-
-            # Exponential backoff: 1s → 2s → 4s → 8s → 16s
-            if attempt < self._max_retries - 1:
-                backoff = 2 ** attempt  # 1, 2, 4, 8, 16
-                self._logger.debug(
-                    "metrics.batch_retry_backoff",
-                    backoff_seconds=backoff,
-                    next_attempt=attempt + 2,
-                )
-                time.sleep(backoff)
+                return "retry"
 
-        # All retries exhausted
+        # All attempts exhausted
         self._logger.error(
             "metrics.batch_all_retries_exhausted",
             batch_size=len(batch.events),
             last_error=last_error,
         )
-        return False
+        return "retry"
 
-    def _get_pending_events(self, limit: int = 10) -> list[MetricsEvent]:
-        """Get pending events from database."""
+    def _get_pending_events(self, limit: int = 500) -> list[tuple[int, MetricsEvent]]:
+        """Get the oldest pending events from database as (row id, event)."""
         conn = self._get_connection()
         query = """
-            SELECT event_type, tenant_id, timestamp, duration_ms, metadata
+            SELECT id, event_type, tenant_id, timestamp, duration_ms, metadata
             FROM metrics_events
             WHERE status = 'pending'
-            ORDER BY created_at ASC
+            ORDER BY id ASC
             LIMIT ?
         """
-        cursor = conn.execute(query, (limit,))
-        rows = cursor.fetchall()
-
-        events = []
-        for row in rows:
-            events.append(MetricsEvent(
-                event_type=row["event_type"],
-                tenant_id=row["tenant_id"],
-                timestamp=row["timestamp"],
-                duration_ms=row["duration_ms"],
-                metadata=json.loads(row["metadata"]) if row["metadata"] else {},
-            ))
-
-        return events
-
-    def _update_event_status(self, event: MetricsEvent, status: str, error: Optional[str] = None) -> None:
-        """Update event status in database."""
-        conn = self._get_connection()
+        with self._lock:
+            rows = conn.execute(query, (limit,)).fetchall()
 
-        if status == "sent":
-            # Delete sent events to keep DB small
-            conn.execute("DELETE FROM metrics_events WHERE id = (SELECT id FROM metrics_events WHERE event_type = ? AND tenant_id = ? AND timestamp = ? LIMIT 1)",
-                (event.event_type, event.tenant_id, event.timestamp))
-        else:
-            query = """
-                UPDATE metrics_events
-                SET status = ?, retry_count = retry_count + 1, last_error = ?
-                WHERE event_type = ? AND tenant_id = ? AND timestamp = ?
-            """
-            conn.execute(
-                query,
-                (status, error, event.event_type, event.tenant_id, event.timestamp),
+        return [
+            (
+                row["id"],
+                MetricsEvent(
+                    event_type=row["event_type"],
+                    tenant_id=row["tenant_id"],
+                    timestamp=row["timestamp"],
+                    duration_ms=row["duration_ms"],
+                    metadata=json.loads(row["metadata"]) if row["metadata"] else {},
+                ),
             )
+            for row in rows
+        ]
 
-        conn.commit()
-
-    def flush(self) -> int:
-        """
-        Flush pending events to analytics API.
+    def _update_event_status(
+        self, ids: list[int], status: str, error: Optional[str] = None, rejected: bool = False,
+    ) -> None:
+        """Update many events in one transaction; sent events are deleted.
 
-        Returns:
-            Number of events flushed
+        Every retry bumps ``retry_count``; only a server rejection (4xx)
+        bumps ``rejection_count``, which is what dead-lettering counts.
         """
-        events = self._get_pending_events(self._batch_size)
-
-        if not events:
-            return 0
-
-        # Group events by tenant_id
-        tenant_events: dict[str, list[MetricsEvent]] = {}
-        for event in events:
-            if event.tenant_id not in tenant_events:
-                tenant_events[event.tenant_id] = []
-            tenant_events[event.tenant_id].append(event)
+        conn = self._get_connection()
+        with self._lock:
+            with conn:
+                if status == "sent":
+                    # Delete sent events to keep DB small
+                    conn.executemany("DELETE FROM metrics_events WHERE id = ?", [(i,) for i in ids])
+                else:
+                    conn.executemany(
+                        """
+                        UPDATE metrics_events
+                        SET status = ?, retry_count = retry_count + 1,
+                            rejection_count = rejection_count + ?, last_error = ?
+                        WHERE id = ?
+                        """,
+                        [(status, int(rejected), error, i) for i in ids],
+                    )
+            if status != "pending":
+                self._pending_count = max(0, self._pending_count - len(ids))
 
-        total_flushed = 0
+    def _dead_letter(self, ids: list[int]) -> int:
+        """Move events rejected ``max_rejections`` times to status "failed"."""
+        conn = self._get_connection()
+        with self._lock:
+            with conn:
+                cursor = conn.executemany(
+                    """
+                    UPDATE metrics_events SET status = 'failed'
+                    WHERE id = ? AND status = 'pending' AND rejection_count >= ?
+                    """,
+                    [(i, self._max_rejections) for i in ids],
+                )
+            dead = max(0, cursor.rowcount)
+            self._pending_count = max(0, self._pending_count - dead)
+        return dead
+
+    def _drain(self, attempts: Optional[int] = None) -> int:
+        """Upload pending events batch by batch until empty or a batch fails."""
+        with self._send_lock:
+            total_flushed = 0
+            while True:
+                rows = self._get_pending_events(self._batch_size)
+                if not rows:
+                    return total_flushed
+
+                # Group events by tenant_id
+                tenant_rows: dict[str, list[tuple[int, MetricsEvent]]] = {}
+                for row in rows:
+                    tenant_rows.setdefault(row[1].tenant_id, []).append(row)
+
+                failed = False
+                for tenant_id, items in tenant_rows.items():
+                    batch = MetricsBatch(
+                        tenant_id=tenant_id,
+                        events=[event for _, event in items],
+                        batch_timestamp=datetime.now(timezone.utc).isoformat(),
+                    )
+                    ids = [row_id for row_id, _ in items]
+                    outcome = self._send_batch(batch, attempts)
+                    self._stats.last_batch_size = len(ids)
+
+                    if outcome == "sent":
+                        self._update_event_status(ids, "sent")
+                        self._stats.batches_sent += 1
+                        self._stats.events_uploaded += len(ids)
+                        total_flushed += len(ids)
+                    elif outcome == "rejected":
+                        # Retried later like any failure; dead-lettered only
+                        # once rejected max_rejections times
+                        self._update_event_status(ids, "pending", error="Rejected by server", rejected=True)
+                        self._stats.batches_failed += 1
+                        self._stats.events_rejected += self._dead_letter(ids)
+                        failed = True
+                    else:
+                        # Mark events for retry
+                        self._update_event_status(ids, "pending", error="Batch send failed")
+                        self._stats.batches_failed += 1
+                        failed = True
+
+                if failed:
+                    self._stats.consecutive_failures += 1
+                    backoff = min(self._max_backoff, 2 ** (self._stats.consecutive_failures - 1))
+                    self._retry_at = time.time() + backoff
+                    self._logger.debug(
+                        "metrics.batch_retry_backoff",
+                        backoff_seconds=backoff,
+                        consecutive_failures=self._stats.consecutive_failures,
+                    )
+                    return total_flushed
 
-        for tenant_id, tenant_event_list in tenant_events.items():
-            batch = MetricsBatch(
-                tenant_id=tenant_id,
-                events=tenant_event_list,
-                batch_timestamp=datetime.now(timezone.utc).isoformat(),
-            )
+                self._stats.consecutive_failures = 0
+                self._retry_at = 0.0
 
-            success = self._send_batch(batch)
+    def flush(self) -> int:
+        """
+        Flush all pending events to analytics API now.
 
-            if success:
-                for event in tenant_event_list:
-                    self._update_event_status(event, "sent")
-                total_flushed += len(tenant_event_list)
-            else:
-                # Mark events for retry
-                for event in tenant_event_list:
-                    self._update_event_status(event, "pending", error="Batch send failed")
+        Each batch gets up to ``max_retries`` immediate attempts; a batch
+        that still fails stays pending and leaves the rest for the
+        uploader's backoff schedule.
 
-        return total_flushed
+        Returns:
+            Number of events flushed
+        """
+        return self._drain(attempts=self._max_retries)
 
     def track_api_call(
         self,
@@ -670,22 +859,33 @@ class UsageMeteringService:
         Get usage statistics.
 
         Returns:
-            Dictionary with pending/sent event counts and circuit breaker state
+            Dictionary with pending/sent event counts, circuit breaker state,
+            and uploader backpressure metrics
         """
         conn = self._get_connection()
 
-        # Count by status
-        cursor = conn.execute("""
-            SELECT status, COUNT(*) as count
-            FROM metrics_events
-            GROUP BY status
-        """)
-        status_counts = {row["status"]: row["count"] for row in cursor.fetchall()}
-
-        # Total events
-        cursor = conn.execute("SELECT COUNT(*) as total FROM metrics_events")
-        total = cursor.fetchone()["total"]
-
+        with self._lock:
+            # Count by status
+            cursor = conn.execute("""
+                SELECT status, COUNT(*) as count
+                FROM metrics_events
+                GROUP BY status
+            """)
+            status_counts = {row["status"]: row["count"] for row in cursor.fetchall()}
+
+            # Total events
+            cursor = conn.execute("SELECT COUNT(*) as total FROM metrics_events")
+            total = cursor.fetchone()["total"]
+
+            # Age of the oldest event still waiting for upload
+            cursor = conn.execute("""
+                SELECT (julianday('now') - julianday(MIN(created_at))) * 86400 AS age
+                FROM metrics_events
+                WHERE status = 'pending'
+            """)
+            oldest_age = cursor.fetchone()["age"]
+
+        stats = self._stats
         return {
             "total_events": total,
             "pending_events": status_counts.get("pending", 0),
@@ -693,6 +893,21 @@ class UsageMeteringService:
             "failed_events": status_counts.get("failed", 0),
             "circuit_breaker_state": self._circuit_breaker.state.value,
             "db_path": str(self._db_path),
+            "uploader_running": self._thread is not None and self._thread.is_alive(),
+            "batch_size": self._batch_size,
+            "oldest_pending_age_seconds": round(oldest_age, 1) if oldest_age is not None else None,
+            "pending_high_water": stats.pending_high_water,
+            "events_enqueued": stats.events_enqueued,
+            "events_uploaded": stats.events_uploaded,
+            "events_rejected": stats.events_rejected,
+            "batches_sent": stats.batches_sent,
+            "batches_failed": stats.batches_failed,
+            "last_batch_size": stats.last_batch_size,
+            "last_upload_ms": stats.last_upload_ms,
+            "bytes_sent": stats.bytes_sent,
+            "compression_ratio": round(stats.bytes_sent / stats.bytes_raw, 3) if stats.bytes_raw else None,
+            "consecutive_failures": stats.consecutive_failures,
+            "retry_in_seconds": round(max(0.0, self._retry_at - time.time()), 1),
         }
 
 
@@ -745,6 +960,7 @@ def track_runtime_duration(
 __all__ = [
     "MetricsEvent",
     "MetricsBatch",
+    "UploaderStats",
     "CircuitState",
     "CircuitBreaker",
     "UsageMeteringService",
@@ -5,55 +5,32 @@ RaaS Agency Operating System CLI
 Refactored: 2026-03-11 — Modular architecture (src/cli/ submodules)
 ROIaaS Phase 1: Startup License Validation (TypeScript source of truth)
 ROIaaS Phase 2: Remote Validation, Usage Metering, Key Generation
+Lazy command loading: see src/cli/lazy_commands.py
 """
 
 import typer
-from rich.console import Console
-from rich.panel import Panel
-from rich.text import Text
 
-from src.cli.commands_registry import register_all_commands
-from src.cli.command_registry_legacy import register_legacy_commands
-from src.cli.core_commands import register_core_commands
-from src.cli.start_command import register_start_command
-from src.cli.trace_command import register_trace_command
-from src.cli.recipe_commands import register_recipe_commands
-from src.cli.cook_command import register_cook_command
-from src.cli.workflow_commands import register_workflow_commands
-from src.cli.swarm_commands import swarm_app
-from src.cli.schedule_commands import schedule_app
-from src.cli.memory_commands import memory_app
-from src.cli.autonomous_commands import register_agi_commands
+from src.cli.lazy_commands import LazyTyperGroup
 
+# Commands are listed from src/cli/command_manifest.py and imported on first
+# use; regenerate the manifest with: python -m src.cli.lazy_commands
 app = typer.Typer(
     name="mekong",
     help="🚀 Mekong CLI: RaaS Agency Operating System",
     add_completion=False,
+    cls=LazyTyperGroup,
 )
 
-# Register command groups
-register_all_commands(app)
-register_legacy_commands(app)
-register_core_commands(app)
-register_start_command(app)
-register_trace_command(app)
-register_recipe_commands(app)
-register_cook_command(app)
-register_workflow_commands(app)
-register_agi_commands(app)
-
-# Register sub-typers
-app.add_typer(swarm_app, name="swarm")
-app.add_typer(schedule_app, name="schedule")
-app.add_typer(memory_app, name="memory")
-
-console = Console()
-
 
 @app.callback(invoke_without_command=True)
 def main(ctx: typer.Context) -> None:
     """Mekong CLI: RaaS Agency Operating System"""
     if ctx.invoked_subcommand is None:
+        from rich.console import Console
+        from rich.panel import Panel
+        from rich.text import Text
+
+        console = Console()
         console.print(
             Panel(
                 Text("Mekong CLI: RaaS Agency Operating System", style="bold green"),
@@ -116,51 +116,78 @@ class ReconciliationService:
         results: List[AuditResult] = []
 
         for license_info in licenses:
-            license_key = license_info["license_key"]
-            key_id = license_info["key_id"]
-
-            try:
-                result = await self._reconcile_license(
-                    license_key=license_key,
-                    key_id=key_id,
-                    audit_date=audit_date,
-                )
-                results.append(result)
-
-                # Emit event
-                self._emit_reconciliation_event(result)
-
-                # Log if variance detected
-                if result.status != "matched":
-                    logger.warning(
-                        f"Reconciliation variance for {license_key}: "
-                        f"{result.variance_percent:.2f}%"
-                    )
-
-            except Exception as e:
-                logger.error(
-                    f"Reconciliation failed for {license_key}: {e}"
-                )
-                # Create error audit record
-                results.append(AuditResult(
-                    audit_id=f"audit_{license_key}_{audit_date}_error",
-                    license_key=license_key,
-                    key_id=key_id,
-                    audit_date=audit_date,
-                    expected_amount=Decimal(0),
-                    actual_amount=Decimal(0),
-                    variance=Decimal(0),
-                    variance_percent=0,
-                    status="investigating",
-                    discrepancies=[{"error": str(e)}],
-                    details={"reconciliation_error": str(e)},
-                ))
+            results.append(await self.reconcile_license(
+                license_key=license_info["license_key"],
+                key_id=license_info["key_id"],
+                audit_date=audit_date,
+            ))
 
         logger.info(
             f"Daily reconciliation complete: {len(results)} licenses audited"
         )
         return results
 
+    async def reconcile_license(
+        self,
+        license_key: str,
+        key_id: str,
+        audit_date: date,
+    ) -> AuditResult:
+        """
+        Reconcile one license, emitting its event.
+
+        Errors are returned as an "investigating" AuditResult rather than
+        raised, so one bad license does not stop a run.
+
+        Args:
+            license_key: License key
+            key_id: Key ID
+            audit_date: Date to audit
+
+        Returns:
+            AuditResult
+        """
+        try:
+            result = await self._reconcile_license(
+                license_key=license_key,
+                key_id=key_id,
+                audit_date=audit_date,
+            )
+
+            # Emit event
+            self._emit_reconciliation_event(result)
+
+            # Log if variance detected
+            if result.status != "matched":
+                logger.warning(
+                    f"Reconciliation variance for {license_key}: "
+                    f"{result.variance_percent:.2f}%"
+                )
+            return result
+
+        except Exception as e:
+            logger.error(
+                f"Reconciliation failed for {license_key}: {e}"
+            )
+            # Create error audit record
+            return AuditResult(
+                audit_id=f"audit_{license_key}_{audit_date}_error",
+                license_key=license_key,
+                key_id=key_id,
+                audit_date=audit_date,
+                expected_amount=Decimal(0),
+                actual_amount=Decimal(0),
+                variance=Decimal(0),
+                variance_percent=0,
+                status="investigating",
+                discrepancies=[{"error": str(e)}],
+                details={"reconciliation_error": str(e)},
+            )
+
+    async def _get_active_licenses(self) -> List[Dict[str, Any]]:
+        """Get all active licenses."""
+        return await self._repo.list_active_licenses()
+
     async def _reconcile_license(
         self,
         license_key: str,
@@ -3,6 +3,11 @@ Mekong CLI - Billing Engine
 
 Core billing calculation engine for API usage metering.
 Calculates charges based on actual consumption with rate card application.
+
+Batch mode (calculate_batch_charges / calculate_batch_period_charges) bills
+many licenses in one pass: events are loaded as columnar arrays, quantities
+are summed as integer micro-units with NumPy, and all rate cards come from a
+single repository query. Results match calculate_charges exactly.
 """
 
 from __future__ import annotations
@@ -11,7 +16,10 @@ import logging
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Any, Dict, List, Optional
+from enum import Enum
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
 
 from src.db.repository import get_repository, LicenseRepository
 from src.core.usage_metering import UsageEvent
@@ -131,12 +139,40 @@ class BillingResult:
         }
 
 
+def _rate_card_from_row(rate_card_data: Dict[str, Any]) -> RateCard:
+    """Build a RateCard from a rate_cards row."""
+    return RateCard(
+        plan_tier=rate_card_data["plan_tier"],
+        event_type=rate_card_data["event_type"],
+        model_name=rate_card_data.get("model_name"),
+        unit=rate_card_data["unit"],
+        unit_price=Decimal(str(rate_card_data["unit_price"])),
+        included_quantity=Decimal(str(rate_card_data.get("included_quantity", 0))),
+        overage_rate=(
+            Decimal(str(rate_card_data["overage_rate"]))
+            if rate_card_data.get("overage_rate")
+            else None
+        ),
+        overage_threshold=(
+            Decimal(str(rate_card_data["overage_threshold"]))
+            if rate_card_data.get("overage_threshold")
+            else None
+        ),
+        metadata=rate_card_data.get("metadata", {}),
+    )
+
+
+def _event_type_value(event_type: Any) -> str:
+    return event_type.value if isinstance(event_type, Enum) else str(event_type)
+
+
 class RateCardResolver:
     """Resolve rate cards for license key and event type."""
 
     def __init__(self, repository: Optional[LicenseRepository] = None) -> None:
         self._repo = repository or get_repository()
         self._cache: Dict[str, RateCard] = {}
+        self._prefetched: Dict[Tuple[str, str, Optional[str]], RateCard] = {}
 
     async def resolve(
         self,
@@ -187,32 +223,231 @@ class RateCardResolver:
             logger.warning(f"No rate card found for {cache_key}")
             return None
 
-        rate_card = RateCard(
-            plan_tier=rate_card_data["plan_tier"],
-            event_type=rate_card_data["event_type"],
-            model_name=rate_card_data.get("model_name"),
-            unit=rate_card_data["unit"],
-            unit_price=Decimal(str(rate_card_data["unit_price"])),
-            included_quantity=Decimal(str(rate_card_data.get("included_quantity", 0))),
-            overage_rate=(
-                Decimal(str(rate_card_data["overage_rate"]))
-                if rate_card_data.get("overage_rate")
-                else None
-            ),
-            overage_threshold=(
-                Decimal(str(rate_card_data["overage_threshold"]))
-                if rate_card_data.get("overage_threshold")
-                else None
-            ),
-            metadata=rate_card_data.get("metadata", {}),
-        )
+        rate_card = _rate_card_from_row(rate_card_data)
 
         self._cache[cache_key] = rate_card
         return rate_card
 
+    async def prefetch(self, plan_tiers: Iterable[str]) -> int:
+        """
+        Load every active rate card for the given tiers in one query.
+
+        Args:
+            plan_tiers: Plan tiers to load
+
+        Returns:
+            Number of rate cards loaded
+        """
+        rows = await self._repo.get_active_rate_cards(sorted(set(plan_tiers)))
+        for row in rows:
+            card = _rate_card_from_row(row)
+            self._prefetched[(card.plan_tier, card.event_type, card.model_name)] = card
+        return len(rows)
+
+    def lookup(
+        self,
+        plan_tier: str,
+        event_type: str,
+        model_name: Optional[str] = None,
+    ) -> Optional[RateCard]:
+        """
+        Resolve a rate card from prefetched cards, without querying.
+
+        Same precedence as resolve(): model-specific card, then plan-wide.
+
+        Returns:
+            RateCard or None if not found
+        """
+        return (
+            self._prefetched.get((plan_tier, event_type, model_name))
+            or self._prefetched.get((plan_tier, event_type, None))
+        )
+
     def clear_cache(self) -> None:
         """Clear rate card cache."""
         self._cache.clear()
+        self._prefetched.clear()
+
+
+# Quantities are summed as integers in units of 10**-MICRO_SCALE
+MICRO_SCALE = 6
+_MICRO = 10 ** MICRO_SCALE
+# Beyond this a float's 6th decimal is no longer exact in float64
+_MAX_EXACT_FLOAT = 1e9
+_MAX_EXACT_SUM = 2 ** 62
+
+
+def _float_micros(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Convert floats to exact integer micro-units where possible.
+
+    ``Decimal(str(v)) == micros / 10**6`` holds exactly for rows flagged
+    exact: |v| < 1e9 and v round-trips through 6 decimal places.
+
+    Returns:
+        Tuple of (micros int64, decimal places int8, exact bool)
+    """
+    with np.errstate(invalid="ignore", over="ignore"):
+        scaled = np.round(values * _MICRO)
+        exact = (np.abs(values) < _MAX_EXACT_FLOAT) & (scaled / _MICRO == values)
+    micros = np.where(exact, scaled, 0).astype(np.int64)
+
+    # repr() of a float always shows at least one decimal place ("3.0")
+    places = np.ones(len(values), dtype=np.int8)
+    for digits in range(2, MICRO_SCALE + 1):
+        places[micros % 10 ** (MICRO_SCALE - digits + 1) != 0] = digits
+    return micros, places, exact
+
+
+def _decimal_micros(values: List[Any]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Per-row fallback of _float_micros for ints, Decimals and strings."""
+    micros = np.zeros(len(values), dtype=np.int64)
+    places = np.zeros(len(values), dtype=np.int8)
+    exact = np.zeros(len(values), dtype=bool)
+    for i, value in enumerate(values):
+        if isinstance(value, float):
+            row_micros, row_places, row_exact = _float_micros(np.array([value]))
+            micros[i], places[i], exact[i] = row_micros[0], row_places[0], row_exact[0]
+            continue
+        quantity = Decimal(str(value))
+        exponent = quantity.as_tuple().exponent
+        if isinstance(exponent, int) and -MICRO_SCALE <= exponent <= 0 and abs(quantity) < _MAX_EXACT_FLOAT:
+            micros[i] = int(quantity.scaleb(MICRO_SCALE))
+            places[i] = -exponent
+            exact[i] = True
+    return micros, places, exact
+
+
+@dataclass
+class UsageColumns:
+    """
+    Usage events for many licenses as columnar arrays.
+
+    Events are grouped by (license, event type, model) in first-seen order,
+    which is the order calculate_charges emits line items in.
+
+    Attributes:
+        license_keys: Distinct license keys; index = license code
+        key_ids: key_id per license (from its first event)
+        groups: (license code, event type, model name) per group code
+        group: Group code per event
+        values: Raw quantity per event
+        timestamps: Unix timestamp per event
+    """
+
+    license_keys: List[str]
+    key_ids: List[str]
+    groups: List[Tuple[int, Any, Optional[str]]]
+    group: np.ndarray
+    values: List[Any]
+    timestamps: np.ndarray
+
+    @classmethod
+    def from_records(
+        cls,
+        records: Iterable[Tuple[str, Any, Optional[str], Any, float, Dict[str, Any]]],
+    ) -> UsageColumns:
+        """Build columns from (license_key, event_type, model, value, timestamp, metadata)."""
+        license_codes: Dict[str, int] = {}
+        group_codes: Dict[Tuple[int, str, Optional[str]], int] = {}
+        key_ids: List[str] = []
+        groups: List[Tuple[int, Any, Optional[str]]] = []
+        group: List[int] = []
+        values: List[Any] = []
+        timestamps: List[float] = []
+
+        for license_key, event_type, model_name, value, timestamp, metadata in records:
+            license_code = license_codes.get(license_key)
+            if license_code is None:
+                license_code = license_codes[license_key] = len(key_ids)
+                key_ids.append(metadata.get("key_id", ""))
+            group_key = (license_code, _event_type_value(event_type), model_name)
+            group_code = group_codes.get(group_key)
+            if group_code is None:
+                group_code = group_codes[group_key] = len(groups)
+                groups.append((license_code, event_type, model_name))
+            group.append(group_code)
+            values.append(value)
+            timestamps.append(timestamp)
+
+        return cls(
+            license_keys=list(license_codes),
+            key_ids=key_ids,
+            groups=groups,
+            group=np.asarray(group, dtype=np.int64),
+            values=values,
+            timestamps=np.asarray(timestamps, dtype=np.float64),
+        )
+
+    @classmethod
+    def from_events(cls, events_by_license: Dict[str, List[UsageEvent]]) -> UsageColumns:
+        """Build columns from UsageEvent lists keyed by license key."""
+        return cls.from_records(
+            (license_key, e.event_type, e.metadata.get("model"), e.value, e.timestamp, e.metadata)
+            for license_key, events in events_by_license.items()
+            for e in events
+        )
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Dict[str, Any]]) -> UsageColumns:
+        """
+        Build columns from usage event rows (get_usage_events_batch).
+
+        Reads the same fields as calculate_period_charges; ``quantity`` and
+        ``model_name`` columns are used when ``value`` / metadata ``model``
+        are absent.
+        """
+        def record(row: Dict[str, Any]) -> Tuple[str, Any, Optional[str], Any, float, Dict[str, Any]]:
+            metadata = row.get("metadata") or {}
+            timestamp = row["timestamp"]
+            return (
+                row["license_key"],
+                row["event_type"],
+                metadata.get("model", row.get("model_name")),
+                row["value"] if "value" in row else row["quantity"],
+                timestamp.timestamp() if isinstance(timestamp, datetime) else timestamp,
+                metadata,
+            )
+
+        return cls.from_records(record(row) for row in rows)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def aggregate(self) -> Tuple[List[Decimal], np.ndarray]:
+        """
+        Sum quantities per group, exactly as ``sum(Decimal(str(v)))`` would.
+
+        Returns:
+            Tuple of (quantity per group, event count per group)
+        """
+        if not self.values:
+            return [], np.zeros(0, dtype=np.int64)
+
+        if all(type(v) is float for v in self.values):
+            micros, places, exact = _float_micros(np.asarray(self.values, dtype=np.float64))
+        else:
+            micros, places, exact = _decimal_micros(self.values)
+
+        order = np.argsort(self.group, kind="stable")
+        starts = np.flatnonzero(np.r_[True, np.diff(self.group[order]) != 0])
+        sums = np.add.reduceat(micros[order], starts)
+        max_places = np.maximum.reduceat(places[order], starts)
+        group_exact = np.logical_and.reduceat(exact[order], starts)
+        group_exact &= np.add.reduceat(np.abs(micros[order]).astype(np.float64), starts) < _MAX_EXACT_SUM
+        counts = np.bincount(self.group, minlength=len(self.groups))
+
+        quantities: List[Decimal] = []
+        for code in range(len(self.groups)):
+            if group_exact[code]:
+                digits = int(max_places[code])
+                # Every value in the group is a multiple of 10**(6 - digits)
+                coefficient = int(sums[code]) // 10 ** (MICRO_SCALE - digits)
+                quantities.append(Decimal(0) + Decimal(coefficient).scaleb(-digits))
+            else:
+                rows = np.flatnonzero(self.group == code)
+                quantities.append(sum(Decimal(str(self.values[i])) for i in rows))
+        return quantities, counts
 
 
 class BillingEngine:
@@ -289,42 +524,14 @@ class BillingEngine:
                 Decimal(str(e.value)) for e in events
             )
 
-            # Get remaining included quantity
             cache_key = f"{rate_card.plan_tier}:{event_type}:{model_name or '*'}"
-            remaining_included = (
-                rate_card.included_quantity - included_used.get(cache_key, Decimal(0))
-            )
-
-            # Calculate charge
-            charge, overage = rate_card.calculate_charge(
-                quantity=total_quantity,
-                included_remaining=remaining_included,
-            )
-
-            # Update included usage tracking
-            included_used[cache_key] = (
-                included_used.get(cache_key, Decimal(0))
-                + min(total_quantity, remaining_included)
-            )
-
-            # Create line item
-            line_item = LineItem(
-                event_type=event_type,
-                model_name=model_name,
-                quantity=total_quantity,
-                unit=rate_card.unit,
-                unit_price=rate_card.unit_price,
-                subtotal=charge,
-                final_amount=charge,
-                metadata={
-                    "event_count": len(events),
-                    "overage_quantity": str(overage),
-                    "included_used": str(included_used[cache_key]),
-                },
+            line_item = self._line_item(
+                rate_card, event_type, model_name, total_quantity, len(events),
+                included_used, cache_key,
             )
 
             line_items.append(line_item)
-            total += charge
+            total += line_item.subtotal
 
         # Get period dates
         if period_start is None:
@@ -341,6 +548,49 @@ class BillingEngine:
             total=total,
         )
 
+    @staticmethod
+    def _line_item(
+        rate_card: RateCard,
+        event_type: Any,
+        model_name: Optional[str],
+        total_quantity: Decimal,
+        event_count: int,
+        included_used: Dict[Any, Decimal],
+        cache_key: Any,
+    ) -> LineItem:
+        """Price one (event type, model) aggregate, tracking included usage."""
+        # Get remaining included quantity
+        remaining_included = (
+            rate_card.included_quantity - included_used.get(cache_key, Decimal(0))
+        )
+
+        # Calculate charge
+        charge, overage = rate_card.calculate_charge(
+            quantity=total_quantity,
+            included_remaining=remaining_included,
+        )
+
+        # Update included usage tracking
+        included_used[cache_key] = (
+            included_used.get(cache_key, Decimal(0))
+            + min(total_quantity, remaining_included)
+        )
+
+        return LineItem(
+            event_type=event_type,
+            model_name=model_name,
+            quantity=total_quantity,
+            unit=rate_card.unit,
+            unit_price=rate_card.unit_price,
+            subtotal=charge,
+            final_amount=charge,
+            metadata={
+                "event_count": event_count,
+                "overage_quantity": str(overage),
+                "included_used": str(included_used[cache_key]),
+            },
+        )
+
     def _aggregate_events(
         self,
         events: List[UsageEvent],
@@ -416,6 +666,119 @@ class BillingEngine:
             period_end=period_end,
         )
 
+    async def calculate_batch_charges(
+        self,
+        usage: Any,
+        period_start: Optional[datetime] = None,
+        period_end: Optional[datetime] = None,
+    ) -> Dict[str, BillingResult]:
+        """
+        Calculate charges for many licenses in one pass.
+
+        Equivalent to calling calculate_charges per license, but quantities
+        are aggregated columnar and all rate cards are resolved from one
+        prefetch query instead of a resolve() per (event type, model).
+
+        Args:
+            usage: UsageColumns, or dict of license key -> list of UsageEvent
+            period_start: Billing period start (default: first event per license)
+            period_end: Billing period end (default: last event per license)
+
+        Returns:
+            Dict of license key -> BillingResult
+        """
+        columns = usage if isinstance(usage, UsageColumns) else UsageColumns.from_events(usage)
+        if not len(columns):
+            return {}
+
+        licenses = await self._repo.get_licenses_by_keys(columns.license_keys)
+        tiers = {row["license_key"]: row.get("tier", "free") for row in licenses}
+        await self._rate_resolver.prefetch(set(tiers.values()))
+
+        quantities, counts = columns.aggregate()
+        line_items: List[List[LineItem]] = [[] for _ in columns.license_keys]
+        totals = [Decimal(0) for _ in columns.license_keys]
+        included_used: Dict[Any, Decimal] = {}
+
+        for code, (license_code, event_type, model_name) in enumerate(columns.groups):
+            license_key = columns.license_keys[license_code]
+            plan_tier = tiers.get(license_key)
+            if plan_tier is None:
+                continue
+            rate_card = self._rate_resolver.lookup(
+                plan_tier, _event_type_value(event_type), model_name,
+            )
+            if not rate_card:
+                logger.warning(f"No rate card for {event_type}/{model_name}, skipping")
+                continue
+            line_item = self._line_item(
+                rate_card, event_type, model_name, quantities[code], int(counts[code]),
+                included_used, (license_code, rate_card.plan_tier, _event_type_value(event_type), model_name),
+            )
+            line_items[license_code].append(line_item)
+            totals[license_code] += line_item.subtotal
+
+        missing = [key for key in columns.license_keys if key not in tiers]
+        if missing:
+            logger.warning(f"Licenses not found, billed as empty: {len(missing)}")
+
+        # Same defaults as calculate_charges: first / last event timestamp
+        license_of_event = np.asarray([g[0] for g in columns.groups], dtype=np.int64)[columns.group]
+        first_seen = np.full(len(columns.license_keys), np.inf)
+        last_seen = np.full(len(columns.license_keys), -np.inf)
+        np.minimum.at(first_seen, license_of_event, columns.timestamps)
+        np.maximum.at(last_seen, license_of_event, columns.timestamps)
+
+        return {
+            license_key: BillingResult(
+                license_key=license_key,
+                key_id=columns.key_ids[code],
+                period_start=period_start if period_start is not None else float(first_seen[code]),
+                period_end=period_end if period_end is not None else float(last_seen[code]),
+                line_items=line_items[code],
+                total=totals[code],
+            )
+            for code, license_key in enumerate(columns.license_keys)
+        }
+
+    async def calculate_batch_period_charges(
+        self,
+        license_keys: List[str],
+        period_start: datetime,
+        period_end: datetime,
+    ) -> Dict[str, BillingResult]:
+        """
+        Calculate period charges for many licenses with one usage query.
+
+        Args:
+            license_keys: Licenses to bill
+            period_start: Billing period start
+            period_end: Billing period end
+
+        Returns:
+            Dict of license key -> BillingResult (empty result for licenses
+            without usage)
+        """
+        rows = await self._repo.get_usage_events_batch(
+            license_keys=license_keys,
+            start_date=period_start,
+            end_date=period_end,
+        )
+        results = await self.calculate_batch_charges(
+            UsageColumns.from_rows(rows),
+            period_start=period_start,
+            period_end=period_end,
+        )
+        return {
+            license_key: results.get(license_key) or BillingResult(
+                license_key=license_key,
+                key_id="",
+                period_start=period_start,
+                period_end=period_end,
+            )
+            for license_key in license_keys
+        }
+
 
 # Module-level singleton
 _engine: Optional[BillingEngine] = None
@@ -450,6 +813,7 @@ __all__ = [
     "LineItem",
     "BillingResult",
     "RateCardResolver",
+    "UsageColumns",
     "BillingEngine",
     "get_engine",
     "get_rate_resolver",
@@ -2,18 +2,38 @@
 
 Implements a sliding window rate limiter backed by SQLite.
 Daily = last 24 hours, monthly = last 30 days.
+
+Usage is pre-aggregated into time buckets — per-minute for the daily
+window, per-hour for the monthly window — held per tenant in memory as
+ring buffers with running totals, so a check costs O(buckets) no matter
+how many events a tenant has recorded. The one bucket straddling a
+window's start is counted exactly from its raw events (loaded once per
+bucket), so totals and ``retry_after`` match an event-by-event scan.
+Events are written behind to
+SQLite in batches (raw events + bucket rollups); other processes' writes
+become visible within ``refresh_interval`` seconds. Raw events older than
+the retention period are pruned by the background writer.
 """
 from __future__ import annotations
 
+import atexit
+import bisect
+import logging
 import sqlite3
+import threading
+import time
 import uuid
+from collections import deque
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
 
 DB_PATH = Path.home() / ".mekong" / "raas" / "tenants.db"
 
+
 TIER_LIMITS: dict[str, dict[str, int]] = {
     "free":       {"daily": 10,  "monthly": 100},
     "starter":    {"daily": 50,  "monthly": 500},
@@ -45,6 +65,7 @@ def get_overage_config(tier: str) -> OverageConfig:
     """Get overage config for tier. Defaults to free (no overage)."""
     return OVERAGE_TIERS.get(tier.lower(), OVERAGE_TIERS["free"])
 
+
 _DDL = """
 CREATE TABLE IF NOT EXISTS rate_limit_events (
     id          TEXT PRIMARY KEY,
@@ -54,8 +75,23 @@ CREATE TABLE IF NOT EXISTS rate_limit_events (
 );
 CREATE INDEX IF NOT EXISTS idx_rle_tenant_ts
     ON rate_limit_events (tenant_id, timestamp);
+CREATE TABLE IF NOT EXISTS rate_limit_buckets (
+    tenant_id    TEXT NOT NULL,
+    granularity  INTEGER NOT NULL,
+    bucket_start INTEGER NOT NULL,
+    credits      INTEGER NOT NULL,
+    first_ts     REAL NOT NULL,
+    last_ts      REAL NOT NULL,
+    PRIMARY KEY (tenant_id, granularity, bucket_start)
+);
 """
 
+DAILY_WINDOW_SECONDS = 24 * 3600
+MONTHLY_WINDOW_SECONDS = 30 * 24 * 3600
+MINUTE_BUCKET = 60
+HOUR_BUCKET = 3600
+RAW_EVENT_RETENTION_DAYS = 31
+
 
 @dataclass
 class RateLimitStatus:
@@ -81,6 +117,363 @@ class RateLimitStatus:
     overage_charges_usd: float = 0.0
 
 
+# edge_loader(bucket_start, bucket_end) -> [(ts, credits), ...] for one tenant
+EdgeLoader = Callable[[int, int], list]
+
+
+class _BucketWindow:
+    """Ring buffer of ``[start, credits, first_ts, last_ts]`` buckets.
+
+    Buckets wholly inside the window count in full. The oldest bucket may
+    straddle the window start; its events are then loaded through
+    ``edge_loader`` and counted one by one, so the total is exact. Without
+    a loader (or if the raw events do not add up to the bucket) the edge
+    bucket is prorated over its ``[first_ts, last_ts]`` span instead.
+    """
+
+    __slots__ = ("granularity", "span", "buckets", "total", "edge_loader", "_edge")
+
+    def __init__(
+        self, granularity: int, span: int, edge_loader: Optional[EdgeLoader] = None,
+    ) -> None:
+        self.granularity = granularity
+        self.span = span
+        self.buckets: deque[list] = deque()
+        self.total = 0
+        self.edge_loader = edge_loader
+        # (bucket start, bucket credits, sorted timestamps, cumulative credits)
+        self._edge: Optional[tuple[int, int, list[float], list[int]]] = None
+
+    def add(self, ts: float, credits: int) -> None:
+        start = int(ts // self.granularity) * self.granularity
+        self.merge(start, credits, ts, ts)
+        self._drop_expired(ts - self.span)  # Keep the ring bounded even when nobody checks
+
+    def merge(self, start: int, credits: int, first_ts: float, last_ts: float) -> None:
+        buckets = self.buckets
+        self.total += credits
+        if not buckets or start > buckets[-1][0]:
+            buckets.append([start, credits, first_ts, last_ts])
+            return
+        # Same or older bucket (clock skew, reload): walk back from the newest
+        for i in range(len(buckets) - 1, -1, -1):
+            bucket = buckets[i]
+            if bucket[0] == start:
+                bucket[1] += credits
+                bucket[2] = min(bucket[2], first_ts)
+                bucket[3] = max(bucket[3], last_ts)
+                return
+            if bucket[0] < start:
+                buckets.insert(i + 1, [start, credits, first_ts, last_ts])
+                return
+        buckets.appendleft([start, credits, first_ts, last_ts])
+
+    def used(self, now: float) -> int:
+        """Credits recorded at or after ``now - span``."""
+        since = now - self.span
+        self._drop_expired(since)
+        if not self.buckets or self.buckets[0][2] >= since:
+            return self.total
+        return self.total - self._edge_expired(since)[0]
+
+    def retry_after(self, now: float) -> Optional[int]:
+        """Seconds until the oldest event still in the window leaves it."""
+        since = now - self.span
+        self._drop_expired(since)
+        if not self.buckets:
+            return None
+        oldest = self.buckets[0][2]
+        if oldest < since:
+            oldest = self._edge_expired(since)[1]
+        return max(0, int(oldest + self.span - now))
+
+    def _drop_expired(self, since: float) -> None:
+        buckets = self.buckets
+        while buckets and buckets[0][3] < since:
+            self.total -= buckets.popleft()[1]
+
+    def _edge_expired(self, since: float) -> tuple[int, float]:
+        """(credits before *since*, oldest timestamp at/after it) in the edge bucket."""
+        start, credits, first_ts, last_ts = self.buckets[0]
+        edge = self._edge
+        if edge is None or edge[0] != start or edge[1] != credits:
+            edge = self._edge = self._load_edge(start, credits)
+        if edge is not None:
+            i = bisect.bisect_left(edge[2], since)
+            return edge[3][i], edge[2][i]
+        # No exact events: prorate, rounding toward counting more usage
+        fraction = (since - first_ts) / (last_ts - first_ts)
+        return int(credits * fraction), last_ts
+
+    def _load_edge(self, start: int, credits: int) -> Optional[tuple[int, int, list[float], list[int]]]:
+        if self.edge_loader is None:
+            return None
+        events = sorted(self.edge_loader(start, start + self.granularity))
+        if sum(c for _, c in events) != credits:
+            return None  # Raw rows pruned or not yet visible; fall back
+        cumulative = [0]
+        for _, c in events:
+            cumulative.append(cumulative[-1] + c)
+        return start, credits, [ts for ts, _ in events], cumulative
+
+
+class _TenantUsage:
+    """Daily and monthly windows for one tenant."""
+
+    __slots__ = ("daily", "monthly")
+
+    def __init__(self, edge_loader: Optional[EdgeLoader] = None) -> None:
+        self.daily = _BucketWindow(MINUTE_BUCKET, DAILY_WINDOW_SECONDS, edge_loader)
+        self.monthly = _BucketWindow(HOUR_BUCKET, MONTHLY_WINDOW_SECONDS, edge_loader)
+
+    def add(self, ts: float, credits: int) -> None:
+        self.daily.add(ts, credits)
+        self.monthly.add(ts, credits)
+
+
+class _BucketEngine:
+    """Per-database usage cache with a write-behind SQLite flusher.
+
+    Shared by every CreditRateLimiter on the same DB file in this process,
+    so callers that build a limiter per request still hit a warm cache.
+    Writes from other processes are detected via ``PRAGMA data_version``
+    (checked at most every ``refresh_interval`` seconds), which drops the
+    cache so tenants reload from the bucket rows.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        refresh_interval: float = 1.0,
+        flush_delay: float = 0.05,
+        retention_days: int = RAW_EVENT_RETENTION_DAYS,
+    ) -> None:
+        self.db_path = db_path
+        self.refresh_interval = refresh_interval
+        self.flush_delay = flush_delay
+        self.retention_days = retention_days
+        self._lock = threading.RLock()
+        self._tenants: dict[str, _TenantUsage] = {}
+        self._pending: list[tuple[str, int, float]] = []
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._last_prune = 0.0
+        self._data_version: Optional[int] = None
+        self._checked_at = 0.0
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(db_path), timeout=10, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_DDL)
+        self._backfill_buckets()
+
+    # --- Hot path ---
+
+    def record(self, tenant_id: str, credits: int, ts: float) -> None:
+        with self._lock:
+            self._usage(tenant_id, ts).add(ts, credits)
+            self._pending.append((tenant_id, credits, ts))
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="rate-limit-flusher", daemon=True,
+                )
+                self._thread.start()
+        if not self._wake.is_set():
+            self._wake.set()
+
+    def measure(self, tenant_id: str, now: float) -> tuple[int, int, Optional[int], Optional[int]]:
+        """(daily used, monthly used, daily retry_after, monthly retry_after) at *now*.
+
+        Reading a window also drops expired buckets, so it runs under the
+        same lock as :meth:`record`.
+        """
+        with self._lock:
+            usage = self._usage(tenant_id, now)
+            return (
+                usage.daily.used(now),
+                usage.monthly.used(now),
+                usage.daily.retry_after(now),
+                usage.monthly.retry_after(now),
+            )
+
+    def _usage(self, tenant_id: str, now: float) -> _TenantUsage:
+        mono = time.monotonic()
+        if mono - self._checked_at > self.refresh_interval:
+            self._checked_at = mono
+            # data_version only moves when *another* connection commits
+            version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+            if self._data_version is not None and version != self._data_version:
+                self._tenants.clear()
+            self._data_version = version
+        usage = self._tenants.get(tenant_id)
+        if usage is None:
+            self.flush()  # Load from rows that include our own buffered events
+            usage = self._load(tenant_id, now)
+            self._tenants[tenant_id] = usage
+        return usage
+
+    def _load(self, tenant_id: str, now: float) -> _TenantUsage:
+        """Rebuild one tenant's windows from the persisted rollups."""
+        usage = _TenantUsage(lambda start, end: self._events_between(tenant_id, start, end))
+        rows = self._conn.execute(
+            "SELECT granularity, bucket_start, credits, first_ts, last_ts "
+            "FROM rate_limit_buckets WHERE tenant_id = ? AND last_ts >= ? "
+            "ORDER BY bucket_start",
+            (tenant_id, now - MONTHLY_WINDOW_SECONDS),
+        ).fetchall()
+        for granularity, start, credits, first_ts, last_ts in rows:
+            window = usage.daily if granularity == MINUTE_BUCKET else usage.monthly
+            window.merge(start, credits, first_ts, last_ts)
+        return usage
+
+    def _events_between(self, tenant_id: str, start: float, end: float) -> list[tuple[float, int]]:
+        """Raw ``(ts, credits)`` events of one tenant in ``[start, end)``."""
+        with self._lock:
+            self.flush()
+            rows = self._conn.execute(
+                "SELECT timestamp, credits_used FROM rate_limit_events "
+                "WHERE tenant_id = ? AND timestamp >= ? AND timestamp < ?",
+                (
+                    tenant_id,
+                    datetime.fromtimestamp(start - 1, timezone.utc).isoformat(),
+                    datetime.fromtimestamp(end + 1, timezone.utc).isoformat(),
+                ),
+            ).fetchall()
+        events = [(datetime.fromisoformat(ts).timestamp(), credits) for ts, credits in rows]
+        return [(ts, credits) for ts, credits in events if start <= ts < end]
+
+    # --- Write-behind ---
+
+    def _run(self) -> None:
+        while True:
+            if not self._wake.wait(timeout=5.0):
+                with self._lock:
+                    if not self._pending:
+                        self._thread = None  # Idle — the next record() restarts us
+                        return
+            time.sleep(self.flush_delay)  # Let a burst coalesce into one txn
+            self._wake.clear()
+            try:
+                self.flush()
+                if time.time() - self._last_prune > 3600:
+                    self.prune()
+            except sqlite3.Error as exc:
+                logger.warning("CreditRateLimiter flush failed: %s", exc)
+
+    def flush(self) -> int:
+        """Write pending events and their bucket rollups in one transaction."""
+        with self._lock:
+            pending = self._pending
+            if not pending:
+                return 0
+            self._write(pending, raw=True)
+            self._pending = []
+            return len(pending)
+
+    def _write(self, events: list[tuple[str, int, float]], raw: bool) -> None:
+        rollups: dict[tuple[str, int, int], list] = {}
+        for tenant_id, credits, ts in events:
+            for granularity in (MINUTE_BUCKET, HOUR_BUCKET):
+                key = (tenant_id, granularity, int(ts // granularity) * granularity)
+                agg = rollups.get(key)
+                if agg is None:
+                    rollups[key] = [credits, ts, ts]
+                else:
+                    agg[0] += credits
+                    agg[1] = min(agg[1], ts)
+                    agg[2] = max(agg[2], ts)
+        with self._conn:
+            if raw:
+                self._conn.executemany(
+                    "INSERT INTO rate_limit_events "
+                    "(id, tenant_id, credits_used, timestamp) VALUES (?, ?, ?, ?)",
+                    [
+                        (
+                            str(uuid.uuid4()), tenant_id, credits,
+                            datetime.fromtimestamp(ts, timezone.utc).isoformat(),
+                        )
+                        for tenant_id, credits, ts in events
+                    ],
+                )
+            self._conn.executemany(
+                "INSERT INTO rate_limit_buckets "
+                "(tenant_id, granularity, bucket_start, credits, first_ts, last_ts) "
+                "VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (tenant_id, granularity, bucket_start) DO UPDATE SET "
+                "credits = credits + excluded.credits, "
+                "first_ts = MIN(first_ts, excluded.first_ts), "
+                "last_ts = MAX(last_ts, excluded.last_ts)",
+                [(*key, *agg) for key, agg in rollups.items()],
+            )
+
+    def prune(self, now: Optional[float] = None) -> int:
+        """Drop raw events past retention and rollups past their window.
+
+        Returns:
+            Number of raw events deleted.
+        """
+        now = time.time() if now is None else now
+        raw_cutoff = datetime.fromtimestamp(
+            now - self.retention_days * 86400, timezone.utc,
+        ).isoformat()
+        with self._lock, self._conn:
+            removed = self._conn.execute(
+                "DELETE FROM rate_limit_events WHERE timestamp < ?", (raw_cutoff,),
+            ).rowcount
+            self._conn.execute(
+                "DELETE FROM rate_limit_buckets WHERE granularity = ? AND last_ts < ?",
+                (MINUTE_BUCKET, now - DAILY_WINDOW_SECONDS),
+            )
+            self._conn.execute(
+                "DELETE FROM rate_limit_buckets WHERE granularity = ? AND last_ts < ?",
+                (HOUR_BUCKET, now - MONTHLY_WINDOW_SECONDS),
+            )
+            self._last_prune = time.time()
+        return removed
+
+    def _backfill_buckets(self) -> None:
+        """Build rollups once for databases written before buckets existed."""
+        if self._conn.execute("SELECT 1 FROM rate_limit_buckets LIMIT 1").fetchone():
+            return
+        since = datetime.fromtimestamp(
+            time.time() - MONTHLY_WINDOW_SECONDS, timezone.utc,
+        ).isoformat()
+        rows = self._conn.execute(
+            "SELECT tenant_id, credits_used, timestamp FROM rate_limit_events "
+            "WHERE timestamp >= ?",
+            (since,),
+        ).fetchall()
+        if rows:
+            self._write(
+                [(t, c, datetime.fromisoformat(ts).timestamp()) for t, c, ts in rows],
+                raw=False,
+            )
+
+
+_ENGINES: dict[str, _BucketEngine] = {}
+_ENGINES_LOCK = threading.Lock()
+
+
+def _engine_for(db_path: Path) -> _BucketEngine:
+    """Return the shared engine for *db_path*, creating it on first use."""
+    key = str(Path(db_path).resolve())
+    with _ENGINES_LOCK:
+        engine = _ENGINES.get(key)
+        if engine is None:
+            engine = _BucketEngine(Path(db_path))
+            _ENGINES[key] = engine
+        return engine
+
+
+@atexit.register
+def _flush_all_engines() -> None:
+    for engine in list(_ENGINES.values()):
+        try:
+            engine.flush()
+        except sqlite3.Error:
+            pass
+
+
 class CreditRateLimiter:
     """Sliding-window rate limiter persisted in SQLite.
 
@@ -104,7 +497,7 @@ class CreditRateLimiter:
         daily_limit: int = TIER_LIMITS["free"]["daily"],
         monthly_limit: int = TIER_LIMITS["free"]["monthly"],
     ) -> None:
-        """Initialise the limiter and create the DB table when needed.
+        """Initialise the limiter and create the DB tables when needed.
 
         Args:
             db_path: SQLite file path (defaults to shared RaaS DB).
@@ -114,63 +507,26 @@ class CreditRateLimiter:
         self.db_path = db_path
         self.daily_limit = daily_limit
         self.monthly_limit = monthly_limit
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self._init_db()
+        try:
+            self._engine = _engine_for(db_path)
+        except sqlite3.Error as exc:
+            raise RuntimeError(f"CreditRateLimiter: DB init failed: {exc}") from exc
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
-    def _connect(self) -> sqlite3.Connection:
-        """Return a WAL-mode SQLite connection with row_factory."""
-        conn = sqlite3.connect(str(self.db_path), timeout=10)
-        conn.execute("PRAGMA journal_mode=WAL")
-        conn.row_factory = sqlite3.Row
-        return conn
-
-    def _init_db(self) -> None:
-        """Create rate_limit_events table and index if missing."""
-        try:
-            with self._connect() as conn:
-                conn.executescript(_DDL)
-        except sqlite3.Error as exc:
-            raise RuntimeError(f"CreditRateLimiter: DB init failed: {exc}") from exc
-
     @staticmethod
     def _now() -> datetime:
         """Return current UTC datetime."""
         return datetime.now(timezone.utc)
 
-    @staticmethod
-    def _iso(dt: datetime) -> str:
-        """Serialise a datetime to ISO-8601 string."""
-        return dt.isoformat()
-
-    def _sum_credits(
-        self, conn: sqlite3.Connection, tenant_id: str, since: datetime
-    ) -> int:
-        """Sum credits_used for *tenant_id* from *since* until now."""
-        row = conn.execute(
-            "SELECT COALESCE(SUM(credits_used), 0) AS total "
-            "FROM rate_limit_events "
-            "WHERE tenant_id = ? AND timestamp >= ?",
-            (tenant_id, self._iso(since)),
-        ).fetchone()
-        return int(row["total"])
-
-    def _oldest_timestamp_in_window(
-        self, conn: sqlite3.Connection, tenant_id: str, since: datetime
-    ) -> Optional[datetime]:
-        """Return the oldest event timestamp within the window, or None."""
-        row = conn.execute(
-            "SELECT MIN(timestamp) AS oldest "
-            "FROM rate_limit_events "
-            "WHERE tenant_id = ? AND timestamp >= ?",
-            (tenant_id, self._iso(since)),
-        ).fetchone()
-        if row and row["oldest"]:
-            return datetime.fromisoformat(row["oldest"])
-        return None
+    def _usage(self, tenant_id: str) -> tuple[int, int, Optional[int], Optional[int]]:
+        """Return (daily_used, monthly_used, daily_retry, monthly_retry) for *tenant_id*."""
+        try:
+            return self._engine.measure(tenant_id, self._now().timestamp())
+        except sqlite3.Error as exc:
+            raise RuntimeError(f"CreditRateLimiter: usage lookup failed: {exc}") from exc
 
     # ------------------------------------------------------------------
     # Public API
@@ -188,58 +544,34 @@ class CreditRateLimiter:
         Raises:
             RuntimeError: On SQLite error.
         """
-        now = self._now()
-        daily_since = now - timedelta(hours=24)
-        monthly_since = now - timedelta(days=30)
-
-        try:
-            with self._connect() as conn:
-                daily_used = self._sum_credits(conn, tenant_id, daily_since)
-                monthly_used = self._sum_credits(conn, tenant_id, monthly_since)
+        daily_used, monthly_used, daily_retry, monthly_retry = self._usage(tenant_id)
 
-                # 0 limit = unlimited
-                daily_exceeded = (
-                    self.daily_limit > 0 and daily_used >= self.daily_limit
-                )
-                monthly_exceeded = (
-                    self.monthly_limit > 0 and monthly_used >= self.monthly_limit
-                )
+        # 0 limit = unlimited
+        daily_exceeded = self.daily_limit > 0 and daily_used >= self.daily_limit
+        monthly_exceeded = (
+            self.monthly_limit > 0 and monthly_used >= self.monthly_limit
+        )
 
-                if daily_exceeded or monthly_exceeded:
-                    # Calculate retry_after: time until oldest event leaves window
-                    window_since = daily_since if daily_exceeded else monthly_since
-                    window_hours = 24 if daily_exceeded else 24 * 30
-                    oldest = self._oldest_timestamp_in_window(
-                        conn, tenant_id, window_since
-                    )
-                    retry_after: Optional[int] = None
-                    if oldest is not None:
-                        expires_at = oldest + timedelta(hours=window_hours)
-                        delta = (expires_at - now).total_seconds()
-                        retry_after = max(0, int(delta))
-
-                    return RateLimitStatus(
-                        allowed=False,
-                        daily_used=daily_used,
-                        daily_limit=self.daily_limit,
-                        monthly_used=monthly_used,
-                        monthly_limit=self.monthly_limit,
-                        retry_after_seconds=retry_after,
-                    )
-
-                return RateLimitStatus(
-                    allowed=True,
-                    daily_used=daily_used,
-                    daily_limit=self.daily_limit,
-                    monthly_used=monthly_used,
-                    monthly_limit=self.monthly_limit,
-                )
-        except sqlite3.Error as exc:
-            raise RuntimeError(f"CreditRateLimiter.check_limit failed: {exc}") from exc
+        retry_after: Optional[int] = None
+        if daily_exceeded or monthly_exceeded:
+            # retry_after: time until the oldest counted usage leaves the window
+            retry_after = daily_retry if daily_exceeded else monthly_retry
+
+        return RateLimitStatus(
+            allowed=not (daily_exceeded or monthly_exceeded),
+            daily_used=daily_used,
+            daily_limit=self.daily_limit,
+            monthly_used=monthly_used,
+            monthly_limit=self.monthly_limit,
+            retry_after_seconds=retry_after,
+        )
 
     def record_request(self, tenant_id: str, credits_used: int) -> None:
         """Log a request event into the sliding window.
 
+        The in-memory windows update immediately; the event is written to
+        SQLite by the background flusher (see :meth:`flush`).
+
         Args:
             tenant_id: Tenant that made the request.
             credits_used: Number of credits consumed by this request.
@@ -252,17 +584,42 @@ class CreditRateLimiter:
             raise ValueError("credits_used must be positive")
 
         try:
-            with self._connect() as conn:
-                conn.execute(
-                    "INSERT INTO rate_limit_events "
-                    "(id, tenant_id, credits_used, timestamp) VALUES (?, ?, ?, ?)",
-                    (str(uuid.uuid4()), tenant_id, credits_used, self._iso(self._now())),
-                )
+            self._engine.record(tenant_id, credits_used, self._now().timestamp())
         except sqlite3.Error as exc:
             raise RuntimeError(
                 f"CreditRateLimiter.record_request failed: {exc}"
             ) from exc
 
+    def flush(self) -> int:
+        """Write buffered events to SQLite now. Returns the number written.
+
+        Raises:
+            RuntimeError: On SQLite error.
+        """
+        try:
+            return self._engine.flush()
+        except sqlite3.Error as exc:
+            raise RuntimeError(f"CreditRateLimiter.flush failed: {exc}") from exc
+
+    def prune_events(self, retention_days: int = RAW_EVENT_RETENTION_DAYS) -> int:
+        """Retention job: delete raw events older than *retention_days*.
+
+        Also drops bucket rollups that no longer overlap either window.
+        Runs automatically from the background flusher at most hourly.
+
+        Returns:
+            Number of raw events deleted.
+
+        Raises:
+            RuntimeError: On SQLite error.
+        """
+        self._engine.retention_days = retention_days
+        try:
+            self._engine.flush()
+            return self._engine.prune(self._now().timestamp())
+        except sqlite3.Error as exc:
+            raise RuntimeError(f"CreditRateLimiter.prune_events failed: {exc}") from exc
+
     def get_limits(self, tenant_id: str) -> dict:
         """Return current usage versus configured limits for *tenant_id*.
 
@@ -274,20 +631,7 @@ class CreditRateLimiter:
             ``monthly_used``, ``monthly_limit``, ``daily_remaining``,
             ``monthly_remaining``.
         """
-        now = self._now()
-        try:
-            with self._connect() as conn:
-                daily_used = self._sum_credits(
-                    conn, tenant_id, now - timedelta(hours=24)
-                )
-                monthly_used = self._sum_credits(
-                    conn, tenant_id, now - timedelta(days=30)
-                )
-
-        except sqlite3.Error as exc:
-            raise RuntimeError(
-                f"CreditRateLimiter.get_limits failed: {exc}"
-            ) from exc
+        daily_used, monthly_used, _, _ = self._usage(tenant_id)
 
         daily_remaining = (
             max(0, self.daily_limit - daily_used) if self.daily_limit > 0 else None
@@ -2,9 +2,10 @@
 from __future__ import annotations
 
 import asyncio
+import time
 from typing import Any, Optional
 
-from src.core.event_bus import Event, EventBus, EventType
+from src.core.event_bus import Event, EventBus, EventType, OverflowPolicy
 
 # Human-friendly Vietnamese messages for dashboard events
 HUMAN_MESSAGES: dict[str, str] = {
@@ -32,6 +33,9 @@ class SSEManager:
     def __init__(self) -> None:
         """Initialize with empty connection registry."""
         self.connections: dict[str, list[asyncio.Queue]] = {}
+        # Loop that owns each queue, so pushes from bus worker threads are
+        # handed over with call_soon_threadsafe
+        self._loops: dict[int, asyncio.AbstractEventLoop] = {}
 
     def register(self, tenant_id: str) -> asyncio.Queue:
         """Create a new queue for a client and register it.
@@ -44,6 +48,10 @@ class SSEManager:
         """
         queue: asyncio.Queue = asyncio.Queue()
         self.connections.setdefault(tenant_id, []).append(queue)
+        try:
+            self._loops[id(queue)] = asyncio.get_running_loop()
+        except RuntimeError:
+            pass
         return queue
 
     def unregister(self, tenant_id: str, queue: asyncio.Queue) -> None:
@@ -56,24 +64,59 @@ class SSEManager:
         queues = self.connections.get(tenant_id, [])
         if queue in queues:
             queues.remove(queue)
+        self._loops.pop(id(queue), None)
         if not queues:
             self.connections.pop(tenant_id, None)
 
     def push(self, tenant_id: str, event_data: dict[str, Any]) -> None:
         """Push an event to all active queues for a tenant.
 
-        Uses put_nowait so it can be called from sync callbacks.
+        Uses put_nowait so it can be called from sync callbacks; calls from
+        other threads are scheduled on the queue's own event loop.
         Drops silently if a queue is full (non-blocking).
 
         Args:
             tenant_id: Target tenant identifier.
             event_data: JSON-serialisable event payload dict.
         """
-        for queue in self.connections.get(tenant_id, []):
-            try:
-                queue.put_nowait(event_data)
-            except asyncio.QueueFull:
-                pass  # Drop if client is slow — keepalive will resync
+        try:
+            current = asyncio.get_running_loop()
+        except RuntimeError:
+            current = None
+        for queue in list(self.connections.get(tenant_id, [])):
+            loop = self._loops.get(id(queue))
+            if loop is not None and loop is not current:
+                try:
+                    loop.call_soon_threadsafe(self._put, queue, event_data)
+                except RuntimeError:
+                    pass  # Loop closed — the connection is gone
+                continue
+            self._put(queue, event_data)
+
+    @staticmethod
+    def _put(queue: asyncio.Queue, event_data: dict[str, Any]) -> None:
+        try:
+            queue.put_nowait(event_data)
+        except asyncio.QueueFull:
+            pass  # Drop if client is slow — keepalive will resync
+
+    def push_token(
+        self, tenant_id: str, order: int, delta: str, task_id: str = "",
+    ) -> None:
+        """Push a streamed LLM token to all active queues for a tenant.
+
+        Args:
+            tenant_id: Target tenant identifier.
+            order: Recipe step order that is generating the token.
+            delta: Token text fragment.
+            task_id: Optional RaaS task identifier.
+        """
+        self.push(tenant_id, {
+            "type": "llm_token",
+            "message": "",
+            "data": {"task_id": task_id, "order": order, "delta": delta},
+            "timestamp": time.time(),
+        })
 
 
 class EventBusAdapter:
@@ -81,6 +124,8 @@ class EventBusAdapter:
 
     Translates internal Event objects to human-friendly dashboard
     payloads using HUMAN_MESSAGES, then pushes to the correct tenant.
+    Subscribes with async dispatch so translation never slows the emitter;
+    if the dashboard falls behind, the oldest undelivered events are dropped.
     """
 
     def __init__(self, sse_manager: SSEManager, event_bus: EventBus) -> None:
@@ -93,7 +138,10 @@ class EventBusAdapter:
         self._sse = sse_manager
         self._bus = event_bus
         for event_type in EventType:
-            self._bus.subscribe(event_type, self._handle)
+            self._bus.subscribe(
+                event_type, self._handle,
+                dispatch="async", overflow=OverflowPolicy.DROP_OLDEST,
+            )
 
     def _translate(self, event: Event) -> str:
         """Return a human-friendly Vietnamese message for the event.
@@ -11,6 +11,11 @@ from src.security.command_sanitizer import (
     sanitize_command,
     is_safe_command,
 )
+from src.security.sanitizer_engine import (
+    PatternEngine,
+    VerdictCache,
+    get_verdict_cache,
+)
 
 __all__ = [
     "CommandSanitizer",
@@ -18,4 +23,7 @@ __all__ = [
     "get_sanitizer",
     "sanitize_command",
     "is_safe_command",
+    "PatternEngine",
+    "VerdictCache",
+    "get_verdict_cache",
 ]
@@ -5,11 +5,12 @@ Protects against command injection attacks by sanitizing shell commands
 before execution. Validates and escapes dangerous characters/patterns.
 """
 
-import re
 import shlex
 from typing import Optional
 from dataclasses import dataclass
 
+from src.security.sanitizer_engine import compile_rules, get_verdict_cache
+
 
 @dataclass
 class SanitizationResult:
@@ -29,6 +30,7 @@ class CommandSanitizer:
         "pipe_injection": r"\|.*(?:bash|sh|curl|wget|nc|netcat)",  # | bash, | sh
         "redirect_danger": r">\s*/etc/|>\s*/root/|>\s*/var/",  # > /etc/...
         "eval_exec": r"\b(eval|exec|system|os\.system|subprocess)\s*\(",  # eval(), exec()
+        "eval_builtin": r"\beval\s",  # eval "$payload"
         "base64_decode": r"base64\s+(-d|--decode)",  # base64 -d
         "curl_pipe_bash": r"curl.*\|\s*(?:bash|sh)",  # curl | bash
         "wget_pipe_bash": r"wget.*\|\s*(?:bash|sh)",  # wget | bash
@@ -70,32 +72,46 @@ class CommandSanitizer:
         self._compile_patterns()
 
     def _compile_patterns(self) -> None:
-        """Pre-compile regex patterns for performance."""
-        self._dangerous_regex = {
-            name: re.compile(pattern, re.IGNORECASE)
-            for name, pattern in self.DANGEROUS_PATTERNS.items()
-        }
-        self._suspicious_regex = {
-            name: re.compile(pattern, re.IGNORECASE)
-            for name, pattern in self.SUSPICIOUS_PATTERNS.items()
-        }
+        """Use the shared engine for this class's patterns (compiled once per class)."""
+        cls = type(self)
+        engine = cls.__dict__.get("_shared_engine")
+        if engine is None:
+            engine = cls._shared_engine = compile_rules(
+                tuple((("dangerous", name), pattern) for name, pattern in cls.DANGEROUS_PATTERNS.items())
+                + tuple((("suspicious", name), pattern) for name, pattern in cls.SUSPICIOUS_PATTERNS.items())
+            )
+        self._engine = engine
 
     def sanitize(self, command: str) -> SanitizationResult:
         """
         Sanitize a shell command string.
 
+        Verdicts are cached process-wide per (patterns, strict_mode), so
+        repeated commands skip matching and shlex entirely.
+
         Args:
             command: The shell command to sanitize
 
         Returns:
             SanitizationResult with safety assessment
         """
+        verdict = get_verdict_cache().get_or_compute(
+            (self._engine, self.strict_mode), command, self._sanitize,
+        )
+        return SanitizationResult(
+            is_safe=verdict.is_safe,
+            sanitized_command=verdict.sanitized_command,
+            warnings=list(verdict.warnings),
+            blocked_patterns=list(verdict.blocked_patterns),
+        )
+
+    def _sanitize(self, command: str) -> SanitizationResult:
+        """Uncached sanitize: one engine pass, then shlex escaping."""
         warnings: list[str] = []
         blocked: list[str] = []
 
-        # Check for dangerous patterns
-        for name, regex in self._dangerous_regex.items():
-            if regex.search(command):
+        for kind, name in self._engine.matches(command):
+            if kind == "dangerous":
                 blocked.append(name)
                 if self.strict_mode:
                     return SanitizationResult(
@@ -104,10 +120,8 @@ class CommandSanitizer:
                         warnings=warnings,
                         blocked_patterns=blocked,
                     )
-
-        # Check for suspicious patterns (warn only)
-        for name, regex in self._suspicious_regex.items():
-            if regex.search(command):
+            else:
+                # Suspicious patterns warn only
                 warnings.append(f"Suspicious pattern detected: {name}")
 
         # Attempt to safely escape the command
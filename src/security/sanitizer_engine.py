@@ -0,0 +1,145 @@
+"""
+Sanitizer Engine - shared pattern matching and verdict cache
+
+Both command sanitizers (``src.security.command_sanitizer`` and
+``src.core.command_sanitizer``) compile their rules through this module:
+
+- PatternEngine: every rule compiled once per process, plus one
+  alternation of all of them, so a clean command costs a single
+  search instead of one search per rule.
+- VerdictCache: LRU of recent verdicts keyed by (sanitizer config,
+  command digest). Recipes re-run the same commands constantly; a
+  changed allow/deny list is a different config, so old verdicts are
+  never served for it.
+"""
+
+import functools
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Iterable, List, Optional, Tuple
+
+
+class PatternEngine:
+    """Labelled regex rules, screened with one combined search."""
+
+    def __init__(self, rules: Iterable[Tuple[Hashable, str]], flags: int = re.IGNORECASE):
+        """
+        Compile rules.
+
+        Args:
+            rules: (label, pattern) pairs in priority order. Patterns must
+                not use numbered backreferences (they are renumbered when
+                combined).
+            flags: re flags applied to every pattern
+        """
+        rules = list(rules)
+        self.labels: List[Hashable] = [label for label, _ in rules]
+        self._regexes = [re.compile(pattern, flags) for _, pattern in rules]
+        # Non-capturing on purpose: named groups (one per rule) make the
+        # combined search slower than searching each rule separately
+        self._any = re.compile(
+            "|".join(f"(?:{pattern})" for _, pattern in rules) or r"(?!)",
+            flags,
+        )
+
+    def matches(self, text: str) -> List[Hashable]:
+        """
+        Labels of every rule that matches somewhere in ``text``.
+
+        Same result as searching each rule separately, in rule order. Text
+        no rule matches (the common case) is settled by the combined
+        search alone; otherwise each rule is searched to report all of
+        them, overlapping matches included.
+        """
+        if self._any.search(text) is None:
+            return []
+        return [label for label, regex in zip(self.labels, self._regexes) if regex.search(text)]
+
+
+@functools.lru_cache(maxsize=32)
+def compile_rules(rules: Tuple[Tuple[Hashable, str], ...], flags: int = re.IGNORECASE) -> PatternEngine:
+    """PatternEngine for a rule set, compiled once per process."""
+    return PatternEngine(rules, flags)
+
+
+def command_digest(command: str) -> bytes:
+    """Fixed-size key for a command of any length."""
+    return hashlib.blake2b(command.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+
+class VerdictCache:
+    """Thread-safe LRU of sanitizer verdicts."""
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple[Hashable, bytes], Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_compute(
+        self,
+        config: Hashable,
+        command: str,
+        compute: Callable[[str], Any],
+    ) -> Any:
+        """
+        Cached verdict for ``command`` under ``config``, computing it on a miss.
+
+        Args:
+            config: Everything the verdict depends on besides the command
+            command: Command string
+            compute: Produces the verdict for a miss
+
+        Returns:
+            The cached (shared) verdict; callers copy before mutating
+        """
+        key = (config, command_digest(command))
+        with self._lock:
+            verdict = self._entries.get(key)
+            if verdict is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return verdict
+            self.misses += 1
+
+        verdict = compute(command)
+        with self._lock:
+            self._entries[key] = verdict
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return verdict
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+# Shared by every sanitizer instance, so per-step sanitizers still hit
+_verdict_cache: Optional[VerdictCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_verdict_cache() -> VerdictCache:
+    """Get or create the process-wide verdict cache."""
+    global _verdict_cache
+    if _verdict_cache is None:
+        with _cache_lock:
+            if _verdict_cache is None:
+                _verdict_cache = VerdictCache()
+    return _verdict_cache
+
+
+__all__ = [
+    "PatternEngine",
+    "VerdictCache",
+    "command_digest",
+    "compile_rules",
+    "get_verdict_cache",
+]
@@ -0,0 +1,99 @@
+"""Mekong CLI - Auth RateLimiter Microbenchmark.
+
+Runs RateLimiter.check_limit for 10k distinct keys concurrently
+(asyncio.gather), several rounds deep so later rounds hit the limit, plus
+the bare storage ``acquire`` cost, and compares:
+1. InMemoryRateStorage (global storage lock + per-bucket TokenBucket locks)
+2. ShardedRateStorage (GCRA timestamps, per-shard locks, no awaits)
+
+Also times a full cleanup sweep over the 10k keys.
+
+Usage:
+    RUN_BENCHMARKS=1 python -m pytest tests/benchmarks/test_auth_rate_limiter_bench.py -s
+    python -m tests.benchmarks.test_auth_rate_limiter_bench
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+
+import pytest
+
+from src.auth.rate_limiter import (
+    DEFAULT_RATE_LIMITS,
+    InMemoryRateStorage,
+    RateLimiter,
+    RateLimitPreset,
+    ShardedRateStorage,
+)
+
+pytestmark = pytest.mark.skipif(
+    os.getenv("RUN_BENCHMARKS") != "1",
+    reason="Skip benchmarks — set RUN_BENCHMARKS=1 to run",
+)
+
+KEYS = 10_000
+ROUNDS = 8  # AUTH_LOGIN allows 5/min, so the last rounds are denials
+
+
+async def _run(make_storage) -> dict[str, float]:
+    keys = [f"10.0.{i // 256}.{i % 256}:/auth/login" for i in range(KEYS)]
+    config = DEFAULT_RATE_LIMITS[RateLimitPreset.AUTH_LOGIN]
+    storage = make_storage()
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        for key in keys:
+            await storage.acquire(key, config)
+    acquire_us = (time.perf_counter() - start) / (KEYS * ROUNDS) * 1e6
+
+    storage = make_storage()
+    limiter = RateLimiter(storage=storage)
+    allowed = 0
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        results = await asyncio.gather(
+            *(limiter.check_limit(key, RateLimitPreset.AUTH_LOGIN) for key in keys)
+        )
+        allowed += sum(ok for ok, _ in results)
+    elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    await storage.cleanup(max_age=3600)  # Nothing is stale: pure scan cost
+    cleanup_ms = (time.perf_counter() - start) * 1000
+    return {
+        "us_per_check": elapsed / (KEYS * ROUNDS) * 1e6,
+        "us_per_acquire": acquire_us,
+        "allowed": allowed,
+        "cleanup_ms": cleanup_ms,
+    }
+
+
+def run_benchmark() -> dict[str, dict[str, float]]:
+    return {
+        "in_memory": asyncio.run(_run(InMemoryRateStorage)),
+        "sharded": asyncio.run(_run(lambda: ShardedRateStorage(evict_interval=0))),
+    }
+
+
+def _print(r: dict[str, dict[str, float]]) -> None:
+    print(f"\n{KEYS:,} concurrent keys x {ROUNDS} rounds of check_limit")
+    for name, stats in r.items():
+        print(
+            f"  {name:<10} {stats['us_per_check']:.1f}us/check_limit, "
+            f"{stats['us_per_acquire']:.1f}us/acquire, "
+            f"{stats['allowed']:,} allowed, cleanup scan {stats['cleanup_ms']:.1f}ms"
+        )
+
+
+def test_sharded_storage_beats_global_lock():
+    report = run_benchmark()
+    _print(report)
+    assert report["sharded"]["allowed"] == report["in_memory"]["allowed"] == KEYS * 5
+    assert report["sharded"]["us_per_acquire"] * 1.2 < report["in_memory"]["us_per_acquire"]
+    assert report["sharded"]["us_per_check"] < report["in_memory"]["us_per_check"]
+
+
+if __name__ == "__main__":
+    _print(run_benchmark())
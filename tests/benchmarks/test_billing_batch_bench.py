@@ -0,0 +1,157 @@
+"""Mekong CLI - Batch Billing Benchmark.
+
+Bills 500k usage events across 500 licenses two ways against a repository
+that costs 1ms per query:
+1. BillingEngine.calculate_charges per license (Decimal loop, one resolve()
+   round-trip per license and (event type, model))
+2. BillingEngine.calculate_batch_charges (columnar micro-unit sums, one
+   license query and one rate card query)
+
+and checks every license total matches to the cent.
+
+Usage:
+    RUN_BENCHMARKS=1 python -m pytest tests/benchmarks/test_billing_batch_bench.py -s
+    python -m tests.benchmarks.test_billing_batch_bench
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import random
+import time
+from decimal import Decimal
+
+import pytest
+
+from src.core.anomaly_detector import AnomalyCategory
+from src.core.usage_metering import UsageEvent, UsageEventType
+from src.raas.billing_engine import BillingEngine, UsageColumns
+
+pytestmark = pytest.mark.skipif(
+    os.getenv("RUN_BENCHMARKS") != "1",
+    reason="Skip benchmarks — set RUN_BENCHMARKS=1 to run",
+)
+
+LICENSES = 500
+EVENTS = 500_000
+QUERY_LATENCY = 0.001
+EVENT_TYPES = [UsageEventType.API_CALL, UsageEventType.LLM_CALL, UsageEventType.TOKEN_USAGE]
+MODELS = [None, "gpt-4", "claude-3"]
+
+
+class SlowRepository:
+    """In-memory licenses and rate cards with a fixed per-query latency."""
+
+    def __init__(self) -> None:
+        self.licenses = {
+            f"lic-{i}": {"license_key": f"lic-{i}", "tier": ("pro", "enterprise")[i % 2]}
+            for i in range(LICENSES)
+        }
+        self.cards = [
+            {
+                "plan_tier": tier, "event_type": event_type.value, "model_name": None,
+                "unit": "calls", "unit_price": Decimal("0.0015"),
+                "included_quantity": Decimal(1000), "overage_rate": None, "overage_threshold": None,
+            }
+            for tier in ("pro", "enterprise")
+            for event_type in EVENT_TYPES
+        ]
+        self.queries = 0
+
+    async def _query(self) -> None:
+        self.queries += 1
+        await asyncio.sleep(QUERY_LATENCY)
+
+    async def get_license_by_key(self, license_key):
+        await self._query()
+        return self.licenses.get(license_key)
+
+    async def get_rate_card(self, plan_tier, event_type, model_name=None):
+        await self._query()
+        event_type = getattr(event_type, "value", event_type)
+        for card in self.cards:
+            if (card["plan_tier"], card["event_type"], card["model_name"]) == (plan_tier, event_type, model_name):
+                return card
+        return None
+
+    async def get_licenses_by_keys(self, license_keys):
+        await self._query()
+        return [self.licenses[k] for k in license_keys if k in self.licenses]
+
+    async def get_active_rate_cards(self, plan_tiers):
+        await self._query()
+        return [card for card in self.cards if card["plan_tier"] in plan_tiers]
+
+
+def _usage() -> dict[str, list[UsageEvent]]:
+    rng = random.Random(42)
+    usage: dict[str, list[UsageEvent]] = {f"lic-{i}": [] for i in range(LICENSES)}
+    keys = list(usage)
+    for n in range(EVENTS):
+        model = rng.choice(MODELS)
+        usage[rng.choice(keys)].append(UsageEvent(
+            event_type=rng.choice(EVENT_TYPES),
+            category=AnomalyCategory.API_CALLS,
+            metric="requests",
+            value=round(rng.uniform(0, 50), 2),
+            timestamp=float(n),
+            metadata={"model": model} if model else {},
+        ))
+    return usage
+
+
+async def _bench(usage) -> dict[str, float]:
+    legacy_repo = SlowRepository()
+    legacy = BillingEngine(repository=legacy_repo)
+    start = time.perf_counter()
+    expected = {key: await legacy.calculate_charges(key, events) for key, events in usage.items()}
+    legacy_s = time.perf_counter() - start
+
+    batch_repo = SlowRepository()
+    batch = BillingEngine(repository=batch_repo)
+    start = time.perf_counter()
+    columns = UsageColumns.from_events(usage)
+    columns_s = time.perf_counter() - start
+    results = await batch.calculate_batch_charges(columns)
+    batch_s = time.perf_counter() - start
+
+    cents = Decimal("0.01")
+    mismatches = sum(
+        results[key].total.quantize(cents) != expected[key].total.quantize(cents)
+        for key in usage
+    )
+    return {
+        "legacy_s": legacy_s,
+        "legacy_queries": legacy_repo.queries,
+        "batch_s": batch_s,
+        "columns_s": columns_s,
+        "batch_queries": batch_repo.queries,
+        "mismatches": mismatches,
+    }
+
+
+def run_benchmark() -> dict[str, float]:
+    return asyncio.run(_bench(_usage()))
+
+
+def _print(r: dict[str, float]) -> None:
+    print(
+        f"\n{EVENTS:,} events / {LICENSES} licenses"
+        f"\nper-license: {r['legacy_s']:.2f}s ({r['legacy_queries']:,} queries)"
+        f"\nbatch: {r['batch_s']:.2f}s incl. {r['columns_s']:.2f}s building columns "
+        f"({r['batch_queries']} queries)"
+        f"\nlicense totals differing at the cent: {r['mismatches']}",
+    )
+
+
+def test_batch_billing_matches_and_beats_per_license():
+    report = run_benchmark()
+    _print(report)
+    assert report["mismatches"] == 0
+    assert report["batch_queries"] == 2
+    assert report["batch_s"] * 3 < report["legacy_s"]
+
+
+if __name__ == "__main__":
+    _print(run_benchmark())
@@ -0,0 +1,70 @@
+"""Mekong CLI - Cold Start Benchmark.
+
+Times fresh interpreters running:
+1. ``import src.main`` (what every ``mekong`` invocation pays)
+2. ``mekong --help`` (manifest listing, no command modules imported)
+
+and fails if the median exceeds the budget, so a stray eager import in
+``src/main.py`` or a stale command manifest shows up as a regression.
+
+Usage:
+    RUN_BENCHMARKS=1 python -m pytest tests/benchmarks/test_cli_startup_bench.py -s
+    MEKONG_STARTUP_BUDGET_MS=600 python -m tests.benchmarks.test_cli_startup_bench
+"""
+
+from __future__ import annotations
+
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+pytestmark = pytest.mark.skipif(
+    os.getenv("RUN_BENCHMARKS") != "1",
+    reason="Skip benchmarks — set RUN_BENCHMARKS=1 to run",
+)
+
+ROOT = Path(__file__).resolve().parents[2]
+RUNS = 5
+IMPORT_BUDGET_MS = float(os.getenv("MEKONG_STARTUP_BUDGET_MS", "1000"))
+HELP_BUDGET_MS = 2 * IMPORT_BUDGET_MS
+
+
+def _median_ms(args: list[str]) -> float:
+    samples = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, *args], cwd=ROOT, capture_output=True, check=True)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def run_benchmark() -> dict[str, float]:
+    return {
+        "bare_ms": _median_ms(["-c", "pass"]),
+        "import_ms": _median_ms(["-c", "import src.main"]),
+        "help_ms": _median_ms(["-m", "src.main", "--help"]),
+    }
+
+
+def _print(r: dict[str, float]) -> None:
+    print(
+        f"\npython -c pass {r['bare_ms']:.0f}ms"
+        f"\nimport src.main {r['import_ms']:.0f}ms (budget {IMPORT_BUDGET_MS:.0f}ms)"
+        f"\nmekong --help {r['help_ms']:.0f}ms (budget {HELP_BUDGET_MS:.0f}ms)",
+    )
+
+
+def test_cold_start_within_budget():
+    report = run_benchmark()
+    _print(report)
+    assert report["import_ms"] <= IMPORT_BUDGET_MS
+    assert report["help_ms"] <= HELP_BUDGET_MS
+
+
+if __name__ == "__main__":
+    _print(run_benchmark())
@@ -0,0 +1,129 @@
+"""Mekong CLI - CreditRateLimiter Load Benchmark.
+
+Records 1M usage events across a pool of tenants spread over 30 days, then
+compares per-check latency of:
+1. The previous per-request SQL path (fresh connection + two SUM scans)
+2. The bucketed engine (in-memory minute/hour rollups)
+
+Also times the write-behind flush and a cold reload from bucket rows.
+
+Usage:
+    RUN_BENCHMARKS=1 python -m pytest tests/benchmarks/test_credit_rate_limiter_bench.py -s
+    python -m tests.benchmarks.test_credit_rate_limiter_bench
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import sqlite3
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.raas import credit_rate_limiter as crl
+from src.raas.credit_rate_limiter import CreditRateLimiter
+
+pytestmark = pytest.mark.skipif(
+    os.getenv("RUN_BENCHMARKS") != "1",
+    reason="Skip benchmarks — set RUN_BENCHMARKS=1 to run",
+)
+
+EVENTS = 1_000_000
+TENANTS = 100
+CHECKS = 200
+
+
+def _legacy_check(db_path: Path, tenant_id: str, now: datetime) -> tuple[int, int]:
+    """Reference: the old connect-per-call SUM(credits_used) queries."""
+    conn = sqlite3.connect(str(db_path), timeout=10)
+    try:
+        daily = conn.execute(
+            "SELECT COALESCE(SUM(credits_used), 0) FROM rate_limit_events "
+            "WHERE tenant_id = ? AND timestamp >= ?",
+            (tenant_id, (now - timedelta(hours=24)).isoformat()),
+        ).fetchone()[0]
+        monthly = conn.execute(
+            "SELECT COALESCE(SUM(credits_used), 0) FROM rate_limit_events "
+            "WHERE tenant_id = ? AND timestamp >= ?",
+            (tenant_id, (now - timedelta(days=30)).isoformat()),
+        ).fetchone()[0]
+    finally:
+        conn.close()
+    return daily, monthly
+
+
+def run_benchmark() -> dict[str, float]:
+    """Return timings in milliseconds (seconds for the bulk phases)."""
+    rng = random.Random(42)
+    now = datetime.now(timezone.utc)
+    base = now.timestamp() - 30 * 86400
+    stamps = sorted(base + rng.random() * 30 * 86400 for _ in range(EVENTS))
+    tenants = [f"tenant-{i}" for i in range(TENANTS)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "rate_limit_bench.db"
+        limiter = CreditRateLimiter(db_path=db_path, daily_limit=0, monthly_limit=0)
+        engine = limiter._engine
+        engine.flush_delay = 3600  # Keep the background flusher out of the timings
+
+        start = time.perf_counter()
+        for ts in stamps:
+            engine.record(tenants[rng.randrange(TENANTS)], 1, ts)
+        record_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        engine.flush()
+        flush_s = time.perf_counter() - start
+
+        queried = [rng.choice(tenants) for _ in range(CHECKS)]
+        with patch.object(CreditRateLimiter, "_now", return_value=now):
+            start = time.perf_counter()
+            for tenant in queried:
+                limiter.check_limit(tenant)
+            bucket_ms = (time.perf_counter() - start) / CHECKS * 1000
+
+            start = time.perf_counter()
+            for tenant in queried:
+                _legacy_check(db_path, tenant, now)
+            legacy_ms = (time.perf_counter() - start) / CHECKS * 1000
+
+            crl._ENGINES.pop(str(db_path.resolve()), None)
+            start = time.perf_counter()
+            cold = CreditRateLimiter(db_path=db_path, daily_limit=0, monthly_limit=0)
+            cold_status = cold.get_limits(queried[0])
+            reload_ms = (time.perf_counter() - start) * 1000
+            warm = limiter.get_limits(queried[0])
+
+    return {
+        "events": EVENTS,
+        "record_s": record_s,
+        "flush_s": flush_s,
+        "legacy_ms": legacy_ms,
+        "bucket_ms": bucket_ms,
+        "reload_ms": reload_ms,
+        "monthly_match": float(cold_status["monthly_used"] == warm["monthly_used"]),
+    }
+
+
+def _print(r: dict[str, float]) -> None:
+    print(
+        f"\n{r['events']:,} events: record {r['record_s']:.2f}s, flush {r['flush_s']:.2f}s"
+        f"\ncheck_limit: legacy SUM {r['legacy_ms']:.3f}ms, buckets {r['bucket_ms']:.4f}ms"
+        f"\ncold tenant reload {r['reload_ms']:.2f}ms",
+    )
+
+
+def test_bucketed_checks_beat_sum_scans():
+    report = run_benchmark()
+    _print(report)
+    assert report["bucket_ms"] * 10 < report["legacy_ms"]
+    assert report["monthly_match"] == 1.0
+
+
+if __name__ == "__main__":
+    _print(run_benchmark())
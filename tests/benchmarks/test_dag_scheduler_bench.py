@@ -0,0 +1,117 @@
+"""Mekong CLI - DAG Scheduler Benchmark.
+
+Compares wall-clock time of the wave-barrier DAGScheduler against the
+EventDrivenDAGScheduler on synthetic wide and deep DAGs with uneven
+step durations (one slow step per wave holds back the barrier scheduler).
+
+Usage:
+    RUN_BENCHMARKS=1 python -m pytest tests/benchmarks/test_dag_scheduler_bench.py -s
+    python -m tests.benchmarks.test_dag_scheduler_bench
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import time
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from src.core.dag_scheduler import DAGScheduler
+from src.core.event_dag_scheduler import EventDrivenDAGScheduler
+
+pytestmark = pytest.mark.skipif(
+    os.getenv("RUN_BENCHMARKS") != "1",
+    reason="Skip benchmarks — set RUN_BENCHMARKS=1 to run",
+)
+
+_PASSED = SimpleNamespace(verification=SimpleNamespace(passed=True))
+
+
+@dataclass
+class BenchStep:
+    """Synthetic step with a simulated duration."""
+
+    order: int
+    dependencies: list[int] = field(default_factory=list)
+    params: dict[str, Any] = field(default_factory=dict)
+
+
+def wide_dag(chains: int = 30, length: int = 10, seed: int = 7) -> list[BenchStep]:
+    """Many independent chains; each chain has random step durations."""
+    rng = random.Random(seed)
+    steps = []
+    order = 0
+    for _ in range(chains):
+        prev = None
+        for _ in range(length):
+            order += 1
+            duration = 0.02 if rng.random() < 0.1 else 0.002
+            steps.append(
+                BenchStep(order, [prev] if prev else [], {"duration": duration}),
+            )
+            prev = order
+    return steps
+
+
+def deep_dag(layers: int = 40, width: int = 8, seed: int = 11) -> list[BenchStep]:
+    """Layered DAG where each node depends on 1-2 nodes of the previous layer."""
+    rng = random.Random(seed)
+    steps = []
+    previous: list[int] = []
+    order = 0
+    for _ in range(layers):
+        current = []
+        for _ in range(width):
+            order += 1
+            deps = rng.sample(previous, k=min(len(previous), rng.randint(1, 2)))
+            duration = 0.02 if rng.random() < 0.1 else 0.002
+            steps.append(BenchStep(order, deps, {"duration": duration}))
+            current.append(order)
+        previous = current
+    return steps
+
+
+def _run_step(step: BenchStep) -> SimpleNamespace:
+    time.sleep(step.params["duration"])
+    return _PASSED
+
+
+def _time(scheduler_cls: type, steps: list[BenchStep], workers: int) -> float:
+    scheduler = scheduler_cls(steps, max_workers=workers)
+    start = time.perf_counter()
+    results = scheduler.execute_all(_run_step)
+    elapsed = time.perf_counter() - start
+    assert len(results) == len(steps)
+    return elapsed
+
+
+def run_benchmark(workers: int = 8) -> dict[str, dict[str, float]]:
+    """Return wall-clock seconds per (shape, scheduler)."""
+    report = {}
+    for name, steps in (("wide", wide_dag()), ("deep", deep_dag())):
+        report[name] = {
+            "steps": len(steps),
+            "wave_barrier": _time(DAGScheduler, steps, workers),
+            "event_driven": _time(EventDrivenDAGScheduler, steps, workers),
+        }
+    return report
+
+
+def test_event_driven_beats_wave_barrier():
+    report = run_benchmark()
+    for name, row in report.items():
+        print(
+            f"{name:5s} steps={row['steps']:4d} "
+            f"wave={row['wave_barrier']:.3f}s event={row['event_driven']:.3f}s "
+            f"speedup={row['wave_barrier'] / row['event_driven']:.2f}x",
+        )
+        assert row["event_driven"] < row["wave_barrier"]
+
+
+if __name__ == "__main__":
+    for shape, row in run_benchmark().items():
+        print(shape, row)
@@ -0,0 +1,103 @@
+"""Mekong CLI - DurableTaskQueue Throughput Benchmark.
+
+Producer processes enqueue tasks while competing worker processes lease
+them with poll_many and acknowledge each batch with ack_many. Reports enqueue and
+lease+ack throughput and checks every task was handed out exactly once.
+
+Usage:
+    RUN_BENCHMARKS=1 python -m pytest tests/benchmarks/test_durable_task_queue_bench.py -s
+    python -m tests.benchmarks.test_durable_task_queue_bench
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+
+from src.core.durable_task_queue import DurableTaskQueue
+from src.core.task_queue import TaskPriority
+
+pytestmark = pytest.mark.skipif(
+    os.getenv("RUN_BENCHMARKS") != "1",
+    reason="Skip benchmarks — set RUN_BENCHMARKS=1 to run",
+)
+
+TASKS_PER_PRODUCER = 5_000
+PRODUCERS = 2
+WORKERS = 4
+BATCH = 32
+
+
+def _produce(db_path: str, producer: int, out) -> None:
+    queue = DurableTaskQueue(db_path, max_size=0)
+    start = time.perf_counter()
+    for i in range(TASKS_PER_PRODUCER):
+        queue.enqueue(f"p{producer}-{i}", "bench", TaskPriority(i % 5))
+    out.put(("produce", time.perf_counter() - start, TASKS_PER_PRODUCER))
+
+
+def _consume(db_path: str, worker: int, total: int, out) -> None:
+    queue = DurableTaskQueue(db_path, max_size=0, worker_id=f"w{worker}")
+    seen = []
+    first = last = None
+    idle_since = None
+    while True:
+        batch = queue.poll_many(BATCH)
+        if not batch:
+            idle_since = idle_since or time.perf_counter()
+            if time.perf_counter() - idle_since > 1.0:
+                break
+            time.sleep(0.005)
+            continue
+        idle_since = None
+        first = first or time.time()
+        queue.ack_many(batch)
+        last = time.time()
+        seen.extend(task.task_id for task in batch)
+    out.put(("consume", (first, last), seen))
+
+
+def run_benchmark() -> dict:
+    db_path = str(Path(tempfile.mkdtemp()) / "queue.db")
+    DurableTaskQueue(db_path).close()  # Create schema before the race
+    total = TASKS_PER_PRODUCER * PRODUCERS
+    ctx = multiprocessing.get_context("spawn")
+    out = ctx.Queue()
+    procs = [ctx.Process(target=_produce, args=(db_path, p, out)) for p in range(PRODUCERS)]
+    procs += [ctx.Process(target=_consume, args=(db_path, w, total, out)) for w in range(WORKERS)]
+    for p in procs:
+        p.start()
+    results = [out.get(timeout=300) for _ in procs]
+    for p in procs:
+        p.join(30)
+
+    produce_secs = max(r[1] for r in results if r[0] == "produce")
+    consumers = [r for r in results if r[0] == "consume" and r[1][0]]
+    seen = [tid for r in consumers for tid in r[2]]
+    # Wall-clock span from the first lease to the last ack across workers
+    span = max(r[1][1] for r in consumers) - min(r[1][0] for r in consumers)
+    return {
+        "tasks": total,
+        "producers": PRODUCERS,
+        "workers": WORKERS,
+        "enqueue_per_sec": round(total / produce_secs),
+        "lease_ack_per_sec": round(len(seen) / span),
+        "delivered": len(seen),
+        "duplicates": len(seen) - len(set(seen)),
+    }
+
+
+def test_durable_queue_throughput() -> None:
+    result = run_benchmark()
+    print("\nDurableTaskQueue:", result)
+    assert result["delivered"] == result["tasks"]
+    assert result["duplicates"] == 0
+
+
+if __name__ == "__main__":
+    print(run_benchmark())
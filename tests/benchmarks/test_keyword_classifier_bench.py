@@ -0,0 +1,132 @@
+"""Mekong CLI - Goal Keyword Classification Benchmark.
+
+Classifies a 100k-goal corpus (seeded, EN + VN templates, with the
+repeats a real goal log has) through IntentClassifier, classify_task and
+the daemon ComplexityClassifier, and compares:
+1. legacy: one ``keyword in goal`` check per keyword, serial classify
+2. matcher: one shared Aho–Corasick scan per goal, classify_batch dedup
+
+Both paths must produce identical classifications.
+
+Usage:
+    RUN_BENCHMARKS=1 python -m pytest tests/benchmarks/test_keyword_classifier_bench.py -s
+    python -m tests.benchmarks.test_keyword_classifier_bench
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import time
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from src.core.keyword_matcher import scan_goal
+from src.core.nlu import KEYWORD_MAP, IntentClassifier
+from src.core.task_classifier import SIGNAL_GROUPS, classify_task
+from src.daemon.classifier import DEFAULT_KEYWORDS, LEVELS, ComplexityClassifier
+
+pytestmark = pytest.mark.skipif(
+    os.getenv("RUN_BENCHMARKS") != "1",
+    reason="Skip benchmarks — set RUN_BENCHMARKS=1 to run",
+)
+
+GOALS = 100_000
+
+_TEMPLATES = [
+    "deploy {p} to {t}", "fix the login bug in {p}", "audit security of {p}",
+    "create a new api endpoint for {p}", "refactor the billing module in {p}",
+    "write a blog post announcing {p}", "monitor health and uptime of {t}",
+    "analyze revenue trends for {p} and build a dashboard",
+    "send marketing email sequence to trial users of {p}",
+    "check status of all services on {t}", "optimize database queries in {p}",
+    "migrate {p} from {t} to kubernetes", "schedule a daily report every 5 minutes for {p}",
+    "rotate the api token and secret key for {p}", "triển khai {p} lên {t}",
+    "sửa lỗi đăng nhập trong {p}", "tối ưu hiệu năng của {p}", "báo cáo doanh thu tháng này cho {p}",
+    "help a confused customer with a refund ticket about {p}",
+    "redesign the architecture of the {p} platform infrastructure",
+    "summarize yesterday's standup notes for {p}", "{p} feels slow, why?",
+]
+_PROJECTS = [f"app-{i}" for i in range(300)] + ["sophia", "mekong", "agencyos", "polar"]
+_TARGETS = ["production", "staging", "vercel", "fly.io", "cloud run", "máy chủ"]
+
+
+def build_corpus(size: int = GOALS, seed: int = 42) -> list[str]:
+    rng = random.Random(seed)
+    return [
+        rng.choice(_TEMPLATES).format(p=rng.choice(_PROJECTS), t=rng.choice(_TARGETS))
+        for _ in range(size)
+    ]
+
+
+class NaiveMatcher:
+    """The scan this replaced: one ``keyword in text`` check per keyword."""
+
+    def __init__(self, groups: dict[Any, list[str]]) -> None:
+        self.groups = groups
+
+    def scan(self, text: str) -> dict[Any, list[str]]:
+        hits = {label: [kw for kw in kws if kw in text] for label, kws in self.groups.items()}
+        return {label: kws for label, kws in hits.items() if kws}
+
+
+def _classify_all(corpus: list[str], batch: bool) -> tuple[list[Any], float]:
+    classifier = IntentClassifier()
+    daemon = ComplexityClassifier()
+    if not batch:
+        daemon._matcher = NaiveMatcher({level: DEFAULT_KEYWORDS[level]["keywords"] for level in LEVELS})
+    start = time.perf_counter()
+    intents = classifier.classify_batch(corpus) if batch else [classifier.classify(g) for g in corpus]
+    profiles = [classify_task(goal) for goal in corpus]
+    levels = [daemon.classify(goal) for goal in corpus]
+    elapsed = time.perf_counter() - start
+    return list(zip(intents, profiles, levels)), elapsed
+
+
+def run_benchmark(size: int = GOALS) -> dict[str, Any]:
+    corpus = build_corpus(size)
+    # Each module scans only its own keyword tables, as before
+    intent_scan = NaiveMatcher({("intent", i): kws for i, kws in KEYWORD_MAP.items()}).scan
+    signal_scan = NaiveMatcher(SIGNAL_GROUPS).scan
+
+    with patch("src.core.nlu.scan_goal", intent_scan), \
+            patch("src.core.task_classifier.scan_goal", signal_scan):
+        legacy, legacy_s = _classify_all(corpus, batch=False)
+
+    scan_goal.cache_clear()
+    matched, matcher_s = _classify_all(corpus, batch=True)
+
+    mismatches = sum(
+        (a.intent, a.confidence, a.entities) != (b.intent, b.confidence, b.entities)
+        or p != q
+        or (d.level, d.matched_keyword) != (e.level, e.matched_keyword)
+        for (a, p, d), (b, q, e) in zip(legacy, matched)
+    )
+    return {
+        "goals": size,
+        "unique": len(set(corpus)),
+        "legacy_s": legacy_s,
+        "matcher_s": matcher_s,
+        "mismatches": mismatches,
+    }
+
+
+def _print(r: dict[str, Any]) -> None:
+    print(f"\n{r['goals']:,} goals ({r['unique']:,} distinct), intent + task + daemon classification")
+    for name in ("legacy", "matcher"):
+        seconds = r[f"{name}_s"]
+        print(f"  {name:<8} {seconds:.2f}s  ({r['goals'] / seconds:,.0f} goals/s)")
+    print(f"  mismatches: {r['mismatches']}")
+
+
+def test_shared_matcher_beats_per_keyword_scans():
+    report = run_benchmark()
+    _print(report)
+    assert report["mismatches"] == 0
+    assert report["matcher_s"] < report["legacy_s"]
+
+
+if __name__ == "__main__":
+    _print(run_benchmark())
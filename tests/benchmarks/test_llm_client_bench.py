@@ -0,0 +1,75 @@
+"""Mekong CLI - LLMClient Throughput Benchmark.
+
+Measures requests/sec against a local stub OpenAI-compatible server with a
+fixed per-request latency:
+1. Sequential sync chat() (one call after another)
+2. Async chat_many() with bounded concurrency and pooled connections
+
+Usage:
+    RUN_BENCHMARKS=1 python -m pytest tests/benchmarks/test_llm_client_bench.py -s
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+
+import pytest
+
+from src.core.llm_client import LLMClient
+from src.core.providers import OpenAICompatibleProvider
+from tests.fixtures.llm_stub_server import StubLLMServer
+
+pytestmark = pytest.mark.skipif(
+    os.getenv("RUN_BENCHMARKS") != "1",
+    reason="Skip benchmarks — set RUN_BENCHMARKS=1 to run",
+)
+
+REQUESTS = 200
+LATENCY = 0.02
+
+
+def _client(base_url: str) -> LLMClient:
+    provider = OpenAICompatibleProvider(base_url, model="stub", max_connections=32)
+    return LLMClient(providers=[provider], enable_cache=False, enable_hooks=False)
+
+
+def run_benchmark(concurrency: int = 32) -> dict[str, float]:
+    """Return requests/sec for sequential and concurrent paths."""
+    prompts = [[{"role": "user", "content": f"prompt {i}"}] for i in range(REQUESTS)]
+    report: dict[str, float] = {}
+
+    with StubLLMServer(latency=LATENCY) as server:
+        client = _client(server.base_url)
+        start = time.perf_counter()
+        for messages in prompts:
+            client.chat(messages)
+        report["sequential_rps"] = REQUESTS / (time.perf_counter() - start)
+        report["sequential_connections"] = server.connections
+
+    with StubLLMServer(latency=LATENCY) as server:
+        client = _client(server.base_url)
+
+        async def _run() -> None:
+            await client.chat_many([{"messages": m} for m in prompts], concurrency=concurrency)
+            await client.aclose()
+
+        start = time.perf_counter()
+        asyncio.run(_run())
+        report["chat_many_rps"] = REQUESTS / (time.perf_counter() - start)
+        report["chat_many_connections"] = server.connections
+
+    return report
+
+
+def test_chat_many_throughput():
+    report = run_benchmark()
+    print(
+        f"sequential={report['sequential_rps']:.1f} req/s "
+        f"({report['sequential_connections']} conns)  "
+        f"chat_many={report['chat_many_rps']:.1f} req/s "
+        f"({report['chat_many_connections']} conns)",
+    )
+    assert report["chat_many_rps"] > report["sequential_rps"] * 2
+    assert report["sequential_connections"] == 1
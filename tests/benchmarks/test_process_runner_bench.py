@@ -0,0 +1,115 @@
+"""Mekong CLI - Process Runner Benchmark.
+
+Runs a command that prints ~40MB and compares:
+1. buffered: ``subprocess.run(capture_output=True, text=True)``, the way
+   shell steps, missions and tools used to capture output
+2. runner: ProcessRunner with its bounded tail plus spill-to-disk
+
+Reports wall time, Python heap peak (tracemalloc, from a separate run so
+tracing overhead does not skew the timings) and how soon the first line
+was visible to the caller.
+
+Usage:
+    RUN_BENCHMARKS=1 python -m pytest tests/benchmarks/test_process_runner_bench.py -s
+    python -m tests.benchmarks.test_process_runner_bench
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any
+
+import pytest
+
+from src.core.process_runner import ProcessRunner
+
+pytestmark = pytest.mark.skipif(
+    os.getenv("RUN_BENCHMARKS") != "1",
+    reason="Skip benchmarks — set RUN_BENCHMARKS=1 to run",
+)
+
+LINES = 500_000
+_SCRIPT = (
+    "import sys, time\n"
+    "w = sys.stdout.write\n"
+    "w('start\\n'); sys.stdout.flush(); time.sleep(0.2)\n"
+    "for i in range({n}): w('%08d ' % i + 'x' * 70 + '\\n')\n"
+)
+
+
+def _measure(fn: Any) -> tuple[Any, float, int]:
+    start = time.perf_counter()
+    result = fn()
+    seconds = time.perf_counter() - start
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, seconds, peak
+
+
+def run_benchmark(lines: int = LINES) -> dict[str, Any]:
+    argv = [sys.executable, "-c", _SCRIPT.format(n=lines)]
+
+    buffered, buffered_s, buffered_peak = _measure(
+        lambda: subprocess.run(argv, capture_output=True, text=True),
+    )
+
+    first_line: list[float] = []
+    with tempfile.TemporaryDirectory() as spill_dir:
+        runner = ProcessRunner(max_concurrency=1, spill_dir=spill_dir)
+
+        def on_line(stream: str, line: str) -> None:
+            if not first_line:
+                first_line.append(time.perf_counter() - start)
+
+        def streamed_run() -> Any:
+            nonlocal start
+            start = time.perf_counter()
+            return runner.run(argv, on_line=on_line)
+
+        start = 0.0
+        try:
+            streamed, runner_s, runner_peak = _measure(streamed_run)
+        finally:
+            runner.shutdown()
+        spilled = os.path.getsize(streamed.spill_paths["stdout"])
+
+    return {
+        "output_mb": len(buffered.stdout) / 1e6,
+        "buffered_s": buffered_s,
+        "buffered_peak_mb": buffered_peak / 1e6,
+        "runner_s": runner_s,
+        "runner_peak_mb": runner_peak / 1e6,
+        "runner_first_line_s": first_line[0],
+        "spilled_mb": spilled / 1e6,
+        "tail_matches": buffered.stdout.endswith(streamed.stdout.split("\n", 1)[1]),
+    }
+
+
+def _print(r: dict[str, Any]) -> None:
+    print(f"\n{r['output_mb']:.1f}MB of stdout")
+    print(f"  buffered  {r['buffered_s'] * 1000:8.1f}ms  heap peak {r['buffered_peak_mb']:7.1f}MB  first line at exit")
+    print(
+        f"  runner    {r['runner_s'] * 1000:8.1f}ms  heap peak {r['runner_peak_mb']:7.1f}MB  "
+        f"first line {r['runner_first_line_s'] * 1000:.0f}ms  (spilled {r['spilled_mb']:.1f}MB)",
+    )
+
+
+def test_runner_bounds_memory_and_streams():
+    report = run_benchmark()
+    _print(report)
+    assert report["tail_matches"]
+    assert report["spilled_mb"] >= report["output_mb"] * 0.99
+    assert report["runner_peak_mb"] < report["buffered_peak_mb"] / 10
+    assert report["runner_s"] < report["buffered_s"] * 2
+    assert report["runner_first_line_s"] < report["runner_s"] / 2
+
+
+if __name__ == "__main__":
+    _print(run_benchmark())
@@ -0,0 +1,160 @@
+"""Mekong CLI - Swarm Dispatch Benchmark.
+
+Starts 1, 2 and 4 local stub gateway nodes (FastAPI + uvicorn in threads,
+each with a fixed number of worker slots and a fixed cost per goal) and
+measures steps/sec for:
+1. legacy: every step to the first healthy node, fresh connection each time
+2. dispatch: least-outstanding node selection over keep-alive sessions
+3. batch: DAG-ready waves sent with dispatch_batch (one request per node)
+
+Usage:
+    RUN_BENCHMARKS=1 python -m pytest tests/benchmarks/test_swarm_dispatch_bench.py -s
+    python -m tests.benchmarks.test_swarm_dispatch_bench
+"""
+
+from __future__ import annotations
+
+import os
+import socket
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+import requests  # type: ignore[import-untyped]
+
+from src.core.swarm import SwarmDispatcher, SwarmRegistry
+
+pytestmark = pytest.mark.skipif(
+    os.getenv("RUN_BENCHMARKS") != "1",
+    reason="Skip benchmarks — set RUN_BENCHMARKS=1 to run",
+)
+
+NODE_COUNTS = (1, 2, 4)
+STEPS = 96
+WAVE = 16  # Ready steps per DAG wave / concurrent callers
+NODE_SLOTS = 2  # Goals a stub node runs at once
+STEP_SECONDS = 0.05
+
+
+def _stub_app() -> Any:
+    from fastapi import FastAPI
+
+    app = FastAPI()
+    slots = threading.Semaphore(NODE_SLOTS)
+    pool = ThreadPoolExecutor(max_workers=NODE_SLOTS)
+
+    def run(goal: str) -> dict[str, Any]:
+        with slots:
+            time.sleep(STEP_SECONDS)
+        return {"status": "success", "result": goal}
+
+    @app.get("/health")
+    def health() -> dict[str, str]:
+        return {"status": "ok"}
+
+    @app.post("/cmd")
+    def cmd(req: dict[str, Any]) -> dict[str, Any]:
+        return run(req["goal"])
+
+    @app.post("/cmd/batch")
+    def cmd_batch(req: dict[str, Any]) -> dict[str, Any]:
+        return {"results": list(pool.map(run, req["goals"]))}
+
+    return app
+
+
+def _start_node() -> tuple[Any, int]:
+    import uvicorn
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config(_stub_app(), host="127.0.0.1", port=port, log_level="error"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.01)
+    return server, port
+
+
+class LegacyDispatcher(SwarmDispatcher):
+    """Previous behaviour: healthy[0] and a new connection per step."""
+
+    def dispatch(self, step: Any) -> Any:
+        node = self.get_healthy_nodes()[0]
+        resp = requests.post(
+            f"http://{node.host}:{node.port}/cmd",
+            json={"goal": step.description, "token": node.token},
+            timeout=60.0,
+        )
+        return self._to_result(resp.json())
+
+
+def _steps() -> list[SimpleNamespace]:
+    return [SimpleNamespace(description=f"step {i}", params={}) for i in range(STEPS)]
+
+
+def _concurrent(dispatcher: SwarmDispatcher) -> float:
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=WAVE) as pool:
+        results = list(pool.map(dispatcher.dispatch, _steps()))
+    assert all(r.exit_code == 0 for r in results)
+    return STEPS / (time.perf_counter() - start)
+
+
+def _waves(dispatcher: SwarmDispatcher) -> float:
+    steps = _steps()
+    start = time.perf_counter()
+    for i in range(0, STEPS, WAVE):
+        results = dispatcher.dispatch_batch(steps[i:i + WAVE])
+        assert all(r.exit_code == 0 for r in results)
+    return STEPS / (time.perf_counter() - start)
+
+
+def run_benchmark() -> dict[int, dict[str, float]]:
+    nodes = [_start_node() for _ in range(max(NODE_COUNTS))]
+    report: dict[int, dict[str, float]] = {}
+    try:
+        for count in NODE_COUNTS:
+            with tempfile.TemporaryDirectory() as tmp:
+                registry = SwarmRegistry(config_path=str(Path(tmp) / "swarm.yaml"))
+                for i, (_, port) in enumerate(nodes[:count]):
+                    registry.register_node(f"node{i}", "127.0.0.1", port, "tok")
+                registry.check_all_health()
+                dispatcher = SwarmDispatcher(registry)
+                report[count] = {
+                    "legacy": _concurrent(LegacyDispatcher(registry)),
+                    "dispatch": _concurrent(dispatcher),
+                    "batch": _waves(dispatcher),
+                }
+                dispatcher.close()
+    finally:
+        for server, _ in nodes:
+            server.should_exit = True
+    return report
+
+
+def _print(r: dict[int, dict[str, float]]) -> None:
+    print(f"\n{STEPS} steps, {NODE_SLOTS} slots/node, {STEP_SECONDS * 1000:.0f}ms/step, waves of {WAVE}")
+    for count, stats in r.items():
+        print(
+            f"  {count} node(s): legacy {stats['legacy']:.0f} steps/s, "
+            f"dispatch {stats['dispatch']:.0f} steps/s, batch {stats['batch']:.0f} steps/s"
+        )
+
+
+def test_throughput_scales_with_nodes():
+    report = run_benchmark()
+    _print(report)
+    many = max(NODE_COUNTS)
+    # Legacy piles everything on one node; load-aware dispatch spreads it
+    assert report[many]["dispatch"] > 2 * report[many]["legacy"]
+    assert report[many]["batch"] > 1.5 * report[1]["batch"]
+
+
+if __name__ == "__main__":
+    _print(run_benchmark())
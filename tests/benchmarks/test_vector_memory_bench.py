@@ -0,0 +1,128 @@
+"""Mekong CLI - VectorMemoryStore Benchmark.
+
+Compares top-k query latency across 1k / 10k / 100k vectors (dim 64):
+1. Pure-Python cosine scan + full sort (the previous implementation)
+2. Exact matrix search (one mat-vec product + argpartition)
+3. IVF approximate search, with recall@10 against the exact result
+
+Also times a binary snapshot save and memory-mapped reload.
+
+Usage:
+    RUN_BENCHMARKS=1 python -m pytest tests/benchmarks/test_vector_memory_bench.py -s
+    python -m tests.benchmarks.test_vector_memory_bench
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pytest
+
+from src.core.vector_memory_store import VectorMemoryStore
+
+pytestmark = pytest.mark.skipif(
+    os.getenv("RUN_BENCHMARKS") != "1",
+    reason="Skip benchmarks — set RUN_BENCHMARKS=1 to run",
+)
+
+DIM = 64
+SIZES = (1_000, 10_000, 100_000)
+QUERIES = 20
+TOP_K = 10
+
+
+def _python_scan(rows: list[list[float]], query: list[float]) -> list[tuple[int, float]]:
+    """Reference: the old per-entry pure-Python cosine + sort."""
+    def cosine(a: list[float], b: list[float]) -> float:
+        dot = sum(x * y for x, y in zip(a, b))
+        mag = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+        return dot / mag if mag else 0.0
+
+    scored = [(i, cosine(query, row)) for i, row in enumerate(rows)]
+    scored.sort(key=lambda x: x[1], reverse=True)
+    return scored[:TOP_K]
+
+
+def _dataset(n: int, rng: np.random.Generator) -> np.ndarray:
+    centers = rng.normal(size=(max(8, n // 250), DIM))
+    labels = rng.integers(0, len(centers), size=n)
+    return (centers[labels] + rng.normal(scale=0.3, size=(n, DIM))).astype(np.float32)
+
+
+def _ms_per_query(fn: Any, queries: np.ndarray) -> float:
+    start = time.perf_counter()
+    for q in queries:
+        fn(q)
+    return (time.perf_counter() - start) / len(queries) * 1000
+
+
+def run_benchmark() -> list[dict[str, float]]:
+    """Return one report row per collection size."""
+    rng = np.random.default_rng(42)
+    report = []
+    for n in SIZES:
+        data = _dataset(n, rng)
+        ids = [f"v{i}" for i in range(n)]
+        queries = data[rng.integers(0, n, size=QUERIES)] + rng.normal(scale=0.1, size=(QUERIES, DIM))
+
+        exact = VectorMemoryStore()
+        exact.create_collection("bench", DIM)
+        exact.upsert_many("bench", ids, data)
+        ann = VectorMemoryStore(ann_threshold=5_000)
+        ann.create_collection("bench", DIM)
+        ann.upsert_many("bench", ids, data)
+        ann.search("bench", queries[0].tolist(), top_k=TOP_K)  # build IVF outside the timer
+
+        rows = data.tolist()
+        python_q = queries[: max(2, QUERIES // (n // 1_000))]
+        row = {
+            "n": n,
+            "python_ms": _ms_per_query(lambda q: _python_scan(rows, q.tolist()), python_q),
+            "matrix_ms": _ms_per_query(lambda q: exact.search("bench", q.tolist(), top_k=TOP_K), queries),
+            "ivf_ms": _ms_per_query(lambda q: ann.search("bench", q.tolist(), top_k=TOP_K), queries),
+        }
+        hits = 0
+        for q in queries:
+            truth = {e.id for e, _ in exact.search("bench", q.tolist(), top_k=TOP_K)}
+            hits += len(truth & {e.id for e, _ in ann.search("bench", q.tolist(), top_k=TOP_K)})
+        row["ivf_recall"] = hits / (QUERIES * TOP_K)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = str(Path(tmp) / "vectors.json")
+            exact._persist_path = Path(path)
+            start = time.perf_counter()
+            exact.save_snapshot(path)
+            row["save_ms"] = (time.perf_counter() - start) * 1000
+            start = time.perf_counter()
+            VectorMemoryStore(path)
+            row["load_ms"] = (time.perf_counter() - start) * 1000
+        report.append(row)
+    return report
+
+
+def _print(report: list[dict[str, float]]) -> None:
+    print(f"\n{'n':>8} {'python':>10} {'matrix':>10} {'ivf':>10} {'recall':>7} {'save':>9} {'load':>9}")
+    for r in report:
+        print(
+            f"{r['n']:>8} {r['python_ms']:>8.2f}ms {r['matrix_ms']:>8.3f}ms "
+            f"{r['ivf_ms']:>8.3f}ms {r['ivf_recall']:>7.2f} "
+            f"{r['save_ms']:>7.1f}ms {r['load_ms']:>7.1f}ms",
+        )
+
+
+def test_vector_search_scaling():
+    report = run_benchmark()
+    _print(report)
+    for r in report:
+        assert r["matrix_ms"] * 10 < r["python_ms"]
+    assert report[-1]["ivf_recall"] >= 0.8
+
+
+if __name__ == "__main__":
+    _print(run_benchmark())
@@ -0,0 +1,76 @@
+"""
+Tests for lazy command loading
+
+Tests cover:
+- Manifest matches the eager registration
+- Importing src.main does not import command modules
+- --help lists every command from the manifest
+- Commands and subgroups resolve on first use
+- doctor --startup import profile
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import typer
+from typer.testing import CliRunner
+
+from src.cli.command_manifest import COMMAND_MANIFEST
+from src.cli.lazy_commands import LazyCommand, build_manifest
+from src.main import app
+
+ROOT = Path(__file__).resolve().parents[2]
+runner = CliRunner()
+
+
+def test_manifest_is_up_to_date():
+    """Regenerate with: python -m src.cli.lazy_commands"""
+    assert build_manifest() == COMMAND_MANIFEST
+
+
+def test_import_main_skips_command_modules():
+    code = (
+        "import sys, src.main\n"
+        "print(sorted(m for m in sys.modules if m.startswith(('src.commands', 'src.core', 'httpx'))))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, timeout=60,
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "[]"
+
+
+def test_help_lists_manifest_commands():
+    result = runner.invoke(app, ["--help"], terminal_width=200)
+    assert result.exit_code == 0
+    for name, entry in COMMAND_MANIFEST.items():
+        if not entry.get("hidden"):
+            assert name in result.output
+
+
+def test_subgroup_resolves_on_invoke():
+    result = runner.invoke(app, ["doctor", "info"])
+    assert result.exit_code == 0
+    assert "System Information" in result.output
+
+
+def test_lazy_stub_loads_real_command():
+    stub = typer.main.get_group(app).get_command(None, "license")
+    assert isinstance(stub, LazyCommand)
+    assert stub.help == COMMAND_MANIFEST["license"]["help"]
+    assert "tiers" in stub.load().commands
+
+
+def test_unknown_command_errors():
+    result = runner.invoke(app, ["no-such-command"])
+    assert result.exit_code == 2
+    assert "No such command" in result.output
+
+
+def test_doctor_startup_profile():
+    result = runner.invoke(app, ["doctor", "--startup", "--top", "5"], terminal_width=200)
+    assert result.exit_code == 0
+    assert "import src.main" in result.output
+    assert "command modules imported at startup" not in result.output
+
@@ -0,0 +1,145 @@
+"""
+Local OpenAI-compatible stub server for LLM client tests and benchmarks.
+
+Serves POST /chat/completions over HTTP/1.1 keep-alive on 127.0.0.1.
+Echoes the last user message, optionally after a fixed latency, and
+counts requests and accepted TCP connections. Requests with "stream": true
+get a chunked server-sent-events response, one word per chunk. Paths listed
+in ``redirects`` answer with that (status, Location) instead; every request
+target and its headers are recorded, so the stub can also stand in for a
+forward proxy.
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        return
+
+    def setup(self) -> None:
+        super().setup()
+        with self.server.lock:  # type: ignore[attr-defined]
+            self.server.connections += 1  # type: ignore[attr-defined]
+
+    def do_GET(self) -> None:  # noqa: N802
+        self.do_POST()
+
+    def do_POST(self) -> None:  # noqa: N802
+        server = self.server
+        length = int(self.headers.get("Content-Length", 0))
+        payload = json.loads(self.rfile.read(length) or b"{}")
+        with server.lock:  # type: ignore[attr-defined]
+            server.seen.append((self.command, self.path, dict(self.headers)))  # type: ignore[attr-defined]
+        redirect = server.redirects.get(self.path)  # type: ignore[attr-defined]
+        if redirect:
+            self.send_response(redirect[0])
+            self.send_header("Location", redirect[1])
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        with server.lock:  # type: ignore[attr-defined]
+            server.requests += 1  # type: ignore[attr-defined]
+            server.payloads.append(payload)  # type: ignore[attr-defined]
+            status = server.fail_status  # type: ignore[attr-defined]
+
+        if server.latency:  # type: ignore[attr-defined]
+            time.sleep(server.latency)  # type: ignore[attr-defined]
+
+        user = [m for m in payload.get("messages", []) if m.get("role") == "user"]
+        content = f"echo: {user[-1]['content'] if user else ''}"
+        if payload.get("stream") and not status:
+            self._stream(content)
+            return
+
+        if status:
+            body = b'{"error": "stub failure"}'
+            self.send_response(status)
+        else:
+            body = json.dumps({
+                "model": payload.get("model", "stub"),
+                "choices": [{"message": {"role": "assistant", "content": content}}],
+                "usage": {"total_tokens": len(content.split())},
+            }).encode()
+            self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _stream(self, content: str) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        words = content.split(" ")
+        for i, word in enumerate(words):
+            delta = word if i == 0 else f" {word}"
+            event = {"choices": [{"delta": {"content": delta}}]}
+            self._write_chunk(f"data: {json.dumps(event)}\n\n".encode())
+            if self.server.chunk_delay:  # type: ignore[attr-defined]
+                time.sleep(self.server.chunk_delay)  # type: ignore[attr-defined]
+        self._write_chunk(b"data: [DONE]\n\n")
+        self.wfile.write(b"0\r\n\r\n")
+
+    def _write_chunk(self, data: bytes) -> None:
+        self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+        self.wfile.flush()
+
+
+class StubLLMServer:
+    """Threaded stub server; use as a context manager."""
+
+    def __init__(
+        self, latency: float = 0.0, fail_status: int = 0, chunk_delay: float = 0.0,
+        redirects: Optional[Dict[str, Tuple[int, str]]] = None,
+    ) -> None:
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self._server.daemon_threads = True
+        self._server.lock = threading.Lock()  # type: ignore[attr-defined]
+        self._server.latency = latency  # type: ignore[attr-defined]
+        self._server.fail_status = fail_status  # type: ignore[attr-defined]
+        self._server.chunk_delay = chunk_delay  # type: ignore[attr-defined]
+        self._server.requests = 0  # type: ignore[attr-defined]
+        self._server.connections = 0  # type: ignore[attr-defined]
+        self._server.payloads = []  # type: ignore[attr-defined]
+        self._server.redirects = redirects or {}  # type: ignore[attr-defined]
+        self._server.seen = []  # type: ignore[attr-defined]
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    @property
+    def requests(self) -> int:
+        return self._server.requests  # type: ignore[attr-defined]
+
+    @property
+    def connections(self) -> int:
+        return self._server.connections  # type: ignore[attr-defined]
+
+    @property
+    def payloads(self) -> List[Dict[str, Any]]:
+        return self._server.payloads  # type: ignore[attr-defined]
+
+    @property
+    def seen(self) -> List[Tuple[str, str, Dict[str, str]]]:
+        """(method, request target, headers) of every request received."""
+        return self._server.seen  # type: ignore[attr-defined]
+
+    def __enter__(self) -> "StubLLMServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self._server.shutdown()
+        self._server.server_close()
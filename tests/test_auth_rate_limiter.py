@@ -0,0 +1,192 @@
+"""
+Tests for auth rate limiter storage backends
+
+Covers:
+- GCRA limits, refill and retry-after in ShardedRateStorage
+- Exact limits under concurrent asyncio and thread access
+- Incremental and background eviction of full buckets
+- RedisRateStorage against a local Redis stand-in
+"""
+
+import asyncio
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.auth.rate_limiter import (
+    GCRA_LUA,
+    InMemoryRateStorage,
+    RateLimitConfig,
+    RateLimiter,
+    RateLimitPreset,
+    RedisRateStorage,
+    ShardedRateStorage,
+    gcra_update,
+)
+
+LOGIN = RateLimitConfig(limit=5, window=60)
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class LocalRedis:
+    """fakeredis-style stand-in: GET/SET PX, SCAN, DELETE and GCRA_LUA run in Python."""
+
+    def __init__(self, clock=time.time):
+        self._data = {}
+        self._clock = clock
+
+    def _live(self):
+        now = self._clock()
+        self._data = {k: v for k, v in self._data.items() if v[1] > now}
+        return self._data
+
+    def register_script(self, script):
+        assert script == GCRA_LUA
+
+        async def run(keys, args):
+            now = self._clock()
+            interval, burst, increment = (float(a) for a in args)
+            stored = self._live().get(keys[0])
+            tat = float(stored[0]) if stored else now
+            allowed, tat, retry_after = gcra_update(tat, now, interval, burst, increment)
+            if not allowed:
+                return [0, repr(retry_after).encode(), repr(tat - now).encode()]
+            if increment > 0:
+                self._data[keys[0]] = (repr(tat).encode(), now + math.ceil((tat - now) * 1000) / 1000)
+            return [1, b"0", repr(tat - now).encode()]
+
+        return run
+
+    async def scan_iter(self, match):
+        prefix = match.rstrip("*")
+        for key in list(self._live()):
+            if key.startswith(prefix):
+                yield key.encode()
+
+    async def delete(self, *keys):
+        for key in keys:
+            self._data.pop(key.decode(), None)
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def storage(clock):
+    return ShardedRateStorage(shards=4, ttl_seconds=60, evict_interval=0, clock=clock)
+
+
+class TestShardedRateStorage:
+    async def test_burst_then_deny_with_retry_after(self, storage):
+        decisions = [await storage.acquire("ip:/auth/login", LOGIN) for _ in range(6)]
+        assert [d.allowed for d in decisions] == [True] * 5 + [False]
+        assert [d.remaining for d in decisions] == [4, 3, 2, 1, 0, 0]
+        assert decisions[-1].retry_after == pytest.approx(12.0)
+
+    async def test_refills_one_token_per_interval(self, storage, clock):
+        for _ in range(5):
+            await storage.acquire("k", LOGIN)
+        clock.now += 12
+        assert (await storage.acquire("k", LOGIN)).allowed is True
+        assert (await storage.acquire("k", LOGIN)).allowed is False
+        peek = await storage.peek("k", LOGIN)
+        assert peek.remaining == 0
+        assert peek.reset_after == pytest.approx(60.0)
+
+    async def test_cleanup_evicts_only_full_buckets(self, storage, clock):
+        await storage.acquire("idle", LOGIN)
+        clock.now += 30
+        await storage.acquire("busy", LOGIN)
+        clock.now += 61  # "idle" full for 79s, "busy" for 49s
+        assert await storage.cleanup() == 1
+        assert (await storage.get_stats())["active_buckets"] == 1
+        # An evicted key starts full, exactly as if it had been kept
+        assert (await storage.peek("idle", LOGIN)).remaining == 5
+
+    async def test_evict_step_sweeps_one_shard_at_a_time(self, storage, clock):
+        for i in range(40):
+            await storage.acquire(f"k{i}", LOGIN)
+        clock.now += 200
+        removed = [storage.evict_step() for _ in range(4)]
+        assert sum(removed) == 40
+        assert max(removed) < 40
+
+    async def test_exact_limit_under_concurrent_tasks(self):
+        storage = ShardedRateStorage(evict_interval=0)
+        config = RateLimitConfig(limit=100, window=3600)
+        results = await asyncio.gather(*(storage.acquire("hot", config) for _ in range(500)))
+        assert sum(d.allowed for d in results) == 100
+
+    def test_exact_limit_under_threads(self):
+        storage = ShardedRateStorage(evict_interval=0)
+        config = RateLimitConfig(limit=200, window=3600)
+
+        def hammer(_):
+            return asyncio.run(storage.acquire("hot", config)).allowed
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            assert sum(pool.map(hammer, range(1000))) == 200
+
+    async def test_background_evictor(self):
+        storage = ShardedRateStorage(shards=2, ttl_seconds=0, evict_interval=0.02)
+        await storage.acquire("k", RateLimitConfig(limit=1000, window=1))
+        deadline = time.monotonic() + 2
+        while (await storage.get_stats())["active_buckets"] and time.monotonic() < deadline:
+            await asyncio.sleep(0.01)
+        storage.close()
+        assert (await storage.get_stats())["evicted_total"] == 1
+
+
+class TestRateLimiter:
+    async def test_default_storage_is_sharded(self):
+        assert isinstance(RateLimiter()._storage, ShardedRateStorage)
+
+    @pytest.mark.parametrize("make_storage", [
+        lambda: ShardedRateStorage(evict_interval=0),
+        InMemoryRateStorage,
+        lambda: RedisRateStorage(LocalRedis()),
+    ])
+    async def test_check_limit_headers(self, make_storage):
+        limiter = RateLimiter(storage=make_storage())
+        for _ in range(5):
+            allowed, headers = await limiter.check_limit("1.2.3.4:/auth/login", RateLimitPreset.AUTH_LOGIN)
+            assert allowed
+        allowed, headers = await limiter.check_limit("1.2.3.4:/auth/login", RateLimitPreset.AUTH_LOGIN)
+        assert not allowed
+        assert headers["X-RateLimit-Remaining"] == "0"
+        assert 1 <= int(headers["Retry-After"]) <= 13
+        assert await limiter.get_remaining("1.2.3.4:/auth/login", RateLimitPreset.AUTH_LOGIN) == 0
+
+
+class TestRedisRateStorage:
+    async def test_state_shared_between_instances(self, clock):
+        server = LocalRedis(clock=clock)
+        first, second = RedisRateStorage(server), RedisRateStorage(server)
+        for _ in range(3):
+            await first.acquire("k", LOGIN)
+        assert (await second.acquire("k", LOGIN)).remaining == 1
+
+    async def test_keys_expire_once_full(self, clock):
+        storage = RedisRateStorage(LocalRedis(clock=clock))
+        await storage.acquire("k", LOGIN)
+        assert (await storage.get_stats())["active_buckets"] == 1
+        clock.now += 12.001
+        assert (await storage.get_stats())["active_buckets"] == 0
+
+    async def test_clear_removes_prefixed_keys(self):
+        storage = RedisRateStorage(LocalRedis())
+        await storage.acquire("a", LOGIN)
+        await storage.acquire("b", LOGIN)
+        await storage.clear()
+        assert (await storage.get_stats())["active_buckets"] == 0
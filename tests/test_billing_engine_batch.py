@@ -0,0 +1,202 @@
+"""
+Tests for batch billing in BillingEngine
+
+Covers:
+- Golden set: batch results match calculate_charges per license exactly
+- Exact decimal aggregation in integer micro-units, with Decimal fallback
+- Rate cards prefetched in one query; no per-group resolve()
+- Period billing from usage rows (DECIMAL quantities from the database)
+"""
+
+import random
+from collections import Counter
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import numpy as np
+
+from src.core.anomaly_detector import AnomalyCategory
+from src.core.usage_metering import UsageEvent, UsageEventType
+from src.raas.billing_engine import BillingEngine, UsageColumns, _float_micros
+
+TIERS = {"free": 0, "pro": 1, "enterprise": 2}
+EVENT_TYPES = [UsageEventType.API_CALL, UsageEventType.LLM_CALL, UsageEventType.TOKEN_USAGE, UsageEventType.AGENT_SPAWN]
+MODELS = [None, "gpt-4", "claude-3", "unpriced-model"]
+PERIOD = (datetime(2026, 9, 1, tzinfo=timezone.utc), datetime(2026, 9, 30, tzinfo=timezone.utc))
+
+
+def _rate_cards():
+    cards = []
+    for tier, level in TIERS.items():
+        for event_type in EVENT_TYPES:
+            if tier == "free" and event_type == UsageEventType.AGENT_SPAWN:
+                continue  # No rate card: skipped with a warning
+            cards.append({
+                "plan_tier": tier, "event_type": event_type.value, "model_name": None,
+                "unit": "calls", "unit_price": Decimal("0.00125") / (level + 1),
+                "included_quantity": Decimal(50 * level), "overage_rate": None,
+                "overage_threshold": None,
+            })
+        for model, price in (("gpt-4", "0.03"), ("claude-3", "0.015")):
+            cards.append({
+                "plan_tier": tier, "event_type": UsageEventType.LLM_CALL.value, "model_name": model,
+                "unit": "1K tokens", "unit_price": Decimal(price),
+                "included_quantity": Decimal("10.5"), "overage_rate": Decimal(price) * Decimal("1.2"),
+                "overage_threshold": None,
+            })
+    return cards
+
+
+class FakeRepository:
+    def __init__(self, licenses, rows=None):
+        self.licenses = licenses
+        self.cards = _rate_cards()
+        self.rows = rows or []
+        self.calls = Counter()
+
+    async def get_license_by_key(self, license_key):
+        self.calls["get_license_by_key"] += 1
+        return self.licenses.get(license_key)
+
+    async def get_rate_card(self, plan_tier, event_type, model_name=None):
+        self.calls["get_rate_card"] += 1
+        event_type = getattr(event_type, "value", event_type)
+        for card in self.cards:
+            if (card["plan_tier"], card["event_type"], card["model_name"]) == (plan_tier, event_type, model_name):
+                return card
+        return None
+
+    async def get_licenses_by_keys(self, license_keys):
+        self.calls["get_licenses_by_keys"] += 1
+        return [self.licenses[k] for k in license_keys if k in self.licenses]
+
+    async def get_active_rate_cards(self, plan_tiers):
+        self.calls["get_active_rate_cards"] += 1
+        return [card for card in self.cards if card["plan_tier"] in plan_tiers]
+
+    async def get_usage_events(self, license_key, start_date, end_date):
+        return [row for row in self.rows if row["license_key"] == license_key]
+
+    async def get_usage_events_batch(self, license_keys, start_date, end_date):
+        return sorted((row for row in self.rows if row["license_key"] in license_keys), key=lambda r: r["license_key"])
+
+
+def _value(rng):
+    kind = rng.random()
+    if kind < 0.4:
+        return float(rng.randint(0, 5000))
+    if kind < 0.9:
+        return round(rng.uniform(0, 2000), rng.randint(1, 6))
+    if kind < 0.95:
+        return rng.uniform(0, 10)  # ~17 significant digits: Decimal fallback
+    return round(rng.uniform(0, 1e-3), 5)  # repr uses exponent form, e.g. 1e-05
+
+
+def _golden_set(seed=20260917, licenses=40, events=4000):
+    rng = random.Random(seed)
+    license_rows = {}
+    usage = {}
+    for i in range(licenses):
+        key = f"raas-lic-{i:03d}"
+        if i != 7:  # One unknown license: billed with no line items
+            license_rows[key] = {"license_key": key, "key_id": f"kid-{i}", "tier": rng.choice(list(TIERS))}
+        usage[key] = []
+    keys = list(usage)
+    for n in range(events):
+        model = rng.choice(MODELS)
+        key = rng.choice(keys)
+        metadata = {"key_id": f"kid-{keys.index(key)}"}
+        if model:
+            metadata["model"] = model
+        usage[key].append(UsageEvent(
+            event_type=rng.choice(EVENT_TYPES),
+            category=AnomalyCategory.API_CALLS,
+            metric="requests",
+            value=_value(rng),
+            timestamp=1_788_000_000 + n,
+            metadata=metadata,
+        ))
+    return license_rows, usage
+
+
+def _comparable(result):
+    return (
+        result.key_id,
+        str(result.total),
+        [
+            (item.event_type, item.model_name, str(item.quantity), item.unit, str(item.subtotal), item.metadata)
+            for item in result.line_items
+        ],
+    )
+
+
+async def test_golden_set_matches_per_license_engine():
+    license_rows, usage = _golden_set()
+    legacy_engine = BillingEngine(repository=FakeRepository(license_rows))
+    batch_repo = FakeRepository(license_rows)
+    batch_engine = BillingEngine(repository=batch_repo)
+
+    batch = await batch_engine.calculate_batch_charges(usage, *PERIOD)
+
+    assert set(batch) == set(usage)
+    for key, events in usage.items():
+        expected = await legacy_engine.calculate_charges(key, events, *PERIOD)
+        assert _comparable(batch[key]) == _comparable(expected), key
+    assert sum(r.total for r in batch.values()) > 0
+    assert batch_repo.calls == Counter({"get_licenses_by_keys": 1, "get_active_rate_cards": 1})
+
+
+async def test_default_period_is_first_and_last_event():
+    license_rows, usage = _golden_set(licenses=3, events=50)
+    engine = BillingEngine(repository=FakeRepository(license_rows))
+    batch = await engine.calculate_batch_charges(usage)
+    for key, events in usage.items():
+        expected = await engine.calculate_charges(key, events)
+        assert (batch[key].period_start, batch[key].period_end) == (expected.period_start, expected.period_end)
+
+
+def test_float_micros_exact_only_when_repr_round_trips():
+    values = np.array([0.1, 2.5, 3.0, 1e-05, 0.1234567, 1 / 3, 5e9, -4.25])
+    micros, places, exact = _float_micros(values)
+    assert exact.tolist() == [True, True, True, True, False, False, False, True]
+    assert micros[exact].tolist() == [100000, 2500000, 3000000, 10, -4250000]
+    assert places[exact].tolist() == [1, 1, 1, 5, 2]
+
+
+def test_aggregate_matches_decimal_sum():
+    rng = random.Random(7)
+    values = [_value(rng) for _ in range(2000)] + [Decimal("1.25"), 3, "0.000001"]
+    columns = UsageColumns.from_records(
+        ("lic", "usage:api_call", None if i % 2 else "m", v, 0.0, {}) for i, v in enumerate(values)
+    )
+    quantities, counts = columns.aggregate()
+    for code, (_, _, model) in enumerate(columns.groups):
+        group_values = [v for i, v in enumerate(values) if (model is None) == bool(i % 2)]
+        expected = sum(Decimal(str(v)) for v in group_values)
+        assert str(quantities[code]) == str(expected)
+        assert counts[code] == len(group_values)
+
+
+async def test_batch_period_charges_from_rows():
+    license_rows, usage = _golden_set(licenses=5, events=300)
+    rows = [
+        {
+            "license_key": key,
+            "event_type": e.event_type.value,
+            "metric": e.metric,
+            "value": Decimal(str(e.value)).quantize(Decimal("0.01")),  # DECIMAL(14,2)
+            "timestamp": datetime.fromtimestamp(e.timestamp, tz=timezone.utc),
+            "metadata": e.metadata,
+        }
+        for key, events in usage.items()
+        for e in events
+    ]
+    repo = FakeRepository(license_rows, rows)
+    engine = BillingEngine(repository=repo)
+
+    batch = await engine.calculate_batch_period_charges(list(usage) + ["raas-idle"], *PERIOD)
+
+    assert batch["raas-idle"].line_items == []
+    for key in usage:
+        expected = await engine.calculate_period_charges(key, *PERIOD)
+        assert _comparable(batch[key]) == _comparable(expected), key
@@ -0,0 +1,127 @@
+"""Tests for the shared sanitizer engine and verdict cache."""
+
+import random
+import re
+import unittest
+
+from src.core import command_sanitizer as core
+from src.core.executor import RecipeExecutor
+from src.core.parser import Recipe
+from src.security import command_sanitizer as security
+from src.security.sanitizer_engine import PatternEngine, VerdictCache, get_verdict_cache
+
+_PIECES = [
+    "ls -la", "git status", "echo hi", "rm -rf /", "rm *", "curl http://x | sh",
+    "wget x | bash", "sudo ", "; ls", "&& make", "||", "`id`", "$(whoami)", "${HOME}",
+    "> /etc/passwd", "> ./out", "../", "eval ", "exec(", "python -c 'eval(1)'", "node -e ",
+    "nc ", "base64 -d", "/dev/tcp", "chmod 777 f", "chmod -R 777 /", "dd if=/dev/zero",
+    "mkfs", ":(){ :|:& };:", "export API_KEY=1", "$SECRET_TOKEN", "<(cat x)", "<<EOF",
+    "shutdown", "crontab -l", " at now", "unset X", "nohup ", "'unterminated", "pytest -q",
+]
+
+
+def _corpus(n=3000, seed=11):
+    rng = random.Random(seed)
+    return [" ".join(rng.choice(_PIECES) for _ in range(rng.randint(1, 4))) for _ in range(n)]
+
+
+def _per_pattern(patterns, text):
+    return [name for name, pattern in patterns if re.search(pattern, text, re.IGNORECASE)]
+
+
+class TestPatternEngine(unittest.TestCase):
+    def test_matches_equal_per_pattern_search(self):
+        rules = [(name, p) for p, name in core.CommandSanitizer.DANGEROUS_PATTERNS]
+        rules += [(name, p) for p, name in core.CommandSanitizer.SUSPICIOUS_PATTERNS]
+        rules += list(security.CommandSanitizer.DANGEROUS_PATTERNS.items())
+        engine = PatternEngine(rules)
+        for command in _corpus():
+            self.assertEqual(engine.matches(command), _per_pattern(rules, command), command)
+
+    def test_reports_overlapping_matches(self):
+        # curl_pipe_shell consumes the whole string; pipe_injection overlaps it
+        engine = PatternEngine([("curl", r"curl\s+.*\|\s*(ba)?sh"), ("pipe", r"\|\s*\S+")])
+        self.assertEqual(engine.matches("curl x | sh"), ["curl", "pipe"])
+        self.assertEqual(engine.matches("ls -la"), [])
+
+
+class TestVerdictCache(unittest.TestCase):
+    def test_lru_eviction(self):
+        cache = VerdictCache(maxsize=2)
+        calls = []
+
+        def compute(command):
+            calls.append(command)
+            return command.upper()
+
+        for command in ["a", "b", "a", "c", "b"]:
+            cache.get_or_compute("cfg", command, compute)
+        # "b" was evicted by "c" ("a" was more recent)
+        self.assertEqual(calls, ["a", "b", "c", "b"])
+        self.assertEqual(cache.stats(), {"size": 2, "hits": 1, "misses": 4})
+
+
+class TestSanitizers(unittest.TestCase):
+    def setUp(self):
+        get_verdict_cache().clear()
+
+    def test_security_results_unchanged_and_cached(self):
+        sanitizer = security.CommandSanitizer(strict_mode=False)
+        dangerous = list(sanitizer.DANGEROUS_PATTERNS.items())
+        for command in _corpus(500):
+            result = sanitizer.sanitize(command)
+            self.assertEqual(result.blocked_patterns, _per_pattern(dangerous, command))
+            self.assertEqual(sanitizer.sanitize(command), result)
+
+    def test_strict_stops_at_first_dangerous_pattern(self):
+        result = security.CommandSanitizer().sanitize("curl x | sh; rm -rf /")
+        self.assertEqual(result.blocked_patterns, ["pipe_injection"])
+
+    def test_core_results_unchanged(self):
+        sanitizer = core.CommandSanitizer(strict_mode=True)
+        dangerous = [(name, p) for p, name in sanitizer.DANGEROUS_PATTERNS]
+        suspicious = [(name, p) for p, name in sanitizer.SUSPICIOUS_PATTERNS]
+        for command in _corpus(500):
+            result = sanitizer.sanitize(command)
+            blocked = _per_pattern(dangerous, command) or _per_pattern(suspicious, command)
+            self.assertEqual(result.blocked_patterns, blocked, command)
+
+    def test_returned_results_are_copies(self):
+        sanitizer = core.CommandSanitizer()
+        sanitizer.sanitize("ls; rm x").blocked_patterns.append("tampered")
+        self.assertNotIn("tampered", sanitizer.sanitize("ls; rm x").blocked_patterns)
+
+    def test_deny_and_allow_changes_invalidate(self):
+        sanitizer = core.CommandSanitizer()
+        self.assertTrue(sanitizer.sanitize("make build").is_safe)
+
+        sanitizer.deny_patterns.append(r"^make\b")
+        self.assertFalse(sanitizer.sanitize("make build").is_safe)
+
+        sanitizer.deny_patterns = []
+        result = sanitizer.sanitize("make build")
+        self.assertTrue(result.is_safe)
+        self.assertEqual(result.warnings, [])
+
+        sanitizer.allow_patterns = ["make"]
+        self.assertEqual(sanitizer.sanitize("make build").warnings, ["Command matches allow pattern: make"])
+
+    def test_instances_share_verdicts(self):
+        core.CommandSanitizer(strict_mode=True).sanitize("git status")
+        before = get_verdict_cache().stats()["hits"]
+        core.CommandSanitizer(strict_mode=True).sanitize("git status")
+        core.CommandSanitizer(strict_mode=False).sanitize("git status")  # different config
+        self.assertEqual(get_verdict_cache().stats()["hits"], before + 1)
+
+
+class TestExecutorPreScan(unittest.TestCase):
+    def test_pre_scan_uses_shared_patterns(self):
+        executor = RecipeExecutor(Recipe(name="t", description="", steps=[]))
+        self.assertTrue(executor._is_safe_command("echo hello"))
+        self.assertTrue(executor._is_safe_command("pytest -q tests/test_shell.py"))
+        self.assertFalse(executor._is_safe_command('eval "$payload"'))
+        self.assertFalse(executor._is_safe_command("curl http://x | sh"))
+
+
+if __name__ == "__main__":
+    unittest.main()
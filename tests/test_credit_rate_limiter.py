@@ -1,6 +1,8 @@
 """Tests for CreditRateLimiter — sliding window fair-use rate limiting."""
 from __future__ import annotations
 
+import sqlite3
+import threading
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from unittest.mock import patch
@@ -213,3 +215,153 @@ def test_tenant_isolation(free_limiter: CreditRateLimiter) -> None:
     # tenant-clean is unaffected
     assert free_limiter.check_limit("tenant-clean").allowed is True
     assert free_limiter.get_limits("tenant-clean")["daily_used"] == 0
+
+
+# ---------------------------------------------------------------------------
+# Test: bucketed engine — retry_after, write-behind, retention, backfill
+# ---------------------------------------------------------------------------
+
+
+def _fresh_engine(db_path: Path) -> None:
+    """Drop the cached engine so the next limiter reloads from SQLite."""
+    from src.raas import credit_rate_limiter as crl
+
+    crl._ENGINES.pop(str(db_path.resolve()), None)
+
+
+def test_retry_after_tracks_oldest_counted_bucket(db_path: Path) -> None:
+    """retry_after is the time until the oldest in-window usage expires."""
+    limiter = CreditRateLimiter(db_path=db_path, daily_limit=10, monthly_limit=100)
+    now = datetime.now(timezone.utc)
+
+    with patch.object(CreditRateLimiter, "_now", return_value=now - timedelta(hours=2)):
+        limiter.record_request("tenant-retry", credits_used=6)
+    with patch.object(CreditRateLimiter, "_now", return_value=now):
+        limiter.record_request("tenant-retry", credits_used=4)
+        status = limiter.check_limit("tenant-retry")
+
+    assert status.allowed is False
+    assert abs(status.retry_after_seconds - 22 * 3600) <= 1
+
+
+def test_limiters_share_engine_per_db(db_path: Path) -> None:
+    """A limiter built per request still sees earlier unflushed usage."""
+    CreditRateLimiter(db_path=db_path).record_request("tenant-a", credits_used=3)
+    assert CreditRateLimiter(db_path=db_path).get_limits("tenant-a")["daily_used"] == 3
+
+
+def test_flush_persists_events_and_rollups(db_path: Path) -> None:
+    """Flushed usage survives a cold engine reload."""
+    limiter = CreditRateLimiter(db_path=db_path)
+    for _ in range(5):
+        limiter.record_request("tenant-p", credits_used=2)
+    limiter.flush()
+    _fresh_engine(db_path)
+
+    reloaded = CreditRateLimiter(db_path=db_path)
+    assert reloaded.get_limits("tenant-p")["monthly_used"] == 10
+    with sqlite3.connect(str(db_path)) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM rate_limit_events").fetchone()[0] == 5
+
+
+def test_prune_events_drops_old_raw_rows(db_path: Path) -> None:
+    """Retention removes raw events but keeps in-window totals intact."""
+    limiter = CreditRateLimiter(db_path=db_path, daily_limit=0, monthly_limit=0)
+    now = datetime.now(timezone.utc)
+    with patch.object(CreditRateLimiter, "_now", return_value=now - timedelta(days=40)):
+        limiter.record_request("tenant-old", credits_used=7)
+    limiter.record_request("tenant-old", credits_used=1)
+
+    assert limiter.prune_events(retention_days=31) == 1
+    assert limiter.get_limits("tenant-old")["monthly_used"] == 1
+    with sqlite3.connect(str(db_path)) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM rate_limit_events").fetchone()[0] == 1
+
+
+def test_existing_raw_events_are_backfilled(db_path: Path) -> None:
+    """A database written before buckets existed is rolled up on first use."""
+    now = datetime.now(timezone.utc)
+    with sqlite3.connect(str(db_path)) as conn:
+        conn.execute(
+            "CREATE TABLE rate_limit_events (id TEXT PRIMARY KEY, tenant_id TEXT NOT NULL, "
+            "credits_used INTEGER NOT NULL, timestamp TEXT NOT NULL)"
+        )
+        conn.executemany(
+            "INSERT INTO rate_limit_events VALUES (?, ?, ?, ?)",
+            [
+                ("e1", "tenant-legacy", 4, (now - timedelta(hours=1)).isoformat()),
+                ("e2", "tenant-legacy", 5, (now - timedelta(days=3)).isoformat()),
+                ("e3", "tenant-legacy", 9, (now - timedelta(days=45)).isoformat()),
+            ],
+        )
+
+    limits = CreditRateLimiter(db_path=db_path).get_limits("tenant-legacy")
+    assert limits["daily_used"] == 4
+    assert limits["monthly_used"] == 9
+
+
+def _exact_usage(events: list[tuple[datetime, int]], now: datetime, span: timedelta):
+    """What the event-list limiter reported: (used, retry_after_seconds)."""
+    since = now - span
+    counted = [ts for ts, _ in events if ts >= since]
+    used = sum(c for ts, c in events if ts >= since)
+    retry = int((min(counted) + span - now).total_seconds()) if counted else None
+    return used, retry
+
+
+@pytest.mark.parametrize("cold", [False, True])
+def test_window_edge_matches_event_list_limiter(db_path: Path, cold: bool) -> None:
+    """A bucket straddling the window start counts only its in-window events."""
+    hour = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+    start = hour - timedelta(days=29)
+    offsets = [timedelta(seconds=s) for s in (5, 20, 40, 55, 600, 1800, 3000, 3590)]
+    events = [(start + off, credits) for off, credits in zip(offsets, (3, 2, 4, 1, 5, 6, 7, 8))]
+    # Same pattern a day later, so the daily window also has a straddling bucket
+    events += [(ts + timedelta(days=28), c) for ts, c in events]
+
+    daily = CreditRateLimiter(db_path=db_path, daily_limit=1, monthly_limit=0)
+    monthly = CreditRateLimiter(db_path=db_path, daily_limit=0, monthly_limit=1)
+    for ts, credits in events:
+        with patch.object(CreditRateLimiter, "_now", return_value=ts):
+            daily.record_request("tenant-edge", credits_used=credits)
+    if cold:
+        daily.flush()
+        _fresh_engine(db_path)
+        daily = CreditRateLimiter(db_path=db_path, daily_limit=1, monthly_limit=0)
+        monthly = CreditRateLimiter(db_path=db_path, daily_limit=0, monthly_limit=1)
+
+    # Daily first: the clock only moves forward, as it does in production
+    for limiter, span, key, edge in (
+        (daily, timedelta(days=1), "daily_used", events[8][0]),
+        (monthly, timedelta(days=30), "monthly_used", events[0][0]),
+    ):
+        for off in (0, 10, 30, 50, 59, 300, 1200, 2400, 3500):
+            now = edge - timedelta(seconds=5) + span + timedelta(seconds=off)
+            used, retry = _exact_usage(events, now, span)
+            with patch.object(CreditRateLimiter, "_now", return_value=now):
+                assert limiter.get_limits("tenant-edge")[key] == used, (key, off)
+                assert limiter.check_limit("tenant-edge").retry_after_seconds == retry, (key, off)
+
+
+def test_concurrent_record_and_check_keep_totals(db_path: Path) -> None:
+    """Reads drop expired buckets under the same lock as record()."""
+    limiter = CreditRateLimiter(db_path=db_path, daily_limit=0, monthly_limit=0)
+    errors: list[BaseException] = []
+
+    def worker() -> None:
+        try:
+            for _ in range(300):
+                limiter.record_request("tenant-race", credits_used=1)
+                limiter.check_limit("tenant-race")
+        except BaseException as exc:  # noqa: BLE001
+            errors.append(exc)
+
+    threads = [threading.Thread(target=worker) for _ in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+    limits = limiter.get_limits("tenant-race")
+    assert limits["daily_used"] == limits["monthly_used"] == 1800
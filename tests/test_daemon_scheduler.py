@@ -0,0 +1,110 @@
+"""Tests for the daemon worker pool and event-driven task watcher."""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from src.daemon.classifier import ComplexityClassifier
+from src.daemon.scheduler import DaemonScheduler
+from src.daemon.watcher import TaskWatcher
+
+
+def _scheduler(tmp_path: Path, **overrides) -> DaemonScheduler:
+    cfg = {
+        "watch_dir": str(tmp_path / "tasks"),
+        "poll_interval_secs": 0.05,
+        "journal_path": str(tmp_path / "journal.jsonl"),
+        "watch_backend": "poll",
+    }
+    cfg.update(overrides)
+    return DaemonScheduler(cfg)
+
+
+class TestTaskWatcher:
+    def test_poll_backend_wakes_on_new_file(self, tmp_path: Path) -> None:
+        watcher = TaskWatcher(str(tmp_path), poll_interval=0.02, backend="poll")
+        assert watcher.wait(0.05) is False
+        time.sleep(0.01)
+        (tmp_path / "mission_a.txt").write_text("echo hi")
+        assert watcher.wait(1.0) is True
+        assert [p.name for p in watcher.scan_once()] == ["mission_a.txt"]
+
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+    def test_inotify_backend_wakes_on_close_write(self, tmp_path: Path) -> None:
+        watcher = TaskWatcher(str(tmp_path), backend="inotify")
+        assert watcher.backend == "inotify"
+        threading.Timer(0.05, (tmp_path / "mission_b.txt").write_text, args=("echo hi",)).start()
+        assert watcher.wait(2.0) is True
+        watcher.notify()
+        assert watcher.wait(0.5) is True
+        watcher.close()
+
+    def test_processed_set_persists_and_prunes(self, tmp_path: Path) -> None:
+        keep = tmp_path / "mission_keep.txt"
+        gone = tmp_path / "mission_gone.txt"
+        keep.write_text("x")
+        gone.write_text("y")
+        watcher = TaskWatcher(str(tmp_path), backend="poll")
+        watcher.mark_processed(keep)
+        watcher.mark_processed(gone)
+        gone.unlink()
+
+        reloaded = TaskWatcher(str(tmp_path), backend="poll")
+        assert reloaded.scan_once() == []
+        assert len(reloaded._processed) == 1
+
+
+class TestDaemonScheduler:
+    def test_concurrency_limits_come_from_classifier(self, tmp_path: Path) -> None:
+        daemon = _scheduler(tmp_path, concurrency={"complex": 2})
+        expected = ComplexityClassifier().concurrency_limits()
+        expected["complex"] = 2
+        assert daemon.status()["concurrency_limits"] == expected
+        assert daemon.status()["max_workers"] == sum(expected.values())
+
+    def test_long_mission_does_not_block_small_ones(self, tmp_path: Path) -> None:
+        daemon = _scheduler(tmp_path)
+        tasks = tmp_path / "tasks"
+        (tasks / "mission_0_big.txt").write_text('sh -c "sleep 1 # refactor"')
+        for i in range(3):
+            (tasks / f"mission_{i + 1}_small.txt").write_text("true")
+
+        started = time.monotonic()
+        daemon.run_until_idle(timeout=10)
+        elapsed = time.monotonic() - started
+
+        order = [e.mission for e in daemon.journal.recent()]
+        assert order[-1] == "mission_0_big.txt"
+        assert elapsed < 2.5
+        status = daemon.status()
+        assert status["completed"] == 4
+        assert status["pending"] == 0
+        assert status["throughput_per_min"] > 0
+        assert len(list((tasks / "processed").iterdir())) == 4
+
+    def test_failed_mission_retries_then_dead_letters(self, tmp_path: Path) -> None:
+        daemon = _scheduler(tmp_path, max_retries=2)
+        (tmp_path / "tasks" / "mission_fail.txt").write_text("false")
+
+        daemon.run_until_idle(timeout=10)
+
+        status = daemon.status()
+        assert status["failed"] == 1
+        assert status["dead_letters"] == 1
+        assert daemon.journal.recent()[-1].success is False
+
+    def test_start_stop_from_worker_thread(self, tmp_path: Path) -> None:
+        daemon = _scheduler(tmp_path)
+        thread = threading.Thread(target=daemon.start)
+        thread.start()
+        (tmp_path / "tasks" / "mission_live.txt").write_text("true")
+        deadline = time.time() + 5
+        while daemon.status()["completed"] < 1 and time.time() < deadline:
+            time.sleep(0.02)
+        daemon.stop()
+        thread.join(5)
+        assert not thread.is_alive()
+        assert daemon.status()["completed"] == 1
@@ -0,0 +1,120 @@
+"""Tests for DurableTaskQueue: leases, visibility timeouts, aging and DLQ."""
+
+import multiprocessing
+import time
+from pathlib import Path
+
+import pytest
+
+from src.core.durable_task_queue import DurableTaskQueue
+from src.core.task_queue import TaskPriority
+
+
+@pytest.fixture()
+def db(tmp_path: Path) -> Path:
+    return tmp_path / "queue.db"
+
+
+def _drain_worker(db_path, worker, results):
+    queue = DurableTaskQueue(db_path, max_size=0, worker_id=f"w{worker}")
+    seen = []
+    idle = 0
+    while idle < 20:
+        batch = queue.poll_many(8)
+        if not batch:
+            idle += 1
+            time.sleep(0.01)
+            continue
+        idle = 0
+        for task in batch:
+            assert queue.ack(task)
+            seen.append(task.task_id)
+    results.put(seen)
+
+
+class TestDurableTaskQueue:
+    def test_priority_order_and_persistence(self, db):
+        queue = DurableTaskQueue(db, aging_interval=0)
+        queue.enqueue("low", "l", TaskPriority.LOW)
+        queue.enqueue("crit", "c", TaskPriority.CRITICAL)
+        queue.enqueue("norm", "n", TaskPriority.NORMAL)
+        assert queue.peek().task_id == "crit"
+        queue.close()
+
+        reopened = DurableTaskQueue(db, aging_interval=0)
+        assert [t.task_id for t in reopened.poll_many(3)] == ["crit", "norm", "low"]
+        assert reopened.in_flight == 3 and reopened.size == 0
+
+    def test_backpressure_and_duplicates(self, db):
+        queue = DurableTaskQueue(db, max_size=2)
+        assert queue.enqueue("a", "g") is not None
+        assert queue.enqueue("a", "g") is None  # Already queued
+        assert queue.enqueue("b", "g") is not None
+        assert queue.enqueue("c", "g") is None  # Full
+
+    def test_expired_lease_reappears(self, db):
+        queue = DurableTaskQueue(db, visibility_timeout=0.05)
+        queue.enqueue("t1", "g")
+        first = queue.poll()
+        assert queue.poll() is None  # Invisible while leased
+        time.sleep(0.06)
+        second = queue.poll()
+        assert second.task_id == "t1" and second.attempt == 1
+        assert not queue.ack(first)  # Stale lease can't ack
+        assert queue.ack(second)
+        assert queue.is_empty and queue.in_flight == 0
+
+    def test_extend_lease(self, db):
+        queue = DurableTaskQueue(db, visibility_timeout=0.05)
+        queue.enqueue("t1", "g")
+        task = queue.poll()
+        assert queue.extend_lease(task, 10)
+        time.sleep(0.06)
+        assert queue.poll() is None
+
+    def test_nack_retries_then_dead_letters(self, db):
+        queue = DurableTaskQueue(db)
+        queue.enqueue("t1", "g", max_attempts=2)
+        assert queue.nack(queue.poll(), "boom") is True
+        assert queue.mark_failed(queue.poll(), "boom again") is False
+        dlq = queue.get_dlq()
+        assert [e.task.task_id for e in dlq] == ["t1"]
+        assert dlq[0].final_error == "boom again"
+        assert queue.retry_from_dlq("t1") and not queue.retry_from_dlq("t1")
+        assert queue.poll().attempt == 0
+
+    def test_nack_delay_hides_task(self, db):
+        queue = DurableTaskQueue(db)
+        queue.enqueue("t1", "g")
+        queue.nack(queue.poll(), "later", delay=60)
+        assert queue.poll() is None and queue.size == 1
+
+    def test_lease_expiry_counts_toward_dlq(self, db):
+        queue = DurableTaskQueue(db, visibility_timeout=0.01)
+        queue.enqueue("t1", "g", max_attempts=1)
+        queue.poll()
+        time.sleep(0.02)
+        assert queue.requeue_expired() == 1
+        assert queue.dlq_size == 1 and queue.get_dlq()[0].final_error == "lease expired"
+
+    def test_aging_prevents_starvation(self, db):
+        queue = DurableTaskQueue(db, aging_interval=0.01)
+        queue.enqueue("old-low", "g", TaskPriority.LOW)
+        time.sleep(0.05)  # Waited for more than 3 levels' worth
+        queue.enqueue("new-crit", "g", TaskPriority.CRITICAL)
+        assert queue.poll().task_id == "old-low"
+
+    def test_competing_processes_lease_each_task_once(self, db):
+        producer = DurableTaskQueue(db, max_size=0)
+        for i in range(400):
+            producer.enqueue(f"t{i}", "g", TaskPriority(i % 5))
+        ctx = multiprocessing.get_context("spawn")
+        results = ctx.Queue()
+        workers = [ctx.Process(target=_drain_worker, args=(str(db), w, results)) for w in range(4)]
+        for p in workers:
+            p.start()
+        seen = [tid for _ in workers for tid in results.get(timeout=60)]
+        for p in workers:
+            p.join(10)
+        assert sorted(seen) == sorted(f"t{i}" for i in range(400))
+        assert producer.stats()["pending"] == 0 and producer.stats()["in_flight"] == 0
@@ -0,0 +1,179 @@
+"""Tests for the event-driven DAG scheduler.
+
+Tests verify completion-driven dispatch:
+1. Indegree/adjacency bookkeeping (mark_completed releases dependents)
+2. Transitive cancellation via the reverse-dependency list
+3. Priority and critical-path ordering of ready steps
+4. execute_all() releases dependents without waiting for a wave
+5. Pool selection per step type
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import unittest
+from dataclasses import dataclass, field
+from typing import Any
+from unittest.mock import MagicMock
+
+from src.core.event_dag_scheduler import (
+    PROCESS_POOL,
+    THREAD_POOL,
+    EventDrivenDAGScheduler,
+)
+
+
+@dataclass
+class MockStep:
+    """Mock recipe step for testing."""
+    order: int
+    dependencies: list[int] | None = None
+    params: dict[str, Any] = field(default_factory=dict)
+
+
+def _passing_result() -> MagicMock:
+    result = MagicMock()
+    result.verification.passed = True
+    return result
+
+
+class TestBookkeeping(unittest.TestCase):
+    """Test indegree counters and reverse adjacency."""
+
+    def test_roots_ready_initially(self):
+        steps = [MockStep(1), MockStep(2, [1]), MockStep(3)]
+        scheduler = EventDrivenDAGScheduler(steps)
+        self.assertEqual({s.order for s in scheduler.get_ready_steps()}, {1, 3})
+
+    def test_mark_completed_releases_only_when_all_deps_done(self):
+        steps = [MockStep(1), MockStep(2), MockStep(3, [1, 2])]
+        scheduler = EventDrivenDAGScheduler(steps)
+        self.assertEqual(scheduler.mark_completed(1), [])
+        self.assertEqual(scheduler.mark_completed(2), [3])
+
+    def test_mark_failed_cancels_transitively(self):
+        steps = [MockStep(1), MockStep(2, [1]), MockStep(3, [2]), MockStep(4)]
+        scheduler = EventDrivenDAGScheduler(steps)
+        scheduler.mark_failed(1)
+        self.assertEqual(scheduler.cancelled_steps, {2, 3})
+        self.assertFalse(scheduler.is_done())
+        scheduler.mark_completed(4)
+        self.assertTrue(scheduler.is_done())
+
+    def test_has_dependencies(self):
+        self.assertFalse(EventDrivenDAGScheduler([MockStep(1)]).has_dependencies())
+        self.assertTrue(
+            EventDrivenDAGScheduler([MockStep(1), MockStep(2, [1])]).has_dependencies(),
+        )
+
+    def test_steps_property(self):
+        steps = [MockStep(1), MockStep(2)]
+        self.assertEqual(EventDrivenDAGScheduler(steps).steps, steps)
+
+
+class TestOrdering(unittest.TestCase):
+    """Test priority and critical-path ordering."""
+
+    def test_critical_path_length(self):
+        steps = [MockStep(1), MockStep(2, [1]), MockStep(3, [2]), MockStep(4)]
+        scheduler = EventDrivenDAGScheduler(steps)
+        self.assertEqual(scheduler.critical_path_length(1), 3)
+        self.assertEqual(scheduler.critical_path_length(4), 1)
+
+    def test_longer_chain_dispatched_first(self):
+        steps = [MockStep(1), MockStep(2), MockStep(3, [2]), MockStep(4, [3])]
+        scheduler = EventDrivenDAGScheduler(steps)
+        self.assertEqual([s.order for s in scheduler.get_ready_steps()], [2, 1])
+
+    def test_explicit_priority_wins(self):
+        steps = [MockStep(1, params={"priority": 5}), MockStep(2), MockStep(3, [2])]
+        scheduler = EventDrivenDAGScheduler(steps)
+        self.assertEqual([s.order for s in scheduler.get_ready_steps()], [1, 2])
+
+    def test_single_worker_runs_in_priority_order(self):
+        steps = [MockStep(1), MockStep(2, params={"priority": 1}), MockStep(3)]
+        seen: list[int] = []
+
+        def run(step):
+            seen.append(step.order)
+            return _passing_result()
+
+        EventDrivenDAGScheduler(steps, max_workers=1).execute_all(run)
+        self.assertEqual(seen, [2, 1, 3])
+
+
+class TestExecuteAll(unittest.TestCase):
+    """Test completion-driven execute_all()."""
+
+    def test_dependent_not_blocked_by_slow_sibling(self):
+        """Step 3 depends only on fast step 1 and must start before slow step 2 ends."""
+        steps = [MockStep(1), MockStep(2), MockStep(3, [1])]
+        slow_done = threading.Event()
+        started_before_slow_done: list[bool] = []
+
+        def run(step):
+            if step.order == 2:
+                time.sleep(0.3)
+                slow_done.set()
+            elif step.order == 3:
+                started_before_slow_done.append(not slow_done.is_set())
+            return _passing_result()
+
+        results = EventDrivenDAGScheduler(steps, max_workers=4).execute_all(run)
+        self.assertEqual(set(results), {1, 2, 3})
+        self.assertEqual(started_before_slow_done, [True])
+
+    def test_failure_cancels_downstream(self):
+        steps = [MockStep(1), MockStep(2, [1]), MockStep(3)]
+
+        def run(step):
+            if step.order == 1:
+                raise RuntimeError("boom")
+            return _passing_result()
+
+        scheduler = EventDrivenDAGScheduler(steps)
+        results = scheduler.execute_all(run)
+        self.assertFalse(results[1].success)
+        self.assertIn("boom", results[1].error)
+        self.assertNotIn(2, results)
+        self.assertTrue(results[3].success)
+        self.assertEqual(scheduler.cancelled_steps, {2})
+
+    def test_missing_dependency_is_cancelled(self):
+        steps = [MockStep(1), MockStep(2, [99])]
+        scheduler = EventDrivenDAGScheduler(steps)
+        results = scheduler.execute_all(MagicMock(return_value=_passing_result()))
+        self.assertEqual(set(results), {1})
+        self.assertEqual(scheduler.cancelled_steps, {2})
+
+    def test_callback_per_step(self):
+        steps = [MockStep(1), MockStep(2, [1])]
+        callback = MagicMock()
+        EventDrivenDAGScheduler(steps).execute_all(
+            MagicMock(return_value=_passing_result()), on_complete=callback,
+        )
+        self.assertEqual([c.args[0] for c in callback.call_args_list], [1, 2])
+
+
+class TestPoolSelection(unittest.TestCase):
+    """Test thread/process pool routing."""
+
+    def test_defaults_to_thread(self):
+        scheduler = EventDrivenDAGScheduler([MockStep(1)])
+        self.assertEqual(scheduler.pool_for(MockStep(1)), THREAD_POOL)
+
+    def test_process_pool_by_type(self):
+        scheduler = EventDrivenDAGScheduler(
+            [], process_workers=2, pool_by_type={"tool": PROCESS_POOL},
+        )
+        self.assertEqual(scheduler.pool_for(MockStep(1, params={"type": "tool"})), PROCESS_POOL)
+        self.assertEqual(scheduler.pool_for(MockStep(2, params={"type": "llm"})), THREAD_POOL)
+
+    def test_process_pool_disabled_without_workers(self):
+        scheduler = EventDrivenDAGScheduler([], pool_by_type={"tool": PROCESS_POOL})
+        self.assertEqual(scheduler.pool_for(MockStep(1, params={"type": "tool"})), THREAD_POOL)
+
+
+if __name__ == "__main__":
+    unittest.main()
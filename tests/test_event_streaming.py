@@ -5,6 +5,7 @@ from src.core.event_bus import (
     EventBus,
     EventStream,
     EventType,
+    OverflowPolicy,
     StreamingEventBus,
     get_streaming_bus,
 )
@@ -145,3 +146,142 @@ class TestGetStreamingBus:
         assert hasattr(bus, "stream")
         # Cleanup
         mod._default_bus = None
+
+
+class TestAsyncDispatch:
+    """Test per-subscriber queues, ordering, overflow policies and stats."""
+
+    def test_sync_is_default_and_inline(self):
+        bus = EventBus()
+        received = []
+        bus.subscribe(EventType.STEP_COMPLETED, received.append)
+        bus.emit(EventType.STEP_COMPLETED, {"i": 1})
+        assert bus.dispatch == "sync"
+        assert len(received) == 1
+
+    def test_slow_subscriber_does_not_block_emitter(self):
+        import threading
+        import time
+
+        bus = EventBus(dispatch="async")
+        release = threading.Event()
+        received = []
+        bus.subscribe(EventType.STEP_COMPLETED, lambda e: (release.wait(5), received.append(e)))
+        start = time.perf_counter()
+        for i in range(50):
+            bus.emit(EventType.STEP_COMPLETED, {"i": i})
+        assert time.perf_counter() - start < 0.5
+        release.set()
+        assert bus.flush(timeout=5)
+        assert [e.data["i"] for e in received] == list(range(50))
+        bus.close()
+
+    def test_order_preserved_across_event_types(self):
+        bus = EventBus(dispatch="async")
+        received = []
+        for event_type in (EventType.STEP_STARTED, EventType.STEP_COMPLETED):
+            bus.subscribe(event_type, received.append)
+        for i in range(200):
+            bus.emit(EventType.STEP_STARTED if i % 2 else EventType.STEP_COMPLETED, {"i": i})
+        assert bus.flush(timeout=5)
+        assert [e.data["i"] for e in received] == list(range(200))
+        assert len(bus.stats()) == 1  # One queue per callback, not per type
+        bus.close()
+
+    def test_drop_oldest_counts_drops(self):
+        import threading
+
+        bus = EventBus(dispatch="async")
+        gate = threading.Event()
+        received = []
+        bus.subscribe(
+            EventType.STEP_COMPLETED, lambda e: (gate.wait(5), received.append(e)),
+            queue_size=5, overflow=OverflowPolicy.DROP_OLDEST,
+        )
+        bus.emit(EventType.STEP_COMPLETED, {"i": 0})
+        _wait_until(lambda: bus.stats()[0]["queued"] == 0)  # Worker holds event 0
+        for i in range(1, 21):
+            bus.emit(EventType.STEP_COMPLETED, {"i": i})
+        stats = bus.stats()[0]
+        assert stats["queued"] == 5 and stats["dropped"] == 15
+        assert stats["lag_seconds"] >= 0
+        gate.set()
+        bus.flush(timeout=5)
+        assert [e.data["i"] for e in received] == [0, 16, 17, 18, 19, 20]
+        bus.close()
+
+    def test_coalesce_keeps_latest_per_type(self):
+        import threading
+
+        bus = EventBus(dispatch="async")
+        gate = threading.Event()
+        received = []
+        callback = lambda e: (gate.wait(5), received.append(e))  # noqa: E731
+        for event_type in (EventType.HEALTH_WARNING, EventType.STEP_COMPLETED):
+            bus.subscribe(event_type, callback, queue_size=2, overflow=OverflowPolicy.COALESCE)
+        bus.emit(EventType.STEP_COMPLETED, {"i": 0})
+        _wait_until(lambda: bus.stats()[0]["queued"] == 0)
+        bus.emit(EventType.HEALTH_WARNING, {"i": 1})
+        bus.emit(EventType.STEP_COMPLETED, {"i": 2})
+        for i in range(3, 10):
+            bus.emit(EventType.HEALTH_WARNING, {"i": i})
+        assert bus.stats()[0]["coalesced"] == 7
+        gate.set()
+        bus.flush(timeout=5)
+        assert [e.data["i"] for e in received] == [0, 9, 2]
+        bus.close()
+
+    def test_block_applies_backpressure(self):
+        import threading
+
+        bus = EventBus(dispatch="async")
+        received = []
+        bus.subscribe(
+            EventType.STEP_COMPLETED, received.append,
+            queue_size=1, overflow=OverflowPolicy.BLOCK,
+        )
+        emitters = [
+            threading.Thread(target=lambda: [bus.emit(EventType.STEP_COMPLETED) for _ in range(100)])
+            for _ in range(4)
+        ]
+        for t in emitters:
+            t.start()
+        for t in emitters:
+            t.join(10)
+        assert bus.flush(timeout=5)
+        stats = bus.stats()[0]
+        assert len(received) == 400 and stats["dropped"] == 0
+        bus.close()
+
+    def test_subscriber_errors_are_counted(self):
+        bus = EventBus(dispatch="async")
+
+        def boom(event):
+            raise RuntimeError("bad subscriber")
+
+        bus.subscribe(EventType.STEP_FAILED, boom)
+        bus.emit(EventType.STEP_FAILED)
+        bus.flush(timeout=5)
+        assert bus.stats()[0]["errors"] == 1
+        bus.unsubscribe(EventType.STEP_FAILED, boom)
+        assert bus.subscriber_count == 0 and bus.stats() == []
+
+    def test_per_subscriber_override(self):
+        bus = EventBus()
+        inline, queued = [], []
+        bus.subscribe(EventType.GOAL_STARTED, inline.append)
+        bus.subscribe(EventType.GOAL_STARTED, queued.append, dispatch="async")
+        bus.emit(EventType.GOAL_STARTED)
+        assert len(inline) == 1
+        bus.flush(timeout=5)
+        assert len(queued) == 1
+        bus.close()
+
+
+def _wait_until(predicate, timeout: float = 5.0) -> None:
+    import time
+
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.005)
@@ -0,0 +1,131 @@
+"""Tests for ExecutionHistory indexes, write-once persistence and snapshots."""
+
+import time
+
+from src.core.execution_history import EventKind, ExecutionEvent, ExecutionHistory
+
+
+def _event(kind, wf="wf1", step=None, ts=None, **data):
+    event = ExecutionEvent.create(kind, wf, step, data=data or None)
+    if ts is not None:
+        event.timestamp = ts
+    return event
+
+
+def _run_workflow(history, wf="wf1", steps=3, retries_on=2):
+    history.append(_event(EventKind.WORKFLOW_STARTED, wf))
+    for order in range(1, steps + 1):
+        history.append(_event(EventKind.STEP_STARTED, wf, order))
+        if order == retries_on:
+            history.append(_event(EventKind.STEP_FAILED, wf, order))
+            history.append(_event(EventKind.STEP_RETRIED, wf, order))
+        history.append(_event(EventKind.STEP_COMPLETED, wf, order))
+    history.append(_event(EventKind.WORKFLOW_COMPLETED, wf))
+
+
+class TestIndexes:
+    def test_queries_answered_from_index(self, tmp_path):
+        history = ExecutionHistory(str(tmp_path))
+        _run_workflow(history)
+        assert history.get_last_checkpoint("wf1") == 3
+        assert history.get_retry_count("wf1", 2) == 1
+        assert history.get_retry_count("wf1", 1) == 0
+        kinds = [e.kind for e in history.get_step_events("wf1", 2)]
+        assert kinds == [
+            EventKind.STEP_STARTED, EventKind.STEP_FAILED,
+            EventKind.STEP_RETRIED, EventKind.STEP_COMPLETED,
+        ]
+        assert history.get_last_checkpoint("missing") is None
+
+    def test_out_of_order_events_are_sorted(self, tmp_path):
+        history = ExecutionHistory(str(tmp_path))
+        for ts in (3.0, 1.0, 2.0):
+            history.append(_event(EventKind.STEP_HEARTBEAT, step=1, ts=ts))
+        assert [e.timestamp for e in history.get_history("wf1")] == [1.0, 2.0, 3.0]
+        assert [e.timestamp for e in history.get_step_events("wf1", 1)] == [1.0, 2.0, 3.0]
+
+
+class TestPersistence:
+    def test_each_event_written_once(self, tmp_path):
+        history = ExecutionHistory(str(tmp_path), batch_size=4)
+        _run_workflow(history)
+        history.persist("wf1")
+        history.persist("wf1")
+        lines = (tmp_path / "wf1.jsonl").read_text().splitlines()
+        assert len(lines) == len(history.get_history("wf1")) == 10
+
+    def test_load_replays_indexes(self, tmp_path):
+        history = ExecutionHistory(str(tmp_path))
+        _run_workflow(history)
+        history.flush_all()
+        reloaded = ExecutionHistory(str(tmp_path))
+        assert len(reloaded.load("wf1")) == 10
+        assert reloaded.get_last_checkpoint("wf1") == 3
+        assert reloaded.get_retry_count("wf1", 2) == 1
+
+    def test_snapshot_skips_replayed_lines(self, tmp_path):
+        history = ExecutionHistory(str(tmp_path), batch_size=50, snapshot_every=200)
+        for i in range(1000):
+            history.append(_event(EventKind.STEP_RETRIED, step=i % 5))
+        history.append(_event(EventKind.STEP_COMPLETED, step=7))
+        history.flush_all()
+        assert (tmp_path / "wf1.snapshot.json").exists()
+
+        reloaded = ExecutionHistory(str(tmp_path))
+        tail = reloaded.load("wf1")
+        assert len(tail) < 200  # Only lines after the snapshot are replayed
+        assert reloaded.get_retry_count("wf1", 0) == 200
+        assert reloaded.get_last_checkpoint("wf1") == 7
+        assert reloaded.summary("wf1")["event_count"] == 1001
+
+        full = ExecutionHistory(str(tmp_path))
+        assert len(full.load("wf1", full=True)) == 1001
+        assert full.get_retry_count("wf1", 0) == 200
+
+    def test_snapshot_by_process_that_never_loaded_keeps_earlier_log(self, tmp_path):
+        first = ExecutionHistory(str(tmp_path))
+        _run_workflow(first, steps=3)
+        first.flush_all()
+
+        # A resumed run appends without calling load() and hits an auto-snapshot
+        resumed = ExecutionHistory(str(tmp_path), batch_size=5, snapshot_every=5)
+        for _ in range(5):
+            resumed.append(_event(EventKind.STEP_HEARTBEAT, step=4))
+        assert (tmp_path / "wf1.snapshot.json").exists()
+        assert resumed.get_last_checkpoint("wf1") == 3
+
+        reloaded = ExecutionHistory(str(tmp_path))
+        reloaded.load("wf1")
+        assert reloaded.get_last_checkpoint("wf1") == 3
+        assert reloaded.get_retry_count("wf1", 2) == 1
+        assert reloaded.summary("wf1")["event_count"] == 15
+
+    def test_clear_removes_snapshot(self, tmp_path):
+        history = ExecutionHistory(str(tmp_path))
+        _run_workflow(history)
+        assert history.snapshot("wf1") is not None
+        history.clear("wf1")
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestAnalytics:
+    def test_summaries_and_query_across_workflows(self, tmp_path):
+        history = ExecutionHistory(str(tmp_path))
+        _run_workflow(history, "wf1")
+        _run_workflow(history, "wf2", retries_on=1)
+        history.append(_event(EventKind.WORKFLOW_STARTED, "wf3"))
+        history.append(_event(EventKind.WORKFLOW_FAILED, "wf3"))
+        history.flush_all()
+        history.append(_event(EventKind.STEP_RETRIED, "wf3", 1))  # Still buffered
+
+        fresh = ExecutionHistory(str(tmp_path))
+        statuses = {s["workflow_id"]: s["status"] for s in fresh.summaries()}
+        assert statuses == {"wf1": "completed", "wf2": "completed", "wf3": "failed"}
+        assert [s["workflow_id"] for s in fresh.summaries(status="failed")] == ["wf3"]
+
+        retried = list(history.query(kinds=[EventKind.STEP_RETRIED]))
+        assert sorted((e.workflow_id, e.step_order) for e in retried) == [
+            ("wf1", 2), ("wf2", 1), ("wf3", 1),
+        ]
+        assert list(history.query(since=time.time() + 60)) == []
+        assert {e.workflow_id for e in history.query(workflow_ids=["wf2"])} == {"wf2"}
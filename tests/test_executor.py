@@ -7,6 +7,7 @@ import pytest
 
 from src.core.executor import RecipeExecutor
 from src.core.parser import Recipe, RecipeStep
+from src.core.process_runner import ProcessResult
 from src.core.verifier import ExecutionResult
 
 
@@ -74,9 +75,9 @@ class TestExecuteShellStep:
         step = RecipeStep(order=1, title="Test", description="echo hello")
         executor = RecipeExecutor(recipe)
         with patch.object(executor, "_is_safe_command", return_value=True), \
-             patch("subprocess.run") as mock_run:
-            mock_run.return_value = subprocess.CompletedProcess(
-                args=["echo", "hello"], returncode=0, stdout="hello\n", stderr="",
+             patch.object(executor.process_runner, "run") as mock_run:
+            mock_run.return_value = ProcessResult(
+                argv=["echo", "hello"], returncode=0, stdout="hello\n", stderr="",
             )
             result = executor._execute_shell_step(step)
             assert result.exit_code == 0
@@ -89,14 +90,14 @@ class TestExecuteShellStep:
         step = RecipeStep(order=1, title="Test", description="exit 1")
         executor = RecipeExecutor(recipe)
         with patch.object(executor, "_is_safe_command", return_value=True), \
-             patch("subprocess.run") as mock_run:
-            exc = subprocess.CalledProcessError(1, "exit 1")
-            exc.stdout = "output"
-            exc.stderr = "error"
-            mock_run.side_effect = exc
+             patch.object(executor.process_runner, "run") as mock_run:
+            mock_run.return_value = ProcessResult(
+                argv=["exit", "1"], returncode=1, stdout="output", stderr="error",
+            )
             result = executor._execute_shell_step(step)
             assert result.exit_code == 1
-            assert result.error is not None
+            assert result.stderr == "error"
+            assert isinstance(result.error, subprocess.CalledProcessError)
 
     def test_empty_command_skipped(self):
         """Empty command returns skipped result."""
@@ -116,18 +117,54 @@ class TestExecuteShellStep:
         def side_effect(*args, **kwargs):
             nonlocal call_count
             call_count += 1
-            if call_count < 3:
-                exc = subprocess.CalledProcessError(1, "cmd")
-                exc.stdout = ""
-                exc.stderr = ""
-                raise exc
-            return subprocess.CompletedProcess(args=["cmd"], returncode=0, stdout="ok", stderr="")
+            return ProcessResult(argv=["cmd"], returncode=1 if call_count < 3 else 0, stdout="ok")
         with patch.object(executor, "_is_safe_command", return_value=True), \
-             patch("subprocess.run", side_effect=side_effect):
+             patch.object(executor.process_runner, "run", side_effect=side_effect):
             result = executor._execute_shell_step(step)
         assert result.exit_code == 0
         assert call_count == 3
 
+    def test_streams_lines_and_times_out(self):
+        """Lines reach output_callback live; a timeout kills the step."""
+        recipe = Recipe(name="test", description="Test")
+        lines = []
+        executor = RecipeExecutor(recipe, output_callback=lambda s, stream, line: lines.append((stream, line)))
+        step = RecipeStep(order=1, title="Test", description="python -c 'print(1); print(2)'")
+        result = executor._execute_shell_step(step)
+        assert result.exit_code == 0
+        assert lines == [("stdout", "1"), ("stdout", "2")]
+
+        slow = RecipeStep(order=2, title="Slow", description="sleep 5", params={"retry": 0})
+        with patch("src.core.executor.SHELL_TIMEOUT", 0.2):
+            result = executor._execute_shell_step(slow)
+        assert result.exit_code == 1
+        assert isinstance(result.error, subprocess.TimeoutExpired)
+
+    def test_timeout_discards_spill_files(self, tmp_path):
+        """A timed-out step's spilled output is not left on disk."""
+        spill = tmp_path / "mekong-stdout.log"
+        spill.write_text("lots of output")
+        executor = RecipeExecutor(Recipe(name="test", description="Test"))
+        step = RecipeStep(order=1, title="Test", description="slow", params={"retry": 0})
+        with patch.object(executor, "_is_safe_command", return_value=True), \
+             patch.object(executor.process_runner, "run") as mock_run:
+            mock_run.return_value = ProcessResult(
+                argv=["slow"], returncode=-15, timed_out=True, spill_paths={"stdout": str(spill)},
+            )
+            result = executor._execute_shell_step(step)
+        assert isinstance(result.error, subprocess.TimeoutExpired)
+        assert "output_files" not in result.metadata
+        assert not spill.exists()
+
+    def test_cancel_does_not_outlive_the_run(self):
+        """cancel() stops the current run; the next run() executes its steps."""
+        steps = [RecipeStep(order=1, title="Step 1", description="echo hello")]
+        executor = RecipeExecutor(Recipe(name="r", description="Test", steps=steps))
+        executor.cancel()
+        with patch.object(executor, "_is_safe_command", return_value=True):
+            assert executor._execute_shell_step(steps[0]).metadata.get("cancelled")
+            assert executor.run() is True
+
 
 class TestExecuteLlmStep:
     """Test _execute_llm_step() - LLM generation."""
@@ -219,8 +256,8 @@ class TestRunFullRecipe:
         recipe = Recipe(name="success-recipe", description="Success test", steps=steps)
         executor = RecipeExecutor(recipe)
         with patch("src.core.executor.RecipeExecutor._is_safe_command", return_value=True), \
-             patch("subprocess.run") as mock_run:
-            mock_run.return_value = subprocess.CompletedProcess(args=["echo"], returncode=0, stdout="out", stderr="")
+             patch.object(executor.process_runner, "run") as mock_run:
+            mock_run.return_value = ProcessResult(argv=["echo"], returncode=0, stdout="out")
             result = executor.run()
             assert result is True
             assert mock_run.call_count >= 2  # May retry
@@ -235,13 +272,10 @@ class TestRunFullRecipe:
         recipe = Recipe(name="fail-recipe", description="Fail test", steps=steps)
         executor = RecipeExecutor(recipe)
         with patch("src.core.executor.RecipeExecutor._is_safe_command", return_value=True), \
-             patch("subprocess.run") as mock_run:
-            exc = subprocess.CalledProcessError(1, "fail")
-            exc.stdout = ""
-            exc.stderr = ""
+             patch.object(executor.process_runner, "run") as mock_run:
             mock_run.side_effect = [
-                subprocess.CompletedProcess(args=["echo"], returncode=0, stdout="ok", stderr=""),
-                exc,
+                ProcessResult(argv=["echo"], returncode=0, stdout="ok"),
+                ProcessResult(argv=["fail"], returncode=1),
             ]
             result = executor.run()
             assert result is False
@@ -0,0 +1,118 @@
+"""Tests for the incremental file tree index behind the World Model."""
+
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from src.core.file_index import DEFAULT_EXCLUSIONS, FileTreeIndex, diff_trees
+
+
+def _rglob_tree(root, max_depth=3):
+    """The walk WorldModel used before the index."""
+    files = set()
+    for item in Path(root).rglob("*"):
+        rel = item.relative_to(root)
+        if len(rel.parts) > max_depth or any(p in DEFAULT_EXCLUSIONS for p in rel.parts):
+            continue
+        if item.is_file():
+            files.add(str(rel))
+    return files
+
+
+def _touch(root, rel):
+    path = os.path.join(root, rel)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    open(path, "w").close()
+
+
+class _IndexTests:
+    use_inotify = True
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = self._tmp.name
+        for rel in [
+            "a.py", "src/b.py", "src/pkg/c.py", "src/pkg/deep/d.py",
+            "node_modules/x.js", "src/__pycache__/b.pyc", "docs/build/e.txt",
+        ]:
+            _touch(self.root, rel)
+        self.index = FileTreeIndex(self.root, use_inotify=self.use_inotify)
+
+    def tearDown(self):
+        self.index.close()
+        self._tmp.cleanup()
+
+    def test_matches_rglob_walk(self):
+        tree = self.index.refresh()
+        self.assertEqual(set(tree.paths()), _rglob_tree(self.root))
+        self.assertEqual(tree.file_count, 3)
+
+    def test_unchanged_refresh_reuses_nodes(self):
+        first = self.index.refresh()
+        second = self.index.refresh()
+        self.assertIs(first, second)
+
+    def test_change_rebuilds_only_its_path(self):
+        before = self.index.refresh()
+        _touch(self.root, "src/pkg/new.py")
+        after = self.index.refresh()
+
+        self.assertIsNot(before, after)
+        self.assertIs(before.dirs["docs"], after.dirs["docs"])
+        self.assertEqual(diff_trees(before, after), ([os.path.join("src", "pkg", "new.py")], []))
+
+    def test_removed_and_renamed_directories(self):
+        before = self.index.refresh()
+        os.rename(os.path.join(self.root, "src", "pkg"), os.path.join(self.root, "src", "lib"))
+        after = self.index.refresh()
+        self.assertEqual(set(after.paths()), _rglob_tree(self.root))
+        self.assertEqual(
+            diff_trees(before, after),
+            ([os.path.join("src", "lib", "c.py")], [os.path.join("src", "pkg", "c.py")]),
+        )
+
+
+class TestInotifyIndex(_IndexTests, unittest.TestCase):
+    def test_backend(self):
+        self.assertIn(self.index.backend, ("inotify", "mtime"))
+
+    def test_write_bumps_generation(self):
+        if self.index.backend != "inotify":
+            self.skipTest("inotify unavailable")
+        self.index.refresh()
+        generation = self.index.generation
+        with open(os.path.join(self.root, "a.py"), "w") as f:
+            f.write("x = 1\n")
+        self.index.refresh()
+        self.assertGreater(self.index.generation, generation)
+
+
+class TestMtimeIndex(_IndexTests, unittest.TestCase):
+    use_inotify = False
+
+    def test_settled_directories_are_not_relisted(self):
+        old = time.time() - 10
+        for dirpath, _, _ in os.walk(self.root):
+            os.utime(dirpath, (old, old))
+        self.index.refresh()
+        listings = dict(self.index._listings)
+        self.index.refresh()
+        self.assertTrue(all(self.index._listings[rel] is listing for rel, listing in listings.items()))
+
+
+class TestDiffTrees(unittest.TestCase):
+    def test_equal_digests_skip_subtrees(self):
+        with tempfile.TemporaryDirectory() as root:
+            _touch(root, "a/one.txt")
+            first = FileTreeIndex(root, use_inotify=False).refresh()
+            second = FileTreeIndex(root, use_inotify=False).refresh()
+        # Separate indexes: different node objects, same structure
+        self.assertIsNot(first, second)
+        self.assertEqual(first.digest, second.digest)
+        self.assertEqual(diff_trees(first, second), ([], []))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+"""Tests for the gateway /ws endpoint's outbound message queue."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+from src.core.gateway import gateway_main
+
+
+class _SlowSocket:
+    """Stands in for a WebSocket whose every send takes a network round trip."""
+
+    def __init__(self, delay: float) -> None:
+        self.delay = delay
+        self.sent: list[dict] = []
+
+    async def send_json(self, msg: dict) -> None:
+        await asyncio.sleep(self.delay)
+        self.sent.append(msg)
+
+
+class TestWsOutbox:
+    async def test_lines_are_batched_in_order_without_blocking_producer(self) -> None:
+        ws = _SlowSocket(delay=0.01)
+        outbox = gateway_main._WsOutbox(ws, asyncio.get_running_loop())
+        sender = asyncio.create_task(outbox.run())
+        step = SimpleNamespace(order=1)
+        timings: list[float] = []
+
+        def produce() -> None:
+            start = time.monotonic()
+            for i in range(2000):
+                outbox.put_output(step.order, "stdout", str(i))
+            outbox.put({"type": "step", "order": 1})
+            outbox.put({"type": "token", "order": 2, "delta": "he"})
+            outbox.put({"type": "token", "order": 2, "delta": "llo"})
+            timings.append(time.monotonic() - start)
+
+        await asyncio.to_thread(produce)
+        outbox.close()
+        await sender
+
+        # 2000 sends at 10ms each would take 20s; the producer never waits on them
+        assert timings[0] < 1.0
+        outputs = [m for m in ws.sent if m["type"] == "output"]
+        assert [line for m in outputs for line in m["lines"]] == [str(i) for i in range(2000)]
+        assert len(outputs) < 20
+        assert ws.sent[-2:] == [{"type": "step", "order": 1}, {"type": "token", "order": 2, "delta": "hello"}]
+
+    async def test_backlog_overflow_drops_lines_and_reports(self) -> None:
+        ws = _SlowSocket(delay=0)
+        outbox = gateway_main._WsOutbox(ws, asyncio.get_running_loop(), max_lines=5)
+        for i in range(8):
+            outbox.put_output(1, "stderr", str(i))
+        outbox.close()
+        await outbox.run()
+
+        assert ws.sent[0]["lines"] == ["0", "1", "2", "3", "4"]
+        assert ws.sent[1]["type"] == "status"
+        assert ws.sent[1]["message"].startswith("3 output lines")
+
+
+def test_ws_streams_output_before_completion(monkeypatch) -> None:
+    from fastapi.testclient import TestClient
+
+    monkeypatch.setenv("MEKONG_API_TOKEN", "tok")
+
+    def run_from_goal(goal, progress_callback, token_callback, output_callback):
+        step = SimpleNamespace(order=1, title="echo")
+        for i in range(500):
+            output_callback(step, "stdout", f"line {i}")
+        progress_callback(
+            SimpleNamespace(
+                step=step,
+                verification=SimpleNamespace(passed=True, summary="ok"),
+                execution=SimpleNamespace(exit_code=0),
+            ),
+            SimpleNamespace(completed_steps=1, total_steps=1),
+        )
+        return SimpleNamespace(
+            status=SimpleNamespace(value="success"), total_steps=1, completed_steps=1,
+            failed_steps=0, success_rate=100.0, errors=[],
+        )
+
+    monkeypatch.setattr(
+        gateway_main, "_build_orchestrator", lambda: SimpleNamespace(run_from_goal=run_from_goal),
+    )
+    client = TestClient(gateway_main.create_app())
+
+    with client.websocket_connect("/ws") as ws:
+        ws.send_json({"goal": "echo", "token": "tok"})
+        messages = []
+        while not messages or messages[-1]["type"] not in ("complete", "error"):
+            messages.append(ws.receive_json())
+
+    types = [m["type"] for m in messages]
+    assert types[0] == "status"
+    assert types[-2:] == ["step", "complete"]
+    lines = [line for m in messages if m["type"] == "output" for line in m["lines"]]
+    assert lines == [f"line {i}" for i in range(500)]
+
+
+def test_ws_disconnect_cancels_the_run(monkeypatch) -> None:
+    from fastapi.testclient import TestClient
+
+    monkeypatch.setenv("MEKONG_API_TOKEN", "tok")
+    cancelled = threading.Event()
+
+    def run_from_goal(goal, progress_callback, token_callback, output_callback):
+        output_callback(SimpleNamespace(order=1), "stdout", "started")
+        assert cancelled.wait(5)
+        return SimpleNamespace(
+            status=SimpleNamespace(value="failed"), total_steps=1, completed_steps=0,
+            failed_steps=1, success_rate=0.0, errors=["cancelled"],
+        )
+
+    monkeypatch.setattr(
+        gateway_main, "_build_orchestrator",
+        lambda: SimpleNamespace(run_from_goal=run_from_goal, cancel=cancelled.set),
+    )
+    client = TestClient(gateway_main.create_app())
+
+    with client.websocket_connect("/ws") as ws:
+        ws.send_json({"goal": "sleep", "token": "tok"})
+        while ws.receive_json()["type"] != "output":
+            pass
+
+    assert cancelled.wait(5)
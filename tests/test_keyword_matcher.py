@@ -0,0 +1,133 @@
+"""Tests for the Aho–Corasick keyword matcher and the batch NLU API."""
+
+import random
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from src.core.keyword_matcher import KeywordMatcher, goal_matcher, scan_goal
+from src.core.nlu import Intent, IntentClassifier
+from src.core.task_classifier import DOMAIN_SIGNALS, SIGNAL_GROUPS
+from src.daemon.classifier import ComplexityClassifier
+
+
+def _naive(groups, text):
+    hits = {label: [kw for kw in kws if kw in text] for label, kws in groups.items()}
+    return {label: kws for label, kws in hits.items() if kws}
+
+
+class TestKeywordMatcher(unittest.TestCase):
+    """One pass must equal ``keyword in text`` for every keyword."""
+
+    def test_matches_substring_semantics(self):
+        rng = random.Random(7)
+        alphabet = "ab c"
+        for _ in range(2000):
+            groups = {
+                g: ["".join(rng.choice(alphabet) for _ in range(rng.randint(0, 4))) for _ in range(rng.randint(0, 5))]
+                for g in range(rng.randint(1, 4))
+            }
+            text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 16)))
+            self.assertEqual(KeywordMatcher(groups).scan(text), _naive(groups, text), (groups, text))
+
+    def test_overlapping_and_prefix_keywords(self):
+        matcher = KeywordMatcher({"a": ["fix", "hotfix", "email", "email sequence", "sửa"]})
+        hits = matcher.scan("hotfix the email sequence, sửa lỗi")
+        self.assertEqual(hits["a"], ["fix", "hotfix", "email", "email sequence", "sửa"])
+
+    def test_duplicate_definitions_count_twice(self):
+        # DOMAIN_SIGNALS["creative"] lists "write" twice; counts must match
+        hits = scan_goal("write a blog")
+        self.assertEqual(hits[("domain", "creative")], ["write", "blog", "write"])
+        self.assertEqual(
+            len(hits[("domain", "creative")]),
+            sum(1 for kw in DOMAIN_SIGNALS["creative"] if kw in "write a blog"),
+        )
+
+    def test_shared_matcher_covers_all_tables(self):
+        goal = "deploy the billing api, check health and write a report about password rotation"
+        hits = goal_matcher().scan(goal)
+        self.assertIn(("intent", Intent.DEPLOY), hits)
+        self.assertIn(("intent", Intent.AUDIT), hits)
+        self.assertEqual(
+            {label: kws for label, kws in hits.items() if label in SIGNAL_GROUPS},
+            _naive(SIGNAL_GROUPS, goal),
+        )
+
+
+class TestDaemonClassifier(unittest.TestCase):
+    def test_highest_level_and_first_keyword(self):
+        classifier = ComplexityClassifier()
+        result = classifier.classify("Fix and REFACTOR the infrastructure audit")
+        self.assertEqual((result.level, result.matched_keyword), ("strategic", "audit"))
+        self.assertEqual(classifier.classify("rename a var").matched_keyword, "rename")
+        self.assertIsNone(classifier.classify("hello").matched_keyword)
+
+
+class SlowLLM:
+    """LLM stub recording concurrency and the prompts it saw."""
+
+    def __init__(self, delay=0.2):
+        self.delay = delay
+        self.prompts = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def generate(self, prompt):
+        with self._lock:
+            self.prompts.append(prompt)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        return "report"
+
+
+class TestClassifyBatch(unittest.TestCase):
+    GOALS = [
+        "deploy sophia", "zzz one", "fix login bug", "zzz two",
+        "deploy sophia", "zzz one", "zzz three", "zzz four",
+    ]
+
+    def test_matches_serial_classify(self):
+        serial_llm, batch_llm = SlowLLM(0), SlowLLM(0)
+        serial_classifier = IntentClassifier(llm_client=serial_llm)
+        serial = [serial_classifier.classify(g) for g in self.GOALS]
+        batch = IntentClassifier(llm_client=batch_llm).classify_batch(self.GOALS)
+
+        self.assertEqual(batch, serial)
+        # Each distinct goal's LLM prompt carries the context of its first
+        # serial occurrence
+        first_prompts = {}
+        for prompt in serial_llm.prompts:
+            first_prompts.setdefault(prompt.split("## User Goal")[1], prompt)
+        self.assertEqual(sorted(batch_llm.prompts), sorted(first_prompts.values()))
+
+    def test_dedups_identical_goals(self):
+        classifier = IntentClassifier()
+        with patch.object(classifier, "_keyword_match", wraps=classifier._keyword_match) as match:
+            results = classifier.classify_batch(self.GOALS)
+        self.assertEqual(match.call_count, len(set(self.GOALS)))
+        self.assertEqual(len(results), len(self.GOALS))
+        self.assertIsNot(results[0], results[4])
+        self.assertEqual(results[0], results[4])
+        self.assertEqual(len(classifier.conversation.turns), len(self.GOALS))
+
+    def test_llm_fallbacks_run_concurrently(self):
+        llm = SlowLLM(0.2)
+        classifier = IntentClassifier(llm_client=llm)
+        started = time.perf_counter()
+        results = classifier.classify_batch(self.GOALS)
+        elapsed = time.perf_counter() - started
+
+        self.assertEqual(len(llm.prompts), 4)  # zzz one..four, once each
+        self.assertEqual(llm.max_active, 4)
+        self.assertLess(elapsed, 0.6)
+        self.assertEqual(results[1].intent, Intent.REPORT)
+
+
+if __name__ == "__main__":
+    unittest.main()
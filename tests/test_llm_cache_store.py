@@ -0,0 +1,154 @@
+"""Tests for the persistent LLM cache tier and two-tier LLMCache."""
+
+import multiprocessing
+import secrets
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from src.core.llm_cache import CacheEntry, LLMCache
+from src.core.llm_cache_store import DiskCacheTier
+
+
+def _entry(key: str, content: str = "resp", ttl: int = 3600) -> CacheEntry:
+    return CacheEntry(key=key, content=content, model="gpt-4o", created_at=time.time(), ttl=ttl)
+
+
+def _writer(db_path: str, worker: int) -> None:
+    tier = DiskCacheTier(db_path)
+    for i in range(50):
+        tier.put(_entry(f"w{worker}-{i}", f"content {worker}-{i}"))
+    tier.close()
+
+
+class TestDiskCacheTier(unittest.TestCase):
+    """Test DiskCacheTier storage semantics."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.db_path = Path(self._tmp.name) / "cache.db"
+        self.tier = DiskCacheTier(self.db_path, max_bytes=10_000, compress_threshold=100)
+
+    def tearDown(self):
+        self.tier.close()
+        self._tmp.cleanup()
+
+    def test_put_get_roundtrip(self):
+        entry = _entry("k1", "hello")
+        entry.usage = {"total_tokens": 5}
+        self.tier.put(entry)
+        got = self.tier.get("k1")
+        self.assertEqual(got.content, "hello")
+        self.assertEqual(got.usage, {"total_tokens": 5})
+
+    def test_large_content_compressed(self):
+        content = "x" * 5000
+        self.tier.put(_entry("big", content))
+        self.assertEqual(self.tier.get("big").content, content)
+        self.assertLess(self.tier.get_stats()["bytes"], 1000)
+
+    def test_expired_entry_removed(self):
+        entry = _entry("old", ttl=5)
+        entry.created_at = time.time() - 10
+        self.tier.put(entry)
+        self.assertIsNone(self.tier.get("old"))
+        self.assertEqual(self.tier.get_stats()["entries"], 0)
+
+    def test_byte_budget_evicts_least_recently_used(self):
+        for i in range(5):
+            self.tier.put(_entry(f"k{i}", secrets.token_hex(2000)))
+            self.tier.get("k0")  # keep k0 hot
+        stats = self.tier.get_stats()
+        self.assertLessEqual(stats["bytes"], 10_000)
+        self.assertGreater(stats["evictions"], 0)
+        self.assertIsNotNone(self.tier.get("k0"))
+        self.assertIsNone(self.tier.get("k1"))
+
+    def test_overwrite_keeps_byte_total_exact(self):
+        self.tier.put(_entry("k", "a" * 50))
+        self.tier.put(_entry("k", "b" * 20))
+        self.assertEqual(self.tier.get_stats()["bytes"], 20)
+
+    def test_visible_across_instances(self):
+        self.tier.put(_entry("shared", "from first"))
+        other = DiskCacheTier(self.db_path)
+        self.assertEqual(other.get("shared").content, "from first")
+        other.close()
+
+    def test_concurrent_processes(self):
+        ctx = multiprocessing.get_context("spawn")
+        procs = [ctx.Process(target=_writer, args=(str(self.db_path), w)) for w in range(3)]
+        for p in procs:
+            p.start()
+        for p in procs:
+            p.join(timeout=60)
+            self.assertEqual(p.exitcode, 0)
+        big = DiskCacheTier(self.db_path, max_bytes=10**9)
+        self.assertEqual(big.get_stats()["entries"], 150)
+        self.assertEqual(big.get("w2-49").content, "content 2-49")
+        big.close()
+
+
+class TestTwoTierLLMCache(unittest.TestCase):
+    """Test LLMCache with a disk tier behind the memory LRU."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.db_path = Path(self._tmp.name) / "cache.db"
+        self.messages = [{"role": "user", "content": "hello"}]
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_cold_process_hits_disk(self):
+        LLMCache(disk_tier=DiskCacheTier(self.db_path)).put(self.messages, "warm", "gpt-4o")
+        fresh = LLMCache(disk_tier=DiskCacheTier(self.db_path))
+        self.assertEqual(fresh.get(self.messages, "gpt-4o").content, "warm")
+        self.assertEqual(fresh.stats.hits, 1)
+        self.assertEqual(fresh.stats.disk_hits, 1)
+        self.assertEqual(fresh.stats.misses, 0)
+        # Promoted: second hit is served from memory
+        fresh.get(self.messages, "gpt-4o")
+        self.assertEqual(fresh.stats.hits, 2)
+        self.assertEqual(fresh.stats.disk_hits, 1)
+
+    def test_single_miss_when_both_tiers_miss(self):
+        cache = LLMCache(disk_tier=DiskCacheTier(self.db_path))
+        self.assertIsNone(cache.get(self.messages, "gpt-4o"))
+        self.assertEqual(cache.stats.misses, 1)
+        self.assertEqual(cache.stats.hits, 0)
+
+    def test_cost_saved_counts_disk_hits(self):
+        LLMCache(disk_tier=DiskCacheTier(self.db_path)).put(self.messages, "warm", "gpt-4o")
+        fresh = LLMCache(cost_per_hit=0.5, disk_tier=DiskCacheTier(self.db_path))
+        fresh.get(self.messages, "gpt-4o")
+        self.assertEqual(fresh.stats.estimated_cost_saved, 0.5)
+
+    def test_memory_eviction_falls_back_to_disk(self):
+        cache = LLMCache(max_entries=1, disk_tier=DiskCacheTier(self.db_path))
+        cache.put(self.messages, "first", "gpt-4o")
+        cache.put([{"role": "user", "content": "other"}], "second", "gpt-4o")
+        self.assertEqual(cache.get(self.messages, "gpt-4o").content, "first")
+        self.assertEqual(cache.stats.disk_hits, 1)
+
+    def test_invalidate_and_clear_reach_disk(self):
+        tier = DiskCacheTier(self.db_path)
+        cache = LLMCache(disk_tier=tier)
+        key = cache.put(self.messages, "x", "gpt-4o")
+        self.assertTrue(cache.invalidate(key))
+        self.assertIsNone(tier.get(key))
+        cache.put(self.messages, "x", "gpt-4o")
+        cache.clear()
+        self.assertEqual(tier.get_stats()["entries"], 0)
+
+    def test_stats_include_disk(self):
+        cache = LLMCache(disk_tier=DiskCacheTier(self.db_path))
+        cache.put(self.messages, "x", "gpt-4o")
+        stats = cache.get_stats()
+        self.assertEqual(stats["disk"]["entries"], 1)
+        self.assertEqual(stats["disk_hits"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
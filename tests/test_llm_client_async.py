@@ -0,0 +1,177 @@
+"""Tests for the async LLMClient path and pooled OpenAI-compatible provider.
+
+Runs against a local stub HTTP server (tests/fixtures/llm_stub_server.py):
+1. Sync chat() reuses keep-alive connections
+2. achat() uses the same hooks → cache → failover pipeline
+3. chat_many() preserves order and bounds concurrency
+4. Identical concurrent prompts are coalesced into one upstream call
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from src.core.llm_client import LLMClient
+from src.core.providers import LLMProvider, LLMResponse, OpenAICompatibleProvider
+from tests.fixtures.llm_stub_server import StubLLMServer
+
+
+def _msgs(text: str) -> list[dict[str, str]]:
+    return [{"role": "user", "content": text}]
+
+
+def _client(*providers: LLMProvider, cache: bool = False) -> LLMClient:
+    return LLMClient(providers=list(providers), enable_cache=cache, enable_hooks=False)
+
+
+class _FailingProvider(LLMProvider):
+    @property
+    def name(self) -> str:
+        return "failing"
+
+    def is_available(self) -> bool:
+        return True
+
+    def chat(self, messages, model, temperature, max_tokens, json_mode) -> LLMResponse:
+        raise RuntimeError("upstream down")
+
+
+class TestKeepAlivePool:
+    def test_sync_chat_reuses_connection(self):
+        with StubLLMServer() as server:
+            provider = OpenAICompatibleProvider(server.base_url, model="stub")
+            client = _client(provider)
+            for i in range(5):
+                assert client.chat(_msgs(f"hi {i}")).content == f"echo: hi {i}"
+            assert server.requests == 5
+            assert server.connections == 1
+
+    def test_http_error_raises_runtime_error(self):
+        with StubLLMServer(fail_status=503) as server:
+            provider = OpenAICompatibleProvider(server.base_url, model="stub")
+            with pytest.raises(RuntimeError, match="HTTP 503"):
+                provider.chat(_msgs("x"), "stub", 0.7, 16, False)
+
+
+    def test_follows_redirects_like_urllib(self):
+        with StubLLMServer() as target:
+            moved = target.base_url + "/chat/completions"
+            with StubLLMServer(redirects={
+                "/old/chat/completions": (308, "/v1/chat/completions"),
+                "/v1/chat/completions": (307, moved),
+            }) as server:
+                base = server.base_url.replace("/v1", "/old")
+                provider = OpenAICompatibleProvider(base, api_key="sk", model="stub")
+                assert provider.chat(_msgs("moved"), "stub", 0.7, 16, False).content == "echo: moved"
+                assert [path for _, path, _ in server.seen] == ["/old/chat/completions", "/v1/chat/completions"]
+                assert server.connections == 1
+            # Same method and body after 307/308; credentials stay with the original origin
+            method, _, headers = target.seen[0]
+            assert method == "POST"
+            assert target.payloads[0]["messages"] == _msgs("moved")
+            assert "Authorization" not in headers
+
+    def test_see_other_redirect_becomes_get(self):
+        with StubLLMServer(redirects={"/v1/chat/completions": (303, "/v1/result")}) as server:
+            provider = OpenAICompatibleProvider(server.base_url, model="stub")
+            provider.chat(_msgs("x"), "stub", 0.7, 16, False)
+            assert [(m, p) for m, p, _ in server.seen] == [
+                ("POST", "/v1/chat/completions"), ("GET", "/v1/result"),
+            ]
+
+    def test_http_proxy_from_environment(self, monkeypatch):
+        with StubLLMServer() as proxy:
+            monkeypatch.setenv("http_proxy", proxy.base_url.replace("/v1", ""))
+            monkeypatch.setenv("no_proxy", "")
+            provider = OpenAICompatibleProvider("http://llm.invalid/v1", model="stub")
+            for i in range(2):
+                assert provider.chat(_msgs(f"p{i}"), "stub", 0.7, 16, False).content == f"echo: p{i}"
+            assert [path for _, path, _ in proxy.seen] == ["http://llm.invalid/v1/chat/completions"] * 2
+            assert proxy.connections == 1
+
+    def test_no_proxy_bypasses_proxy(self, monkeypatch):
+        monkeypatch.setenv("http_proxy", "http://127.0.0.1:9")  # Nothing listens here
+        monkeypatch.setenv("no_proxy", "127.0.0.1")
+        with StubLLMServer() as server:
+            provider = OpenAICompatibleProvider(server.base_url, model="stub")
+            assert provider.chat(_msgs("direct"), "stub", 0.7, 16, False).content == "echo: direct"
+
+
+class TestAsyncChat:
+    @pytest.mark.asyncio
+    async def test_achat_round_trip(self):
+        with StubLLMServer() as server:
+            client = _client(OpenAICompatibleProvider(server.base_url, model="stub"))
+            resp = await client.achat(_msgs("hello"))
+            await client.aclose()
+        assert resp.content == "echo: hello"
+
+    @pytest.mark.asyncio
+    async def test_achat_fails_over(self):
+        with StubLLMServer() as server:
+            client = _client(
+                _FailingProvider(), OpenAICompatibleProvider(server.base_url, model="stub"),
+            )
+            resp = await client.achat(_msgs("failover"))
+            await client.aclose()
+        assert resp.content == "echo: failover"
+        assert client._provider_health["failing"].failures == 1
+
+    @pytest.mark.asyncio
+    async def test_achat_uses_cache(self):
+        with StubLLMServer() as server:
+            client = _client(OpenAICompatibleProvider(server.base_url, model="stub"), cache=True)
+            await client.achat(_msgs("cached"))
+            resp = await client.achat(_msgs("cached"))
+            await client.aclose()
+            assert server.requests == 1
+        assert resp.raw == {"cache": True}
+
+
+class TestChatMany:
+    @pytest.mark.asyncio
+    async def test_order_preserved(self):
+        with StubLLMServer(latency=0.01) as server:
+            client = _client(OpenAICompatibleProvider(server.base_url, model="stub"))
+            responses = await client.chat_many(
+                [{"messages": _msgs(f"q{i}")} for i in range(10)], concurrency=4,
+            )
+            await client.aclose()
+        assert [r.content for r in responses] == [f"echo: q{i}" for i in range(10)]
+
+    @pytest.mark.asyncio
+    async def test_concurrency_bounded(self):
+        active = 0
+        peak = 0
+
+        class _Slow(_FailingProvider):
+            @property
+            def name(self) -> str:
+                return "slow"
+
+            async def achat(self, messages, model, temperature, max_tokens, json_mode):
+                nonlocal active, peak
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+                return LLMResponse(content=messages[0]["content"])
+
+        client = _client(_Slow())
+        await client.chat_many([{"messages": _msgs(str(i))} for i in range(12)], concurrency=3)
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_identical_requests_coalesced(self):
+        with StubLLMServer(latency=0.05) as server:
+            client = _client(OpenAICompatibleProvider(server.base_url, model="stub"))
+            responses = await client.chat_many(
+                [{"messages": _msgs("same")} for _ in range(5)], concurrency=5,
+            )
+            await client.aclose()
+            assert server.requests == 1
+        assert {r.content for r in responses} == {"echo: same"}
+        assert client.coalesced_requests == 4
+        assert client._pending_requests == {}
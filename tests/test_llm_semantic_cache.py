@@ -0,0 +1,200 @@
+"""Tests for the semantic (near-duplicate) LLM response cache."""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from src.core.llm_client import LLMClient
+from src.core.llm_semantic_cache import (
+    SemanticCache,
+    hashed_ngram_embedding,
+    normalize_prompt,
+    split_prompt,
+)
+from src.core.providers import LLMProvider, LLMResponse
+
+CONTEXT_A = "Project mekong uses a plan execute verify loop for every recipe step."
+CONTEXT_B = "Billing is metered per mission and credits are deducted after success."
+QUESTION = "Summarise how the orchestrator retries a failed step and reports it."
+
+
+def _msgs(*blocks: str) -> list[dict[str, str]]:
+    return [
+        {"role": "system", "content": "You are a concise assistant."},
+        {"role": "user", "content": "\n\n".join(blocks)},
+    ]
+
+
+class _CountingProvider(LLMProvider):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    @property
+    def name(self) -> str:
+        return "counting"
+
+    def is_available(self) -> bool:
+        return True
+
+    def chat(self, messages, model, temperature, max_tokens, json_mode) -> LLMResponse:
+        self.calls += 1
+        return LLMResponse(content=f"answer {self.calls}", model=model)
+
+
+def test_normalize_keeps_values_and_collapses_whitespace():
+    text = normalize_prompt([{"role": "user", "content": "Run at 2026-01-02T10:11:12Z\n  id 1700000000"}])
+    assert text == "user: Run at 2026-01-02T10:11:12Z id 1700000000"
+
+
+def test_split_prompt_separates_last_user_turn():
+    context, query = split_prompt([
+        {"role": "system", "content": "sys"},
+        {"role": "user", "content": "first"},
+        {"role": "assistant", "content": "reply"},
+        {"role": "user", "content": "  second  question "},
+    ])
+    assert query == "second question"
+    assert context == "system: sys\nuser: first\nassistant: reply\nquery: "
+
+
+def test_embedding_is_normalised_and_deterministic():
+    v = hashed_ngram_embedding("hello world", 64)
+    assert v == hashed_ngram_embedding("hello world", 64)
+    assert abs(sum(x * x for x in v) - 1.0) < 1e-9
+
+
+def test_whitespace_variant_is_exact_hit():
+    cache = SemanticCache()
+    cache.put(_msgs(f"Now: 2026-03-01 09:00. {QUESTION}"), "cached", "m", 0.2)
+    hit = cache.get(_msgs(f"Now:   2026-03-01 09:00.\n{QUESTION}"), "m", 0.2)
+    assert hit is not None
+    entry, score = hit
+    assert entry.content == "cached"
+    assert score == 1.0
+    assert cache.stats.exact_hits == 1
+
+
+def test_dates_are_not_masked_by_default():
+    cache = SemanticCache()
+    cache.put(_msgs("Is 2024-01-01 a Monday?"), "yes", "m", 0.2)
+    assert cache.get(_msgs("Is 2024-01-02 a Monday?"), "m", 0.2) is None
+
+
+def test_declared_volatile_patterns_are_masked():
+    cache = SemanticCache(volatile_patterns=[r"req-\d+"])
+    cache.put(_msgs(f"{QUESTION} (req-1)"), "cached", "m", 0.2)
+    hit = cache.get(_msgs(f"{QUESTION} (req-2)"), "m", 0.2)
+    assert hit is not None and hit[1] == 1.0
+
+
+def test_shared_system_prompt_does_not_mask_different_question():
+    system = " ".join(["You are the ops assistant for the mekong platform."] * 40)
+    cache = SemanticCache()
+    cache.put(
+        [{"role": "system", "content": system},
+         {"role": "user", "content": "Delete the staging database and all its snapshots."}],
+        "deleted", "m", 0.2,
+    )
+    miss = cache.get(
+        [{"role": "system", "content": system},
+         {"role": "user", "content": "Back up the production database to S3."}],
+        "m", 0.2,
+    )
+    assert miss is None
+
+
+def test_context_must_match_exactly():
+    cache = SemanticCache()
+    cache.put(
+        [{"role": "system", "content": "Answer in English."}, {"role": "user", "content": QUESTION}],
+        "cached", "m", 0.2,
+    )
+    other = [{"role": "system", "content": "Answer in Vietnamese."}, {"role": "user", "content": QUESTION}]
+    assert cache.get(other, "m", 0.2) is None
+
+
+def test_reordered_context_hits_above_threshold():
+    cache = SemanticCache(threshold=0.85)
+    cache.put(_msgs(CONTEXT_A, CONTEXT_B, QUESTION), "cached", "m", 0.2)
+    hit = cache.get(_msgs(CONTEXT_B, CONTEXT_A, QUESTION), "m", 0.2)
+    assert hit is not None
+    assert 0.85 <= hit[1] < 1.0
+
+
+def test_unrelated_prompt_misses():
+    cache = SemanticCache()
+    cache.put(_msgs(CONTEXT_A, QUESTION), "cached", "m", 0.2)
+    assert cache.get(_msgs("Write a haiku about rain on the Mekong delta."), "m", 0.2) is None
+    assert cache.stats.misses == 1
+
+
+def test_partitioned_by_model_and_temperature():
+    cache = SemanticCache()
+    cache.put(_msgs(QUESTION), "cached", "m", 0.2)
+    assert cache.get(_msgs(QUESTION), "other-model", 0.2) is None
+    assert cache.get(_msgs(QUESTION), "m", 0.9) is None
+    assert cache.get(_msgs(QUESTION), "m", 0.2) is not None
+
+
+def test_lru_eviction_and_expiry():
+    cache = SemanticCache(max_entries=2)
+    cache.put(_msgs("first prompt"), "1", "m", 0.0)
+    cache.put(_msgs("second prompt"), "2", "m", 0.0)
+    cache.put(_msgs("third prompt"), "3", "m", 0.0)
+    assert len(cache) == 2
+    assert cache.get(_msgs("first prompt"), "m", 0.0) is None
+
+    cache.put(_msgs("short lived"), "x", "m", 0.0, ttl=-1)
+    cache._items[next(reversed(cache._items))].entry.ttl = 1
+    cache._items[next(reversed(cache._items))].entry.created_at -= 10
+    assert cache.get(_msgs("short lived"), "m", 0.0) is None
+
+
+def test_concurrent_put_and_get_are_safe():
+    cache = SemanticCache(max_entries=8, threshold=0.5)
+    errors: list[BaseException] = []
+
+    def worker(n: int) -> None:
+        try:
+            for i in range(200):
+                cache.put(_msgs(f"{QUESTION} variant {n} {i}"), "x", "m", 0.2)
+                cache.get(_msgs(f"{QUESTION} variant {n} {i - 1}"), "m", 0.2)
+        except BaseException as e:  # noqa: BLE001
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert errors == []
+    assert len(cache) <= 8
+
+
+def test_wrong_embedding_dimension_rejected():
+    cache = SemanticCache(embed_fn=lambda text: [1.0, 0.0], dimension=4)
+    with pytest.raises(ValueError):
+        cache.put(_msgs("x"), "y", "m", 0.0)
+
+
+def test_client_saves_upstream_calls():
+    provider = _CountingProvider()
+    client = LLMClient(
+        providers=[provider], enable_hooks=False,
+        semantic_cache=SemanticCache(threshold=0.85),
+    )
+    first = client.chat(_msgs(CONTEXT_A, CONTEXT_B, QUESTION), model="m", temperature=0.1)
+    second = client.chat(_msgs(CONTEXT_B, CONTEXT_A, QUESTION), model="m", temperature=0.1)
+    assert provider.calls == 1
+    assert second.content == first.content
+    assert second.raw["semantic"] is True
+    assert client.semantic_cache.get_stats()["saved_calls"] == 1
+
+    client.chat(_msgs(CONTEXT_B, CONTEXT_A, QUESTION), model="m", temperature=0.1, json_mode=True)
+    assert provider.calls == 2
+
+
+def test_client_semantic_cache_off_by_default():
+    assert LLMClient(providers=[_CountingProvider()], enable_hooks=False).semantic_cache is None
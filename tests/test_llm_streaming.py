@@ -0,0 +1,144 @@
+"""Tests for token streaming through providers, LLMClient, executor and SSE.
+
+Runs against a local chunked-response stub (tests/fixtures/llm_stub_server.py).
+"""
+
+from __future__ import annotations
+
+import time
+from unittest.mock import patch
+
+import pytest
+
+from src.core.executor import RecipeExecutor
+from src.core.llm_client import LLMClient
+from src.core.parser import Recipe, RecipeStep
+from src.core.providers import LLMProvider, LLMResponse, OpenAICompatibleProvider
+from src.raas.sse import SSEManager
+from tests.fixtures.llm_stub_server import StubLLMServer
+
+
+def _msgs(text: str) -> list[dict[str, str]]:
+    return [{"role": "user", "content": text}]
+
+
+class _BrokenStream(LLMProvider):
+    def __init__(self, fail_after: int = 0) -> None:
+        self._fail_after = fail_after
+
+    @property
+    def name(self) -> str:
+        return "broken"
+
+    def is_available(self) -> bool:
+        return True
+
+    def chat(self, messages, model, temperature, max_tokens, json_mode) -> LLMResponse:
+        raise RuntimeError("down")
+
+    def chat_stream(self, messages, model, temperature, max_tokens, json_mode):
+        for i in range(self._fail_after):
+            yield f"t{i}"
+        raise RuntimeError("stream dropped")
+
+
+class TestProviderStream:
+    def test_openai_compatible_yields_chunks(self):
+        with StubLLMServer() as server:
+            provider = OpenAICompatibleProvider(server.base_url, model="stub")
+            chunks = list(provider.chat_stream(_msgs("one two three"), "stub", 0.7, 64, False))
+            list(provider.chat_stream(_msgs("again"), "stub", 0.7, 64, False))
+            assert server.payloads[0]["stream"] is True
+            assert server.connections == 1
+        assert chunks == ["echo:", " one", " two", " three"]
+
+    def test_first_token_before_generation_finishes(self):
+        with StubLLMServer(chunk_delay=0.1) as server:
+            provider = OpenAICompatibleProvider(server.base_url, model="stub")
+            start = time.perf_counter()
+            stream = provider.chat_stream(_msgs("a b c d"), "stub", 0.7, 64, False)
+            next(stream)
+            first_token = time.perf_counter() - start
+            list(stream)
+            total = time.perf_counter() - start
+        assert first_token < total / 2
+
+    def test_http_error(self):
+        with StubLLMServer(fail_status=500) as server:
+            provider = OpenAICompatibleProvider(server.base_url, model="stub")
+            with pytest.raises(RuntimeError, match="HTTP 500"):
+                list(provider.chat_stream(_msgs("x"), "stub", 0.7, 64, False))
+
+    def test_default_stream_wraps_chat(self):
+        class _Whole(_BrokenStream):
+            chat_stream = LLMProvider.chat_stream
+
+            def chat(self, messages, model, temperature, max_tokens, json_mode):
+                return LLMResponse(content="whole")
+
+        assert list(_Whole().chat_stream(_msgs("x"), "m", 0.7, 64, False)) == ["whole"]
+
+
+class TestClientStream:
+    def test_stream_is_cached_assembled(self):
+        with StubLLMServer() as server:
+            client = LLMClient(
+                providers=[OpenAICompatibleProvider(server.base_url, model="stub")],
+                enable_hooks=False,
+            )
+            first = list(client.chat_stream(_msgs("cache me"), model="stub"))
+            second = list(client.chat_stream(_msgs("cache me"), model="stub"))
+            assert server.requests == 1
+        assert "".join(first) == "echo: cache me"
+        assert second == ["echo: cache me"]
+
+    def test_failover_before_first_chunk(self):
+        with StubLLMServer() as server:
+            client = LLMClient(
+                providers=[
+                    _BrokenStream(),
+                    OpenAICompatibleProvider(server.base_url, model="stub"),
+                ],
+                enable_cache=False, enable_hooks=False,
+            )
+            text = "".join(client.chat_stream(_msgs("hi")))
+        assert text == "echo: hi"
+
+    def test_mid_stream_failure_raises(self):
+        client = LLMClient(
+            providers=[_BrokenStream(fail_after=2)], enable_cache=False, enable_hooks=False,
+        )
+        with pytest.raises(RuntimeError, match="mid-stream"):
+            list(client.chat_stream(_msgs("hi")))
+
+
+class TestExecutorStream:
+    def test_token_callback_receives_tokens(self):
+        step = RecipeStep(order=1, title="Write", description="hello world",
+                          params={"type": "llm"})
+        tokens: list[tuple[int, str]] = []
+        with StubLLMServer() as server:
+            client = LLMClient(
+                providers=[OpenAICompatibleProvider(server.base_url, model="stub")],
+                enable_cache=False, enable_hooks=False,
+            )
+            executor = RecipeExecutor(
+                Recipe(name="r", description="", steps=[step]),
+                token_callback=lambda s, d: tokens.append((s.order, d)),
+            )
+            with patch("src.core.llm_client.get_client", return_value=client):
+                result = executor.execute_step(step)
+        assert result.exit_code == 0
+        assert result.stdout == "echo: hello world"
+        assert [d for _, d in tokens] == ["echo:", " hello", " world"]
+        assert {o for o, _ in tokens} == {1}
+
+
+class TestSSETokens:
+    def test_push_token(self):
+        manager = SSEManager()
+        queue = manager.register("tenant-1")
+        manager.push_token("tenant-1", 3, "abc", task_id="task-9")
+        event = queue.get_nowait()
+        assert event["type"] == "llm_token"
+        assert event["data"] == {"task_id": "task-9", "order": 3, "delta": "abc"}
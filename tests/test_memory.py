@@ -171,11 +171,11 @@ class TestMemoryStore(unittest.TestCase):
             path = str(Path(tmpdir) / "memory.yaml")
             store = MemoryStore(store_path=path, sync_save=True)
             store.record(MemoryEntry(goal="x", status="success"))
-            self.assertTrue(Path(path).exists())
+            self.assertTrue(store.log_path.exists())
 
             store.clear()
             self.assertEqual(len(store._entries), 0)
-            self.assertFalse(Path(path).exists())
+            self.assertFalse(store.log_path.exists())
 
     def test_empty_success_rate(self):
         """Success rate returns 0 for empty store."""
@@ -184,5 +184,97 @@ class TestMemoryStore(unittest.TestCase):
             self.assertEqual(store.get_success_rate(), 0.0)
 
 
+class TestMemoryLog(unittest.TestCase):
+    """Test the append-only log, indexes and YAML migration."""
+
+    def test_yaml_is_migrated_once(self):
+        """Legacy YAML is imported into the log and set aside."""
+        import yaml
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "memory.yaml"
+            path.write_text(yaml.dump([
+                {"goal": "old", "status": "failed", "recipe_used": "r1"},
+            ]))
+            store = MemoryStore(store_path=str(path), sync_save=True)
+            self.assertEqual(store._entries[0].goal, "old")
+            self.assertFalse(path.exists())
+            self.assertTrue(Path(tmpdir, "memory.yaml.migrated").exists())
+
+            store.record(MemoryEntry(goal="new", status="success"))
+            again = MemoryStore(store_path=str(path), sync_save=True)
+            self.assertEqual([e.goal for e in again._entries], ["old", "new"])
+
+    def test_async_records_append_in_order(self):
+        """Concurrent records all land in the log, one line each."""
+        import threading
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = str(Path(tmpdir) / "memory.yaml")
+            store = MemoryStore(store_path=path)
+            threads = [
+                threading.Thread(
+                    target=lambda n=n: [
+                        store.record(MemoryEntry(goal=f"t{n}-{i}", status="success"))
+                        for i in range(25)
+                    ],
+                )
+                for n in range(4)
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            store.flush()
+
+            lines = store.log_path.read_text().splitlines()
+            self.assertEqual(len(lines), 100)
+            self.assertEqual(len(MemoryStore(store_path=path)._entries), 100)
+
+    def test_log_compacts_past_twice_capacity(self):
+        """Log is rewritten once it holds 2x MAX_ENTRIES lines."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = MemoryStore(store_path=str(Path(tmpdir) / "memory.yaml"), sync_save=True)
+            store.MAX_ENTRIES = 5
+            for i in range(12):
+                store.record(MemoryEntry(goal=f"g{i}", status="success"))
+            lines = store.log_path.read_text().splitlines()
+            self.assertLessEqual(len(lines), 10)
+            self.assertEqual(len(store._entries), 5)
+
+    def test_torn_trailing_line_skipped(self):
+        """A partial last line from a crash does not lose earlier entries."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = str(Path(tmpdir) / "memory.yaml")
+            store = MemoryStore(store_path=path, sync_save=True)
+            store.record(MemoryEntry(goal="kept", status="success"))
+            with open(store.log_path, "a") as f:
+                f.write('{"goal": "torn", "sta')
+            self.assertEqual([e.goal for e in MemoryStore(store_path=path)._entries], ["kept"])
+
+    def test_secondary_indexes_follow_eviction(self):
+        """Recipe/status indexes drop evicted entries."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = MemoryStore(store_path=str(Path(tmpdir) / "memory.yaml"), sync_save=True)
+            store.MAX_ENTRIES = 3
+            store.record(MemoryEntry(goal="a", status="failed", recipe_used="r"))
+            for i in range(3):
+                store.record(MemoryEntry(goal=f"b{i}", status="success", recipe_used="r"))
+            self.assertEqual([e.goal for e in store.entries_for_recipe("r")], ["b0", "b1", "b2"])
+            self.assertEqual(store.entries_with_status("failed"), [])
+            self.assertEqual(store.get_success_rate(), 100.0)
+
+    def test_semantic_hit_resolves_exact_entry(self):
+        """Vector hits map back to the exact recorded entry by id."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = MemoryStore(store_path=str(Path(tmpdir) / "memory.yaml"), sync_save=True)
+            first = MemoryEntry(goal="ship it", status="failed", timestamp=1.0)
+            second = MemoryEntry(goal="ship it", status="failed", timestamp=2.0)
+            store.record(first)
+            store.record(second)
+            hits = store.semantic_search("ship it failed ", top_k=2)
+            self.assertEqual({id(e) for e in hits}, {id(first), id(second)})
+
+
 if __name__ == "__main__":
     unittest.main()
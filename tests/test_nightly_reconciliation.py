@@ -0,0 +1,213 @@
+"""
+Tests for the nightly reconciliation job
+
+Covers:
+- Bounded concurrency across licenses
+- Token-bucket pacing of Stripe calls
+- Checkpoint/resume of an interrupted run
+- Concurrent results identical to a serial run
+- Per-stage timings
+"""
+
+import asyncio
+import time
+from datetime import date
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from src.billing.reconciliation import AuditResult
+from src.jobs.nightly_reconciliation import (
+    LicenseOutcome,
+    NightlyReconciliationService,
+    ReconciliationCheckpoint,
+    StripeReconciliationAdapter,
+)
+
+AUDIT_DATE = date(2026, 3, 1)
+
+
+def _licenses(count: int):
+    return [
+        {"license_key": f"lic-{i:03d}", "key_id": f"key-{i}", "email": f"user{i}@example.com", "tier": "pro"}
+        for i in range(count)
+    ]
+
+
+class FakeStripe:
+    """Stand-in for the ``stripe`` module: one invoice per customer."""
+
+    def __init__(self, amounts_cents):
+        self.amounts_cents = amounts_cents
+        self.calls = []
+        self.Customer = SimpleNamespace(list=self._list_customers)
+        self.Invoice = SimpleNamespace(list=self._list_invoices)
+
+    def _list_customers(self, email, limit):
+        self.calls.append(("customer", email, time.monotonic()))
+        return SimpleNamespace(data=[SimpleNamespace(id=email)])
+
+    def _list_invoices(self, customer, created, limit):
+        self.calls.append(("invoice", customer, time.monotonic()))
+        amount = self.amounts_cents[customer]
+        line = SimpleNamespace(description="usage", amount=amount, quantity=1, unit_amount=amount, type="invoiceitem")
+        invoice = SimpleNamespace(
+            id=f"in_{customer}", invoice_pdf=None, hosted_invoice_url=None,
+            amount_due=amount, amount_paid=amount, status="paid",
+            created=created["gte"], period_start=created["gte"], period_end=created["lte"],
+            lines=SimpleNamespace(data=[line]),
+        )
+        return SimpleNamespace(data=[invoice])
+
+
+class FakeAudit:
+    """Local reconciliation stub tracking how many licenses run at once."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.calls = []
+
+    async def reconcile_license(self, license_key, key_id, audit_date):
+        self.calls.append(license_key)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        index = int(license_key.split("-")[1])
+        variance = Decimal("1.00") if index % 4 == 0 else Decimal(0)
+        return AuditResult(
+            audit_id=f"audit_{license_key}", license_key=license_key, key_id=key_id,
+            audit_date=audit_date, expected_amount=Decimal(index) + variance,
+            actual_amount=Decimal(index), variance=variance,
+            variance_percent=float(variance), status="variance" if variance else "matched",
+        )
+
+
+def _service(tmp_path, count=8, concurrency=4, rps=1000.0, delay=0.0):
+    # Every third customer is billed $2 more in Stripe than locally
+    amounts = {f"user{i}@example.com": i * 100 + (200 if i % 3 == 0 else 0) for i in range(count)}
+    stripe = FakeStripe(amounts)
+    repo = MagicMock()
+    repo.list_active_licenses = AsyncMock(return_value=_licenses(count))
+    service = NightlyReconciliationService(
+        repository=repo,
+        stripe_adapter=StripeReconciliationAdapter(api_key="sk_test_x", requests_per_second=rps, client=stripe),
+        audit_service=FakeAudit(delay),
+        concurrency=concurrency,
+        checkpoint_dir=tmp_path,
+    )
+    return service, stripe
+
+
+def _comparable(report):
+    data = report.to_dict()
+    for volatile in ("duration_seconds", "stage_timings", "resumed_count"):
+        data.pop(volatile)
+    for discrepancy in data["discrepancies"]:
+        discrepancy.pop("created_at", None)
+    return data
+
+
+class TestConcurrency:
+    def test_concurrency_is_bounded(self, tmp_path):
+        service, _ = _service(tmp_path, count=12, concurrency=3, delay=0.02)
+        report = asyncio.run(service.run_full_reconciliation(AUDIT_DATE, dry_run=True))
+        assert service._audit_service.max_in_flight == 3
+        assert report.total_licenses == 12
+
+    def test_results_match_serial_run(self, tmp_path):
+        serial, _ = _service(tmp_path / "serial", count=20, concurrency=1)
+        parallel, _ = _service(tmp_path / "parallel", count=20, concurrency=8, delay=0.001)
+        serial_report = asyncio.run(serial.run_full_reconciliation(AUDIT_DATE))
+        parallel_report = asyncio.run(parallel.run_full_reconciliation(AUDIT_DATE))
+
+        assert _comparable(parallel_report) == _comparable(serial_report)
+        assert serial_report.reconciled_count == 15
+        assert len(serial_report.local_only_discrepancies) == 5
+        assert len(serial_report.discrepancies) == 7
+        assert serial_report.stripe_reconciled_count == 13
+
+
+class TestStripePacing:
+    def test_calls_are_spaced_by_token_bucket(self, tmp_path):
+        # 4 licenses x 2 calls at 4 req/s: a burst of 4, then 4 paced calls
+        service, stripe = _service(tmp_path, count=4, concurrency=4, rps=4.0)
+        started = time.monotonic()
+        asyncio.run(service.run_full_reconciliation(AUDIT_DATE, dry_run=True))
+
+        assert len(stripe.calls) == 8
+        assert time.monotonic() - started >= 0.7
+        assert service._stripe.api_calls == 8
+        assert service._stripe.paced_seconds > 0
+
+    def test_stats_describe_a_single_run(self, tmp_path):
+        service, _ = _service(tmp_path, count=4, concurrency=4, rps=4.0)
+        asyncio.run(service.run_full_reconciliation(AUDIT_DATE, dry_run=True, resume=False))
+        report = asyncio.run(service.run_full_reconciliation(AUDIT_DATE, dry_run=True, resume=False))
+
+        assert service._stripe.api_calls == 8
+        assert report.stage_timings["stripe_pacing"].count == 8
+
+
+class TestCheckpoint:
+    def test_resume_skips_checkpointed_licenses(self, tmp_path):
+        service, stripe = _service(tmp_path, count=6)
+        done = asyncio.run(FakeAudit().reconcile_license("lic-001", "key-1", AUDIT_DATE))
+        checkpoint = service.checkpoint_for(AUDIT_DATE)
+        checkpoint.append(LicenseOutcome(license_key="lic-001", local=done, stripe_checked=True))
+        checkpoint.close()
+
+        report = asyncio.run(service.run_full_reconciliation(AUDIT_DATE))
+
+        assert "lic-001" not in service._audit_service.calls
+        assert len(service._audit_service.calls) == 5
+        assert all(email != "user1@example.com" for _, email, _ in stripe.calls)
+        assert report.resumed_count == 1
+        assert report.total_licenses == 6
+        assert not checkpoint.path.exists()  # Cleared once the run completes
+
+    def test_no_resume_starts_over(self, tmp_path):
+        service, _ = _service(tmp_path, count=3)
+        checkpoint = service.checkpoint_for(AUDIT_DATE)
+        checkpoint.append(LicenseOutcome(license_key="lic-000"))
+        checkpoint.close()
+
+        report = asyncio.run(service.run_full_reconciliation(AUDIT_DATE, resume=False))
+        assert len(service._audit_service.calls) == 3
+        assert report.resumed_count == 0
+
+    def test_failed_licenses_are_not_checkpointed(self, tmp_path):
+        service, _ = _service(tmp_path, count=3)
+        service._audit_service.reconcile_license = AsyncMock(side_effect=RuntimeError("boom"))
+        checkpoint = service.checkpoint_for(AUDIT_DATE)
+        service.checkpoint_for = MagicMock(return_value=checkpoint)
+        checkpoint.clear = MagicMock()  # Keep the file to inspect it
+
+        report = asyncio.run(service.run_full_reconciliation(AUDIT_DATE))
+        assert checkpoint.load() == {}
+        assert sum("Error - boom" in w for w in report.warnings) == 3
+
+    def test_torn_line_is_ignored(self, tmp_path):
+        checkpoint = ReconciliationCheckpoint(tmp_path / "cp.jsonl")
+        checkpoint.append(LicenseOutcome(license_key="lic-000", warnings=["w"]))
+        checkpoint.close()
+        with checkpoint.path.open("a") as f:
+            f.write('{"license_key": "lic-0')
+
+        outcomes = checkpoint.load()
+        assert list(outcomes) == ["lic-000"]
+        assert outcomes["lic-000"].warnings == ["w"]
+
+
+class TestStageTimings:
+    def test_report_includes_stage_timings(self, tmp_path):
+        service, _ = _service(tmp_path, count=5)
+        report = asyncio.run(service.run_full_reconciliation(AUDIT_DATE))
+
+        timings = report.to_dict()["stage_timings"]
+        assert {"licenses", "local", "stripe", "save"} <= set(timings)
+        assert timings["local"]["count"] == 5
+        assert timings["stripe"]["count"] == 5
+        assert timings["licenses"]["count"] == 1
@@ -101,6 +101,26 @@ def test_run_from_recipe_empty(orchestrator):
     assert len(result.step_results) == 0
 
 
+def test_cancel_applies_to_one_run(orchestrator):
+    """A cancel requested before execution stops that run, not the next one."""
+    step = RecipeStep(
+        order=1,
+        title="Echo test",
+        description="echo hello_mekong",
+        params={"verification": {"exit_code": 0}},
+    )
+    recipe = _make_recipe("cancel-recipe", [step])
+
+    orchestrator.cancel()
+    with patch("src.core.executor.RecipeExecutor._is_safe_command", return_value=True):
+        cancelled = orchestrator.run_from_recipe(recipe)
+        rerun = orchestrator.run_from_recipe(recipe)
+
+    assert cancelled.step_results[0].execution.metadata.get("cancelled")
+    assert cancelled.completed_steps == 0
+    assert rerun.status == OrchestrationStatus.SUCCESS
+
+
 # -------------------------------------------------------------------
 # 4. test_orchestration_result_properties
 # -------------------------------------------------------------------
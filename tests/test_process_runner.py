@@ -0,0 +1,148 @@
+"""Tests for the shared process runner behind shell steps, missions and tools."""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+from src.core.process_runner import OutputBuffer, ProcessRunner
+
+PY = sys.executable
+
+
+class TestOutputBuffer(unittest.TestCase):
+    def test_small_output_stays_in_memory(self):
+        buffer = OutputBuffer("stdout", max_chars=100)
+        buffer.append("a\n")
+        buffer.append("b\n")
+        buffer.close()
+        self.assertEqual(buffer.getvalue(), "a\nb\n")
+        self.assertIsNone(buffer.spill_path)
+
+    def test_large_output_keeps_tail_and_spills_everything(self):
+        with tempfile.TemporaryDirectory() as spill_dir:
+            buffer = OutputBuffer("stdout", max_chars=20, spill_dir=spill_dir)
+            lines = [f"line {i}\n" for i in range(10)]
+            for line in lines:
+                buffer.append(line)
+            buffer.close()
+
+            value = buffer.getvalue()
+            self.assertTrue(value.startswith("[... "))
+            self.assertIn(buffer.spill_path, value)
+            self.assertTrue(value.endswith("line 8\nline 9\n"))
+            self.assertEqual(buffer.total_chars, sum(map(len, lines)))
+            with open(buffer.spill_path) as f:
+                self.assertEqual(f.read(), "".join(lines))
+
+
+class TestProcessRunner(unittest.TestCase):
+    def setUp(self):
+        self.runner = ProcessRunner(max_concurrency=2, kill_grace=0.5)
+
+    def tearDown(self):
+        self.runner.shutdown()
+
+    def test_captures_output_and_exit_code(self):
+        result = self.runner.run(
+            [PY, "-c", "import sys; print('out'); print('err', file=sys.stderr); sys.exit(3)"],
+        )
+        self.assertEqual(result.returncode, 3)
+        self.assertEqual(result.stdout, "out\n")
+        self.assertEqual(result.stderr, "err\n")
+        self.assertFalse(result.ok)
+
+    def test_lines_stream_while_running(self):
+        seen = []
+        script = "import time\nfor i in range(3):\n    print(i, flush=True)\n    time.sleep(0.05)"
+        result = self.runner.run(
+            [PY, "-c", script],
+            on_line=lambda stream, line: seen.append((stream, line, time.monotonic())),
+        )
+        self.assertTrue(result.ok)
+        self.assertEqual([(s, line) for s, line, _ in seen], [("stdout", "0"), ("stdout", "1"), ("stdout", "2")])
+        # First line arrived well before the command finished
+        self.assertLess(seen[0][2], seen[-1][2] - 0.05)
+
+    def test_huge_output_is_bounded(self):
+        with tempfile.TemporaryDirectory() as spill_dir:
+            runner = ProcessRunner(max_concurrency=1, max_output_chars=1000, spill_dir=spill_dir)
+            try:
+                result = runner.run([PY, "-c", "for i in range(20000): print(i)"])
+            finally:
+                runner.shutdown()
+            self.assertLess(len(result.stdout), 1200)
+            self.assertTrue(result.stdout.endswith("19999\n"))
+            with open(result.spill_paths["stdout"]) as f:
+                self.assertEqual(f.read().split(), [str(i) for i in range(20000)])
+
+    def test_discard_spills_removes_output_files(self):
+        with tempfile.TemporaryDirectory() as spill_dir:
+            runner = ProcessRunner(max_concurrency=1, max_output_chars=100, spill_dir=spill_dir)
+            try:
+                result = runner.run([PY, "-c", "for i in range(1000): print(i)"])
+            finally:
+                runner.shutdown()
+            self.assertEqual(len(os.listdir(spill_dir)), 1)
+            result.discard_spills()
+            self.assertEqual(os.listdir(spill_dir), [])
+            self.assertEqual(result.spill_paths, {})
+
+    def test_timeout_kills_the_process_group(self):
+        # The background sleep keeps stdout open; only a group kill ends the run
+        start = time.monotonic()
+        result = self.runner.run(["sh", "-c", "sleep 30 & echo started; sleep 30"], timeout=0.5)
+        self.assertTrue(result.timed_out)
+        self.assertEqual(result.stdout, "started\n")
+        self.assertLess(time.monotonic() - start, 5)
+
+    def test_grandchildren_get_the_grace_period(self):
+        # The leader exits on SIGTERM at once; its child needs 0.2s to clean up
+        with tempfile.TemporaryDirectory() as tmp:
+            marker = os.path.join(tmp, "cleaned")
+            child = f"trap 'sleep 0.2; touch {marker}; exit 0' TERM; echo ready; while :; do sleep 0.01; done"
+            script = f"sh -c \"{child}\" & trap 'exit 0' TERM; wait"
+            cancel = threading.Event()
+            start = time.monotonic()
+            result = self.runner.run(["sh", "-c", script], on_line=lambda *_: cancel.set(), cancel=cancel)
+            self.assertTrue(result.cancelled)
+            self.assertTrue(os.path.exists(marker))
+            self.assertLess(time.monotonic() - start, 5)
+
+    def test_cancel_event_and_cancel_all(self):
+        cancel = threading.Event()
+        threading.Timer(0.2, cancel.set).start()
+        self.assertTrue(self.runner.run(["sleep", "30"], cancel=cancel).cancelled)
+
+        results = []
+        worker = threading.Thread(target=lambda: results.append(self.runner.run(["sleep", "30"])))
+        worker.start()
+        while self.runner.active_count == 0:
+            time.sleep(0.01)
+        self.assertEqual(self.runner.cancel_all(), 1)
+        worker.join(5)
+        self.assertTrue(results[0].cancelled)
+
+    def test_concurrency_is_bounded(self):
+        peak = []
+
+        def run():
+            self.runner.run([PY, "-c", "import time; time.sleep(0.2)"])
+
+        threads = [threading.Thread(target=run) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        while any(thread.is_alive() for thread in threads):
+            peak.append(self.runner.active_count)
+            time.sleep(0.01)
+        self.assertEqual(max(peak), 2)
+
+    def test_missing_program_raises(self):
+        with self.assertRaises(OSError):
+            self.runner.run([os.path.join(tempfile.gettempdir(), "no-such-program")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,168 @@
+"""
+Tests for the RaaS license gate decision cache
+
+Covers:
+- JWT claims memoized by token hash until exp, shared across processes
+- Quota snapshots with TTL plus locally pending usage
+- Fail-open with backoff when the usage backend is down
+- Batched usage flush (ack, release on failure, snapshot fold-in)
+- Gate latency percentiles
+"""
+
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.lib.raas_gate import RaasLicenseGate
+from src.lib.raas_gate_cache import GateCache, flush_usage, percentile
+from src.raas.credit_rate_limiter import RateLimitStatus
+
+JWT_KEY = "raasjwt-pro-header.payload.signature"
+
+
+def _claims(exp_offset: float = 3600, **quotas):
+    return {
+        "tier": "pro",
+        "key_id": "jwt-key-1",
+        "exp": int(time.time() + exp_offset),
+        "quotas": {"commands_per_day": 100, "commands_per_month": 1000, **quotas},
+    }
+
+
+@pytest.fixture
+def cache(tmp_path):
+    gate_cache = GateCache(tmp_path / "gate_cache.db")
+    yield gate_cache
+    gate_cache.close()
+
+
+@pytest.fixture
+def meter():
+    mock_meter = MagicMock()
+    mock_meter.get_quota_snapshot = AsyncMock(return_value={"daily_used": 0, "monthly_used": 0})
+    mock_meter.add_usage = AsyncMock()
+    return mock_meter
+
+
+@pytest.fixture
+def backend(meter):
+    """Stub the rate limiter, usage meter and analytics sinks."""
+    limiter = MagicMock()
+    limiter.daily_limit = limiter.monthly_limit = None
+    limiter.check_limit.return_value = RateLimitStatus(
+        allowed=True, daily_used=0, daily_limit=1000, monthly_used=0, monthly_limit=30000,
+    )
+    with patch("src.lib.raas_gate.CreditRateLimiter", return_value=limiter), \
+            patch("src.lib.raas_gate.get_meter", return_value=meter), \
+            patch("src.lib.raas_gate.get_violation_tracker") as tracker, \
+            patch("src.lib.raas_gate.get_validation_logger") as vlogger, \
+            patch("src.lib.raas_gate.cache_quota"):
+        tracker.return_value.record_violation = AsyncMock()
+        vlogger.return_value.log_validation = AsyncMock()
+        yield meter
+
+
+def _jwt_gate(cache):
+    gate = RaasLicenseGate(enable_remote=True, cache=cache)
+    gate._license_key = JWT_KEY
+    return gate
+
+
+class TestJwtClaims:
+    def test_signature_verified_once_across_processes(self, cache, tmp_path, backend):
+        claims = _claims()
+        with patch("src.lib.raas_gate.validate_jwt_license", return_value=(True, claims, "")) as verify:
+            assert _jwt_gate(cache).check("cook") == (True, None)
+            # A new process opens the same cache file
+            other = GateCache(tmp_path / "gate_cache.db")
+            assert _jwt_gate(other).check("cook") == (True, None)
+            other.close()
+        assert verify.call_count == 1
+
+    def test_expired_claims_are_not_served(self, cache):
+        cache.put_claims(JWT_KEY, _claims(exp_offset=-1))
+        assert cache.get_claims(JWT_KEY) is None
+        cache.put_claims(JWT_KEY, _claims())
+        assert cache.get_claims(JWT_KEY)["key_id"] == "jwt-key-1"
+
+    def test_hybrid_jwt_skips_raas_key_format_check(self, cache, backend):
+        with patch("src.lib.raas_gate.validate_jwt_license", return_value=(True, _claims(), "")):
+            gate = _jwt_gate(cache)
+            with patch.object(gate, "validate_remote") as remote:
+                assert gate.check("cook") == (True, None)
+        remote.assert_not_called()
+
+
+class TestQuotaSnapshot:
+    def test_snapshot_reused_within_ttl_and_pending_usage_counted(self, cache, backend):
+        with patch("src.lib.raas_gate.validate_jwt_license", return_value=(True, _claims(), "")):
+            gate = _jwt_gate(cache)
+            for _ in range(3):
+                assert gate.check("cook") == (True, None)
+        assert backend.get_quota_snapshot.await_count == 1
+        assert cache.pending_usage("jwt-key-1") == 9  # 3 x cook (3 credits)
+
+    def test_blocks_when_snapshot_plus_pending_reaches_limit(self, cache, backend):
+        backend.get_quota_snapshot.return_value = {"daily_used": 4, "monthly_used": 4}
+        claims = _claims(commands_per_day=7)
+        with patch("src.lib.raas_gate.validate_jwt_license", return_value=(True, claims, "")):
+            gate = _jwt_gate(cache)
+            assert gate.check("cook")[0] is True   # 4 used + 3
+            allowed, error = gate.check("cook")    # 7 >= 7
+        assert allowed is False
+        assert error
+        assert cache.pending_usage("jwt-key-1") == 3
+
+    def test_backend_down_fails_open_with_backoff(self, cache, backend):
+        backend.get_quota_snapshot.side_effect = ConnectionError("db down")
+        with patch("src.lib.raas_gate.validate_jwt_license", return_value=(True, _claims(), "")):
+            gate = _jwt_gate(cache)
+            assert gate.check("cook") == (True, None)
+            assert gate.check("cook") == (True, None)
+        assert backend.get_quota_snapshot.await_count == 1
+
+
+class TestUsageFlush:
+    def test_flush_acks_and_folds_into_snapshot(self, cache):
+        cache.put_snapshot("k1", daily_used=5, monthly_used=50)
+        cache.add_usage("k1", 3)
+        cache.add_usage("k1", 2)
+        cache.add_usage("k2", 1)
+        send = AsyncMock()
+
+        assert flush_usage(cache, send) == 6
+        assert sorted(c.args for c in send.await_args_list) == [("k1", 5), ("k2", 1)]
+        assert cache.pending_usage("k1") == 0
+        snap = cache.get_snapshot("k1")
+        assert (snap.daily_used, snap.monthly_used) == (10, 55)
+
+    def test_failed_send_releases_rows_for_retry(self, cache):
+        cache.add_usage("k1", 3)
+        assert flush_usage(cache, AsyncMock(side_effect=ConnectionError("down"))) == 0
+        assert cache.pending_usage("k1") == 3
+
+        send = AsyncMock()
+        assert flush_usage(cache, send) == 3
+        send.assert_awaited_once_with("k1", 3)
+
+
+class TestLatency:
+    def test_percentile_nearest_rank(self):
+        values = [float(i) for i in range(1, 101)]
+        assert percentile(values, 50) == 50.0
+        assert percentile(values, 99) == 99.0
+        assert percentile([], 99) == 0.0
+
+    def test_check_records_premium_latency_only(self, cache, backend):
+        with patch("src.lib.raas_gate.validate_jwt_license", return_value=(True, _claims(), "")):
+            gate = _jwt_gate(cache)
+            gate.check("version")
+            gate.check("cook")
+            gate.check("swarm")
+
+        stats = cache.latency_stats()
+        assert stats["count"] == 2
+        assert stats["outcomes"] == {"allowed": 2}
+        assert 0 < stats["p50_ms"] <= stats["p99_ms"] <= stats["max_ms"]
+        assert cache.latency_stats("swarm")["count"] == 1
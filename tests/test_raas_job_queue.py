@@ -0,0 +1,291 @@
+"""Tests for the RaaS job queue behind POST /v1/tasks (stub LLM provider)."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Iterator, List
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from src.api import raas_job_queue, raas_task_store
+from src.api.raas_auth_middleware import require_tenant
+from src.api.raas_job_queue import JobQueue
+from src.api.raas_router import router
+from src.api.raas_task_models import TaskStatus
+from src.api.raas_task_store import TaskRecord, TaskStore
+from src.core.orchestrator import OrchestrationStatus
+from src.core.providers import LLMProvider, LLMResponse
+from src.raas.auth import TenantContext
+
+
+class _StubProvider(LLMProvider):
+    """Deterministic provider with a fixed per-call latency."""
+
+    def __init__(self, latency: float = 0.005) -> None:
+        self.latency = latency
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    @property
+    def name(self) -> str:
+        return "stub"
+
+    def is_available(self) -> bool:
+        return True
+
+    def chat(self, messages, model, temperature, max_tokens, json_mode) -> LLMResponse:
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.latency)
+        return LLMResponse(content=f"done: {messages[-1]['content']}", model=model)
+
+
+class _StubOrchestrator:
+    """Minimal run_from_goal: one LLM call, one streamed token, one step."""
+
+    def __init__(self, provider: _StubProvider, gate: threading.Event | None = None) -> None:
+        self._provider = provider
+        self._gate = gate
+
+    def run_from_goal(self, goal: str, progress_callback=None, token_callback=None) -> Any:
+        if self._gate is not None:
+            self._gate.wait(5)
+        reply = self._provider.chat([{"role": "user", "content": goal}], "stub", 0.0, 64, False)
+        step = SimpleNamespace(order=1, title=goal)
+        if token_callback:
+            token_callback(step, reply.content)
+        step_result = SimpleNamespace(
+            step=step,
+            verification=SimpleNamespace(passed=True, summary="ok"),
+            execution=SimpleNamespace(exit_code=0),
+        )
+        result = SimpleNamespace(
+            status=OrchestrationStatus.SUCCESS, total_steps=1, completed_steps=1,
+            failed_steps=0, success_rate=100.0, errors=[], warnings=[],
+            step_results=[step_result],
+        )
+        if progress_callback:
+            progress_callback(step_result, result)
+        return result
+
+
+def _tenant(request: Request) -> TenantContext:
+    tenant_id = request.headers.get("X-Tenant", "tenant-a")
+    return TenantContext(tenant_id=tenant_id, tenant_name=tenant_id, api_key="mk_test")
+
+
+@pytest.fixture()
+def store(tmp_path: Path) -> TaskStore:
+    return TaskStore(db_path=tmp_path / "tasks.db")
+
+
+@pytest.fixture()
+def provider() -> _StubProvider:
+    return _StubProvider()
+
+
+def _install(monkeypatch, store: TaskStore, queue: JobQueue) -> TestClient:
+    monkeypatch.setattr(raas_task_store, "_store", store)
+    monkeypatch.setattr(raas_job_queue, "_queue", queue)
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[require_tenant] = _tenant
+    return TestClient(app)
+
+
+def _wait_terminal(store: TaskStore, task_ids: List[str], tenant_of, timeout: float = 30) -> None:
+    deadline = time.time() + timeout
+    pending = set(task_ids)
+    while pending and time.time() < deadline:
+        pending = {t for t in pending if not store.get(t, tenant_of(t)).is_terminal}
+        time.sleep(0.01)
+    assert not pending, f"{len(pending)} task(s) never finished"
+
+
+@pytest.fixture()
+def gated(monkeypatch, store: TaskStore, provider: _StubProvider) -> Iterator[tuple]:
+    gate = threading.Event()
+    queue = JobQueue(store=store, workers=2, orchestrator_factory=lambda: _StubOrchestrator(provider, gate))
+    client = _install(monkeypatch, store, queue)
+    yield client, gate, queue
+    gate.set()
+    queue.stop()
+
+
+def test_submit_returns_202_before_execution(gated, store: TaskStore) -> None:
+    client, gate, _ = gated
+    resp = client.post("/v1/tasks", json={"goal": "write report"})
+    assert resp.status_code == 202
+    task_id = resp.json()["task_id"]
+    assert resp.json()["status"] in (TaskStatus.PENDING.value, TaskStatus.RUNNING.value)
+    assert client.get(f"/v1/tasks/{task_id}").json()["status"] != TaskStatus.SUCCESS.value
+
+    gate.set()
+    _wait_terminal(store, [task_id], lambda _: "tenant-a")
+    body = client.get(f"/v1/tasks/{task_id}").json()
+    assert body["status"] == "success"
+    assert body["steps"][0]["title"] == "write report"
+
+
+def test_stream_attaches_to_running_job(gated, provider: _StubProvider) -> None:
+    client, gate, _ = gated
+    task_id = client.post("/v1/tasks", json={"goal": "stream me"}).json()["task_id"]
+    threading.Timer(0.1, gate.set).start()
+
+    with client.stream("GET", f"/v1/tasks/{task_id}/stream") as resp:
+        events = [json.loads(line[6:]) for line in resp.iter_lines() if line.startswith("data: ")]
+
+    assert [e["type"] for e in events] == ["status", "token", "step", "complete"]
+    assert events[-1]["status"] == "success"
+    assert provider.calls == 1  # Streaming did not re-run the goal
+
+    # A late subscriber replays the finished log
+    with client.stream("GET", f"/v1/tasks/{task_id}/stream") as resp:
+        replay = [json.loads(line[6:]) for line in resp.iter_lines() if line.startswith("data: ")]
+    assert replay == events
+    assert provider.calls == 1
+
+
+def test_tenant_fair_round_robin(store: TaskStore, provider: _StubProvider) -> None:
+    order: List[str] = []
+    queue = JobQueue(store=store, workers=1, orchestrator_factory=lambda: _StubOrchestrator(provider))
+    queue._stopping = False  # Queue jobs before any worker runs
+    records = [store.create(f"bulk {i}", "heavy") for i in range(10)]
+    records += [store.create(f"small {i}", "light") for i in range(2)]
+    for record in records:
+        with queue._cond:
+            queue._enqueue(record)
+    while queue._tenants:
+        record = queue._next_job()
+        order.append(record.tenant_id)
+    assert order[:4] == ["heavy", "light", "heavy", "light"]
+
+
+def _orphan(store: TaskStore, age: float = 120.0) -> TaskRecord:
+    """Persist a RUNNING record left behind by a process that never claimed it."""
+    record = TaskRecord(
+        task_id=f"orphan-{time.time_ns()}", goal="left over", tenant_id="tenant-a",
+        status=TaskStatus.RUNNING, created_at=time.time() - age,
+    )
+    store.update(record)
+    return record
+
+
+def test_unfinished_tasks_are_recovered(store: TaskStore, provider: _StubProvider) -> None:
+    stale = _orphan(store)
+
+    queue = JobQueue(store=store, workers=1, orchestrator_factory=lambda: _StubOrchestrator(provider))
+    queue.start()
+    try:
+        _wait_terminal(store, [stale.task_id], lambda _: "tenant-a")
+    finally:
+        queue.stop()
+    assert store.get(stale.task_id, "tenant-a").status == TaskStatus.SUCCESS
+
+
+def test_live_lease_is_not_reclaimed(store: TaskStore, provider: _StubProvider) -> None:
+    running = _orphan(store)
+    fresh = store.create("just submitted", "tenant-a")  # Submitter claims it next
+    assert store.claim(running.task_id, "other-worker", lease_seconds=60)
+
+    queue = JobQueue(store=store, workers=1, orchestrator_factory=lambda: _StubOrchestrator(provider))
+    assert queue._recover() == 0
+
+    # Once the other worker stops heartbeating, its lease runs out
+    assert store.claim(running.task_id, "other-worker", lease_seconds=-1)
+    assert queue._recover() == 1
+    assert not store.claim(running.task_id, "other-worker", lease_seconds=60)
+    assert store.get(fresh.task_id, "tenant-a").status == TaskStatus.PENDING
+
+
+def test_only_one_process_reclaims_an_orphan(tmp_path: Path, provider: _StubProvider) -> None:
+    db_path = tmp_path / "shared.db"
+    stale = _orphan(TaskStore(db_path=db_path))
+    queues = [
+        JobQueue(store=TaskStore(db_path=db_path), workers=1,
+                 orchestrator_factory=lambda: _StubOrchestrator(provider))
+        for _ in range(4)
+    ]
+    barrier = threading.Barrier(len(queues))
+
+    def _race(queue: JobQueue) -> int:
+        barrier.wait()
+        return queue._recover()
+
+    with ThreadPoolExecutor(max_workers=len(queues)) as pool:
+        assert sum(pool.map(_race, queues)) == 1
+    assert stale.task_id in [t for q in queues for t in q._logs]
+
+
+def test_heartbeat_keeps_running_job_leased(tmp_path: Path, provider: _StubProvider) -> None:
+    db_path = tmp_path / "shared.db"
+    store = TaskStore(db_path=db_path)
+    gate = threading.Event()
+    queue = JobQueue(
+        store=store, workers=1, lease_seconds=0.3,
+        orchestrator_factory=lambda: _StubOrchestrator(provider, gate),
+    )
+    record = store.create("slow", "tenant-a")
+    queue.submit(record)
+    try:
+        time.sleep(1.0)  # Several lease periods
+        other = JobQueue(store=TaskStore(db_path=db_path), workers=1, lease_seconds=0.3)
+        assert other._recover() == 0
+    finally:
+        gate.set()
+        _wait_terminal(store, [record.task_id], lambda _: "tenant-a")
+        queue.stop()
+    assert provider.calls == 1
+
+
+def test_store_survives_restart_and_prunes(tmp_path: Path) -> None:
+    store = TaskStore(db_path=tmp_path / "t.db", max_records=3, ttl_seconds=60)
+    old = store.create("old", "t")
+    old.status = TaskStatus.SUCCESS
+    store.update(old)
+    for i in range(3):
+        store.create(f"live {i}", "t")
+
+    reopened = TaskStore(db_path=tmp_path / "t.db", max_records=3, ttl_seconds=60)
+    assert reopened.get(old.task_id, "t").status == TaskStatus.SUCCESS
+    assert reopened.get(old.task_id, "other") is None
+    assert reopened.prune() == 1  # Over the cap: the finished record goes first
+    assert len(reopened) == 3
+    assert reopened.prune(now=time.time() + 120) == 0  # Unfinished records are kept
+
+
+def test_load_hundreds_of_concurrent_submissions(
+    monkeypatch, store: TaskStore, provider: _StubProvider,
+) -> None:
+    """300 concurrent POSTs across 10 tenants all get 202 and all complete."""
+    queue = JobQueue(store=store, workers=8, orchestrator_factory=lambda: _StubOrchestrator(provider))
+    client = _install(monkeypatch, store, queue)
+    tenants = [f"tenant-{i}" for i in range(10)]
+
+    def _submit(i: int) -> tuple:
+        tenant = tenants[i % len(tenants)]
+        start = time.perf_counter()
+        resp = client.post("/v1/tasks", json={"goal": f"goal {i}"}, headers={"X-Tenant": tenant})
+        return resp.status_code, resp.json()["task_id"], tenant, time.perf_counter() - start
+
+    try:
+        with ThreadPoolExecutor(max_workers=32) as pool:
+            results = list(pool.map(_submit, range(300)))
+        assert {code for code, *_ in results} == {202}
+        owner = {task_id: tenant for _, task_id, tenant, _ in results}
+        _wait_terminal(store, list(owner), owner.get)
+    finally:
+        queue.stop()
+
+    latencies = sorted(r[3] for r in results)
+    assert latencies[int(len(latencies) * 0.99)] < 1.0
+    assert provider.calls == 300
+    stats = queue.stats()
+    assert stats["finished"] == 300 and stats["failed"] == 0
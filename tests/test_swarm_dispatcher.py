@@ -0,0 +1,263 @@
+"""
+Tests for the load-aware SwarmDispatcher
+
+Covers:
+- Least-outstanding and power-of-two-choices node selection
+- EWMA latency and in-flight counters
+- Per-node keep-alive sessions
+- Batch dispatch of ready steps (and /cmd fallback on older nodes)
+- Concurrent health probing
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from src.core.swarm import NodeLoad, SwarmDispatcher, SwarmRegistry
+
+
+class FakeResponse:
+    def __init__(self, payload, status_code=200):
+        self._payload = payload
+        self.status_code = status_code
+
+    def json(self):
+        return self._payload
+
+
+class FakeSession:
+    """Stands in for requests.Session; answers /cmd and /cmd/batch."""
+
+    instances = []
+
+    def __init__(self, batch_supported=True, delay=0.0):
+        self.batch_supported = batch_supported
+        self.delay = delay
+        self.posts = []
+        self.closed = False
+        FakeSession.instances.append(self)
+
+    def mount(self, prefix, adapter):
+        pass
+
+    def post(self, url, json, timeout):
+        self.posts.append((url, json))
+        time.sleep(self.delay)
+        if url.endswith("/cmd/batch"):
+            if not self.batch_supported:
+                return FakeResponse({"detail": "Not Found"}, status_code=404)
+            return FakeResponse({"results": [{"status": "success", "result": g} for g in json["goals"]]})
+        return FakeResponse({"status": "success", "result": json["goal"]})
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def registry(tmp_path):
+    reg = SwarmRegistry(config_path=str(tmp_path / "swarm.yaml"))
+    for i in range(3):
+        reg.register_node(f"node{i}", "127.0.0.1", 9000 + i, "tok").status = "healthy"
+    return reg
+
+
+def _step(description):
+    return SimpleNamespace(description=description, params={})
+
+
+def _dispatcher(registry, **kwargs):
+    FakeSession.instances = []
+    factory = kwargs.pop("session_factory", FakeSession)
+    return SwarmDispatcher(registry, session_factory=factory, **kwargs)
+
+
+class TestSelection:
+    def test_every_new_node_is_tried(self, registry):
+        dispatcher = _dispatcher(registry)
+        for i in range(3):
+            assert dispatcher.dispatch(_step(f"echo {i}")).exit_code == 0
+
+        loads = dispatcher.load_snapshot()
+        assert sorted(load.dispatched for load in loads.values()) == [1, 1, 1]
+        assert all(load.in_flight == 0 for load in loads.values())
+
+    def test_least_outstanding_avoids_busy_and_slow_nodes(self, registry):
+        dispatcher = _dispatcher(registry)
+        busy, slow, idle = registry.list_nodes()
+        dispatcher._loads[busy.id] = NodeLoad(in_flight=3, ewma_latency=0.1)
+        dispatcher._loads[slow.id] = NodeLoad(in_flight=0, ewma_latency=2.0)
+        dispatcher._loads[idle.id] = NodeLoad(in_flight=1, ewma_latency=0.1)
+        assert dispatcher.select_node() is idle
+
+    def test_p2c_picks_less_loaded_of_two(self, registry):
+        dispatcher = _dispatcher(registry, strategy="p2c")
+        nodes = registry.list_nodes()
+        dispatcher._loads[nodes[0].id] = NodeLoad(in_flight=5, ewma_latency=0.1)
+        dispatcher._loads[nodes[1].id] = NodeLoad(in_flight=0, ewma_latency=0.1)
+        dispatcher._loads[nodes[2].id] = NodeLoad(in_flight=9, ewma_latency=0.1)
+        with patch("src.core.swarm.random.sample", return_value=[nodes[0], nodes[2]]):
+            assert dispatcher.select_node() is nodes[0]
+        picks = {dispatcher.select_node().id for _ in range(50)}
+        assert nodes[2].id not in picks  # Never wins a pairing
+
+    def test_unknown_strategy_rejected(self, registry):
+        with pytest.raises(ValueError):
+            SwarmDispatcher(registry, strategy="random")
+
+    def test_ewma_latency_and_failures(self, registry):
+        dispatcher = _dispatcher(registry, ewma_alpha=0.5)
+        node = registry.list_nodes()[0]
+        for elapsed, failed in ((1.0, 0), (3.0, 1)):
+            dispatcher._reserve(node)
+            dispatcher._release(node, 1, elapsed, failed)
+        load = dispatcher.load_snapshot()[node.id]
+        assert load.ewma_latency == pytest.approx(2.0)
+        assert (load.dispatched, load.failures, load.in_flight) == (2, 1, 0)
+
+    def test_in_flight_tracked_during_request(self, registry):
+        node = registry.list_nodes()[0]
+        registry.list_nodes()[1].status = registry.list_nodes()[2].status = "down"
+        seen = []
+
+        class Probe(FakeSession):
+            def post(self, url, json, timeout):
+                seen.append(dispatcher.load_snapshot()[node.id].in_flight)
+                return super().post(url, json, timeout)
+
+        dispatcher = _dispatcher(registry, session_factory=Probe)
+        dispatcher.dispatch(_step("echo"))
+        assert seen == [1]
+        assert dispatcher.load_snapshot()[node.id].in_flight == 0
+
+
+class TestSessions:
+    def test_one_keep_alive_session_per_node(self, registry):
+        dispatcher = _dispatcher(registry)
+        for _ in range(3):
+            dispatcher.dispatch_batch([_step(f"echo {i}") for i in range(3)])
+        assert len(FakeSession.instances) == 3
+        assert sum(len(p["goals"]) for s in FakeSession.instances for _, p in s.posts) == 9
+
+        dispatcher.close()
+        assert all(s.closed for s in FakeSession.instances)
+
+    def test_transport_error_becomes_failed_result(self, registry):
+        class Broken(FakeSession):
+            def post(self, url, json, timeout):
+                raise requests.ConnectionError("refused")
+
+        dispatcher = _dispatcher(registry, session_factory=Broken)
+        result = dispatcher.dispatch(_step("echo"))
+        assert result.exit_code == 1
+        assert "refused" in result.stderr
+        assert sum(load.failures for load in dispatcher.load_snapshot().values()) == 1
+
+    def test_non_dict_body_releases_the_node(self, registry):
+        class ListBody(FakeSession):
+            def post(self, url, json, timeout):
+                return FakeResponse(["not", "a", "dict"])
+
+        dispatcher = _dispatcher(registry, session_factory=ListBody)
+        assert dispatcher.dispatch(_step("echo")).exit_code == 1
+
+        class Crashing(FakeSession):
+            def post(self, url, json, timeout):
+                raise RuntimeError("boom")
+
+        dispatcher = _dispatcher(registry, session_factory=Crashing)
+        with pytest.raises(RuntimeError):
+            dispatcher.dispatch(_step("echo"))
+        loads = dispatcher.load_snapshot().values()
+        assert all(load.in_flight == 0 for load in loads)
+        assert sum(load.failures for load in loads) == 1
+
+
+class TestBatchDispatch:
+    def test_ready_steps_sent_one_request_per_node(self, registry):
+        dispatcher = _dispatcher(registry)
+        steps = [_step(f"step {i}") for i in range(9)]
+        results = dispatcher.dispatch_batch(steps)
+
+        assert [r.stdout for r in results] == [s.description for s in steps]
+        assert len(FakeSession.instances) == 3
+        for session in FakeSession.instances:
+            assert len(session.posts) == 1
+            url, payload = session.posts[0]
+            assert url.endswith("/cmd/batch")
+            assert len(payload["goals"]) == 3
+
+    def test_max_batch_splits_requests(self, registry):
+        registry.list_nodes()[1].status = registry.list_nodes()[2].status = "down"
+        dispatcher = _dispatcher(registry, max_batch=2)
+        dispatcher.dispatch_batch([_step(f"step {i}") for i in range(5)])
+        sizes = [len(p["goals"]) for _, p in FakeSession.instances[0].posts]
+        assert sorted(sizes) == [1, 2, 2]
+
+    def test_nodes_receive_batches_concurrently(self, registry):
+        dispatcher = _dispatcher(registry, session_factory=lambda: FakeSession(delay=0.2))
+        started = time.perf_counter()
+        dispatcher.dispatch_batch([_step(f"step {i}") for i in range(6)])
+        assert time.perf_counter() - started < 0.5  # Not 3 x 0.2s
+
+    def test_older_nodes_fall_back_to_single_commands(self, registry):
+        dispatcher = _dispatcher(registry, session_factory=lambda: FakeSession(batch_supported=False))
+        results = dispatcher.dispatch_batch([_step(f"step {i}") for i in range(6)])
+        assert all(r.exit_code == 0 for r in results)
+        urls = [url for s in FakeSession.instances for url, _ in s.posts]
+        assert sum(url.endswith("/cmd") for url in urls) == 6
+
+    def test_no_healthy_nodes_runs_locally(self, registry):
+        for node in registry.list_nodes():
+            node.status = "unreachable"
+        dispatcher = _dispatcher(registry)
+        with patch.object(dispatcher, "_dispatch_local", return_value="local") as local:
+            assert dispatcher.dispatch_batch([_step("a"), _step("b")]) == ["local", "local"]
+        assert local.call_count == 2
+        assert FakeSession.instances == []
+
+
+class TestHealthProbing:
+    def test_nodes_probed_concurrently(self, registry):
+        barrier = threading.Barrier(3, timeout=2)
+
+        def probe(node, timeout):
+            barrier.wait()  # Deadlocks unless all three probes overlap
+            node.status = "healthy"
+            return node.status
+
+        with patch.object(registry, "check_health", side_effect=probe):
+            results = registry.check_all_health()
+        assert set(results.values()) == {"healthy"}
+        assert set(results) == {n.id for n in registry.list_nodes()}
+
+
+class TestGatewayBatchEndpoint:
+    def test_cmd_batch_runs_each_goal(self, monkeypatch):
+        from fastapi.testclient import TestClient
+
+        from src.core.gateway import gateway_main
+
+        monkeypatch.setenv("MEKONG_API_TOKEN", "tok")
+        orchestrator = SimpleNamespace(run_from_goal=lambda goal: goal)
+
+        def respond(result, goal, orch):
+            if goal == "bad":
+                raise RuntimeError("boom")
+            return gateway_main.CommandResponse(
+                status="success", goal=goal, total_steps=1, completed_steps=1,
+                failed_steps=0, success_rate=1.0, errors=[], warnings=[], steps=[],
+            )
+
+        monkeypatch.setattr(gateway_main, "_build_orchestrator", lambda: orchestrator)
+        monkeypatch.setattr(gateway_main, "_build_cmd_response", respond)
+        client = TestClient(gateway_main.create_app())
+
+        resp = client.post("/cmd/batch", json={"goals": ["a", "bad", "c"], "token": "tok"})
+        assert resp.status_code == 200
+        results = resp.json()["results"]
+        assert [r["status"] for r in results] == ["success", "error", "success"]
+        assert results[1]["error"] == "boom"
@@ -0,0 +1,137 @@
+"""Tests for the segmented telemetry log and its collector/uploader integration."""
+
+import json
+import multiprocessing
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.core.telemetry_collector import TelemetryCollector, TelemetryEvent
+from src.core.telemetry_log import LogOffset, TelemetryLog
+from src.core.telemetry_uploader import TelemetryUploader
+
+
+def _records(n, start=0):
+    return [{"i": i, "pad": "x" * 40} for i in range(start, start + n)]
+
+
+def _append_worker(directory, worker, batches):
+    log = TelemetryLog(Path(directory), segment_bytes=4096, fsync="never")
+    for b in range(batches):
+        log.append([{"worker": worker, "batch": b, "n": n} for n in range(5)])
+
+
+class TestTelemetryLog:
+    def test_append_and_read_roundtrip(self, tmp_path):
+        log = TelemetryLog(tmp_path)
+        end = log.append(_records(3))
+        records, offset = log.read()
+        assert [r["i"] for r in records] == [0, 1, 2]
+        assert offset == end == log.end_offset()
+
+    def test_rotation_compresses_sealed_segments(self, tmp_path):
+        log = TelemetryLog(tmp_path, segment_bytes=1024)
+        for b in range(20):
+            log.append(_records(5, b * 5))
+        names = sorted(p.name for p in tmp_path.glob("segment-*"))
+        assert len(names) > 3
+        assert all(n.endswith(".gz") for n in names[:-1])
+        assert [r["i"] for r in log.iter_records(batch=7)] == list(range(100))
+
+    def test_read_resumes_from_offset(self, tmp_path):
+        log = TelemetryLog(tmp_path, segment_bytes=512)
+        log.append(_records(30))
+        first, offset = log.read(limit=12)
+        rest, end = log.read(offset)
+        assert [r["i"] for r in first + rest] == list(range(30))
+        assert log.read(end) == ([], end)
+
+    def test_torn_tail_is_repaired(self, tmp_path):
+        log = TelemetryLog(tmp_path)
+        log.append(_records(2))
+        segment = next(tmp_path.glob("segment-*.jsonl"))
+        with open(segment, "ab") as f:
+            f.write(b'{"i": 99, "pa')  # Crash mid-write
+        records, _ = log.read()
+        assert [r["i"] for r in records] == [0, 1]
+        log.append(_records(1, 2))
+        assert [r["i"] for r in log.iter_records()] == [0, 1, 2]
+
+    def test_offsets_persist_and_release_segments(self, tmp_path):
+        log = TelemetryLog(tmp_path, segment_bytes=512)
+        for b in range(8):
+            log.append(_records(5, b * 5))
+        _, offset = log.read(limit=35)
+        log.commit_offset("uploader", offset)
+        reopened = TelemetryLog(tmp_path, segment_bytes=512)
+        assert reopened.load_offset("uploader") == offset
+        assert reopened.release(offset) > 0
+        remaining, _ = reopened.read(reopened.load_offset("uploader"))
+        assert [r["i"] for r in remaining] == list(range(35, 40))
+
+    def test_invalid_fsync_policy(self, tmp_path):
+        with pytest.raises(ValueError):
+            TelemetryLog(tmp_path, fsync="sometimes")
+
+    def test_concurrent_processes_lose_nothing(self, tmp_path):
+        ctx = multiprocessing.get_context("spawn")
+        procs = [ctx.Process(target=_append_worker, args=(str(tmp_path), w, 40)) for w in range(4)]
+        for p in procs:
+            p.start()
+        for p in procs:
+            p.join(60)
+        records = list(TelemetryLog(tmp_path).iter_records())
+        assert len(records) == 4 * 40 * 5
+        for w in range(4):
+            batches = [r["batch"] for r in records if r["worker"] == w and r["n"] == 0]
+            assert batches == list(range(40))  # Each writer's batches stay in order
+
+
+class TestCollectorIntegration:
+    def _collector(self, tmp_path, consent=True):
+        consent_manager = MagicMock()
+        consent_manager.has_consent.return_value = consent
+        consent_manager.get_anonymous_id.return_value = "anon"
+        with patch("atexit.register"):
+            collector = TelemetryCollector(consent_manager=consent_manager, log_dir=str(tmp_path / "log"))
+        collector._storage_file = tmp_path / "telemetry-buffer.json"
+        return collector, consent_manager
+
+    def test_legacy_buffer_is_migrated(self, tmp_path):
+        collector, _ = self._collector(tmp_path)
+        legacy = [TelemetryEvent("command_executed", "anon", "t", "s").to_dict() for _ in range(3)]
+        collector._storage_file.write_text(json.dumps(legacy, indent=2))
+        assert len(collector.get_pending_events()) == 3
+        assert not collector._storage_file.exists()
+
+    def test_flush_appends_without_rewriting(self, tmp_path):
+        collector, _ = self._collector(tmp_path)
+        for i in range(120):
+            collector.command_executed(f"cmd{i}", 1, 0)
+        collector._flush()
+        events = collector.get_pending_events()
+        assert [e["properties"]["command"] for e in events if e["event_type"] == "command_executed"] == [
+            f"cmd{i}" for i in range(120)
+        ]
+
+    def test_uploader_resumes_after_failure(self, tmp_path):
+        collector, consent = self._collector(tmp_path)
+        collector.get_log().append([{"n": i} for i in range(250)])
+        uploader = TelemetryUploader(collector, consent, backend_url="http://telemetry.invalid")
+        sent = []
+        outcomes = iter([True, False])
+
+        def fake_upload(batch):
+            ok = next(outcomes, True)
+            if ok:
+                sent.extend(e["n"] for e in batch)
+            return ok
+
+        uploader._upload_events = fake_upload
+        assert uploader.upload_batch() == 100  # Second batch fails
+        assert collector.get_log().load_offset("uploader") > LogOffset()
+        assert uploader.upload_batch() == 150
+        assert sent == list(range(250))
+        assert collector.get_pending_events() == []
+        assert uploader.upload_batch() == 0
@@ -1,7 +1,12 @@
 """Tests for Mekong Tool Registry (AGI v2)."""
 
+import os
+import sys
 import tempfile
 import unittest
+from unittest.mock import patch
+
+from src.core.process_runner import ProcessRunner
 
 from src.core.tool_registry import (
     Tool,
@@ -71,6 +76,23 @@ class TestToolRegistry(unittest.TestCase):
         self.assertTrue(result["success"])
         self.assertEqual(result["output"], "7")
 
+    def test_execute_command_leaves_no_spill_files(self):
+        reg = self._make_registry()
+        reg.register(
+            "count", "Print many lines", ToolType.CLI,
+            command_template=sys.executable + " -c {code}",
+        )
+        with tempfile.TemporaryDirectory() as spill_dir:
+            runner = ProcessRunner(max_concurrency=1, max_output_chars=100, spill_dir=spill_dir)
+            try:
+                with patch("src.core.tool_registry.get_process_runner", return_value=runner):
+                    result = reg.execute("count", {"code": "for i in range(1000): print(i)"})
+            finally:
+                runner.shutdown()
+            self.assertTrue(result["success"])
+            self.assertTrue(result["output"].endswith("999"))
+            self.assertEqual(os.listdir(spill_dir), [])
+
     def test_execute_not_found(self):
         reg = self._make_registry()
         result = reg.execute("nonexistent")
@@ -10,7 +10,10 @@ Tests cover:
 - HMAC signature generation
 """
 
+import gzip
+import json
 import time
+from collections.abc import Iterator
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -493,3 +496,195 @@ class TestGlobalService:
 
         assert service is not None
         assert get_service() is service
+
+
+class TestBatchedUploader:
+    """Test pooled, compressed, size/time-batched uploads."""
+
+    @staticmethod
+    def _mock_client(mock_client_class: MagicMock, *status_codes: int) -> MagicMock:
+        responses = []
+        for code in status_codes:
+            response = MagicMock()
+            response.status_code = code
+            responses.append(response)
+        mock_client = MagicMock()
+        mock_client.post.side_effect = responses
+        mock_client_class.return_value = mock_client
+        return mock_client
+
+    @pytest.fixture
+    def service(self, tmp_path: Path) -> Iterator[UsageMeteringService]:
+        """Service with background upload disabled for deterministic flushes."""
+        svc = UsageMeteringService(
+            db_path=str(tmp_path / "test.db"),
+            license_key="k",
+            batch_size=500,
+            background=False,
+        )
+        yield svc
+        svc.close()
+
+    @patch("httpx.Client")
+    def test_flush_drains_in_large_gzipped_batches(
+        self,
+        mock_client_class: MagicMock,
+        service: UsageMeteringService,
+    ) -> None:
+        """1200 events go out as 3 requests over one pooled client."""
+        mock_client = self._mock_client(mock_client_class, 200, 200, 200)
+        service._compress = True
+        for i in range(1200):
+            service.track_feature_usage("tenant-1", f"feature-{i}")
+
+        assert service.flush() == 1200
+        assert mock_client_class.call_count == 1
+        assert mock_client.post.call_count == 3
+
+        kwargs = mock_client.post.call_args_list[0].kwargs
+        assert kwargs["headers"]["Content-Encoding"] == "gzip"
+        payload = json.loads(gzip.decompress(kwargs["content"]))
+        assert len(payload["events"]) == 500
+        assert kwargs["headers"]["X-Signature"] == service._generate_signature(payload)
+
+        stats = service.get_stats()
+        assert stats["pending_events"] == 0
+        assert stats["batches_sent"] == 3
+        assert stats["compression_ratio"] < 0.5
+
+    @patch("httpx.Client")
+    def test_failed_batch_backs_off_without_sleeping(
+        self,
+        mock_client_class: MagicMock,
+        service: UsageMeteringService,
+    ) -> None:
+        """Exhausted retries schedule a backoff instead of sleeping."""
+        self._mock_client(mock_client_class, *([500] * 5))
+        service.track_api_call("tenant-1", "/api/test")
+
+        with patch("time.sleep") as mock_sleep:
+            assert service.flush() == 0
+        mock_sleep.assert_not_called()
+
+        stats = service.get_stats()
+        assert stats["pending_events"] == 1
+        assert stats["consecutive_failures"] == 1
+        assert 0 < stats["retry_in_seconds"] <= 1
+
+    @patch("httpx.Client")
+    def test_bodies_are_plain_json_by_default(
+        self,
+        mock_client_class: MagicMock,
+        service: UsageMeteringService,
+    ) -> None:
+        """Compression is opt-in; the default body is uncompressed JSON."""
+        mock_client = self._mock_client(mock_client_class, 200)
+        service.track_api_call("tenant-1", "/api/test")
+
+        assert service.flush() == 1
+        kwargs = mock_client.post.call_args.kwargs
+        assert "Content-Encoding" not in kwargs["headers"]
+        assert len(json.loads(kwargs["content"])["events"]) == 1
+
+    @patch("httpx.Client")
+    def test_unsupported_gzip_falls_back_to_plain(
+        self,
+        mock_client_class: MagicMock,
+        service: UsageMeteringService,
+    ) -> None:
+        """A 415 on a gzipped body is resent uncompressed, and stays off."""
+        mock_client = self._mock_client(mock_client_class, 415, 200, 200)
+        service._compress = True
+        service.track_api_call("tenant-1", "/api/test")
+        assert service.flush() == 1
+        service.track_api_call("tenant-1", "/api/test")
+        assert service.flush() == 1
+
+        sent = [c.kwargs["headers"].get("Content-Encoding") for c in mock_client.post.call_args_list]
+        assert sent == ["gzip", None, None]
+        assert service.get_stats()["pending_events"] == 0
+
+    @patch("httpx.Client")
+    def test_client_error_keeps_events_until_dead_lettered(
+        self,
+        mock_client_class: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        """A 4xx backs off and keeps events pending; repeated rejections dead-letter them."""
+        mock_client = self._mock_client(mock_client_class, 400, 400, 400)
+        service = UsageMeteringService(
+            db_path=str(tmp_path / "reject.db"), batch_size=500, background=False, max_rejections=3,
+        )
+        try:
+            service.track_api_call("tenant-1", "/api/test")
+            service.track_api_call("tenant-1", "/api/test")
+
+            assert service.flush() == 0
+            assert mock_client.post.call_count == 1
+            stats = service.get_stats()
+            assert stats["pending_events"] == 2
+            assert stats["failed_events"] == 0
+            assert stats["retry_in_seconds"] > 0
+
+            service.flush()
+            service.flush()
+            stats = service.get_stats()
+            assert mock_client.post.call_count == 3
+            assert stats["pending_events"] == 0
+            assert stats["failed_events"] == 2
+            assert stats["events_rejected"] == 2
+        finally:
+            service.close()
+
+    @patch("httpx.Client")
+    def test_outages_do_not_count_as_rejections(
+        self,
+        mock_client_class: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        """Only 4xx responses count toward max_rejections, not 5xx retries."""
+        mock_client = self._mock_client(mock_client_class, 503, 503, 503, 400)
+        service = UsageMeteringService(
+            db_path=str(tmp_path / "outage.db"), batch_size=500, background=False,
+            max_retries=1, max_rejections=2,
+        )
+        try:
+            service.track_api_call("tenant-1", "/api/test")
+            for _ in range(4):
+                service.flush()
+            stats = service.get_stats()
+            assert mock_client.post.call_count == 4
+            assert stats["pending_events"] == 1
+            assert stats["failed_events"] == 0
+            assert stats["events_rejected"] == 0
+        finally:
+            service.close()
+
+    @patch("httpx.Client")
+    def test_background_uploader_size_trigger(
+        self,
+        mock_client_class: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        """A full batch wakes the uploader long before flush_interval."""
+        self._mock_client(mock_client_class, 200)
+        service = UsageMeteringService(
+            db_path=str(tmp_path / "bg.db"),
+            batch_size=5,
+            flush_interval=60.0,
+        )
+        try:
+            for _ in range(5):
+                service.track_api_call("tenant-1", "/api/test")
+            deadline = time.time() + 5
+            while service.get_stats()["pending_events"] and time.time() < deadline:
+                time.sleep(0.02)
+
+            stats = service.get_stats()
+            assert stats["uploader_running"] is True
+            assert stats["pending_events"] == 0
+            assert stats["events_uploaded"] == 5
+            assert stats["pending_high_water"] == 5
+        finally:
+            service.close()
+        assert service.get_stats()["uploader_running"] is False
@@ -0,0 +1,211 @@
+"""Tests for the NumPy-backed VectorMemoryStore."""
+
+import json
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from src.core.vector_memory_store import MemoryType, VectorMemoryStore
+
+
+class TestVectorSearch(unittest.TestCase):
+    """Matrix search semantics match the old per-entry cosine scan."""
+
+    def setUp(self):
+        self.store = VectorMemoryStore()
+        self.store.create_collection("c", 3)
+        self.store.upsert("c", "x", [1.0, 0.0, 0.0], {"tag": "a"})
+        self.store.upsert("c", "y", [0.0, 1.0, 0.0], {"tag": "b"}, MemoryType.SEMANTIC)
+        self.store.upsert("c", "xy", [1.0, 1.0, 0.0], {"tag": "a"}, MemoryType.PROCEDURAL)
+        self.store.upsert("c", "zero", [0.0, 0.0, 0.0])
+
+    def test_ranked_by_cosine(self):
+        results = self.store.search("c", [1.0, 0.2, 0.0], top_k=3)
+        self.assertEqual([e.id for e, _ in results], ["x", "xy", "y"])
+        expected = self.store._cosine_similarity([1.0, 0.2, 0.0], [1.0, 1.0, 0.0])
+        self.assertAlmostEqual(results[1][1], expected, places=5)
+
+    def test_zero_vector_scores_zero(self):
+        scores = dict((e.id, s) for e, s in self.store.search("c", [0.0, 0.0, 1.0], top_k=10))
+        self.assertEqual(scores["zero"], 0.0)
+        self.assertEqual(self.store.search("c", [0.0, 0.0, 0.0], top_k=1)[0][1], 0.0)
+
+    def test_memory_type_filter(self):
+        results = self.store.search("c", [1.0, 0.0, 0.0], memory_type=MemoryType.SEMANTIC)
+        self.assertEqual([e.id for e, _ in results], ["y"])
+        self.assertEqual(results[0][0].memory_type, MemoryType.SEMANTIC)
+
+    def test_delete_moves_last_row(self):
+        self.store.delete_point("c", "x")
+        self.assertEqual(self.store.count("c"), 3)
+        self.assertNotIn("x", self.store._collections["c"].entries)
+        top = self.store.search("c", [1.0, 0.0, 0.0], top_k=5)
+        self.assertEqual(len(top), 3)
+        self.assertEqual(self.store._collections["c"].entries["zero"].vector, [0.0, 0.0, 0.0])
+        with self.assertRaises(KeyError):
+            self.store.delete_point("c", "x")
+
+    def test_upsert_overwrites_in_place(self):
+        self.store.upsert("c", "x", [0.0, 0.0, 1.0], {"tag": "new"})
+        self.assertEqual(self.store.count("c"), 4)
+        best, score = self.store.search("c", [0.0, 0.0, 1.0], top_k=1)[0]
+        self.assertEqual((best.id, best.payload), ("x", {"tag": "new"}))
+        self.assertAlmostEqual(score, 1.0, places=6)
+
+    def test_payload_search_and_info(self):
+        hits = self.store.search_by_payload("c", {"tag": "a"})
+        self.assertEqual({e.id for e in hits}, {"x", "xy"})
+        info = self.store.get_collection_info("c")
+        self.assertEqual(info["memory_types"], {"episodic": 2, "semantic": 1, "procedural": 1})
+        self.assertEqual(info["index"], "flat")
+
+    def test_dimension_mismatch(self):
+        with self.assertRaises(ValueError):
+            self.store.upsert("c", "bad", [1.0, 2.0])
+        with self.assertRaises(ValueError):
+            self.store.search("c", [1.0])
+        with self.assertRaises(ValueError):
+            self.store.upsert_many("c", ["a"], [[1.0, 2.0]])
+
+
+class TestIVFIndex(unittest.TestCase):
+    """Approximate search on clustered data keeps high recall."""
+
+    def test_recall_against_exact(self):
+        rng = np.random.default_rng(7)
+        centers = rng.normal(size=(40, 32))
+        data = centers[rng.integers(0, 40, size=4000)] + rng.normal(scale=0.1, size=(4000, 32))
+        ids = [f"v{i}" for i in range(len(data))]
+
+        exact = VectorMemoryStore()
+        ann = VectorMemoryStore(ann_threshold=1000, ann_nprobe=8)
+        for store in (exact, ann):
+            store.create_collection("c", 32)
+            store.upsert_many("c", ids, data)
+
+        hits = 0
+        for q in data[:50] + rng.normal(scale=0.05, size=(50, 32)):
+            truth = {e.id for e, _ in exact.search("c", q.tolist(), top_k=10)}
+            got = {e.id for e, _ in ann.search("c", q.tolist(), top_k=10)}
+            hits += len(truth & got)
+        self.assertGreaterEqual(hits / 500, 0.9)
+        self.assertEqual(ann.get_collection_info("c")["index"], "ivf")
+
+        # Incremental inserts are assigned to an existing list and found
+        ann.upsert("c", "fresh", (centers[3] * 10).tolist())
+        self.assertEqual(ann.search("c", centers[3].tolist(), top_k=1)[0][0].id, "fresh")
+
+
+class TestPersistence(unittest.TestCase):
+    """Binary snapshots and legacy JSON migration."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "vector_index.json"
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_roundtrip_memory_mapped(self):
+        store = VectorMemoryStore(str(self.path), persist_delay=60)
+        store.create_collection("c", 4)
+        store.upsert("c", "a", [1.0, 2.0, 3.0, 4.0], {"k": 1}, MemoryType.SEMANTIC)
+        self.assertFalse((self.path.with_suffix(".vec") / "manifest.json").exists())
+        store.flush()
+
+        loaded = VectorMemoryStore(str(self.path))
+        index = loaded._collections["c"].index
+        self.assertIsInstance(index.vectors, np.memmap)
+        entry, score = loaded.search("c", [1.0, 2.0, 3.0, 4.0], top_k=1)[0]
+        self.assertEqual((entry.id, entry.payload, entry.memory_type), ("a", {"k": 1}, MemoryType.SEMANTIC))
+        self.assertAlmostEqual(score, 1.0, places=6)
+
+        # First write after load copies out of the read-only map
+        loaded.upsert("c", "b", [0.0, 0.0, 0.0, 1.0])
+        loaded.delete_point("c", "a")
+        loaded.flush()
+        again = VectorMemoryStore(str(self.path))
+        self.assertEqual(list(again._collections["c"].entries), ["b"])
+
+        # Current generation plus the one it replaced are kept, older ones go
+        again.upsert("c", "c", [0.0, 1.0, 0.0, 0.0])
+        again.flush()
+        snap = self.path.with_suffix(".vec")
+        manifest = json.loads((snap / "manifest.json").read_text())
+        dirs = {p.name for p in snap.iterdir() if p.is_dir()}
+        self.assertEqual(len(dirs), 2)
+        self.assertIn(manifest["collections"]["c"]["dir"], dirs)
+
+    def test_overlapping_saves_keep_snapshot_loadable(self):
+        store = VectorMemoryStore(str(self.path), persist_delay=60)
+        store.create_collection("c", 4)
+        for i in range(20):
+            store.upsert("c", f"id{i}", [float(i), 1.0, 0.0, 0.0])
+        store.flush()
+
+        stop = threading.Event()
+
+        def save():
+            while not stop.is_set():
+                store.save_snapshot(str(self.path))
+
+        savers = [threading.Thread(target=save) for _ in range(2)]
+        for thread in savers:
+            thread.start()
+        try:
+            with self.assertNoLogs("src.core.vector_memory_store", level="ERROR"):
+                counts = [VectorMemoryStore(str(self.path)).count("c") for _ in range(50)]
+        finally:
+            stop.set()
+            for thread in savers:
+                thread.join()
+        self.assertEqual(set(counts), {20})
+
+    def test_broken_manifest_is_reported_and_not_overwritten(self):
+        store = VectorMemoryStore(str(self.path), persist_delay=60)
+        store.create_collection("c", 2)
+        store.upsert("c", "a", [1.0, 0.0])
+        store.flush()
+        snap = self.path.with_suffix(".vec")
+        for child in snap.iterdir():
+            if child.is_dir():
+                (child / "records.json").write_text("{")
+
+        with self.assertLogs("src.core.vector_memory_store", level="ERROR"):
+            broken = VectorMemoryStore(str(self.path), persist_delay=0)
+        before = (snap / "manifest.json").read_text()
+        broken.create_collection("d", 2)
+        broken.upsert("d", "x", [0.0, 1.0])
+        self.assertEqual((snap / "manifest.json").read_text(), before)
+
+    def test_immediate_persist_when_delay_zero(self):
+        store = VectorMemoryStore(str(self.path), persist_delay=0)
+        store.create_collection("c", 2)
+        store.upsert("c", "a", [1.0, 0.0])
+        self.assertEqual(VectorMemoryStore(str(self.path)).count("c"), 1)
+
+    def test_legacy_json_is_migrated(self):
+        self.path.write_text(json.dumps({
+            "c": {
+                "dimension": 2,
+                "metadata": {"owner": "t"},
+                "entries": [{
+                    "id": "old", "vector": [0.6, 0.8], "payload": {"goal": "g"},
+                    "memory_type": "procedural", "created_at": 1.0,
+                }],
+            },
+        }))
+        store = VectorMemoryStore(str(self.path), persist_delay=60)
+        entry = store._collections["c"].entries["old"]
+        self.assertEqual(entry.memory_type, MemoryType.PROCEDURAL)
+        self.assertEqual(entry.created_at, 1.0)
+        store.flush()
+        self.assertTrue((self.path.with_suffix(".vec") / "manifest.json").exists())
+        self.assertEqual(VectorMemoryStore(str(self.path)).get_collection_info("c")["metadata"], {"owner": "t"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,10 @@
 """Tests for Mekong World Model (AGI v2)."""
 
 import os
+import subprocess
 import tempfile
 import unittest
+from unittest.mock import patch
 
 from src.core.world_model import (
     SideEffectPrediction,
@@ -167,5 +169,94 @@ class TestWorldModel(unittest.TestCase):
             self.assertLessEqual(len(model._snapshots), 20)
 
 
+class TestIncrementalSnapshot(unittest.TestCase):
+    """Probe caching, latency reporting and structural diffs."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.dir = self._tmp.name
+        subprocess.run(["git", "init", "-q", self.dir], check=True)
+        open(os.path.join(self.dir, "tracked.py"), "w").close()
+        self.model = WorldModel(working_dir=self.dir)
+
+    def tearDown(self):
+        self.model.close()
+        self._tmp.cleanup()
+
+    def _count_cmds(self):
+        calls = []
+        real = self.model._run_cmd
+
+        def run(cmd):
+            calls.append(cmd)
+            return real(cmd)
+
+        return calls, patch.object(self.model, "_run_cmd", side_effect=run)
+
+    def test_probe_latency_reported(self):
+        state = self.model.snapshot()
+        self.assertEqual(set(state.probe_ms), {"files", "git", "processes", "ports", "total"})
+        self.assertTrue(all(ms >= 0 for ms in state.probe_ms.values()))
+
+    def test_repeat_snapshot_served_from_caches(self):
+        self.model.snapshot()
+        calls, patcher = self._count_cmds()
+        with patcher:
+            self.model.snapshot(fresh=False)
+        self.assertEqual(calls, [])
+
+    def test_git_rerun_when_tree_changes(self):
+        self.model.snapshot()
+        open(os.path.join(self.dir, "new.py"), "w").close()
+        calls, patcher = self._count_cmds()
+        with patcher:
+            state = self.model.snapshot(fresh=False)
+        self.assertIn("git status --short", calls)
+        self.assertIn("new.py", state.git_dirty_files)
+
+    def test_git_rerun_after_max_age(self):
+        self.model.git_max_age = 0
+        self.model.snapshot()
+        calls, patcher = self._count_cmds()
+        with patcher:
+            self.model.snapshot(fresh=False)
+        self.assertIn("git status --short", calls)
+
+    def test_diff_sees_edit_to_deep_tracked_file(self):
+        deep = os.path.join(self.dir, "a", "b", "c", "deep.py")
+        os.makedirs(os.path.dirname(deep))
+        with open(deep, "w") as f:
+            f.write("x = 1\n")
+        git = ["git", "-C", self.dir, "-c", "user.name=t", "-c", "user.email=t@example.com"]
+        subprocess.run(git + ["add", "-A"], check=True)
+        subprocess.run(git + ["commit", "-qm", "init"], check=True)
+
+        before = self.model.snapshot()
+        with open(deep, "a") as f:
+            f.write("y = 2\n")
+        after = self.model.snapshot()
+
+        result = self.model.diff(before, after)
+        self.assertTrue(result.git_changed)
+        self.assertEqual(result.files_modified, [os.path.join("a", "b", "c", "deep.py")])
+
+    def test_fresh_snapshot_reruns_process_and_port_probes(self):
+        self.model.snapshot()
+        calls, patcher = self._count_cmds()
+        with patcher:
+            self.model.snapshot()
+        self.assertIn("ps aux", calls)
+        self.assertTrue(any("lsof" in cmd for cmd in calls))
+
+    def test_diff_uses_trees_beyond_file_tree_limit(self):
+        self.model.MAX_FILES = 1
+        s1 = self.model.snapshot()
+        os.makedirs(os.path.join(self.dir, "pkg"))
+        open(os.path.join(self.dir, "pkg", "mod.py"), "w").close()
+        s2 = self.model.snapshot()
+        self.assertEqual(len(s2.file_tree), 1)
+        self.assertEqual(self.model.diff(s1, s2).files_added, [os.path.join("pkg", "mod.py")])
+
+
 if __name__ == "__main__":
     unittest.main()